@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Backfill the card search index (CardSearchTable) from the Cards table.
+
+検索インデックスは Cards テーブルのストリーム（jobs/card_search_index_handler）で
+更新されるため、ストリーム導入前に作成されたカードや、ストリームの保持期間（24 時間）を
+超えて処理できなかった変更はインデックスに載らない。本スクリプトは Cards テーブルを
+全件 Scan し、各カードのトークンを posting（services.card_search_index）へ
+UpdateItem の ADD で追加する。
+
+特性:
+  - 冪等: posting への追加は String Set の ADD のため、何度実行しても同じ状態になる。
+  - 追加のみ: 既存の posting からカードを外すことはしない。ストリームが取りこぼした
+    編集・削除の古いトークンは残る（削除済みカードは検索時の BatchGetItem で落ちるが、
+    編集前の語では引き続きヒットし得る。完全に作り直す場合は表を空にしてから実行する）。
+  - 削除済みカード（"<user_id>#deleted" パーティションのトゥームストーン）は対象外。
+  - 安全: --dry-run で書き込まず対象件数のみ集計する。
+
+使い方（本番はユーザーが手動実行）:
+    python backend/scripts/backfill_card_search_index.py \\
+        --table memoru-cards-prod --search-table memoru-card-search-postings-prod --region ap-northeast-1
+    python backend/scripts/backfill_card_search_index.py --table memoru-cards-prod --dry-run
+
+ストリームのイベントソースを有効にしてから実行すること（実行中の変更はストリーム側で
+上書きされる）。
+"""
+
+import argparse
+import os
+import sys
+from typing import Any, Dict, List
+
+import boto3
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.card_search_index import CardSearchIndex, changes_for_cards  # noqa: E402
+
+# 1 回の apply_changes にまとめるカード数（同じユーザーの posting 更新を束ねる単位）。
+FLUSH_SIZE = 500
+
+
+def backfill(table_name: str, search_table_name: str, region: str, dry_run: bool) -> int:
+    """Cards テーブルを Scan し posting を投入する。索引したカード枚数を返す。"""
+    dynamodb = boto3.resource("dynamodb", region_name=region)
+    table = dynamodb.Table(table_name)
+    index = CardSearchIndex(table_name=search_table_name, dynamodb_resource=dynamodb)
+
+    scanned = 0
+    skipped = 0
+    written = 0
+    pending: List[Dict[str, Any]] = []
+    updates = 0
+
+    def flush(items: List[Dict[str, Any]]) -> int:
+        nonlocal updates
+        if not dry_run:
+            updates += index.apply_changes(changes_for_cards(items))
+        return len(items)
+
+    scan_kwargs: Dict[str, Any] = {}
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            scanned += 1
+            if "#" in item.get("user_id", ""):
+                skipped += 1
+                continue
+            if "front" not in item:
+                skipped += 1
+                continue
+            pending.append(item)
+        if len(pending) >= FLUSH_SIZE:
+            written += flush(pending)
+            pending = []
+
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            break
+        scan_kwargs["ExclusiveStartKey"] = last_key
+
+    if pending:
+        written += flush(pending)
+
+    mode = "DRY-RUN (no writes)" if dry_run else "APPLIED"
+    print(
+        f"[{mode}] table={table_name} search_table={search_table_name} "
+        f"scanned={scanned} skipped={skipped} indexed={written} updates={updates}"
+    )
+    return written
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backfill the card search index from the Cards table.")
+    parser.add_argument(
+        "--table",
+        default=os.environ.get("CARDS_TABLE"),
+        help="Cards テーブル名（既定: 環境変数 CARDS_TABLE）。",
+    )
+    parser.add_argument(
+        "--search-table",
+        default=os.environ.get("CARD_SEARCH_TABLE"),
+        help="検索インデックスのテーブル名（既定: 環境変数 CARD_SEARCH_TABLE）。",
+    )
+    parser.add_argument(
+        "--region",
+        default=os.environ.get("AWS_REGION", "ap-northeast-1"),
+        help="AWS リージョン（既定: 環境変数 AWS_REGION または ap-northeast-1）。",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="書き込まず対象件数のみ集計する。",
+    )
+    args = parser.parse_args()
+
+    if not args.table:
+        parser.error("--table または環境変数 CARDS_TABLE でテーブル名を指定してください。")
+    if not args.search_table:
+        parser.error("--search-table または環境変数 CARD_SEARCH_TABLE でテーブル名を指定してください。")
+
+    backfill(args.table, args.search_table, args.region, args.dry_run)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
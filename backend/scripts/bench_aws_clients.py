@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Benchmark per-instance boto3 clients vs the shared registry (utils/aws_clients.py).
+
+1 回の Lambda 呼び出しで API ハンドラーが組み立てるサービス群（CardRepository /
+DeckService / UserService / ReviewRepository / レート制限 ...）を模し、
+以下を「従来方式（サービスごとに boto3.resource / client を生成）」と
+「レジストリ方式（utils.aws_clients でプロセス共有）」で比較する。
+
+  init:  サービス N 個分のクライアント生成にかかる時間（コールドスタート相当は
+         1 回目、ウォームは 2 回目以降の平均）。
+  calls: --endpoint-url 指定時（または --aws 指定時）のみ。各呼び出しで
+         DynamoDB ListTables を 1 回ずつ発行し、新規 TCP コネクション数
+         （HTTPS なら TLS ハンドシェイク数）とレイテンシを数える。
+
+使い方:
+    # 生成コストのみ（ネットワーク不要）
+    python backend/scripts/bench_aws_clients.py
+    # DynamoDB Local へのリクエストを含める（docker-compose の dynamodb-local）
+    python backend/scripts/bench_aws_clients.py --endpoint-url http://localhost:8000
+    # 実 AWS（TLS ハンドシェイク数の比較。認証情報が必要）
+    python backend/scripts/bench_aws_clients.py --aws --region ap-northeast-1
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import boto3
+import urllib3.connectionpool
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils import aws_clients  # noqa: E402
+
+# 1 リクエストあたりに API ハンドラーが生成していたクライアント数の目安
+# （users / cards / decks / reviews リソース + transact 用クライアント + レート制限）。
+SERVICES_PER_INVOCATION = 6
+
+
+class ConnectionCounter:
+    """urllib3 の新規コネクション生成を数える（HTTPS では 1 回 = TLS ハンドシェイク 1 回）。"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._originals: Dict[type, Callable[..., Any]] = {}
+
+    def __enter__(self) -> "ConnectionCounter":
+        for pool_cls in (urllib3.connectionpool.HTTPConnectionPool, urllib3.connectionpool.HTTPSConnectionPool):
+            original = pool_cls.__dict__["_new_conn"]
+            self._originals[pool_cls] = original
+
+            def counting(pool: Any, _original: Callable[..., Any] = original) -> Any:
+                self.count += 1
+                return _original(pool)
+
+            pool_cls._new_conn = counting
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        for pool_cls, original in self._originals.items():
+            pool_cls._new_conn = original
+
+
+def _legacy_clients(endpoint_url: Optional[str], region: str) -> List[Any]:
+    kwargs: Dict[str, Any] = {"region_name": region}
+    if endpoint_url:
+        kwargs["endpoint_url"] = endpoint_url
+    resources = [boto3.resource("dynamodb", **kwargs) for _ in range(SERVICES_PER_INVOCATION - 1)]
+    return [r.meta.client for r in resources] + [boto3.client("dynamodb", **kwargs)]
+
+
+def _registry_clients(endpoint_url: Optional[str], region: str) -> List[Any]:
+    os.environ.setdefault("AWS_DEFAULT_REGION", region)
+    resource = aws_clients.get_resource("dynamodb", endpoint_url=endpoint_url)
+    client = aws_clients.get_client("dynamodb", endpoint_url=endpoint_url)
+    return [resource.meta.client] * (SERVICES_PER_INVOCATION - 1) + [client]
+
+
+def run(
+    name: str,
+    factory: Callable[[Optional[str], str], List[Any]],
+    invocations: int,
+    endpoint_url: Optional[str],
+    region: str,
+    with_calls: bool,
+) -> Dict[str, Any]:
+    init_ms: List[float] = []
+    call_ms: List[float] = []
+    with ConnectionCounter() as counter:
+        for _ in range(invocations):
+            started = time.perf_counter()
+            clients = factory(endpoint_url, region)
+            init_ms.append((time.perf_counter() - started) * 1000)
+            if with_calls:
+                started = time.perf_counter()
+                for client in clients:
+                    client.list_tables(Limit=1)
+                call_ms.append((time.perf_counter() - started) * 1000)
+    result: Dict[str, Any] = {
+        "name": name,
+        "cold_init_ms": init_ms[0],
+        "warm_init_ms": statistics.mean(init_ms[1:]) if len(init_ms) > 1 else init_ms[0],
+    }
+    if with_calls:
+        result["new_connections"] = counter.count
+        result["warm_calls_ms"] = statistics.mean(call_ms[1:]) if len(call_ms) > 1 else call_ms[0]
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--invocations", type=int, default=20, help="simulated warm invocations")
+    parser.add_argument("--endpoint-url", default=None, help="DynamoDB endpoint (e.g. DynamoDB Local)")
+    parser.add_argument("--aws", action="store_true", help="issue requests against real AWS")
+    parser.add_argument("--region", default=os.environ.get("AWS_REGION", "ap-northeast-1"))
+    args = parser.parse_args(argv)
+
+    if args.endpoint_url:
+        # DynamoDB Local は任意の認証情報を受け付ける。
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "local")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "local")
+    with_calls = bool(args.endpoint_url or args.aws)
+
+    results = [
+        run("per-instance", _legacy_clients, args.invocations, args.endpoint_url, args.region, with_calls),
+        run("registry", _registry_clients, args.invocations, args.endpoint_url, args.region, with_calls),
+    ]
+    columns = ["name", "cold_init_ms", "warm_init_ms"] + (["new_connections", "warm_calls_ms"] if with_calls else [])
+    print(" ".join(f"{c:>16}" for c in columns))
+    for result in results:
+        print(" ".join(f"{result[c]:>16.2f}" if isinstance(result[c], float) else f"{result[c]:>16}" for c in columns))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""Microbenchmark (tests/benchmarks) の計測結果保存とコミット間比較.
+
+``run`` は指定コミット（既定: 作業ツリー）の backend/src に対して tests/benchmarks を
+``--benchmark-only`` で実行し、結果 JSON を .benchmarks/<machine>/ に保存する。
+コミットを指定した場合は ``git archive`` で src だけを一時ディレクトリへ展開し、
+BENCHMARK_SRC_DIR で差し替える（ベンチマークと合成入力は常に作業ツリーのものを使うため、
+同じ入力で実装だけを比較できる）。同じコミット・同じ件数の結果は再利用する（--rerun で再計測）。
+
+``compare`` は BASE と HEAD の結果（未保存なら run と同様に計測）をベンチマークごとに
+比較し、--stat（既定: min。共有ランナーの揺らぎを受けにくい）が --threshold % を超えて
+悪化したものを REGRESSION として終了コード 1 を返す。--min-delta-us 未満の差は
+マイクロ秒単位の揺らぎとして無視する。絶対値はマシン依存のため、比較は同じマシンで
+計測した結果同士で行うこと（結果はマシン識別子ごとのディレクトリに保存される）。
+
+使い方:
+    python backend/scripts/bench_compare.py run
+    python backend/scripts/bench_compare.py run --ref main
+    python backend/scripts/bench_compare.py compare                  # HEAD vs 作業ツリー
+    python backend/scripts/bench_compare.py compare main HEAD --threshold 15
+    python backend/scripts/bench_compare.py compare base.json head.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tarfile
+import tempfile
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BENCHMARK_DIR = os.path.join("tests", "benchmarks")
+STORAGE_DIR = os.path.join(BACKEND_DIR, ".benchmarks")
+
+WORKTREE = "WORKTREE"
+DEFAULT_SCALES = "100,1000"
+DEFAULT_THRESHOLD = 10.0
+DEFAULT_MIN_DELTA_US = 1.0
+STATS = ("min", "median", "mean")
+DEFAULT_STAT = "min"
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=BACKEND_DIR, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def machine_id() -> str:
+    """pytest-benchmark のストレージと同じ形式のマシン識別子."""
+    python = ".".join(platform.python_version_tuple()[:2])
+    return f"{platform.system()}-{platform.python_implementation()}-{python}-{platform.architecture()[0]}"
+
+
+def result_path(ref: str, scales: str) -> Tuple[str, Optional[str]]:
+    """ref の結果 JSON の保存先と、コミットの場合はその SHA を返す."""
+    sha = None if ref == WORKTREE else _git("rev-parse", "--verify", f"{ref}^{{commit}}")
+    label = "worktree" if sha is None else sha[:12]
+    name = f"{label}-n{scales.replace(',', '-')}.json"
+    return os.path.join(STORAGE_DIR, machine_id(), name), sha
+
+
+def _export_src(sha: str, dest: str) -> str:
+    """コミット sha の backend/src を dest に展開し、そのパスを返す."""
+    # git archive はサブディレクトリからだとツリー指定を解決できないため、リポジトリルートで実行する。
+    prefix = _git("rev-parse", "--show-prefix")
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", f"{sha}:{prefix}src"],
+        cwd=_git("rev-parse", "--show-toplevel"),
+        check=True,
+        capture_output=True,
+    ).stdout
+    src_dir = os.path.join(dest, "src")
+    with tempfile.TemporaryFile() as f:
+        f.write(archive)
+        f.seek(0)
+        with tarfile.open(fileobj=f) as tar:
+            tar.extractall(src_dir, filter="data")
+    return src_dir
+
+
+def run_benchmarks(ref: str, scales: str, rerun: bool = False, pytest_args: Sequence[str] = ()) -> str:
+    """ref に対してベンチマークを実行し、結果 JSON のパスを返す."""
+    path, sha = result_path(ref, scales)
+    if sha is not None and os.path.exists(path) and not rerun:
+        print(f"[{ref}] reuse {os.path.relpath(path, BACKEND_DIR)}", file=sys.stderr)
+        return path
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    env = dict(os.environ)
+    env["BENCHMARK_SCALES"] = scales
+    with tempfile.TemporaryDirectory() as tmp:
+        if sha is not None:
+            env["BENCHMARK_SRC_DIR"] = _export_src(sha, tmp)
+        cmd = [
+            sys.executable,
+            "-m",
+            "pytest",
+            BENCHMARK_DIR,
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            "--benchmark-only",
+            "--benchmark-disable-gc",
+            f"--benchmark-json={path}",
+            *pytest_args,
+        ]
+        print(f"[{ref}] {' '.join(cmd[1:])}", file=sys.stderr)
+        proc = subprocess.run(cmd, cwd=BACKEND_DIR, env=env, check=False)
+    if not os.path.exists(path):
+        raise RuntimeError(f"benchmark run for {ref} produced no results (exit {proc.returncode})")
+    if proc.returncode != 0:
+        # 古いコミットに存在しない API のベンチマークは失敗し得る。比較では MISSING として扱う。
+        print(f"[{ref}] WARNING: pytest exited with {proc.returncode}; failed benchmarks are missing", file=sys.stderr)
+    return path
+
+
+def load_results(path: str, stat: str) -> Dict[str, float]:
+    """結果 JSON を {ベンチマーク名: 統計値（秒）} にする."""
+    with open(path) as f:
+        data = json.load(f)
+    return {bench["fullname"].split("::", 1)[-1]: bench["stats"][stat] for bench in data["benchmarks"]}
+
+
+def compare(
+    base: Dict[str, float],
+    head: Dict[str, float],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta_us: float = DEFAULT_MIN_DELTA_US,
+) -> List[Dict[str, Any]]:
+    """ベンチマークごとの比較行を返す（status: ok / improved / REGRESSION / missing / new）."""
+    rows = []
+    for name in sorted(set(base) | set(head)):
+        before, after = base.get(name), head.get(name)
+        row: Dict[str, Any] = {"name": name, "base_us": None, "head_us": None, "change_pct": None}
+        if before is None or after is None:
+            row["status"] = "new" if before is None else "missing"
+            row["base_us" if before is not None else "head_us"] = (before if before is not None else after) * 1e6
+            rows.append(row)
+            continue
+        change = (after - before) / before * 100 if before else 0.0
+        significant = abs(after - before) * 1e6 >= min_delta_us
+        if significant and change > threshold:
+            status = "REGRESSION"
+        elif significant and change < -threshold:
+            status = "improved"
+        else:
+            status = "ok"
+        row.update(base_us=before * 1e6, head_us=after * 1e6, change_pct=round(change, 1), status=status)
+        rows.append(row)
+    return rows
+
+
+def _fmt(value: Optional[float], spec: str) -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def _print_rows(rows: List[Dict[str, Any]], base_label: str, head_label: str, stat: str) -> None:
+    width = max([len(row["name"]) for row in rows] + [9])
+    print(f"{'benchmark':<{width}} {base_label[:12]:>12} {head_label[:12]:>12} {'change':>8}  status   ({stat}, us)")
+    print("-" * (width + 52))
+    for row in rows:
+        change = "-" if row["change_pct"] is None else f"{row['change_pct']:+.1f}%"
+        print(
+            f"{row['name']:<{width}} {_fmt(row['base_us'], '12.2f')} {_fmt(row['head_us'], '12.2f')}"
+            f" {change:>8}  {row['status']}"
+        )
+
+
+def _resolve(ref: str, args: argparse.Namespace) -> str:
+    if ref.endswith(".json") and os.path.exists(ref):
+        return ref
+    return run_benchmarks(ref, args.scales, rerun=args.rerun, pytest_args=args.pytest_args)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default=DEFAULT_SCALES, help="BENCHMARK_SCALES for the run")
+    parser.add_argument("--rerun", action="store_true", help="re-measure even if a stored result exists")
+    parser.add_argument("--pytest-args", nargs=argparse.REMAINDER, default=[], help="extra pytest arguments (last)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="measure a ref and store the result")
+    run_parser.add_argument("--ref", default=WORKTREE, help=f"git ref to measure (default: {WORKTREE})")
+
+    compare_parser = sub.add_parser("compare", help="compare two refs or result JSON files")
+    compare_parser.add_argument("base", nargs="?", default="HEAD", help="base ref or result JSON (default: HEAD)")
+    compare_parser.add_argument("head", nargs="?", default=WORKTREE, help=f"head ref or result JSON (default: {WORKTREE})")
+    compare_parser.add_argument("--stat", choices=STATS, default=DEFAULT_STAT, help="statistic to compare")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="regression threshold in percent")
+    compare_parser.add_argument(
+        "--min-delta-us", type=float, default=DEFAULT_MIN_DELTA_US, help="ignore absolute differences below this"
+    )
+    compare_parser.add_argument("--output", help="write the comparison as JSON")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        path = run_benchmarks(args.ref, args.scales, rerun=args.rerun, pytest_args=args.pytest_args)
+        print(path)
+        return 0
+
+    base_path = _resolve(args.base, args)
+    head_path = _resolve(args.head, args)
+    rows = compare(
+        load_results(base_path, args.stat),
+        load_results(head_path, args.stat),
+        threshold=args.threshold,
+        min_delta_us=args.min_delta_us,
+    )
+    _print_rows(rows, args.base, args.head, args.stat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"base": base_path, "head": head_path, "stat": args.stat, "rows": rows}, f, indent=2)
+
+    regressions = [row for row in rows if row["status"] == "REGRESSION"]
+    for row in regressions:
+        print(f"FAIL: {row['name']} {row['change_pct']:+.1f}% (> {args.threshold:.0f}%)", file=sys.stderr)
+    if not regressions:
+        print(f"OK: no benchmark regressed more than {args.threshold:.0f}% ({args.stat})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
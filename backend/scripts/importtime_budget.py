@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Import-time profile and budget check for Lambda entry modules.
+
+``python -X importtime -c "import <module>"`` を別プロセスで実行し（sys.modules の
+キャッシュを持ち込まないため）、累積 import 時間の大きいモジュールを表示する。
+コールドスタートの回帰検知用に、以下を満たさなければ終了コード 1 を返す。
+
+  - budget: 対象モジュールの累積 import 時間（--runs 回の中央値）が --budget-ms 以下。
+  - forbid: 対象モジュールの import で --forbid のモジュールが読み込まれていない
+    （api.handler の既定: strands / bs4 / httpx / services.ai_job_executors。
+    いずれも初回利用時に遅延 import する設計。api/lazy_routes.py 参照）。
+
+使い方:
+    python backend/scripts/importtime_budget.py
+    python backend/scripts/importtime_budget.py --module api.handler --budget-ms 1500 --top 30
+    python backend/scripts/importtime_budget.py --module jobs.ai_job_worker_handler --forbid ""
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+DEFAULT_MODULE = "api.handler"
+# CI ランナーのばらつきを見込んだ上限（ローカル計測で約 0.9 秒）。
+DEFAULT_BUDGET_MS = 1500.0
+DEFAULT_FORBIDDEN = ("strands", "bs4", "httpx", "services.ai_job_executors")
+
+# "import time:  self [us] | cumulative | imported package"
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """-X importtime の出力を (module, self_us, cumulative_us, depth) のリストにする。"""
+    entries = []
+    for line in stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return entries
+
+
+def profile_once(module: str) -> List[Tuple[str, int, int, int]]:
+    env = dict(os.environ)
+    # モジュールレベルでクライアントを生成するサービスがあってもリージョン解決で落ちないようにする。
+    env.setdefault("AWS_DEFAULT_REGION", "ap-northeast-1")
+    env["PYTHONPATH"] = SRC_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def check(
+    module: str,
+    entries: Sequence[Tuple[str, int, int, int]],
+    total_ms: float,
+    budget_ms: float,
+    forbidden: Sequence[str],
+) -> List[str]:
+    """予算・禁止モジュールの違反メッセージを返す（空なら合格）。"""
+    violations = []
+    if budget_ms > 0 and total_ms > budget_ms:
+        violations.append(f"import {module} took {total_ms:.0f}ms (budget {budget_ms:.0f}ms)")
+    loaded = {name for name, _, _, _ in entries}
+    for name in forbidden:
+        if name in loaded:
+            violations.append(f"import {module} loaded {name} (must be imported lazily)")
+    return violations
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default=DEFAULT_MODULE, help="module to import (relative to backend/src)")
+    parser.add_argument("--runs", type=int, default=3, help="runs; the median total is checked")
+    parser.add_argument("--top", type=int, default=20, help="number of modules to list")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.environ.get("IMPORT_TIME_BUDGET_MS", DEFAULT_BUDGET_MS)),
+        help="cumulative import time budget in ms (0 disables)",
+    )
+    parser.add_argument(
+        "--forbid",
+        default=",".join(DEFAULT_FORBIDDEN),
+        help="comma-separated modules that must not be imported",
+    )
+    args = parser.parse_args(argv)
+
+    runs = [profile_once(args.module) for _ in range(max(1, args.runs))]
+    totals_ms = []
+    for entries in runs:
+        top_level = [e for e in entries if e[0] == args.module]
+        totals_ms.append(top_level[-1][2] / 1000 if top_level else 0.0)
+    total_ms = statistics.median(totals_ms)
+    # 表示は中央値に最も近い回の内訳を使う。
+    entries = runs[min(range(len(runs)), key=lambda i: abs(totals_ms[i] - total_ms))]
+
+    cumulative: Dict[str, Tuple[int, int, int]] = {}
+    for name, self_us, cumulative_us, depth in entries:
+        cumulative[name] = (self_us, cumulative_us, depth)
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for name, (self_us, cumulative_us, depth) in sorted(cumulative.items(), key=lambda kv: -kv[1][1])[: args.top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {'  ' * depth}{name}")
+    print(f"\nimport {args.module}: median {total_ms:.0f}ms over {len(runs)} run(s), {len(entries)} modules")
+
+    forbidden = [name.strip() for name in args.forbid.split(",") if name.strip()]
+    violations = check(args.module, entries, total_ms, args.budget_ms, forbidden)
+    for violation in violations:
+        print(f"FAIL: {violation}", file=sys.stderr)
+    if not violations:
+        print(f"OK: within {args.budget_ms:.0f}ms budget, no forbidden imports")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
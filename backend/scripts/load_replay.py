@@ -0,0 +1,610 @@
+#!/usr/bin/env python3
+"""Local traffic replay load generator for the API / LINE webhook Lambda handlers.
+
+合成ユーザー（LINE 連携済み、カード・デッキ・復習履歴付き）を投入し、以下のイベントを
+重み付きでランダムに生成して、スレッドプール（--concurrency）からハンドラーを
+プロセス内で直接呼び出す。イベント種別ごとにレイテンシ（p50 / p90 / p99 / 最大）・
+スループット・エラー率を集計する。
+
+  rest:  api/handler.handler 向けの HTTP API (v2) イベント。requestContext の JWT クレーム
+         （sub）に合成ユーザーを設定する（API Gateway の JWT オーソライザー通過後と同じ形）。
+  line:  webhook/line_handler.handler 向けの LINE webhook。--channel-secret で署名した
+         x-line-signature を付ける（postback start / reveal / grade、テキスト、URL）。
+
+依存サービスは次のどちらか。いずれもテーブルは template.yaml の定義から作成する
+（tests/budget/dataset.py と共通）。
+
+  moto（既定）:   プロセス内の moto。Docker 不要。ハンドラーと moto が同じプロセス（GIL）で
+                 CPU を取り合うため、絶対値より変更前後の比較に使う。moto はスレッド間の
+                 同時更新に弱く、高い --concurrency では稀に 404 などが出る。
+  ローカル:       --dynamodb-endpoint（make local-db の DynamoDB Local）と
+                 --sqs-endpoint（make local-sqs の ElasticMQ）。テーブル名は
+                 --table-prefix で開発用データと分ける。
+
+LINE Messaging API（reply / push）は 127.0.0.1 上のスタブサーバーに向け、
+--line-latency-ms の固定遅延で 200 を返す。AI 生成・URL 取り込みは SQS への enqueue
+までを計測する（ワーカーは起動しない）。
+
+使い方:
+    python backend/scripts/load_replay.py --requests 2000 --concurrency 8
+    python backend/scripts/load_replay.py --duration 60 --concurrency 16 \\
+        --dynamodb-endpoint http://localhost:8000 --sqs-endpoint http://localhost:9324
+    python backend/scripts/load_replay.py --mix "line postback grade:5,rest POST /reviews/{card_id}:5" \\
+        --output load-report.json
+"""
+
+import argparse
+import base64
+import hashlib
+import hmac
+import itertools
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+
+import boto3
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(BACKEND_DIR, "src"))
+sys.path.insert(0, BACKEND_DIR)
+
+# NOTE: backend/src 配下（と tests.budget.dataset）のモジュールは configure_environment()
+# の後で import する。Powertools の Logger は最初の生成時に LOG_LEVEL を読み、サービスは
+# import 時に boto3 クライアントを作るため。
+
+REGION = "ap-northeast-1"
+DEFAULT_CHANNEL_SECRET = "load-replay-channel-secret"
+
+# 重みは LIFF / LINE の利用実態（復習が大半、AI 生成は低頻度）に合わせた既定値。
+DEFAULT_MIX = ",".join(
+    [
+        "rest GET /users/me:6",
+        "rest GET /bootstrap:4",
+        "rest GET /cards/due:16",
+        "rest GET /cards:6",
+        "rest GET /cards/search:3",
+        "rest POST /reviews/{card_id}:18",
+        "rest POST /cards:4",
+        "rest GET /decks:4",
+        "rest GET /stats:3",
+        "rest POST /cards/generate:1",
+        "line postback start:8",
+        "line postback reveal:8",
+        "line postback grade:12",
+        "line message text:4",
+        "line message url:1",
+    ]
+)
+
+
+@dataclass
+class LoadUser:
+    """投入済みの合成ユーザー（イベント生成に使う ID）。"""
+
+    user_id: str
+    line_user_id: str
+    deck_ids: List[str]
+    card_ids: List[str]
+
+
+@dataclass(frozen=True)
+class EventType:
+    name: str
+    kind: str  # "rest" | "line"
+    # (ユーザー, 乱数) → ハンドラーに渡すイベント
+    build: Callable[[LoadUser, random.Random], Dict[str, Any]]
+    expected: Tuple[int, ...]
+
+
+@dataclass
+class Sample:
+    event_type: str
+    latency_ms: float
+    status: int
+    error: Optional[str] = None
+
+
+@dataclass
+class LoadContext:
+    """Lambda コンテキストの最小実装（Powertools の inject_lambda_context 用）。"""
+
+    function_name: str = "memoru-load-replay"
+    memory_limit_in_mb: int = 256
+    invoked_function_arn: str = "arn:aws:lambda:ap-northeast-1:123456789012:function:memoru-load-replay"
+    aws_request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+
+
+# ---------------------------------------------------------------------------
+# イベント生成
+# ---------------------------------------------------------------------------
+
+
+def rest_event(
+    method: str,
+    path: str,
+    user_id: str,
+    body: Optional[Dict[str, Any]] = None,
+    query: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """JWT オーソライザー通過後の HTTP API (payload v2) イベント。"""
+    now = datetime.now(timezone.utc)
+    event: Dict[str, Any] = {
+        "version": "2.0",
+        "routeKey": "$default",
+        "rawPath": path,
+        "rawQueryString": urlencode(query) if query else "",
+        "headers": {"content-type": "application/json", "user-agent": "load-replay"},
+        "requestContext": {
+            "accountId": "123456789012",
+            "apiId": "load-replay",
+            "authorizer": {"jwt": {"claims": {"sub": user_id, "iss": "http://localhost/realms/memoru"}, "scopes": []}},
+            "domainName": "localhost",
+            "domainPrefix": "localhost",
+            "http": {
+                "method": method,
+                "path": path,
+                "protocol": "HTTP/1.1",
+                "sourceIp": "127.0.0.1",
+                "userAgent": "load-replay",
+            },
+            "requestId": str(uuid.uuid4()),
+            "routeKey": "$default",
+            "stage": "$default",
+            "time": now.strftime("%d/%b/%Y:%H:%M:%S +0000"),
+            "timeEpoch": int(now.timestamp() * 1000),
+        },
+        "isBase64Encoded": False,
+    }
+    if body is not None:
+        event["body"] = json.dumps(body, ensure_ascii=False)
+    if query:
+        event["queryStringParameters"] = query
+    return event
+
+
+def sign(body: str, channel_secret: str) -> str:
+    """LINE の x-line-signature（HMAC-SHA256 / Base64）。"""
+    digest = hmac.new(channel_secret.encode("utf-8"), body.encode("utf-8"), hashlib.sha256).digest()
+    return base64.b64encode(digest).decode("utf-8")
+
+
+def line_event(line_user_id: str, payload: Dict[str, Any], channel_secret: str) -> Dict[str, Any]:
+    """署名付きの LINE webhook イベント（API Gateway 経由の形）。"""
+    body = json.dumps(
+        {
+            "destination": "Uload-replay",
+            "events": [
+                {
+                    "webhookEventId": uuid.uuid4().hex.upper(),
+                    "timestamp": int(time.time() * 1000),
+                    "mode": "active",
+                    "source": {"type": "user", "userId": line_user_id},
+                    "replyToken": uuid.uuid4().hex,
+                    "deliveryContext": {"isRedelivery": False},
+                    **payload,
+                }
+            ],
+        },
+        ensure_ascii=False,
+    )
+    return {
+        "body": body,
+        "headers": {"content-type": "application/json", "x-line-signature": sign(body, channel_secret)},
+        "isBase64Encoded": False,
+    }
+
+
+def event_types(channel_secret: str) -> Dict[str, EventType]:
+    """既知のイベント種別（--mix で参照する名前 → 生成関数）。"""
+
+    def rest(name: str, method: str, path: str, expected: Tuple[int, ...], body=None, query=None) -> EventType:
+        def build(user: LoadUser, rng: random.Random) -> Dict[str, Any]:
+            card_id = rng.choice(user.card_ids)
+            resolved = path.format(card_id=card_id)
+            return rest_event(method, resolved, user.user_id, body(user, rng) if body else None, query)
+
+        return EventType(f"rest {name}", "rest", build, expected)
+
+    def line(name: str, payload: Callable[[LoadUser, random.Random], Dict[str, Any]]) -> EventType:
+        def build(user: LoadUser, rng: random.Random) -> Dict[str, Any]:
+            return line_event(user.line_user_id, payload(user, rng), channel_secret)
+
+        return EventType(f"line {name}", "line", build, (200,))
+
+    def postback(data: Callable[[LoadUser, random.Random], str]):
+        return lambda user, rng: {"type": "postback", "postback": {"data": data(user, rng)}}
+
+    def message(text: str):
+        return lambda user, rng: {
+            "type": "message",
+            "message": {"type": "text", "id": str(rng.getrandbits(60)), "text": text},
+        }
+
+    types = [
+        rest("GET /users/me", "GET", "/users/me", (200,)),
+        rest("GET /bootstrap", "GET", "/bootstrap", (200,)),
+        rest("GET /cards/due", "GET", "/cards/due", (200,)),
+        rest("GET /cards", "GET", "/cards", (200,)),
+        rest("GET /cards/search", "GET", "/cards/search", (200,), query={"q": "りんご"}),
+        rest(
+            "POST /reviews/{card_id}",
+            "POST",
+            "/reviews/{card_id}",
+            # 409: 同一カードへの同時採点（楽観ロックの競合応答）。
+            (200, 409),
+            body=lambda user, rng: {"grade": rng.choice((2, 3, 4, 4, 5))},
+        ),
+        rest(
+            "POST /cards",
+            "POST",
+            "/cards",
+            # 400: カード上限（CardService.MAX_CARDS_PER_USER）到達。
+            (201, 400),
+            body=lambda user, rng: {
+                "front": f"load {rng.getrandbits(32):08x}",
+                "back": "replay",
+                "deck_id": rng.choice(user.deck_ids),
+            },
+        ),
+        rest("GET /decks", "GET", "/decks", (200,)),
+        rest("GET /stats", "GET", "/stats", (200,)),
+        rest(
+            "POST /cards/generate",
+            "POST",
+            "/cards/generate",
+            # 429: ユーザー単位の AI レート制限（負荷試験では正常系として扱う）。
+            (202, 429),
+            body=lambda user, rng: {"input_text": "光合成は植物が光を使って糖を作る仕組み。", "card_count": 3},
+        ),
+        line("postback start", postback(lambda user, rng: "action=start")),
+        line("postback reveal", postback(lambda user, rng: f"action=reveal&card_id={rng.choice(user.card_ids)}")),
+        line(
+            "postback grade",
+            postback(lambda user, rng: f"action=grade&card_id={rng.choice(user.card_ids)}&grade={rng.randint(2, 5)}"),
+        ),
+        line("message text", message("こんにちは")),
+        line("message url", message("https://example.com/articles/photosynthesis")),
+    ]
+    return {event_type.name: event_type for event_type in types}
+
+
+def parse_mix(spec: str, known: Dict[str, EventType]) -> Tuple[List[EventType], List[float]]:
+    """ "name:weight,..." を (イベント種別, 重み) にする。"""
+    selected, weights = [], []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, weight = part.rpartition(":")
+        if name not in known:
+            raise ValueError(f"unknown event type: {name!r} (known: {', '.join(known)})")
+        selected.append(known[name])
+        weights.append(float(weight))
+    if not selected or sum(weights) <= 0:
+        raise ValueError(f"empty mix: {spec!r}")
+    return selected, weights
+
+
+# ---------------------------------------------------------------------------
+# 依存サービス（DynamoDB / SQS / LINE API スタブ）
+# ---------------------------------------------------------------------------
+
+
+class _LineApiStub(BaseHTTPRequestHandler):
+    """LINE Messaging API の reply / push を受けて 200 を返すスタブ。"""
+
+    latency_s = 0.0
+    calls = 0
+    _lock = threading.Lock()
+
+    def do_POST(self) -> None:  # noqa: N802 (BaseHTTPRequestHandler の規約)
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        with self._lock:
+            type(self).calls += 1
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def start_line_stub(latency_ms: float) -> ThreadingHTTPServer:
+    _LineApiStub.latency_s = latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _LineApiStub)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def configure_environment(args: argparse.Namespace) -> None:
+    """backend/src のモジュールを import する前に環境変数を設定する。"""
+    os.environ["LOG_LEVEL"] = os.environ["POWERTOOLS_LOG_LEVEL"] = args.log_level
+    os.environ["POWERTOOLS_TRACE_DISABLED"] = "true"
+    from tests.budget.dataset import table_names
+
+    for name, value in {
+        "AWS_ACCESS_KEY_ID": "local",
+        "AWS_SECRET_ACCESS_KEY": "local",
+        "AWS_DEFAULT_REGION": REGION,
+    }.items():
+        os.environ.setdefault(name, value)
+    os.environ.update(
+        {
+            "ENVIRONMENT": "load",
+            **table_names(args.table_prefix),
+        }
+    )
+    # enqueue 経路を計測するため inline 実行は無効にする。
+    for name in ("AI_JOB_WORKER_MODE", "URL_WORKER_MODE", "LINE_CHANNEL_SECRET_ARN", "AWS_ENDPOINT_URL"):
+        os.environ.pop(name, None)
+    for name, value in (("DYNAMODB_ENDPOINT_URL", args.dynamodb_endpoint), ("SQS_ENDPOINT_URL", args.sqs_endpoint)):
+        if value:
+            os.environ[name] = value
+        else:
+            os.environ.pop(name, None)
+
+
+def create_queues(prefix: str, endpoint_url: Optional[str]) -> None:
+    sqs = boto3.client("sqs", region_name=REGION, endpoint_url=endpoint_url)
+    for env, suffix in (
+        ("AI_JOB_QUEUE_URL", "ai-jobs"),
+        ("AI_JOB_HEAVY_QUEUE_URL", "ai-jobs-heavy"),
+        ("URL_GENERATE_QUEUE_URL", "url-generate"),
+    ):
+        os.environ[env] = sqs.create_queue(QueueName=f"{prefix}-{suffix}")["QueueUrl"]
+
+
+def seed_users(dynamodb: Any, prefix: str, users: int, cards: int) -> List[LoadUser]:
+    """LINE 連携済みユーザーを users 人（各 cards 枚）投入する。"""
+    from models.deck import Deck
+    from models.user import User
+    from tests.budget.dataset import DECK_COUNT, Dataset, build_cards, search_postings, table_names
+
+    names = table_names(prefix)
+    now = datetime.now(timezone.utc)
+    run_id = uuid.uuid4().hex[:8]
+    seeded, items = [], {"USERS_TABLE": [], "DECKS_TABLE": [], "CARDS_TABLE": [], "REVIEWS_TABLE": [], "CARD_SEARCH_TABLE": []}
+    for index in range(users):
+        user_id = f"load-{run_id}-{index:04d}"
+        line_user_id = "U" + hashlib.md5(user_id.encode()).hexdigest()
+        decks = [Deck(user_id=user_id, name=f"deck {d}", created_at=now - timedelta(days=d)) for d in range(DECK_COUNT)]
+        deck_ids = [deck.deck_id for deck in decks]
+        collected = Dataset(cards=cards, user_id=user_id)
+        user_cards, reviews = build_cards(user_id, cards, deck_ids, now, collected)
+        user = User(user_id=user_id, line_user_id=line_user_id, display_name=user_id, created_at=now - timedelta(days=120))
+        user_item = user.to_dynamodb_item()
+        user_item["card_count"] = cards
+        items["USERS_TABLE"].append(user_item)
+        items["DECKS_TABLE"].extend(deck.to_dynamodb_item() for deck in decks)
+        items["CARDS_TABLE"].extend(user_cards)
+        items["REVIEWS_TABLE"].extend(reviews)
+        items["CARD_SEARCH_TABLE"].extend(search_postings(user_cards))
+        seeded.append(LoadUser(user_id, line_user_id, deck_ids, collected.card_ids))
+    for env, table_items in items.items():
+        with dynamodb.Table(names[env]).batch_writer() as writer:
+            for item in table_items:
+                writer.put_item(Item=item)
+    return seeded
+
+
+# ---------------------------------------------------------------------------
+# 実行と集計
+# ---------------------------------------------------------------------------
+
+
+_UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE)
+
+
+def _error_detail(response: Dict[str, Any]) -> str:
+    """エラー応答の本文から集計キー用のメッセージを取り出す（ID は伏せて種類ごとにまとめる）。"""
+    body = response.get("body") or ""
+    try:
+        parsed = json.loads(body)
+        if isinstance(parsed, dict):
+            body = str(parsed.get("error") or parsed.get("message") or body)
+    except ValueError:
+        pass
+    return _UUID_RE.sub("<id>", str(body))[:100]
+
+
+def run_load(
+    invoke: Dict[str, Callable[[Dict[str, Any], Any], Dict[str, Any]]],
+    users: Sequence[LoadUser],
+    mix: Tuple[List[EventType], List[float]],
+    concurrency: int,
+    requests: int,
+    duration: float,
+    seed: int,
+) -> Tuple[List[Sample], float]:
+    """requests 件（または duration 秒）を concurrency 並列で実行し (サンプル, 経過秒) を返す。"""
+    types, weights = mix
+    counter = itertools.count()
+    samples: List[Sample] = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration if duration else None
+
+    def worker(worker_id: int) -> None:
+        rng = random.Random(seed * 1000 + worker_id)
+        local: List[Sample] = []
+        while True:
+            if deadline is not None:
+                if time.perf_counter() >= deadline:
+                    break
+            elif next(counter) >= requests:
+                break
+            event_type = rng.choices(types, weights)[0]
+            event = event_type.build(rng.choice(users), rng)
+            started = time.perf_counter()
+            try:
+                response = invoke[event_type.kind](event, LoadContext())
+                status, error = int(response.get("statusCode", 0)), None
+                if status not in event_type.expected:
+                    error = f"HTTP {status}: {_error_detail(response)}"
+            except Exception as e:  # noqa: BLE001 - ハンドラー外に漏れた例外もエラーとして数える
+                status, error = 0, f"{type(e).__name__}: {e}"
+            local.append(Sample(event_type.name, (time.perf_counter() - started) * 1000, status, error))
+        with lock:
+            samples.extend(local)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(worker, i) for i in range(concurrency)]:
+            future.result()
+    return samples, time.perf_counter() - started
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    """nearest-rank 法のパーセンタイル。"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), int(round(q * len(sorted_values) + 0.5))))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples: Sequence[Sample], elapsed: float) -> List[Dict[str, Any]]:
+    """イベント種別ごと（と全体）の集計。"""
+    groups: Dict[str, List[Sample]] = {}
+    for sample in samples:
+        groups.setdefault(sample.event_type, []).append(sample)
+    rows = []
+    for name, group in sorted(groups.items()) + [("TOTAL", list(samples))]:
+        latencies = sorted(s.latency_ms for s in group)
+        errors = [s for s in group if s.error]
+        statuses: Dict[str, int] = {}
+        for s in group:
+            statuses[str(s.status)] = statuses.get(str(s.status), 0) + 1
+        error_kinds: Dict[str, int] = {}
+        for s in errors:
+            error_kinds[s.error] = error_kinds.get(s.error, 0) + 1
+        rows.append(
+            {
+                "event_type": name,
+                "count": len(group),
+                "throughput_rps": round(len(group) / elapsed, 2) if elapsed else 0.0,
+                "errors": len(errors),
+                "error_rate": round(len(errors) / len(group), 4) if group else 0.0,
+                "p50_ms": round(_percentile(latencies, 0.50), 1),
+                "p90_ms": round(_percentile(latencies, 0.90), 1),
+                "p99_ms": round(_percentile(latencies, 0.99), 1),
+                "max_ms": round(latencies[-1], 1) if latencies else 0.0,
+                "mean_ms": round(statistics.fmean(latencies), 1) if latencies else 0.0,
+                "statuses": statuses,
+                "error_kinds": dict(sorted(error_kinds.items(), key=lambda kv: -kv[1])[:5]),
+            }
+        )
+    return rows
+
+
+def _print_report(rows: Sequence[Dict[str, Any]], elapsed: float, line_calls: int) -> None:
+    width = max(len(row["event_type"]) for row in rows)
+    print(f"{'event type':<{width}} {'count':>7} {'rps':>8} {'err%':>6} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}")
+    for row in rows:
+        if row["event_type"] == "TOTAL":
+            print("-" * (width + 60))
+        print(
+            f"{row['event_type']:<{width}} {row['count']:>7} {row['throughput_rps']:>8.1f} "
+            f"{row['error_rate'] * 100:>5.1f}% {row['p50_ms']:>8.1f} {row['p90_ms']:>8.1f} "
+            f"{row['p99_ms']:>8.1f} {row['max_ms']:>8.1f}"
+        )
+    print(f"\nelapsed {elapsed:.1f}s, LINE API stub calls {line_calls} (latencies in ms)")
+    for row in rows:
+        if row["event_type"] != "TOTAL" and row["error_kinds"]:
+            print(f"  {row['event_type']}: {row['error_kinds']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20, help="synthetic LINE-linked users")
+    parser.add_argument("--cards", type=int, default=200, help="cards per user")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent invocations (threads)")
+    parser.add_argument("--requests", type=int, default=500, help="total invocations (ignored with --duration)")
+    parser.add_argument("--duration", type=float, default=0, help="run for N seconds instead of --requests")
+    parser.add_argument("--warmup", type=int, default=20, help="invocations excluded from the report")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="event mix (name:weight,...)")
+    parser.add_argument("--list-events", action="store_true", help="list event type names and exit")
+    parser.add_argument("--seed", type=int, default=1, help="random seed for the event sequence")
+    parser.add_argument("--channel-secret", default=DEFAULT_CHANNEL_SECRET, help="LINE channel secret used to sign")
+    parser.add_argument("--line-latency-ms", type=float, default=20.0, help="LINE API stub response latency")
+    parser.add_argument("--dynamodb-endpoint", help="DynamoDB Local endpoint (default: in-process moto)")
+    parser.add_argument("--sqs-endpoint", help="ElasticMQ endpoint (default: in-process moto)")
+    parser.add_argument("--table-prefix", default="memoru-load", help="table / queue name prefix")
+    parser.add_argument("--log-level", default="WARNING", help="LOG_LEVEL for the handlers")
+    parser.add_argument("--output", help="write the per-event-type report as JSON")
+    args = parser.parse_args(argv)
+
+    known = event_types(args.channel_secret)
+    if args.list_events:
+        print("\n".join(known))
+        return 0
+    mix = parse_mix(args.mix, known)
+    if bool(args.dynamodb_endpoint) != bool(args.sqs_endpoint):
+        parser.error("--dynamodb-endpoint and --sqs-endpoint must be given together")
+
+    configure_environment(args)
+    with ExitStack() as stack:
+        if not args.dynamodb_endpoint:
+            from moto import mock_aws
+
+            stack.enter_context(mock_aws())
+        dynamodb = boto3.resource("dynamodb", region_name=REGION, endpoint_url=args.dynamodb_endpoint)
+        from tests.budget.dataset import create_tables
+
+        create_tables(dynamodb, args.table_prefix, exist_ok=True)
+        create_queues(args.table_prefix, args.sqs_endpoint)
+        started = time.perf_counter()
+        users = seed_users(dynamodb, args.table_prefix, args.users, args.cards)
+        print(f"seeded {len(users)} users x {args.cards} cards in {time.perf_counter() - started:.1f}s")
+
+        # サービスの singleton は import 時に生成されるため、環境構築後に import する。
+        from api import handler as api_handler
+        from services.line_service import LineService
+        from webhook import dependencies as deps
+        from webhook import line_handler
+
+        server = start_line_stub(args.line_latency_ms)
+        stack.callback(server.shutdown)
+        line_service = LineService(channel_access_token="load-replay-token", channel_secret=args.channel_secret)
+        line_service.API_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v2/bot"
+        deps.line_service = line_service
+
+        invoke = {"rest": api_handler.handler, "line": line_handler.handler}
+        if args.warmup:
+            run_load(invoke, users, mix, args.concurrency, args.warmup, 0, args.seed + 1)
+        _LineApiStub.calls = 0
+        samples, elapsed = run_load(invoke, users, mix, args.concurrency, args.requests, args.duration, args.seed)
+
+    rows = summarize(samples, elapsed)
+    _print_report(rows, elapsed, _LineApiStub.calls)
+    if args.output:
+        report = {
+            "config": {k: v for k, v in vars(args).items() if k not in ("output", "channel_secret", "list_events")},
+            "elapsed_sec": round(elapsed, 2),
+            "line_api_calls": _LineApiStub.calls,
+            "event_types": rows,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 1 if any(row["errors"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,526 @@
+#!/usr/bin/env python3
+"""Long-horizon SRS workload simulator (offline).
+
+合成ユーザー数千人 × 365 日の学習を仮想時刻で再生し、スケジューラー
+（services/srs.py の calculate_sm2 / calculate_next_review_boundary）が生む
+負荷を日ごとに集計する。AWS・ネットワークは使わない。
+
+  due:     日ごとの期限到来カード数（合計 / ユーザーあたり p95・最大）と復習数。
+  push:    due push（jobs/due_push_handler.py, rate(5 minutes)）の通知数と、
+           5 分スロットあたりの最大通知数（notification_time × タイムゾーン分布で決まる）。
+  item:    review_history（最大 100 件）の伸びによるカードアイテムサイズ（p95・最大、
+           DynamoDB のアイテムサイズ算出規則で概算）。
+  calls:   復習・通知に伴う DynamoDB 呼び出し数の概算（tests/budget の予算値を既定に使う）。
+
+カードは 1 枚ずつではなく「ユーザー × 期限日 × (SM-2 状態, 履歴件数)」のコホート単位で扱い、
+状態遷移（calculate_sm2）と期限日（calculate_next_review_boundary）は本番の関数を
+仮想時刻 ``now`` で呼び出した結果をキャッシュして使う。処理量は復習枚数に比例し
+（ローカル計測で約 15 万枚/秒）、既定設定（1,000 ユーザー × 365 日）で 1 分程度、
+CI の比較（--users 200）で 15 秒程度。
+
+--baseline を指定すると、サマリーの「増えると悪化する」指標が基準値から --tolerance
+（割合）を超えて増えた場合に終了コード 1 を返す。
+
+使い方:
+    python backend/scripts/srs_simulator.py
+    python backend/scripts/srs_simulator.py --users 5000 --days 365 --every 7 --output srs-sim.json
+    python backend/scripts/srs_simulator.py --grades "0:0.05,1:0.05,2:0.1,3:0.3,4:0.3,5:0.2" \\
+        --timezones "Asia/Tokyo:0.5,America/New_York:0.5" --new-cards "10:1"
+    # 基準値の更新と比較（CI と同じ設定で生成すること）
+    python backend/scripts/srs_simulator.py --users 200 --no-daily --output backend/scripts/srs_simulator_baseline.json
+    python backend/scripts/srs_simulator.py --users 200 --baseline backend/scripts/srs_simulator_baseline.json
+"""
+
+import argparse
+import itertools
+import json
+import math
+import os
+import random
+import sys
+import time
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.srs import (  # noqa: E402
+    ReviewHistoryEntry,
+    add_review_history,
+    calculate_next_review_boundary,
+    calculate_sm2,
+    to_user_local_date,
+)
+
+DEFAULT_GRADES = "0:0.03,1:0.03,2:0.06,3:0.18,4:0.45,5:0.25"
+DEFAULT_NEW_CARDS = "0:0.3,3:0.3,5:0.2,10:0.15,30:0.05"
+DEFAULT_TIMEZONES = "Asia/Tokyo:0.8,America/Los_Angeles:0.1,Europe/London:0.1"
+DEFAULT_NOTIFICATION_TIMES = "07:00:0.2,08:00:0.2,09:00:0.3,12:00:0.1,21:00:0.2"
+# CardService.MAX_CARDS_PER_USER と同じ。
+DEFAULT_MAX_CARDS = 2000
+# review_history の保持件数（add_review_history の max_entries 既定値）。
+MAX_HISTORY = 100
+# tests/budget/test_query_budget.py の "POST /reviews/{id}" / "due push" の呼び出し予算。
+DEFAULT_CALLS_PER_REVIEW = 5
+DEFAULT_CALLS_PER_PUSH = 3
+SLOT_MINUTES = 5
+
+# 履歴以外の属性（front / back / tags / deck_id / 各種日時）を持つカードアイテムの概算サイズ。
+BASE_CARD_ITEM_BYTES = 600
+
+# サマリーのうち、基準値より増えたら悪化とみなす指標。
+REGRESSION_METRICS = (
+    "peak_due",
+    "peak_user_due_p95",
+    "peak_slot_pushes",
+    "total_reviews",
+    "total_pushes",
+    "estimated_dynamodb_calls",
+    "final_item_bytes_p95",
+    "final_item_bytes_max",
+)
+
+# (repetitions, ease_factor, interval)
+SM2State = Tuple[int, float, int]
+# (SM-2 状態, review_history の件数)
+CardState = Tuple[SM2State, int]
+NEW_CARD: CardState = ((0, 2.5, 0), 0)
+# calculate_sm2 の next_review_at は使わない（期限日は calculate_next_review_boundary で求める）。
+SM2_NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def parse_distribution(spec: str, cast=str) -> Tuple[List, List[float]]:
+    """ "value:weight,value:weight" を (values, weights) にする（value 内の ":" は許容）。"""
+    values, weights = [], []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        value, _, weight = part.rpartition(":")
+        if not value:
+            raise ValueError(f"invalid distribution entry: {part!r} (expected value:weight)")
+        values.append(cast(value))
+        weights.append(float(weight))
+    if not values or sum(weights) <= 0:
+        raise ValueError(f"empty distribution: {spec!r}")
+    return values, weights
+
+
+def _dynamodb_size(value) -> int:
+    """DynamoDB のアイテムサイズ規則による概算バイト数（属性名 + 値）。"""
+    if isinstance(value, dict):
+        return 3 + sum(len(k.encode()) + _dynamodb_size(v) + 1 for k, v in value.items())
+    if isinstance(value, list):
+        return 3 + sum(_dynamodb_size(v) + 1 for v in value)
+    if isinstance(value, bool) or value is None:
+        return 1
+    if isinstance(value, (int, float)):
+        return 1 + math.ceil(len(str(abs(value)).replace(".", "").lstrip("0") or "0") / 2)
+    return len(str(value).encode())
+
+
+def history_entry_bytes() -> int:
+    """review_service が書き込む履歴 1 件分（undo 用フィールド込み）の概算サイズ。"""
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    entry = add_review_history(
+        [],
+        ReviewHistoryEntry(
+            reviewed_at=now,
+            grade=4,
+            ease_factor_before=2.5,
+            ease_factor_after=2.5,
+            interval_before=6,
+            interval_after=15,
+            repetitions_before=2,
+            repetitions_after=3,
+            next_review_at_before=now.isoformat(),
+            next_review_at_after=(now + timedelta(days=15)).isoformat(),
+        ),
+    )[0]
+    return _dynamodb_size(entry) + 1
+
+
+@dataclass
+class SimConfig:
+    users: int = 1000
+    days: int = 365
+    seed: int = 1
+    start: date = date(2026, 1, 5)
+    grades: str = DEFAULT_GRADES
+    new_cards: str = DEFAULT_NEW_CARDS
+    timezones: str = DEFAULT_TIMEZONES
+    notification_times: str = DEFAULT_NOTIFICATION_TIMES
+    day_start_hour: int = 4
+    review_rate: float = 0.85
+    max_reviews_per_day: int = 200
+    max_cards: int = DEFAULT_MAX_CARDS
+    calls_per_review: int = DEFAULT_CALLS_PER_REVIEW
+    calls_per_push: int = DEFAULT_CALLS_PER_PUSH
+
+
+@dataclass
+class SimUser:
+    timezone: str
+    notification_time: Tuple[int, int]
+    new_cards_per_day: int
+    review_rate: float
+    cards: int = 0
+    # 期限到来済み（未復習）のカード: 状態 → 枚数
+    overdue: Dict[CardState, int] = field(default_factory=dict)
+    # 期限日（シミュレーション日）→ 状態 → 枚数
+    buckets: Dict[int, Dict[CardState, int]] = field(default_factory=dict)
+
+
+class Scheduler:
+    """本番のスケジューラー関数を仮想時刻で呼び、結果をキャッシュする。
+
+    calculate_sm2 は SM-2 状態ごとに全 grade 分の遷移表（row）を 1 回だけ作り、
+    calculate_next_review_boundary は (timezone, 復習時刻, 日, interval) ごとに 1 回だけ呼ぶ。
+    """
+
+    def __init__(self, start: date, day_start_hour: int):
+        self.start = start
+        self.day_start_hour = day_start_hour
+        self.rows: Dict[SM2State, List[SM2State]] = {}
+        self._due_days: Dict[Tuple[str, Tuple[int, int]], Dict[int, int]] = {}
+        self._due_days_day = -1
+        self._slot: Dict[Tuple[str, int, Tuple[int, int]], datetime] = {}
+        self.boundary_calls = 0
+
+    def local_time(self, tz: str, day: int, hm: Tuple[int, int]) -> datetime:
+        """シミュレーション日 day のローカル hh:mm（UTC）。DST はここで反映される。"""
+        local_date = self.start + timedelta(days=day)
+        local = datetime(local_date.year, local_date.month, local_date.day, hm[0], hm[1], tzinfo=ZoneInfo(tz))
+        return local.astimezone(timezone.utc)
+
+    def row(self, state: SM2State) -> List[SM2State]:
+        """state から grade 0-5 で遷移した SM-2 状態（index = grade）。"""
+        reps, ease, interval = state
+        row = []
+        for grade in range(6):
+            result = calculate_sm2(grade, reps, ease, interval, now=SM2_NOW)
+            row.append((result.repetitions, result.ease_factor, result.interval))
+        self.rows[state] = row
+        return row
+
+    def due_days(self, tz: str, day: int, reviewed_at: Tuple[int, int]) -> Dict[int, int]:
+        """day の reviewed_at に復習したカードの interval → 次回期限（シミュレーション日）。"""
+        if day != self._due_days_day:
+            self._due_days.clear()
+            self._due_days_day = day
+        return self._due_days.setdefault((tz, reviewed_at), {})
+
+    def due_day(
+        self, due_days: Dict[int, int], tz: str, day: int, reviewed_at: Tuple[int, int], interval: int
+    ) -> int:
+        self.boundary_calls += 1
+        now = self.local_time(tz, day, reviewed_at)
+        boundary = calculate_next_review_boundary(interval, tz, self.day_start_hour, now=now)
+        local_date = date.fromisoformat(to_user_local_date(boundary, tz))
+        # 復習時刻が day_start_hour より前だと境界は同じ日の後半になる。その日の集計は
+        # 済んでいるため翌日に繰り越す。
+        due_day = due_days[interval] = max((local_date - self.start).days, day + 1)
+        return due_day
+
+    def push_slot(self, tz: str, day: int, hm: Tuple[int, int]) -> datetime:
+        """due push が通知する 5 分スロット（UTC）。"""
+        key = (tz, day, hm)
+        cached = self._slot.get(key)
+        if cached is None:
+            utc = self.local_time(tz, day, hm)
+            cached = self._slot[key] = utc.replace(minute=utc.minute - utc.minute % SLOT_MINUTES)
+        return cached
+
+
+def _percentile(sorted_values: Sequence[int], q: float) -> int:
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def _histogram_percentile(histogram: Sequence[int], q: float) -> int:
+    """index = 値 のヒストグラムから q 分位点の index を返す。"""
+    total = sum(histogram)
+    if total == 0:
+        return 0
+    threshold = q * total
+    running = 0
+    for value, count in enumerate(histogram):
+        running += count
+        if running > threshold:
+            return value
+    return len(histogram) - 1
+
+
+def _make_users(config: SimConfig, rng: random.Random) -> List[SimUser]:
+    tz_values, tz_weights = parse_distribution(config.timezones)
+    for tz in tz_values:
+        ZoneInfo(tz)  # 不正なタイムゾーンは開始前に失敗させる
+    nt_values, nt_weights = parse_distribution(
+        config.notification_times, lambda v: tuple(int(x) for x in v.split(":"))
+    )
+    nc_values, nc_weights = parse_distribution(config.new_cards, int)
+    users = []
+    for _ in range(config.users):
+        users.append(
+            SimUser(
+                timezone=rng.choices(tz_values, tz_weights)[0],
+                notification_time=rng.choices(nt_values, nt_weights)[0],
+                new_cards_per_day=rng.choices(nc_values, nc_weights)[0],
+                # 継続率はユーザーごとにばらつかせる（平均は review_rate）。
+                review_rate=min(1.0, max(0.0, rng.gauss(config.review_rate, 0.1))),
+            )
+        )
+    return users
+
+
+def simulate(config: SimConfig) -> Dict:
+    """シミュレーションを実行し {"config", "summary", "daily"} を返す。"""
+    rng = random.Random(config.seed)
+    grade_values, grade_weights = parse_distribution(config.grades, int)
+    for grade in grade_values:
+        if not 0 <= grade <= 5:
+            raise ValueError(f"grade must be 0-5, got {grade}")
+    grade_cum = list(itertools.accumulate(grade_weights))
+    grade_total = grade_cum[-1]
+    scheduler = Scheduler(config.start, config.day_start_hour)
+    users = _make_users(config, rng)
+    entry_bytes = history_entry_bytes()
+    rand = rng.random
+    rows = scheduler.rows
+
+    # 全カードの review_history 件数のヒストグラム（index = 件数）。
+    history_histogram = [0] * (MAX_HISTORY + 1)
+    slot_pushes: Counter = Counter()
+    daily = []
+    started = time.perf_counter()
+
+    for day in range(config.days):
+        due_total = reviews = new_total = pushes = 0
+        user_due: List[int] = []
+        day_slots: Counter = Counter()
+
+        for user in users:
+            # 1) 期限到来カード。overdue は前日までの未復習分で、挿入順が
+            #    next_review_at の古い順（GET /cards/due の並び）に相当する。
+            overdue = user.overdue
+            bucket = user.buckets.pop(day, None)
+            if bucket:
+                for card, count in bucket.items():
+                    overdue[card] = overdue.get(card, 0) + count
+
+            # 2) 新規カード（作成直後に期限到来）。
+            new = min(user.new_cards_per_day, config.max_cards - user.cards)
+            if new > 0:
+                overdue[NEW_CARD] = overdue.get(NEW_CARD, 0) + new
+                user.cards += new
+                new_total += new
+                history_histogram[0] += new
+
+            due = sum(overdue.values())
+            user_due.append(due)
+            if due == 0:
+                continue
+            due_total += due
+
+            # 3) due push（ローカル notification_time のスロットで 1 回）。
+            day_slots[scheduler.push_slot(user.timezone, day, user.notification_time)] += 1
+            pushes += 1
+
+            # 4) 復習（通知時刻に、古い順に上限枚数まで。残りは翌日以降に持ち越す）。
+            if rand() >= user.review_rate:
+                continue
+            if due <= config.max_reviews_per_day:
+                reviewed, user.overdue = overdue, {}
+                reviews += due
+            else:
+                reviewed = {}
+                remaining = config.max_reviews_per_day
+                reviews += remaining
+                for card, count in list(overdue.items()):
+                    taken = min(count, remaining)
+                    reviewed[card] = taken
+                    remaining -= taken
+                    if taken == count:
+                        del overdue[card]
+                    else:
+                        overdue[card] = count - taken
+                    if remaining == 0:
+                        break
+
+            tz, reviewed_at = user.timezone, user.notification_time
+            due_days = scheduler.due_days(tz, day, reviewed_at)
+            buckets = user.buckets
+            for (state, history_len), count in reviewed.items():
+                row = rows.get(state) or scheduler.row(state)
+                next_history = history_len + 1 if history_len < MAX_HISTORY else MAX_HISTORY
+                history_histogram[history_len] -= count
+                history_histogram[next_history] += count
+                graded: Iterable[Tuple[int, int]]
+                if count == 1:
+                    graded = ((grade_values[bisect_right(grade_cum, rand() * grade_total)], 1),)
+                else:
+                    graded = Counter(rng.choices(grade_values, cum_weights=grade_cum, k=count)).items()
+                for grade, graded_count in graded:
+                    next_state = row[grade]
+                    interval = next_state[2]
+                    due_day = due_days.get(interval) or scheduler.due_day(due_days, tz, day, reviewed_at, interval)
+                    target = buckets.get(due_day)
+                    if target is None:
+                        target = buckets[due_day] = {}
+                    card = (next_state, next_history)
+                    target[card] = target.get(card, 0) + graded_count
+
+        slot_pushes.update(day_slots)
+        user_due.sort()
+        active_cards = sum(history_histogram)
+        daily.append(
+            {
+                "day": day,
+                "date": (config.start + timedelta(days=day)).isoformat(),
+                "active_cards": active_cards,
+                "new_cards": new_total,
+                "due": due_total,
+                "reviews": reviews,
+                "user_due_p95": _percentile(user_due, 0.95),
+                "user_due_max": user_due[-1] if user_due else 0,
+                "pushes": pushes,
+                "peak_slot_pushes": max(day_slots.values(), default=0),
+                "item_bytes_p95": BASE_CARD_ITEM_BYTES + entry_bytes * _histogram_percentile(history_histogram, 0.95),
+                "item_bytes_max": BASE_CARD_ITEM_BYTES
+                + entry_bytes * max((h for h, c in enumerate(history_histogram) if c), default=0),
+                "estimated_dynamodb_calls": reviews * config.calls_per_review + pushes * config.calls_per_push,
+            }
+        )
+
+    elapsed = time.perf_counter() - started
+    peak_slot, peak_slot_count = max(slot_pushes.items(), key=lambda kv: kv[1], default=(None, 0))
+    final_cards = sum(history_histogram)
+    summary = {
+        "users": config.users,
+        "days": config.days,
+        "final_cards": final_cards,
+        "total_reviews": sum(d["reviews"] for d in daily),
+        "total_pushes": sum(d["pushes"] for d in daily),
+        "peak_due": max((d["due"] for d in daily), default=0),
+        "peak_user_due_p95": max((d["user_due_p95"] for d in daily), default=0),
+        "peak_user_due_max": max((d["user_due_max"] for d in daily), default=0),
+        "peak_slot_pushes": peak_slot_count,
+        "peak_slot_utc": peak_slot.isoformat() if peak_slot else None,
+        "estimated_dynamodb_calls": sum(d["estimated_dynamodb_calls"] for d in daily),
+        "history_entry_bytes": entry_bytes,
+        "final_item_bytes_p95": daily[-1]["item_bytes_p95"] if daily else 0,
+        "final_item_bytes_max": daily[-1]["item_bytes_max"] if daily else 0,
+        "final_table_bytes": BASE_CARD_ITEM_BYTES * final_cards
+        + entry_bytes * sum(h * c for h, c in enumerate(history_histogram)),
+        "elapsed_sec": round(elapsed, 2),
+        "sm2_states": len(scheduler.rows),
+        "boundary_calls": scheduler.boundary_calls,
+    }
+    config_dict = {k: (v.isoformat() if isinstance(v, date) else v) for k, v in vars(config).items()}
+    return {"config": config_dict, "summary": summary, "daily": daily}
+
+
+def compare(summary: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """基準値より tolerance を超えて悪化した指標の違反メッセージを返す（空なら合格）。"""
+    violations = []
+    for metric in REGRESSION_METRICS:
+        if metric not in baseline:
+            continue
+        limit = baseline[metric] * (1 + tolerance)
+        if summary.get(metric, 0) > limit:
+            violations.append(f"{metric}: {summary[metric]} > {baseline[metric]} (+{tolerance:.0%})")
+    return violations
+
+
+def _print_report(result: Dict, every: int) -> None:
+    print(f"{'day':>4} {'date':>10} {'cards':>9} {'new':>6} {'due':>8} {'reviews':>8} "
+          f"{'u.p95':>6} {'u.max':>6} {'pushes':>7} {'slot':>6} {'item.p95':>9} {'calls':>9}")
+    daily = result["daily"]
+    for d in daily:
+        if d["day"] % every and d is not daily[-1]:
+            continue
+        print(
+            f"{d['day']:>4} {d['date']:>10} {d['active_cards']:>9} {d['new_cards']:>6} {d['due']:>8} "
+            f"{d['reviews']:>8} {d['user_due_p95']:>6} {d['user_due_max']:>6} {d['pushes']:>7} "
+            f"{d['peak_slot_pushes']:>6} {d['item_bytes_p95']:>9} {d['estimated_dynamodb_calls']:>9}"
+        )
+    print()
+    for key, value in result["summary"].items():
+        print(f"{key:>26}: {value}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    defaults = SimConfig()
+    parser.add_argument("--users", type=int, default=defaults.users, help="synthetic users")
+    parser.add_argument("--days", type=int, default=defaults.days, help="simulated days")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="random seed")
+    parser.add_argument("--start", type=date.fromisoformat, default=defaults.start, help="first simulated local date")
+    parser.add_argument("--grades", default=defaults.grades, help="grade distribution (grade:weight,...)")
+    parser.add_argument("--new-cards", default=defaults.new_cards, help="per-user new cards/day distribution")
+    parser.add_argument("--timezones", default=defaults.timezones, help="timezone distribution (tz:weight,...)")
+    parser.add_argument(
+        "--notification-times",
+        default=defaults.notification_times,
+        help="notification_time distribution (HH:MM:weight,...)",
+    )
+    parser.add_argument("--day-start-hour", type=int, default=defaults.day_start_hour, help="users' day_start_hour")
+    parser.add_argument("--review-rate", type=float, default=defaults.review_rate, help="mean daily study probability")
+    parser.add_argument("--max-reviews-per-day", type=int, default=defaults.max_reviews_per_day)
+    parser.add_argument("--max-cards", type=int, default=defaults.max_cards, help="cards per user cap")
+    parser.add_argument("--calls-per-review", type=int, default=defaults.calls_per_review)
+    parser.add_argument("--calls-per-push", type=int, default=defaults.calls_per_push)
+    parser.add_argument("--every", type=int, default=30, help="print every N days")
+    parser.add_argument("--output", help="write the result as JSON")
+    parser.add_argument("--no-daily", action="store_true", help="omit per-day rows from --output")
+    parser.add_argument("--baseline", help="summary JSON to compare against (fails on regression)")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="allowed growth over the baseline")
+    args = parser.parse_args(argv)
+
+    config = SimConfig(
+        users=args.users,
+        days=args.days,
+        seed=args.seed,
+        start=args.start,
+        grades=args.grades,
+        new_cards=args.new_cards,
+        timezones=args.timezones,
+        notification_times=args.notification_times,
+        day_start_hour=args.day_start_hour,
+        review_rate=args.review_rate,
+        max_reviews_per_day=args.max_reviews_per_day,
+        max_cards=args.max_cards,
+        calls_per_review=args.calls_per_review,
+        calls_per_push=args.calls_per_push,
+    )
+    result = simulate(config)
+    _print_report(result, max(1, args.every))
+
+    if args.output:
+        output = dict(result)
+        if args.no_daily:
+            output.pop("daily")
+        with open(args.output, "w") as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get("config") != result["config"]:
+        print("WARN: baseline was produced with a different configuration", file=sys.stderr)
+    violations = compare(result["summary"], baseline["summary"], args.tolerance)
+    for violation in violations:
+        print(f"FAIL: {violation}", file=sys.stderr)
+    if not violations:
+        print(f"OK: within {args.tolerance:.0%} of {args.baseline}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""Content-negotiated response compression (gzip / brotli) for API Gateway HTTP API.
+
+カード一覧・期限カード（references 付き）・Tutor セッション履歴・ジョブ結果は数百 KB に
+なり得るが、LIFF の利用者はモバイル回線が多い。Lambda プロキシレスポンスの body を
+Accept-Encoding に応じて圧縮し、base64 化して ``isBase64Encoded: true`` で返す
+（API Gateway がバイナリへ戻してクライアントに送る）。
+
+- エンコーディング: brotli（src/requirements.txt で同梱。import できない環境では使わない）> gzip。
+  Accept-Encoding の q 値を尊重し、q=0 は拒否として扱う。
+- 対象: JSON / text の応答で、body が RESPONSE_COMPRESSION_MIN_BYTES（既定 1024 バイト）
+  以上のもの。204 / 304、base64 済み、Content-Encoding 付きの応答は触らない。
+  圧縮しても小さくならなければ元の応答を返す。
+- 圧縮対象になり得る応答には ``Vary: Accept-Encoding`` を付ける（共有キャッシュが
+  エンコーディング違いを混同しないため）。ETag は弱い ETag（api/conditional.py）なので
+  エンコーディングで変える必要はない。
+
+RESPONSE_COMPRESSION_ENABLED が "true" 以外（ローカル開発・テスト既定）では何もしない。
+"""
+
+import base64
+import functools
+import gzip
+import os
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import brotli as _brotli
+except ImportError:  # pragma: no cover - Lambda バンドルには含まれる
+    _brotli = None
+
+DEFAULT_MIN_BYTES = 1024
+# 速度と圧縮率の兼ね合い（gzip 6 で JSON 100 KB あたり約 1 ms。
+# tests/benchmarks/test_compression_bench.py）。
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+_COMPRESSIBLE_TYPES = ("application/json", "text/")
+_SKIP_STATUS = frozenset({204, 304})
+
+LambdaHandler = Callable[[Dict[str, Any], Any], Dict[str, Any]]
+
+
+def compression_enabled() -> bool:
+    return os.environ.get("RESPONSE_COMPRESSION_ENABLED", "").lower() == "true"
+
+
+def _min_bytes() -> int:
+    try:
+        return max(0, int(os.environ.get("RESPONSE_COMPRESSION_MIN_BYTES", DEFAULT_MIN_BYTES)))
+    except ValueError:
+        return DEFAULT_MIN_BYTES
+
+
+def _get_header(headers: Optional[Dict[str, Any]], name: str) -> Optional[str]:
+    """ヘッダーを大文字小文字を区別せずに取得する。"""
+    for key, value in (headers or {}).items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def parse_accept_encoding(value: Optional[str]) -> Dict[str, float]:
+    """Accept-Encoding ヘッダーを {エンコーディング: q 値} にする（不正な q は 0）。"""
+    result: Dict[str, float] = {}
+    for part in (value or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, raw = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(raw)
+                except ValueError:
+                    q = 0.0
+        result[coding] = q
+    return result
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Accept-Encoding から使用するエンコーディングを選ぶ（無ければ None）。
+
+    q 値が最大のものを選び、同点ならサーバー側の優先順（br > gzip）に従う。
+    """
+    prefs = parse_accept_encoding(accept_encoding)
+    wildcard = prefs.get("*", 0.0)
+    supported = (("br",) if _brotli is not None else ()) + ("gzip",)
+    best, best_q = None, 0.0
+    for coding in supported:
+        q = prefs.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress_bytes(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return _brotli.compress(data, quality=BROTLI_QUALITY)
+    # mtime=0: 同じ body から同じバイト列を作る（ヘッダーに時刻を埋め込まない）。
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _add_vary(headers: Dict[str, Any]) -> None:
+    for key, value in headers.items():
+        if key.lower() == "vary":
+            if "accept-encoding" not in value.lower():
+                headers[key] = f"{value}, Accept-Encoding"
+            return
+    headers["Vary"] = "Accept-Encoding"
+
+
+def compress_response(event: Dict[str, Any], response: Dict[str, Any]) -> Dict[str, Any]:
+    """Lambda プロキシレスポンスを Accept-Encoding に応じて圧縮する（対象外ならそのまま返す）。"""
+    if not compression_enabled() or not isinstance(response, dict):
+        return response
+    headers = response.get("headers") or {}
+    body = response.get("body")
+    content_type = (_get_header(headers, "content-type") or "").lower()
+    if (
+        not isinstance(body, str)
+        or response.get("isBase64Encoded")
+        or response.get("statusCode") in _SKIP_STATUS
+        or _get_header(headers, "content-encoding")
+        or not content_type.startswith(_COMPRESSIBLE_TYPES)
+    ):
+        return response
+
+    headers = dict(headers)
+    _add_vary(headers)
+    response = {**response, "headers": headers}
+    raw = body.encode("utf-8")
+    encoding = choose_encoding(_get_header(event.get("headers"), "accept-encoding"))
+    if encoding is None or len(raw) < _min_bytes():
+        return response
+    compressed = compress_bytes(raw, encoding)
+    if len(compressed) >= len(raw):
+        return response
+
+    headers["Content-Encoding"] = encoding
+    response["body"] = base64.b64encode(compressed).decode("ascii")
+    response["isBase64Encoded"] = True
+    return response
+
+
+def compressed(func: LambdaHandler) -> LambdaHandler:
+    """Lambda ハンドラーの戻り値に compress_response を適用するデコレーター。"""
+
+    @functools.wraps(func)
+    def wrapper(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+        return compress_response(event, func(event, context))
+
+    return wrapper
@@ -0,0 +1,155 @@
+"""Conditional GET (weak ETag / 304) for read-only Router endpoints.
+
+services/data_version.py のユーザー単位データバージョンから弱い ETag を組み立て、
+If-None-Match が一致した場合はルート関数（＝全件クエリ・集計）を実行せずに 304 を返す。
+
+ETag は W/"<data_version>-<time_bucket>-<query_hash>":
+  - data_version: カード・デッキ・復習・設定の変更で単調増加する。
+  - time_bucket: 「今日」や期限切れ判定など現在時刻に依存する集計（due 数・forecast・
+    streak）用。next_review_at は SRS 上ユーザーの日境界（day_start_hour）に正規化され、
+    タイムゾーンのオフセットは 15 分単位のため、15 分バケットで区切れば時刻経過による
+    集計値の変化を取りこぼさない。時刻に依存しないエンドポイントは 0 固定。
+  - query_hash: パスとクエリパラメータ（limit / cursor / days 等）の違いを区別する。
+
+ETag の値は強い整合性で読んだ data_version だが、本文は GSI や結果整合性の Query から
+組み立てるため、変更直後は新しいバージョンに古い本文が付き得る。そのまま ETag を付けると
+以後の 304 が古い本文を固定するため、最終変更（data_version_at）から
+DATA_VERSION_SETTLE_SECONDS 以内は ETag を付けずに通常応答する（ConditionalGetUnsettled）。
+本文を強い整合性読み取りだけで組み立てるルートは consistent で除外できる。
+同様に、別コンテナで更新された設定（timezone 等）が設定キャッシュに残ったまま新しい
+バージョンの ETag が付かないよう、同じ読み取りの settings_version より古いキャッシュ
+エントリは本文を組み立てる前に捨てる。
+
+ヒット率は CloudWatch EMF の ConditionalGetHit / ConditionalGetMiss（Route 次元）で
+観測する（ヒット率 = Hit / (Hit + Miss) をメトリクス数式で算出）。
+データバージョンの読み取りに失敗した場合は ETag を付けずに通常応答する（fail-open）。
+CONDITIONAL_GET_ENABLED が "true" 以外（ローカル開発・テスト既定）では何もしない。
+"""
+
+import functools
+import hashlib
+import os
+import time
+from typing import Any, Callable, Mapping, Optional, Union
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.event_handler import Response, content_types
+from aws_lambda_powertools.metrics import MetricUnit, single_metric
+
+from api.shared import get_user_id_from_context
+from services.data_version import DataVersionStore
+from services.user_settings_cache import user_settings_cache
+
+logger = Logger()
+
+TIME_BUCKET_SECONDS = 900
+# 変更後、GSI の伝播・結果整合性読み取りが追いつくまでの猶予（通常は 1 秒未満）。
+DATA_VERSION_SETTLE_SECONDS = 2.0
+METRICS_NAMESPACE_DEFAULT = "Memoru"
+
+_data_version_store: Optional[DataVersionStore] = None
+
+
+def _get_store() -> DataVersionStore:
+    """DataVersionStore を取得する（Lambda コンテナ内でキャッシュ）。"""
+    global _data_version_store
+    if _data_version_store is None:
+        _data_version_store = DataVersionStore()
+    return _data_version_store
+
+
+def build_etag(version: int, path: str, query: dict, time_sensitive: bool, now: Optional[float] = None) -> str:
+    """データバージョン・時刻バケット・クエリから弱い ETag を生成する。"""
+    bucket = int((now if now is not None else time.time()) // TIME_BUCKET_SECONDS) if time_sensitive else 0
+    canonical = path + "?" + "&".join(f"{k}={v}" for k, v in sorted(query.items()))
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:10]
+    return f'W/"{version}-{bucket}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match ヘッダー（カンマ区切り・"*" 可）が etag と弱比較で一致するか。"""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def _record(result: str, route: str) -> None:
+    try:
+        with single_metric(
+            name=f"ConditionalGet{result}",
+            unit=MetricUnit.Count,
+            value=1,
+            namespace=os.environ.get("POWERTOOLS_METRICS_NAMESPACE", METRICS_NAMESPACE_DEFAULT),
+        ) as metric:
+            metric.add_dimension(name="Route", value=route)
+    except Exception as e:  # メトリクス出力の失敗で応答を失敗させない
+        logger.debug("Failed to emit conditional GET metric", extra={"error": str(e)})
+
+
+def conditional_get(
+    router: Any,
+    route: str,
+    time_sensitive: bool = False,
+    consistent: Union[bool, Callable[[Mapping[str, str]], bool]] = False,
+) -> Callable:
+    """Router の GET ルート関数を条件付き GET 対応にするデコレーター。
+
+    ``@router.get(...)`` / ``@tracer.capture_method`` の内側に付ける。ルート関数が
+    dict を返した場合は ETag ヘッダー付きの 200 Response に包み、200 の Response を
+    返した場合はヘッダーを追加する。エラー応答（4xx/5xx）には ETag を付けない。
+
+    Args:
+        router: ルート関数が属する Router（current_event / JWT 取得用）。
+        route: メトリクスの Route 次元に使うルート名（例: "GET /decks"）。
+        time_sensitive: 現在時刻に依存する集計を返すエンドポイントなら True。
+        consistent: 本文を強い整合性読み取りだけで組み立てるなら True（変更直後でも
+            ETag を付ける）。クエリパラメータで読み方が変わるルートは、パラメータを受け取って
+            真偽を返す関数を渡す。
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if os.environ.get("CONDITIONAL_GET_ENABLED", "false").strip().lower() != "true":
+                return func(*args, **kwargs)
+            user_id = get_user_id_from_context(router)
+            data_version = _get_store().get(user_id)
+            if data_version is None:
+                return func(*args, **kwargs)
+            user_settings_cache.discard_if_older(user_id, data_version.settings_version)
+
+            event = router.current_event
+            query = event.query_string_parameters or {}
+            is_consistent = consistent(query) if callable(consistent) else consistent
+            if not is_consistent and time.time() - data_version.changed_at < DATA_VERSION_SETTLE_SECONDS:
+                _record("Unsettled", route)
+                return func(*args, **kwargs)
+
+            etag = build_etag(data_version.version, event.path, query, time_sensitive)
+            headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+            if etag_matches(event.headers.get("If-None-Match"), etag):
+                _record("Hit", route)
+                return Response(status_code=304, content_type=None, body="", headers=headers)
+
+            _record("Miss", route)
+            result = func(*args, **kwargs)
+            if isinstance(result, dict):
+                return Response(
+                    status_code=200,
+                    content_type=content_types.APPLICATION_JSON,
+                    body=result,
+                    headers=headers,
+                )
+            if isinstance(result, Response) and result.status_code == 200:
+                result.headers.update(headers)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -1,15 +1,16 @@
 """Main API handler for Memoru LIFF application.
 
 Routes API Gateway events to domain-specific handlers via Lambda Powertools Router.
+Domain routers are imported and registered on first use of their path prefix
+(api/lazy_routes.py) to keep cold starts independent of unrelated domains.
 Standalone Lambda handlers (grade_ai, advice) remain in this file
 (ai-async-jobs: いずれも同期検証 + ジョブ submit のみを行い 202 を返す).
 """
 
 import json
-from typing import Any
+from typing import Any, Optional
 
 from aws_lambda_powertools import Logger, Tracer
-from aws_lambda_powertools.event_handler import APIGatewayHttpResolver
 from aws_lambda_powertools.logging import correlation_paths
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
@@ -19,43 +20,42 @@ from api.shared import (
     make_job_accepted_event_response,
     map_ai_error_to_http,
 )
-from api.handlers.user_handler import router as user_router
-from api.handlers.cards_handler import router as cards_router
-from api.handlers.decks_handler import router as decks_router
-from api.handlers.review_handler import router as review_router
-from api.handlers.ai_handler import router as ai_router
-from api.handlers.ai_jobs_handler import router as ai_jobs_router
-from api.handlers.stats_handler import router as stats_router
-from api.handlers.browser_profile_handler import router as browser_profile_router
-from api.handlers.tutor_handler import router as tutor_router
+from api.compression import compressed
+from api.lazy_routes import LazyRouterResolver, eager_routers_enabled
 
 # Standalone handler dependencies
 from models.grading import GradeAnswerRequest
 from pydantic import ValidationError
 from services.ai_job_service import submit_ai_job
 from services.card_service import CardService, CardNotFoundError
+from utils import json_codec
+from utils.capacity_meter import capacity_scope
+from utils.profiler import profile_scope, profiling_enabled
+from utils.request_cache import request_cache
 
 logger = Logger()
 tracer = Tracer()
-app = APIGatewayHttpResolver()
+# レスポンスの dict → JSON とリクエストボディのパースは共通の高速コーデックを使う
+# （utils/json_codec.py。既定の json.dumps + Encoder と同じ値を出力する）。
+app = LazyRouterResolver(serializer=json_codec.dumps, json_body_deserializer=json_codec.loads)
 
 # 許可する language の許可リスト（ルーター経由の Pydantic Literal["ja", "en"] と対称にする）。
 # スタンドアロンハンドラーはクエリパラメーターを Pydantic 検証しないため、ここで明示的に検証する。
 ALLOWED_LANGUAGES = frozenset({"ja", "en"})
 
-# Register domain routers
-app.include_router(user_router)
-app.include_router(cards_router)
-app.include_router(decks_router)
-app.include_router(review_router)
-app.include_router(ai_router)
-app.include_router(ai_jobs_router)
-app.include_router(stats_router)
-app.include_router(browser_profile_router)
-app.include_router(tutor_router)
+# Domain routers are registered lazily per path prefix (see api/lazy_routes.py).
+if eager_routers_enabled():
+    app.include_all_routers()
 
-# Services for standalone Lambda handlers
-card_service = CardService()
+# Services for standalone Lambda handlers (created on first use; tests patch the global).
+card_service: Optional[CardService] = None
+
+
+def _get_card_service() -> CardService:
+    global card_service
+    if card_service is None:
+        card_service = CardService()
+    return card_service
 
 
 # Keep backward compatibility alias
@@ -67,7 +67,7 @@ def _make_lambda_response(status_code: int, body: dict) -> dict:
     return {
         "statusCode": status_code,
         "headers": {"Content-Type": "application/json"},
-        "body": json.dumps(body),
+        "body": json_codec.dumps(body),
     }
 
 
@@ -76,6 +76,7 @@ def _make_lambda_response(status_code: int, body: dict) -> dict:
 # =============================================================================
 
 
+@compressed
 def grade_ai_handler(event: dict, context: Any) -> dict:
     """POST /reviews/{cardId}/grade-ai の Lambda ハンドラー（ai-async-jobs: submit のみ）。
 
@@ -99,12 +100,12 @@ def grade_ai_handler(event: dict, context: Any) -> dict:
 
         body_str = event.get("body") or ""
         try:
-            body_dict = json.loads(body_str)
+            body_dict = json_codec.loads(body_str)
             request = GradeAnswerRequest(**body_dict)
         except json.JSONDecodeError:
             return _make_lambda_response(400, {"error": "Invalid request body"})
         except ValidationError as e:
-            return _make_lambda_response(400, {"error": "Invalid request", "details": json.loads(e.json())})
+            return _make_lambda_response(400, {"error": "Invalid request", "details": json_codec.loads(e.json())})
 
         logger.info(
             "Grade AI job submit",
@@ -117,7 +118,7 @@ def grade_ai_handler(event: dict, context: Any) -> dict:
 
         # fail-fast: カード存在＋所有権を submit 時に検証（ワーカー側でも再検証される）
         try:
-            card_service.get_card(user_id, card_id)
+            _get_card_service().get_card(user_id, card_id)
         except CardNotFoundError:
             return _make_lambda_response(404, {"error": "Not Found"})
 
@@ -137,6 +138,7 @@ def grade_ai_handler(event: dict, context: Any) -> dict:
         return _make_lambda_response(500, {"error": "Internal Server Error"})
 
 
+@compressed
 def advice_handler(event: dict, context: Any) -> dict:
     """POST /advice の Lambda ハンドラー（ai-async-jobs: submit のみ）。
 
@@ -175,6 +177,7 @@ def url_generate_handler(event: dict, context: Any) -> dict:
     """POST /cards/generate-from-url の Lambda ハンドラー。
 
     専用 Lambda 関数（120s タイムアウト、512MB メモリ）として実行される。
+    レスポンス圧縮は handler 側で適用される。
     """
     return handler(event, context)
 
@@ -186,6 +189,7 @@ def url_generate_handler(event: dict, context: Any) -> dict:
 
 @logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_HTTP)
 @tracer.capture_lambda_handler
+@compressed
 def handler(event: dict, context: LambdaContext) -> dict:
     """Lambda handler for API Gateway events."""
     # Stage path prefix補完:
@@ -198,4 +202,28 @@ def handler(event: dict, context: LambdaContext) -> dict:
     raw_path = event.get("rawPath", "/")
     if stage != "$default" and not raw_path.startswith(f"/{stage}"):
         event["rawPath"] = f"/{stage}{raw_path}"
-    return app.resolve(event, context)
+    # 同一アイテムの重複読み取りを 1 呼び出し内で共有する identity map を有効化する。
+    # ウォームコンテナで前回の呼び出しの値を返さないよう、呼び出しごとに破棄する。
+    request_cache.begin()
+    # DynamoDB の消費キャパシティをルート単位で集計する（DYNAMODB_CAPACITY_METRICS_ENABLED）。
+    # 採取対象のリクエストはプロファイルも取る（PROFILING_ENABLED。utils/profiler.py）。
+    profile_user_id = get_user_id_from_event(event) if profiling_enabled() else None
+    try:
+        with capacity_scope("NotFound") as capacity, profile_scope(
+            "NotFound",
+            request_id=getattr(context, "aws_request_id", None),
+            user_id=profile_user_id,
+            headers=event.get("headers"),
+        ) as profile:
+            try:
+                return app.resolve(event, context)
+            finally:
+                capacity.route = getattr(app, "matched_route", None) or "NotFound"
+                profile.name = capacity.route
+    finally:
+        stats = request_cache.end()
+        if stats["hits"] or stats["misses"]:
+            logger.info(
+                "Request cache stats",
+                extra={"request_cache_hits": stats["hits"], "request_cache_misses": stats["misses"]},
+            )
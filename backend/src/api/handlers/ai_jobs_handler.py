@@ -16,11 +16,12 @@ router = Router()
 ai_job_store = AiJobStore()
 
 # ポーリングレスポンスに含める属性。payload（リクエスト原文）や schema_version は
-# クライアントに不要なため返さない。
+# クライアントに不要なため返さない。progress は import_cards 等の長いジョブのみが持つ。
 _PUBLIC_FIELDS = (
     "job_id",
     "job_type",
     "status",
+    "progress",
     "result",
     "error",
     "created_at",
@@ -0,0 +1,120 @@
+"""Bootstrap API route handler (GET /bootstrap).
+
+アプリ起動時にフロントが個別に呼んでいた GET /users/me・/decks・/cards/due・/stats を
+1 リクエストにまとめる。ユーザー設定（timezone）は 1 回だけ取得し、残り 3 セクションは
+スレッドプールで並列に取得する。
+
+DynamoDB のリソース / クライアントは utils/dynamodb_client が払い出す（リソースは
+スレッドごと、クライアントはプロセス共有。utils/aws_clients）。セクションのスレッドが
+行うのはテーブルのアイテム操作だけで、実際の呼び出しは共有のクライアントに委譲されるため、
+同じサービスを複数セクションから呼んでもよい。
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Literal, Tuple
+
+from aws_lambda_powertools import Logger, Tracer
+from aws_lambda_powertools.event_handler import Response, content_types
+from aws_lambda_powertools.event_handler.api_gateway import Router
+
+from api.shared import get_user_id_from_context
+from models.bootstrap import BootstrapResponse, BootstrapSectionMeta
+from models.deck import DeckListResponse
+from services.deck_service import DeckService
+from services.review_service import ReviewService
+from services.stats_service import StatsService
+from services.user_service import UserService
+
+logger = Logger()
+tracer = Tracer()
+router = Router()
+
+user_service = UserService()
+deck_service = DeckService()
+review_service = ReviewService()
+stats_service = StatsService()
+
+
+def _load_decks(user_id: str) -> DeckListResponse:
+    """GET /decks と同じ内容（カード数・due 数付きデッキ一覧）を組み立てる。"""
+    decks = deck_service.list_decks(user_id)
+    deck_ids = [d.deck_id for d in decks]
+    card_counts = deck_service.get_deck_card_counts(user_id, deck_ids)
+    due_counts = deck_service.get_deck_due_counts(user_id, deck_ids)
+    return DeckListResponse(
+        decks=[
+            d.to_response(
+                card_count=card_counts.get(d.deck_id, 0),
+                due_count=due_counts.get(d.deck_id, 0),
+            )
+            for d in decks
+        ],
+        total=len(decks),
+    )
+
+
+def _timed(name: str, fn: Callable[[], Any]) -> Tuple[Any, BootstrapSectionMeta]:
+    """セクションを実行し、結果と所要時間を返す。失敗はログに残して None にする。"""
+    started = time.perf_counter()
+    status: Literal["ok", "error"] = "ok"
+    try:
+        result = fn()
+    except Exception as e:
+        logger.error("Bootstrap section failed", extra={"section": name, "error": str(e)})
+        result, status = None, "error"
+    duration_ms = round((time.perf_counter() - started) * 1000, 1)
+    return result, BootstrapSectionMeta(duration_ms=duration_ms, status=status)
+
+
+@router.get("/bootstrap")
+@tracer.capture_method
+def get_bootstrap():
+    """Return user, decks, due cards and stats in one composite document."""
+    user_id = get_user_id_from_context(router)
+    logger.info("Bootstrapping", extra={"user_id": user_id})
+
+    params = router.current_event.query_string_parameters or {}
+    try:
+        due_limit = max(1, min(int(params.get("due_limit", 20)), 100))
+    except (ValueError, TypeError):
+        return Response(
+            status_code=400,
+            content_type=content_types.APPLICATION_JSON,
+            body=json.dumps({"error": "due_limit must be a positive integer"}),
+        )
+
+    started = time.perf_counter()
+    # ユーザーは必須セクション。取得失敗は他の API と同様に 500 とする。
+    user_started = time.perf_counter()
+    user = user_service.get_or_create_user(user_id)
+    user_timezone = user.settings.get("timezone", "Asia/Tokyo")
+    meta: Dict[str, BootstrapSectionMeta] = {
+        "user": BootstrapSectionMeta(duration_ms=round((time.perf_counter() - user_started) * 1000, 1)),
+    }
+
+    sections: Dict[str, Callable[[], Any]] = {
+        "decks": lambda: _load_decks(user_id),
+        "due": lambda: review_service.get_due_cards(
+            user_id=user_id,
+            limit=due_limit,
+            user_timezone=user_timezone,
+        ),
+        "stats": lambda: stats_service.get_stats(user_id, user_timezone=user_timezone),
+    }
+    with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+        futures = {name: executor.submit(_timed, name, fn) for name, fn in sections.items()}
+        results = {name: future.result() for name, future in futures.items()}
+
+    for name, (_, section_meta) in results.items():
+        meta[name] = section_meta
+
+    return BootstrapResponse(
+        user=user.to_response(),
+        decks=results["decks"][0],
+        due=results["due"][0],
+        stats=results["stats"][0],
+        meta=meta,
+        total_ms=round((time.perf_counter() - started) * 1000, 1),
+    ).model_dump(mode="json")
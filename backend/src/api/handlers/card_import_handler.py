@@ -0,0 +1,97 @@
+"""Card import API route handlers (CSV / TSV / Anki export).
+
+取り込み本体は import_cards ジョブ（services/ai_job_executors.execute_import_cards）が
+ワーカーで実行する。本ハンドラーはアップロード URL の発行とジョブの submit のみを行い、
+フロントは GET /ai-jobs/{job_id} をポーリングして progress / result を取得する。
+"""
+
+import json
+
+from aws_lambda_powertools import Logger, Tracer
+from aws_lambda_powertools.event_handler import Response, content_types
+from aws_lambda_powertools.event_handler.api_gateway import Router
+
+from api.shared import get_user_id_from_context, make_job_accepted_response, parse_json_body
+from models.card_import import ImportCardsRequest, ImportUploadUrlResponse
+from services.ai_job_service import submit_ai_job
+from services.card_import import ImportUnavailableError, ImportUploadStore
+from services.deck_service import DeckNotFoundError, DeckService
+from services.user_service import UserService
+
+logger = Logger()
+tracer = Tracer()
+router = Router()
+
+upload_store = ImportUploadStore()
+deck_service = DeckService()
+user_service = UserService()
+
+
+def _error_response(status_code: int, message: str) -> Response:
+    return Response(
+        status_code=status_code,
+        content_type=content_types.APPLICATION_JSON,
+        body=json.dumps({"error": message}),
+    )
+
+
+@router.post("/cards/import/upload-url")
+@tracer.capture_method
+def create_import_upload_url():
+    """Issue a presigned PUT URL for an import file."""
+    user_id = get_user_id_from_context(router)
+    try:
+        upload = upload_store.create_upload_url(user_id)
+    except ImportUnavailableError:
+        return _error_response(503, "Card import is not available")
+    logger.info("Issued import upload URL", extra={"user_id": user_id})
+    return ImportUploadUrlResponse(**upload).model_dump(mode="json")
+
+
+@router.post("/cards/import")
+@tracer.capture_method
+def import_cards():
+    """Submit an import_cards job for an uploaded file (async job submit)."""
+    user_id = get_user_id_from_context(router)
+
+    parsed = parse_json_body(router, ImportCardsRequest)
+    if isinstance(parsed, Response):
+        return parsed
+    request = parsed
+
+    if not upload_store.enabled:
+        return _error_response(503, "Card import is not available")
+    # 他ユーザーのアップロードキーを指定させない（存在有無も漏らさない）。
+    if not upload_store.owns_key(user_id, request.upload_key):
+        return _error_response(400, "Invalid upload_key")
+
+    try:
+        # reserve_card_slots は users アイテムへの ADD のため、先にユーザーを作成しておく
+        # （POST /cards と同じ前提）。
+        user_service.get_or_create_user(user_id)
+        if request.deck_id is not None:
+            deck_service.get_deck(user_id, request.deck_id)
+        job = submit_ai_job(
+            user_id=user_id,
+            job_type="import_cards",
+            payload=request.model_dump(mode="json"),
+        )
+    except DeckNotFoundError:
+        # C-7: 存在しない/他人の deck_id はボディパラメータ不正のため 400（POST /cards と同じ）
+        return Response(
+            status_code=400,
+            content_type=content_types.APPLICATION_JSON,
+            body=json.dumps({"code": "invalid_deck", "error": "指定されたデッキが存在しません"}),
+        )
+    except Exception as e:
+        logger.error(
+            "Failed to submit import job",
+            extra={"user_id": user_id, "error": str(e)},
+        )
+        return _error_response(500, "Internal Server Error")
+
+    logger.info(
+        "Submitted import job",
+        extra={"user_id": user_id, "job_id": job["job_id"], "format": request.format},
+    )
+    return make_job_accepted_response(job)
@@ -8,13 +8,22 @@ from aws_lambda_powertools.event_handler import Response, content_types
 from aws_lambda_powertools.event_handler.api_gateway import Router
 from aws_lambda_powertools.event_handler.exceptions import NotFoundError
 
-from api.shared import get_user_id_from_context, parse_json_body
-from models.card import CreateCardRequest, UpdateCardRequest, CardListResponse
+from api.conditional import conditional_get
+from api.shared import get_user_id_from_context, parse_fields_param, parse_json_body
+from models.card import (
+    CardResponse,
+    CardSearchHit,
+    CardSearchResponse,
+    CreateCardRequest,
+    UpdateCardRequest,
+)
 from services.user_service import UserService
 from services.card_service import (
     CardService,
     CardNotFoundError,
     CardLimitExceededError,
+    CardSearchUnavailableError,
+    InvalidCursorError,
 )
 from services.deck_service import DeckNotFoundError
 
@@ -28,6 +37,8 @@ card_service = CardService()
 
 @router.get("/cards")
 @tracer.capture_method
+# deck_id 未指定はベーステーブルの強い整合性 Query のため、変更直後でも ETag を付ける。
+@conditional_get(router, route="GET /cards", consistent=lambda query: not query.get("deck_id"))
 def list_cards():
     """List cards for the current user."""
     user_id = get_user_id_from_context(router)
@@ -46,24 +57,117 @@ def list_cards():
         )
     cursor = params.get("cursor")
     deck_id = params.get("deck_id")
+    # fields=card_id,front,next_review_at 等: 指定フィールドだけを射影して返す（sparse fieldsets）。
+    fields = parse_fields_param(router, CardResponse, always=("card_id",))
+    if isinstance(fields, Response):
+        return fields
 
     try:
-        cards, next_cursor = card_service.list_cards(
+        # CardListResponse(...).model_dump(mode="json") と同じ形をアイテムから直接組み立てる。
+        cards, next_cursor = card_service.list_card_responses(
             user_id=user_id,
             limit=limit,
             cursor=cursor,
             deck_id=deck_id,
+            fields=fields,
+        )
+        return {"cards": cards, "total": len(cards), "next_cursor": next_cursor}
+    except InvalidCursorError:
+        return Response(
+            status_code=400,
+            content_type=content_types.APPLICATION_JSON,
+            body=json.dumps({"error": "Invalid cursor"}),
         )
-        return CardListResponse(
-            cards=[card.to_response() for card in cards],
-            total=len(cards),
-            next_cursor=next_cursor,
-        ).model_dump(mode="json")
     except Exception as e:
         logger.error("Error listing cards", extra={"error": str(e)})
         raise
 
 
+@router.get("/cards/changes")
+@tracer.capture_method
+def get_card_changes():
+    """Return cards created, updated or deleted since a sync token (delta sync)."""
+    user_id = get_user_id_from_context(router)
+
+    params = router.current_event.query_string_parameters or {}
+    try:
+        limit = max(1, min(int(params.get("limit", 100)), 100))
+    except (ValueError, TypeError):
+        return Response(
+            status_code=400,
+            content_type=content_types.APPLICATION_JSON,
+            body=json.dumps({"error": "limit must be a positive integer"}),
+        )
+    since = params.get("since") or None
+    logger.info("Fetching card changes", extra={"user_id": user_id, "has_since": since is not None})
+
+    try:
+        return card_service.get_card_changes(
+            user_id=user_id,
+            since=since,
+            limit=limit,
+        ).model_dump(mode="json")
+    except InvalidCursorError:
+        return Response(
+            status_code=400,
+            content_type=content_types.APPLICATION_JSON,
+            body=json.dumps({"error": "Invalid sync token"}),
+        )
+    except Exception as e:
+        logger.error("Error fetching card changes", extra={"error": str(e)})
+        raise
+
+
+@router.get("/cards/search")
+@tracer.capture_method
+def search_cards():
+    """Full-text search over the current user's cards (n-gram index)."""
+    user_id = get_user_id_from_context(router)
+
+    params = router.current_event.query_string_parameters or {}
+    query = (params.get("q") or "").strip()
+    if not query or len(query) > 100:
+        return Response(
+            status_code=400,
+            content_type=content_types.APPLICATION_JSON,
+            body=json.dumps({"error": "q must be 1-100 characters"}),
+        )
+    try:
+        limit = max(1, min(int(params.get("limit", 20)), 50))
+    except (ValueError, TypeError):
+        return Response(
+            status_code=400,
+            content_type=content_types.APPLICATION_JSON,
+            body=json.dumps({"error": "limit must be a positive integer"}),
+        )
+    logger.info("Searching cards", extra={"user_id": user_id, "query_length": len(query)})
+
+    try:
+        hits = card_service.search_cards(
+            user_id=user_id,
+            query=query,
+            limit=limit,
+            deck_id=params.get("deck_id"),
+            tag=params.get("tag"),
+        )
+        return CardSearchResponse(
+            cards=[
+                CardSearchHit(**card.to_response().model_dump(), score=score)
+                for card, score in hits
+            ],
+            total=len(hits),
+        ).model_dump(mode="json")
+    except CardSearchUnavailableError:
+        return Response(
+            status_code=503,
+            content_type=content_types.APPLICATION_JSON,
+            body=json.dumps({"error": "Card search is not available"}),
+        )
+    except Exception as e:
+        logger.error("Error searching cards", extra={"error": str(e)})
+        raise
+
+
 @router.post("/cards")
 @tracer.capture_method
 def create_card():
@@ -159,9 +263,9 @@ def update_card(card_id: str):
 
         # Get user settings for day boundary normalization when interval is specified
         if request.interval is not None:
-            user = user_service.get_or_create_user(user_id)
-            update_kwargs["user_timezone"] = user.settings.get("timezone", "Asia/Tokyo")
-            update_kwargs["day_start_hour"] = user.settings.get("day_start_hour", 4)
+            settings = user_service.get_settings(user_id)
+            update_kwargs["user_timezone"] = settings.get("timezone", "Asia/Tokyo")
+            update_kwargs["day_start_hour"] = settings.get("day_start_hour", 4)
 
         card = card_service.update_card(**update_kwargs)
         return card.to_response().model_dump(mode="json")
@@ -0,0 +1,52 @@
+"""Data export API route handlers.
+
+エクスポート本体は export_data ジョブ（services/ai_job_executors.execute_export_data）が
+ワーカーで実行する。本ハンドラーはジョブの submit のみを行い、フロントは
+GET /ai-jobs/{job_id} をポーリングして result.download_url（署名付き URL）を取得する。
+"""
+
+import json
+
+from aws_lambda_powertools import Logger, Tracer
+from aws_lambda_powertools.event_handler import Response, content_types
+from aws_lambda_powertools.event_handler.api_gateway import Router
+
+from api.shared import get_user_id_from_context, make_job_accepted_response
+from services.ai_job_service import submit_ai_job
+from services.data_export import DataExporter
+
+logger = Logger()
+tracer = Tracer()
+router = Router()
+
+exporter = DataExporter()
+
+
+def _error_response(status_code: int, message: str) -> Response:
+    return Response(
+        status_code=status_code,
+        content_type=content_types.APPLICATION_JSON,
+        body=json.dumps({"error": message}),
+    )
+
+
+@router.post("/exports")
+@tracer.capture_method
+def create_export():
+    """Submit an export_data job (async job submit)."""
+    user_id = get_user_id_from_context(router)
+
+    if not exporter.enabled:
+        return _error_response(503, "Data export is not available")
+
+    try:
+        job = submit_ai_job(user_id=user_id, job_type="export_data", payload={})
+    except Exception as e:
+        logger.error(
+            "Failed to submit export job",
+            extra={"user_id": user_id, "error": str(e)},
+        )
+        return _error_response(500, "Internal Server Error")
+
+    logger.info("Submitted export job", extra={"user_id": user_id, "job_id": job["job_id"]})
+    return make_job_accepted_response(job)
@@ -7,8 +7,11 @@ from aws_lambda_powertools.event_handler import Response, content_types
 from aws_lambda_powertools.event_handler.api_gateway import Router
 from aws_lambda_powertools.event_handler.exceptions import NotFoundError
 
-from api.shared import get_user_id_from_context, parse_json_body
-from models.deck import CreateDeckRequest, UpdateDeckRequest, DeckListResponse
+from api.conditional import conditional_get
+from api.shared import get_user_id_from_context, make_job_accepted_response, parse_json_body
+from models.deck import CreateDeckRequest, UpdateDeckRequest, DeckListResponse, MoveCardsRequest
+from services.ai_job_service import submit_ai_job
+from services.card_service import CardService
 from services.deck_service import (
     DeckService,
     DeckNotFoundError,
@@ -20,6 +23,11 @@ tracer = Tracer()
 router = Router()
 
 deck_service = DeckService()
+card_service = CardService(deck_service=deck_service)
+
+
+class _ResetJobSubmitError(Exception):
+    """reset_deck_cards ジョブを登録できなかった（デッキは削除していない）。"""
 
 
 @router.post("/decks")
@@ -59,6 +67,7 @@ def create_deck():
 
 @router.get("/decks")
 @tracer.capture_method
+@conditional_get(router, route="GET /decks", time_sensitive=True)
 def list_decks():
     """List all decks for the current user."""
     user_id = get_user_id_from_context(router)
@@ -135,6 +144,12 @@ def update_deck(deck_id: str):
         raise
 
 
+# 204: デッキを削除し、カードの deck_id もリセット済み。
+# 202: 大きなデッキ（DECK_RESET_PAGE_SIZE 枚超）。デッキは削除済みで、カードの deck_id は
+#      reset_deck_cards ジョブが非同期にリセットする（ボディはジョブ受付レスポンス）。
+#      ジョブが終わるまでカードは削除済みデッキの deck_id を持ち続ける。フロントエンド
+#      （deleteDeck）はボディを読まず、204 と同じく削除完了として扱う。
+# ジョブを登録できない場合はデッキを削除せずにエラーを返す（再度の DELETE でやり直せる）。
 @router.delete("/decks/<deck_id>")
 @tracer.capture_method
 def delete_deck(deck_id: str):
@@ -142,15 +157,73 @@ def delete_deck(deck_id: str):
     user_id = get_user_id_from_context(router)
     logger.info("Deleting deck", extra={"deck_id": deck_id, "user_id": user_id})
 
+    def submit_reset_job() -> dict:
+        try:
+            return submit_ai_job(
+                user_id=user_id,
+                job_type="reset_deck_cards",
+                payload={"deck_id": deck_id},
+            )
+        except Exception as e:
+            raise _ResetJobSubmitError(str(e)) from e
+
     try:
-        deck_service.delete_deck(user_id, deck_id)
+        job = deck_service.delete_deck(user_id, deck_id, submit_reset_job=submit_reset_job)
+    except DeckNotFoundError:
+        raise NotFoundError(f"Deck not found: {deck_id}")
+    except _ResetJobSubmitError as e:
+        logger.error(
+            "Failed to submit deck reset job; deck was not deleted",
+            extra={"deck_id": deck_id, "error": str(e)},
+        )
         return Response(
-            status_code=204,
+            status_code=500,
             content_type=content_types.APPLICATION_JSON,
-            body="",
+            body=json.dumps({"error": "Internal Server Error"}),
         )
-    except DeckNotFoundError:
-        raise NotFoundError(f"Deck not found: {deck_id}")
     except Exception as e:
         logger.error("Error deleting deck", extra={"deck_id": deck_id, "error": str(e)})
         raise
+
+    if job is not None:
+        return make_job_accepted_response(job)
+
+    return Response(
+        status_code=204,
+        content_type=content_types.APPLICATION_JSON,
+        body="",
+    )
+
+
+@router.post("/decks/<deck_id>/cards:move")
+@tracer.capture_method
+def move_cards(deck_id: str):
+    """Move cards (card_ids) or a whole deck (source_deck_id) into a deck."""
+    user_id = get_user_id_from_context(router)
+
+    parsed = parse_json_body(router, MoveCardsRequest)
+    if isinstance(parsed, Response):
+        return parsed
+    request = parsed
+
+    if request.source_deck_id == deck_id:
+        return Response(
+            status_code=400,
+            content_type=content_types.APPLICATION_JSON,
+            body=json.dumps({"error": "source_deck_id must differ from the target deck"}),
+        )
+
+    try:
+        result = card_service.move_cards(
+            user_id,
+            deck_id,
+            card_ids=request.card_ids,
+            source_deck_id=request.source_deck_id,
+        )
+    except DeckNotFoundError as e:
+        raise NotFoundError(f"Deck not found: {e.deck_id or deck_id}")
+    except Exception as e:
+        logger.error("Error moving cards", extra={"deck_id": deck_id, "error": str(e)})
+        raise
+
+    return result.model_dump(mode="json")
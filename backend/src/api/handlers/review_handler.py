@@ -7,8 +7,8 @@ from aws_lambda_powertools.event_handler import Response, content_types
 from aws_lambda_powertools.event_handler.api_gateway import Router
 from aws_lambda_powertools.event_handler.exceptions import NotFoundError
 
-from api.shared import get_user_id_from_context, parse_json_body
-from models.review import ReviewRequest
+from api.shared import get_user_id_from_context, parse_fields_param, parse_json_body
+from models.review import DueCardInfo, ReviewRequest
 from services.card_service import CardNotFoundError
 from services.review_service import (
     ReviewService,
@@ -46,11 +46,23 @@ def get_due_cards():
         )
     include_future = params.get("include_future", "false").lower() == "true"
     deck_id = params.get("deck_id")
+    fields = parse_fields_param(router, DueCardInfo, always=("card_id",))
+    if isinstance(fields, Response):
+        return fields
 
     try:
         # due_date / next_due_date をユーザーローカル日付で返すため timezone を取得
-        user = user_service.get_or_create_user(user_id)
-        user_timezone = user.settings.get("timezone", "Asia/Tokyo")
+        user_timezone = user_service.get_settings(user_id).get("timezone", "Asia/Tokyo")
+
+        if fields is not None:
+            return review_service.get_due_cards_json(
+                user_id=user_id,
+                fields=fields,
+                limit=limit,
+                include_future=include_future,
+                deck_id=deck_id,
+                user_timezone=user_timezone,
+            )
 
         response = review_service.get_due_cards(
             user_id=user_id,
@@ -79,9 +91,9 @@ def submit_review(card_id: str):
 
     try:
         # Get user settings for day boundary normalization
-        user = user_service.get_or_create_user(user_id)
-        user_timezone = user.settings.get("timezone", "Asia/Tokyo")
-        day_start_hour = user.settings.get("day_start_hour", 4)
+        settings = user_service.get_settings(user_id)
+        user_timezone = settings.get("timezone", "Asia/Tokyo")
+        day_start_hour = settings.get("day_start_hour", 4)
 
         response = review_service.submit_review(
             user_id=user_id,
@@ -123,8 +135,7 @@ def undo_review(card_id: str):
 
     try:
         # restored.due_date をユーザーローカル日付で返すため timezone を取得
-        user = user_service.get_or_create_user(user_id)
-        user_timezone = user.settings.get("timezone", "Asia/Tokyo")
+        user_timezone = user_service.get_settings(user_id).get("timezone", "Asia/Tokyo")
 
         response = review_service.undo_review(
             user_id=user_id,
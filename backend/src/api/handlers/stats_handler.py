@@ -6,6 +6,7 @@ from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.event_handler import Response, content_types
 from aws_lambda_powertools.event_handler.api_gateway import Router
 
+from api.conditional import conditional_get
 from api.shared import get_user_id_from_context
 from services.stats_service import StatsService
 from services.user_service import UserService
@@ -23,12 +24,12 @@ def _get_user_timezone(user_id: str) -> str:
 
     review_handler と同じパターン。設定が無い場合はアプリ既定の Asia/Tokyo。
     """
-    user = user_service.get_or_create_user(user_id)
-    return user.settings.get("timezone", "Asia/Tokyo")
+    return user_service.get_settings(user_id).get("timezone", "Asia/Tokyo")
 
 
 @router.get("/stats")
 @tracer.capture_method
+@conditional_get(router, route="GET /stats", time_sensitive=True)
 def get_stats():
     """Get learning statistics summary."""
     user_id = get_user_id_from_context(router)
@@ -45,6 +46,7 @@ def get_stats():
 
 @router.get("/stats/weak-cards")
 @tracer.capture_method
+@conditional_get(router, route="GET /stats/weak-cards")
 def get_weak_cards():
     """Get weak cards list."""
     user_id = get_user_id_from_context(router)
@@ -70,6 +72,7 @@ def get_weak_cards():
 
 @router.get("/stats/forecast")
 @tracer.capture_method
+@conditional_get(router, route="GET /stats/forecast", time_sensitive=True)
 def get_forecast():
     """Get review forecast."""
     user_id = get_user_id_from_context(router)
@@ -10,12 +10,14 @@ from api.shared import (
     check_ai_rate_limit,
     get_user_id_from_context,
     make_job_accepted_response,
+    parse_fields_param,
     parse_json_body,
 )
 from models.tutor import (
     SendMessageRequest,
     SessionListResponse,
     StartSessionRequest,
+    TutorSessionResponse,
 )
 from services.ai_job_service import submit_ai_job
 from services.tutor_service import (
@@ -225,11 +227,20 @@ def list_sessions():
             ),
         )
 
+    fields = parse_fields_param(router, TutorSessionResponse, always=("session_id",))
+    if isinstance(fields, Response):
+        return fields
+
     sessions = tutor_service.list_sessions(
         user_id=user_id,
         status=status,
         deck_id=deck_id,
     )
+    if fields is not None:
+        return {
+            "sessions": [s.model_dump(mode="json", include=set(fields)) for s in sessions],
+            "total": len(sessions),
+        }
     return SessionListResponse(
         sessions=[s.model_dump(mode="json") for s in sessions],
         total=len(sessions),
@@ -0,0 +1,106 @@
+"""Lazy router registration for the API Lambda.
+
+api/handler.py はこれまで全ドメインのルーター（user / cards / decks / review / ai /
+tutor ...）をモジュール読み込み時に import・登録していた。各ハンドラーモジュールは
+モジュールレベルでサービス（boto3 リソース）を生成し、Pydantic モデルや httpx / bs4
+（URL 取り込み）まで推移的に読み込むため、``GET /cards`` のような単純な呼び出しでも
+コールドスタートで全ドメイン分の import コストを払っていた。
+
+本モジュールはパスの先頭セグメント（``/cards/...`` → ``cards``）ごとに必要な
+ルーターモジュールを対応付け、最初にそのセグメントへのリクエストが来た時点で
+import・登録する。
+
+  - 同じセグメントを共有するルーター（``/cards/due`` は review、``/cards/generate`` は
+    ai 等）は従来の登録順のまとまりで一度に読み込む。Powertools は静的ルート →
+    動的ルートの順に照合するため、異なるセグメント間で登録順は結果に影響しない。
+  - 未知のセグメントは何も読み込まず、従来どおり 404 になる。
+  - ルーターはいずれも例外ハンドラー・ミドルウェアを持たないため、遅延登録しても
+    他ドメインのルートの挙動は変わらない（持たせる場合は ROUTER_MODULES の設計を見直すこと）。
+  - API_EAGER_ROUTERS="true" で初期化時に全ルーターを登録する（Provisioned Concurrency /
+    SnapStart など初期化コストを事前に払える構成向け）。
+  - 直近の resolve でマッチしたルート（例: "GET /cards/<card_id>"）を ``matched_route`` に
+    保持する（メトリクスの Route 次元用。パスパラメータを含まないため次元数が増えない）。
+"""
+
+import importlib
+import os
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
+
+from aws_lambda_powertools.event_handler import APIGatewayHttpResolver
+
+# パス先頭セグメント → ルーターモジュール（従来の include_router の順序を保つ）。
+ROUTER_MODULES: Dict[str, Tuple[str, ...]] = {
+    "users": ("api.handlers.user_handler",),
+    "cards": (
+        "api.handlers.cards_handler",
+        "api.handlers.review_handler",
+        "api.handlers.ai_handler",
+        "api.handlers.card_import_handler",
+    ),
+    "decks": ("api.handlers.decks_handler",),
+    "reviews": ("api.handlers.review_handler",),
+    "ai-jobs": ("api.handlers.ai_jobs_handler",),
+    "stats": ("api.handlers.stats_handler",),
+    "browser-profiles": ("api.handlers.browser_profile_handler",),
+    "tutor": ("api.handlers.tutor_handler",),
+    "bootstrap": ("api.handlers.bootstrap_handler",),
+    "exports": ("api.handlers.data_export_handler",),
+}
+
+
+def route_segment(event: Mapping[str, Any]) -> Optional[str]:
+    """イベントのパスから先頭セグメントを返す（ステージプレフィックスは除く）。"""
+    path = event.get("rawPath") or event.get("path") or "/"
+    stage = (event.get("requestContext") or {}).get("stage", "$default")
+    if stage != "$default" and path.startswith(f"/{stage}/"):
+        path = path[len(stage) + 1 :]
+    segment = path.lstrip("/").split("/", 1)[0]
+    return segment or None
+
+
+class LazyRouterResolver(APIGatewayHttpResolver):
+    """先頭セグメントに対応するルーターを初回の resolve 時に登録する Resolver。"""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._included_modules: Set[str] = set()
+        self.matched_route: Optional[str] = None
+
+    @property
+    def included_modules(self) -> Set[str]:
+        return set(self._included_modules)
+
+    def include_router_module(self, module_name: str) -> None:
+        """ルーターモジュールを import して登録する（登録済みなら何もしない）。"""
+        if module_name in self._included_modules:
+            return
+        module = importlib.import_module(module_name)
+        self.include_router(module.router)
+        self._included_modules.add(module_name)
+
+    def include_routers_for(self, event: Mapping[str, Any]) -> None:
+        """イベントのパスに対応するルーターを登録する。"""
+        for module_name in ROUTER_MODULES.get(route_segment(event) or "", ()):
+            self.include_router_module(module_name)
+
+    def include_all_routers(self) -> None:
+        for module_names in ROUTER_MODULES.values():
+            for module_name in module_names:
+                self.include_router_module(module_name)
+
+    def append_context(self, **additional_context: Any) -> None:
+        # Powertools はマッチしたルートを _route としてコンテキストに追加する
+        # （resolve の終了時にコンテキストは破棄されるため、ここで控える）。
+        route = additional_context.get("_route")
+        if route is not None:
+            self.matched_route = f"{route.method} {route.path}"
+        super().append_context(**additional_context)
+
+    def resolve(self, event: Mapping[str, Any], context: Any) -> Dict[str, Any]:
+        self.matched_route = None
+        self.include_routers_for(event)
+        return super().resolve(event, context)
+
+
+def eager_routers_enabled() -> bool:
+    return os.environ.get("API_EAGER_ROUTERS", "").lower() == "true"
@@ -136,6 +136,44 @@ def parse_json_body(
         )
 
 
+def parse_fields_param(
+    resolver, model_class: type[BaseModel], always: tuple[str, ...] = ()
+) -> list[str] | Response | None:
+    """``fields=`` クエリパラメータ（カンマ区切り）を ``model_class`` のフィールド名として検証する。
+
+    一覧系 GET の部分取得（sparse fieldsets）用。未知のフィールド名は 400 を返し、
+    DynamoDB の ProjectionExpression に任意の属性名が渡らないようにする。
+
+    Args:
+        resolver: ``current_event`` を持つ APIGatewayHttpResolver または Router インスタンス。
+        model_class: 一覧の 1 要素を表すレスポンスモデル。
+        always: 指定の有無にかかわらず返すフィールド（識別子など）。
+
+    Returns:
+        未指定なら None（全フィールド）。指定時は always を加えてモデルの定義順に並べた
+        フィールド名のリスト。不正な指定（未知のフィールド・空）は 400 ``Response``。
+    """
+    raw = (resolver.current_event.query_string_parameters or {}).get("fields")
+    if raw is None:
+        return None
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = sorted(requested - set(model_class.model_fields))
+    if not requested or unknown:
+        return Response(
+            status_code=400,
+            content_type=content_types.APPLICATION_JSON,
+            body=json.dumps(
+                {
+                    "error": "Invalid fields",
+                    "unknown_fields": unknown,
+                    "allowed_fields": list(model_class.model_fields),
+                }
+            ),
+        )
+    requested.update(always)
+    return [name for name in model_class.model_fields if name in requested]
+
+
 def _is_jwt_dev_fallback_enabled() -> bool:
     """署名検証なし dev JWT フォールバックを有効化してよいか判定する.
 
@@ -0,0 +1,46 @@
+"""Lambda handler that maintains the card search index from the Cards table stream.
+
+Cards テーブルの DynamoDB Streams（NEW_AND_OLD_IMAGES）を受け取り、
+front / back / deck_id / tags が変わったカードの変更前後のトークン差分を求め、
+CARD_SEARCH_TABLE の posting ごとに UpdateItem（ADD / DELETE）でまとめて反映する
+（services/card_search_index.py）。カードの作成・編集・削除・インポート・
+一括作成のどの経路でもリクエスト中にインデックスを書かないための非同期化。
+
+書き込みは冪等（String Set の ADD / DELETE）なので、失敗時は例外を送出して
+バッチごと再試行させる（template.yaml の BisectBatchOnFunctionError /
+MaximumRetryAttempts で毒レコードを切り出し、OnFailure 先の DLQ に送る）。
+"""
+
+from typing import Any, Dict
+
+from aws_lambda_powertools import Logger, Tracer
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+from services.card_search_index import CardSearchIndex, changes_from_stream_records
+from utils.profiler import profiled
+
+logger = Logger()
+tracer = Tracer()
+
+search_index = CardSearchIndex()
+
+
+@logger.inject_lambda_context
+@tracer.capture_lambda_handler
+@profiled("job:card_search_index")
+def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
+    """Cards テーブルのストリームレコードを検索インデックスへ反映する.
+
+    Args:
+        event: DynamoDB Streams イベント（``Records``）。
+        context: Lambda context.
+
+    Returns:
+        処理件数（records / postings: 更新した posting 数 / updates: UpdateItem 回数）。
+    """
+    records = event.get("Records", [])
+    changes = changes_from_stream_records(records)
+    updates = search_index.apply_changes(changes)
+    result = {"records": len(records), "postings": len(changes), "updates": updates}
+    logger.info("Card search index updated", extra=result)
+    return result
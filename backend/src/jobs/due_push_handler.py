@@ -8,6 +8,7 @@ from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
 from services.notification_service import NotificationService
+from utils.profiler import profiled
 
 logger = Logger()
 tracer = Tracer()
@@ -18,6 +19,7 @@ notification_service = NotificationService()
 
 @logger.inject_lambda_context
 @tracer.capture_lambda_handler
+@profiled("job:due_push")
 def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
     """Lambda handler for due push notifications.
 
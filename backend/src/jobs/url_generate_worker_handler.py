@@ -51,6 +51,7 @@ from services.url_generation_service import (
     notify_generation_failure,
     UrlGenerationPermanentError,
 )
+from utils.profiler import profiled
 
 logger = Logger()
 tracer = Tracer()
@@ -177,6 +178,7 @@ def _process_record(record: Dict[str, Any], body: Dict[str, Any]) -> None:
 
 @logger.inject_lambda_context
 @tracer.capture_lambda_handler
+@profiled("job:url_generate")
 def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
     """SQS イベントソースのワーカーハンドラ（ReportBatchItemFailures）。
 
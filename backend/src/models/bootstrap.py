@@ -0,0 +1,32 @@
+"""Bootstrap (app-open composite) models for Memoru LIFF application."""
+
+from typing import Dict, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from .deck import DeckListResponse
+from .review import DueCardsResponse
+from .stats import StatsResponse
+from .user import UserResponse
+
+
+class BootstrapSectionMeta(BaseModel):
+    """Timing and outcome of one bootstrap section."""
+
+    duration_ms: float = Field(..., description="Wall-clock time spent on the section")
+    status: Literal["ok", "error"] = "ok"
+
+
+class BootstrapResponse(BaseModel):
+    """Response model for GET /bootstrap.
+
+    失敗したセクションは null になり、meta の status が "error" になる
+    （フロントは該当セクションだけ個別 API で取り直す）。
+    """
+
+    user: UserResponse
+    decks: Optional[DeckListResponse] = None
+    due: Optional[DueCardsResponse] = None
+    stats: Optional[StatsResponse] = None
+    meta: Dict[str, BootstrapSectionMeta] = Field(default_factory=dict)
+    total_ms: float = 0.0
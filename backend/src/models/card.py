@@ -2,7 +2,7 @@
 
 import uuid
 from datetime import datetime, timezone
-from typing import List, Literal, Optional
+from typing import Any, Callable, Collection, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -113,6 +113,29 @@ class CardListResponse(BaseModel):
     next_cursor: Optional[str] = None
 
 
+class CardChangesResponse(BaseModel):
+    """Response model for card delta sync (GET /cards/changes)."""
+
+    changes: List[CardResponse]
+    deleted_card_ids: List[str]
+    next_since: str
+    has_more: bool
+    full_resync: bool = False
+
+
+class CardSearchHit(CardResponse):
+    """Response model for a card search hit."""
+
+    score: float
+
+
+class CardSearchResponse(BaseModel):
+    """Response model for card search (GET /cards/search)."""
+
+    cards: List[CardSearchHit]
+    total: int
+
+
 class Card(BaseModel):
     """Card domain model."""
 
@@ -230,3 +253,98 @@ class Card(BaseModel):
             created_at=datetime.fromisoformat(item["created_at"]),
             updated_at=datetime.fromisoformat(item["updated_at"]) if item.get("updated_at") else None,
         )
+
+    @classmethod
+    def from_trusted_item(cls, item: dict) -> "Card":
+        """Create Card from an item read back through CardRepository.
+
+        一覧系（list_cards / get_due_cards / 検索など）は 1 リクエストで最大数百件を変換する。
+        from_dynamodb_item は Python 側で int() / float() / fromisoformat() / Reference(**ref)
+        を済ませてから検証に渡すため変換が二重になる。to_dynamodb_item が書いた形のアイテム
+        （Decimal の数値・文字列の ease_factor・ISO 文字列の日時・dict の references）は
+        pydantic の lax モードでそのまま同じ値に変換できるので、生の値を一度の検証で渡す。
+        日時の tzinfo は pydantic の TzInfo になる（値・isoformat() は同一）。
+
+        【model_construct を使わない理由】: pydantic 2.x では model_construct が Python 側で
+        フィールドを組み立てるため、Rust 実装の検証より遅い（tests/benchmarks/test_card_bench.py）。
+        外部入力（インポート・移行中のデータ等）には従来どおり from_dynamodb_item を使うこと。
+        """
+        return cls(
+            card_id=item["card_id"],
+            user_id=item["user_id"],
+            front=item["front"],
+            back=item["back"],
+            deck_id=item.get("deck_id"),
+            tags=item.get("tags") or [],
+            references=item.get("references") or [],
+            next_review_at=item.get("next_review_at") or None,
+            interval=item.get("interval", 0),
+            ease_factor=item.get("ease_factor", 2.5),
+            repetitions=item.get("repetitions", 0),
+            created_at=item["created_at"],
+            updated_at=item.get("updated_at") or None,
+        )
+
+
+def _json_datetime(value: str) -> str:
+    """保存済みの isoformat() 文字列を pydantic の JSON 表記（UTC オフセットは "Z"）に揃える。
+
+    to_dynamodb_item は datetime.isoformat() で書き込むため、パースし直して再整形しても
+    同じ文字列になる。差分は pydantic が "+00:00" を "Z" と書く点だけなので置換で済ませる。
+    """
+    return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+
+def card_response_json(item: dict, fields: Optional[Collection[str]] = None) -> dict:
+    """DynamoDB カードアイテムを CardResponse の JSON 形へ直接変換する。
+
+    ``Card.from_dynamodb_item(item).to_response().model_dump(mode="json")`` と同じ dict
+    （キー順・型・日時表記）を、Card / CardResponse を経由せずに返す。GET /cards のように
+    アイテムをそのままレスポンスへ流すだけの経路で使う（前提は Card.from_trusted_item と同じで、
+    CardRepository が読み出した to_dynamodb_item 形式のアイテムに限る）。
+
+    fields 指定時（GET /cards?fields=）はそのフィールドだけを CardResponse の順で返す。
+    item はそれらの同名属性だけを射影したものでよい。
+    """
+    if fields is not None:
+        return {name: convert(item) for name, convert in _CARD_JSON_FIELDS.items() if name in fields}
+    next_review_at = item.get("next_review_at")
+    updated_at = item.get("updated_at")
+    return {
+        "card_id": item["card_id"],
+        "user_id": item["user_id"],
+        "front": item["front"],
+        "back": item["back"],
+        "deck_id": item.get("deck_id"),
+        "tags": list(item.get("tags") or ()),
+        "next_review_at": _json_datetime(next_review_at) if next_review_at else None,
+        "interval": int(item.get("interval", 0)),
+        "ease_factor": float(item.get("ease_factor", 2.5)),
+        "repetitions": int(item.get("repetitions", 0)),
+        "references": [{"type": ref["type"], "value": ref["value"]} for ref in item.get("references") or ()],
+        "created_at": _json_datetime(item["created_at"]),
+        "updated_at": _json_datetime(updated_at) if updated_at else None,
+    }
+
+
+def _optional_json_datetime(value: Optional[str]) -> Optional[str]:
+    return _json_datetime(value) if value else None
+
+
+# fields= 指定時の CardResponse フィールドごとの変換（フィールド名 = DynamoDB 属性名）。
+# 全フィールド時の card_response_json と同じ結果になること（tests/unit/models/test_card.py）。
+_CARD_JSON_FIELDS: Dict[str, Callable[[dict], Any]] = {
+    "card_id": lambda item: item["card_id"],
+    "user_id": lambda item: item["user_id"],
+    "front": lambda item: item["front"],
+    "back": lambda item: item["back"],
+    "deck_id": lambda item: item.get("deck_id"),
+    "tags": lambda item: list(item.get("tags") or ()),
+    "next_review_at": lambda item: _optional_json_datetime(item.get("next_review_at")),
+    "interval": lambda item: int(item.get("interval", 0)),
+    "ease_factor": lambda item: float(item.get("ease_factor", 2.5)),
+    "repetitions": lambda item: int(item.get("repetitions", 0)),
+    "references": lambda item: [{"type": ref["type"], "value": ref["value"]} for ref in item.get("references") or ()],
+    "created_at": lambda item: _json_datetime(item["created_at"]),
+    "updated_at": lambda item: _optional_json_datetime(item.get("updated_at")),
+}
@@ -0,0 +1,54 @@
+"""Card import (CSV / TSV / Anki export) models for Memoru LIFF application."""
+
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from .card import normalize_tags
+
+ImportFormat = Literal["csv", "tsv", "anki"]
+
+
+class ImportUploadUrlResponse(BaseModel):
+    """Response model for POST /cards/import/upload-url."""
+
+    upload_url: str
+    upload_key: str
+    expires_in: int
+
+
+class ImportCardsRequest(BaseModel):
+    """Request model for POST /cards/import (submits an import_cards job)."""
+
+    upload_key: str = Field(..., min_length=1, max_length=512, description="Key returned by upload-url")
+    format: ImportFormat = Field(..., description="csv / tsv / anki (Anki 'Notes in Plain Text' export)")
+    deck_id: Optional[str] = Field(None, description="Optional deck ID for all imported cards")
+    tags: List[str] = Field(default_factory=list, description="Tags added to every imported card")
+
+    @field_validator("tags")
+    @classmethod
+    def validate_tags(cls, v: List[str]) -> List[str]:
+        """Validate tags."""
+        return normalize_tags(v)
+
+
+class ImportRowError(BaseModel):
+    """A rejected row of an import file."""
+
+    line: int
+    message: str
+
+
+class CardImportResult(BaseModel):
+    """Result of an import_cards job (stored as the job result).
+
+    errors は先頭から最大 MAX_REPORTED_ERRORS 件のみ保持する（件数は invalid を参照）。
+    """
+
+    total_rows: int = 0
+    imported: int = 0
+    invalid: int = 0
+    failed: int = 0
+    skipped_limit: int = 0
+    limit_reached: bool = False
+    errors: List[ImportRowError] = Field(default_factory=list)
@@ -0,0 +1,22 @@
+"""Data export (gzip NDJSON) models for Memoru LIFF application."""
+
+from pydantic import BaseModel
+
+
+class DataExportCounts(BaseModel):
+    """Number of exported records per type."""
+
+    decks: int
+    cards: int
+    reviews: int
+
+
+class DataExportResult(BaseModel):
+    """Result of an export_data job."""
+
+    download_url: str
+    expires_in: int
+    object_key: str
+    size_bytes: int
+    counts: DataExportCounts
+    exported_at: str
@@ -3,9 +3,12 @@
 import re
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+# POST /decks/<deck_id>/cards:move で card_ids 指定時に一度に移動できる枚数の上限。
+MAX_MOVE_CARD_IDS = 500
 
 
 class CreateDeckRequest(BaseModel):
@@ -44,6 +47,61 @@ class UpdateDeckRequest(BaseModel):
         return v.upper()
 
 
+class MoveCardsRequest(BaseModel):
+    """Request model for POST /decks/<deck_id>/cards:move.
+
+    card_ids（指定カードの移動）と source_deck_id（デッキ全体のマージ）のどちらか一方を指定する。
+    """
+
+    card_ids: Optional[List[str]] = Field(
+        None, min_length=1, max_length=MAX_MOVE_CARD_IDS, description="Cards to move"
+    )
+    source_deck_id: Optional[str] = Field(
+        None, min_length=1, description="Move every card of this deck (merge)"
+    )
+
+    @field_validator("card_ids")
+    @classmethod
+    def dedupe_card_ids(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Drop duplicate and blank card IDs, keeping the request order."""
+        if v is None:
+            return v
+        return list(dict.fromkeys(card_id for card_id in v if card_id.strip()))
+
+    @model_validator(mode="after")
+    def validate_exactly_one_source(self) -> "MoveCardsRequest":
+        """Require exactly one of card_ids / source_deck_id."""
+        if (self.card_ids is None) == (self.source_deck_id is None):
+            raise ValueError("Specify exactly one of card_ids or source_deck_id")
+        return self
+
+
+MoveCardStatus = Literal["moved", "unchanged", "not_found", "conflict", "failed"]
+
+
+class MoveCardResult(BaseModel):
+    """Per-card outcome of a move.
+
+    moved: 移動した / unchanged: 既に移動先デッキにあった / not_found: カードが存在しない /
+    conflict: マージ中に別デッキへ移動・削除された / failed: DynamoDB エラー。
+    """
+
+    card_id: str
+    status: MoveCardStatus
+
+
+class MoveCardsResponse(BaseModel):
+    """Response model for POST /decks/<deck_id>/cards:move."""
+
+    deck_id: str
+    moved: int = 0
+    unchanged: int = 0
+    not_found: int = 0
+    conflict: int = 0
+    failed: int = 0
+    results: List[MoveCardResult] = Field(default_factory=list)
+
+
 class DeckResponse(BaseModel):
     """Response model for a deck."""
 
@@ -1,7 +1,7 @@
 """Review models for Memoru LIFF application."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -71,6 +71,19 @@ class DueCardInfo(BaseModel):
     references: List[Reference] = Field(default_factory=list)
 
 
+# GET /cards/due?fields= で選択できる DueCardInfo のフィールドと、その値の元になる
+# カードアイテムの属性（ProjectionExpression に渡す）。
+DUE_CARD_FIELD_ATTRIBUTES: Dict[str, Tuple[str, ...]] = {
+    "card_id": ("card_id",),
+    "front": ("front",),
+    "back": ("back",),
+    "deck_id": ("deck_id",),
+    "due_date": ("next_review_at",),
+    "overdue_days": ("next_review_at",),
+    "references": ("references",),
+}
+
+
 class DueCardsResponse(BaseModel):
     """Response model for due cards list."""
 
@@ -2,7 +2,7 @@
 
 import re
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -105,6 +105,9 @@ class User(BaseModel):
     display_name: Optional[str] = None
     picture_url: Optional[str] = None
     settings: dict = Field(default_factory=lambda: dict(DEFAULT_USER_SETTINGS))
+    # update_settings / link_line / unlink_line で加算される。設定キャッシュの検証用
+    # (services/user_settings_cache.py)。
+    settings_version: int = 0
     last_notified_date: Optional[str] = None  # YYYY-MM-DD format
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: Optional[datetime] = None
@@ -125,7 +128,7 @@ class User(BaseModel):
 
     def to_dynamodb_item(self) -> dict:
         """Convert to DynamoDB item."""
-        item = {
+        item: Dict[str, Any] = {
             "user_id": self.user_id,
             "created_at": self.created_at.isoformat(),
             "settings": self.settings,
@@ -138,6 +141,8 @@ class User(BaseModel):
             item["picture_url"] = self.picture_url
         if self.last_notified_date:
             item["last_notified_date"] = self.last_notified_date
+        if self.settings_version:
+            item["settings_version"] = self.settings_version
         if self.updated_at:
             item["updated_at"] = self.updated_at.isoformat()
         return item
@@ -151,6 +156,7 @@ class User(BaseModel):
             display_name=item.get("display_name"),
             picture_url=item.get("picture_url"),
             settings=item.get("settings", dict(DEFAULT_USER_SETTINGS)),
+            settings_version=int(item.get("settings_version", 0)),
             last_notified_date=item.get("last_notified_date"),
             created_at=datetime.fromisoformat(item["created_at"]),
             updated_at=datetime.fromisoformat(item["updated_at"]) if item.get("updated_at") else None,
@@ -20,7 +20,15 @@ from services.ai_service import (
     AIServiceError,
     AITimeoutError,
 )
+from services.card_import import (
+    ImportFileNotFoundError,
+    ImportFileTooLargeError,
+    ImportFormatError,
+    ImportUnavailableError,
+)
 from services.card_service import CardNotFoundError
+from services.data_export import ExportUnavailableError
+from services.deck_service import DeckNotFoundError as CardDeckNotFoundError
 from services.tutor_ai_service import TutorAIServiceError, TutorAITimeoutError
 from services.tutor_errors import (
     ConcurrentSendError,
@@ -104,6 +112,22 @@ def classify_ai_job_error(exc: Exception) -> JobError:
     if isinstance(exc, CardNotFoundError):
         return JobError(404, "not_found", "Not Found")
 
+    # --- カードインポート系（import_cards） ---
+    if isinstance(exc, CardDeckNotFoundError):
+        return JobError(404, "not_found", str(exc))
+    if isinstance(exc, ImportFileNotFoundError):
+        return JobError(404, "not_found", str(exc))
+    if isinstance(exc, ImportFileTooLargeError):
+        return JobError(413, "payload_too_large", str(exc))
+    if isinstance(exc, ImportFormatError):
+        return JobError(422, "validation_error", str(exc))
+    if isinstance(exc, ImportUnavailableError):
+        return JobError(503, "unavailable", str(exc))
+
+    # --- データエクスポート系（export_data） ---
+    if isinstance(exc, ExportUnavailableError):
+        return JobError(503, "unavailable", str(exc))
+
     # --- AI サービス系（現行 map_ai_error_to_http と同一の status / 文言） ---
     if isinstance(exc, AITimeoutError):
         return JobError(504, "ai_timeout", "AI service timeout")
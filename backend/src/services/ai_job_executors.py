@@ -6,12 +6,14 @@ job_type ごとに payload を受け取り、既存サービス層を呼び出
 - ここでは HTTP 変換を行わない。例外はそのまま送出し、呼び出し側
   （ワーカー / inline 実行）が classify_ai_job_error で failed ジョブに変換する。
 - SQS ワーカーと submit の inline モードの両方から呼ばれる（単一実装）。
+- import_cards のような長いジョブは PROGRESS_EXECUTORS に登録し、第 3 引数の
+  コールバックで途中経過をジョブレコードの progress に記録する。
 """
 
 from __future__ import annotations
 
 import dataclasses
-from typing import Callable, Dict, Literal, cast
+from typing import Callable, Dict, Literal, Optional, cast
 
 from aws_lambda_powertools import Logger
 
@@ -22,6 +24,7 @@ from models.generate import (
     GenerationInfoResponse,
     RefineCardResponse,
 )
+from models.data_export import DataExportResult
 from models.grading import GradeAnswerResponse
 from models.url_generate import (
     GenerateFromUrlResponse,
@@ -29,9 +32,13 @@ from models.url_generate import (
     UrlGenerationInfoResponse,
 )
 from services.ai_job_errors import NoCardsGeneratedError
+from services.ai_job_store import HEAVY_JOB_TYPES as _HEAVY_JOB_TYPES
 from services.ai_service import create_ai_service
 from services.browser_service import BrowserService
+from services.card_import import ImportUploadStore, iter_text_lines, parse_import_rows
 from services.card_service import CardService
+from services.data_export import DataExporter
+from services.deck_service import DeckService
 from services.review_service import ReviewService
 from services.tutor_service import TutorService
 from services.url_content_service import UrlContentService
@@ -182,8 +189,7 @@ def execute_grade_ai(user_id: str, payload: dict) -> dict:
 
 def execute_advice(user_id: str, payload: dict) -> dict:
     """GET(→POST) /advice 相当（LearningAdviceResponse）。"""
-    user = UserService().get_or_create_user(user_id)
-    user_timezone = user.settings.get("timezone", "Asia/Tokyo")
+    user_timezone = UserService().get_settings(user_id).get("timezone", "Asia/Tokyo")
 
     review_summary = ReviewService().get_review_summary(
         user_id, user_timezone=user_timezone
@@ -238,6 +244,60 @@ def execute_tutor_message(user_id: str, payload: dict) -> dict:
     return result.model_dump(mode="json")
 
 
+def execute_import_cards(
+    user_id: str, payload: dict, on_progress: Callable[[dict], None]
+) -> dict:
+    """POST /cards/import のジョブ本体（CardImportResult）。
+
+    S3 上のアップロードファイルをストリームで解析しながら CardService.import_cards で
+    バッチ書き込みする。成功・失敗にかかわらずアップロードファイルは削除する
+    （再実行はクライアントの再アップロードから行う）。
+    """
+    store = ImportUploadStore()
+    upload_key = payload["upload_key"]
+    body = store.open(upload_key)
+    try:
+        rows = parse_import_rows(iter_text_lines(body), payload["format"])
+        result = CardService().import_cards(
+            user_id,
+            rows,
+            deck_id=payload.get("deck_id"),
+            tags=payload.get("tags") or [],
+            on_progress=on_progress,
+        )
+    finally:
+        body.close()
+        store.delete(upload_key)
+    return result.model_dump(mode="json")
+
+
+def execute_export_data(
+    user_id: str, payload: dict, on_progress: Callable[[dict], None]
+) -> dict:
+    """POST /exports のジョブ本体（DataExportResult）。
+
+    カード・デッキ・レビューをページ単位で gzip NDJSON にストリームし、
+    EXPORT_BUCKET へマルチパートアップロードして署名付き URL を返す。
+    """
+    result = DataExporter().export(user_id, on_progress=on_progress)
+    return DataExportResult(**result).model_dump(mode="json")
+
+
+def execute_reset_deck_cards(
+    user_id: str,
+    payload: dict,
+    on_progress: Callable[[dict], None],
+    checkpoint: Optional[dict] = None,
+) -> dict:
+    """DELETE /decks/{deckId} の大きなデッキ向け後処理（カードの deck_id リセット）。
+
+    checkpoint は再 claim 時の前回 progress（件数の引き継ぎのみ。再開位置は GSI が兼ねる）。
+    """
+    return DeckService().reset_deck_cards(
+        user_id, payload["deck_id"], on_progress=on_progress, checkpoint=checkpoint
+    )
+
+
 # job_type → executor のディスパッチテーブル
 EXECUTORS: Dict[str, Callable[[str, dict], dict]] = {
     "generate": execute_generate,
@@ -249,17 +309,39 @@ EXECUTORS: Dict[str, Callable[[str, dict], dict]] = {
     "tutor_message": execute_tutor_message,
 }
 
-# heavy キュー（AiJobHeavyQueue）で処理する job_type。それ以外は interactive。
-HEAVY_JOB_TYPES = frozenset({"generate_from_url"})
+# 進捗コールバックを受け取る executor（job_type → executor）。
+PROGRESS_EXECUTORS: Dict[str, Callable[[str, dict, Callable[[dict], None]], dict]] = {
+    "import_cards": execute_import_cards,
+    "export_data": execute_export_data,
+    "reset_deck_cards": execute_reset_deck_cards,
+}
+
+# 再 claim 時に前回の progress を checkpoint として受け取る job_type（PROGRESS_EXECUTORS の部分集合）。
+RESUMABLE_JOB_TYPES = frozenset({"reset_deck_cards"})
 
+# heavy キュー振り分け対象（定義は ai_job_store。submit 側の import を軽くするため）。
+HEAVY_JOB_TYPES = _HEAVY_JOB_TYPES
 
-def execute_job(job: dict) -> dict:
+
+def execute_job(job: dict, on_progress: Optional[Callable[[dict], None]] = None) -> dict:
     """ジョブレコードに対応する executor を実行して result を返す。
 
+    Args:
+        job: ジョブレコード。
+        on_progress: PROGRESS_EXECUTORS の executor に渡す進捗コールバック
+            （未指定なら進捗は記録しない）。RESUMABLE_JOB_TYPES の executor には
+            ジョブレコードの progress（前回実行の途中経過）を checkpoint として渡す。
+
     Raises:
         KeyError 等はそのまま送出（呼び出し側で classify → internal）。
     """
-    executor = EXECUTORS[job["job_type"]]
+    job_type = job["job_type"]
+    if job_type in PROGRESS_EXECUTORS:
+        kwargs = {"checkpoint": job.get("progress")} if job_type in RESUMABLE_JOB_TYPES else {}
+        return PROGRESS_EXECUTORS[job_type](
+            job["user_id"], job["payload"], on_progress or (lambda progress: None), **kwargs
+        )
+    executor = EXECUTORS[job_type]
     return executor(job["user_id"], job["payload"])
 
 
@@ -6,6 +6,9 @@ inline 判定は既存 `webhook/line_actions._should_enqueue` と同じ規約:
 
 enqueue 失敗時は inline へフォールバックせず例外を伝播する（既存 N-5 と同方針。
 ジョブレコードは queued のまま残るが TTL 24h で自動削除される）。
+
+executor 群（AI SDK・URL 取り込み・全ドメインのサービス）は inline 実行時にのみ
+import する。API Lambda の submit 経路（SQS enqueue）では読み込まない。
 """
 
 from __future__ import annotations
@@ -13,15 +16,18 @@ from __future__ import annotations
 import json
 import os
 import time
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from aws_lambda_powertools import Logger
 
-from services.ai_job_errors import classify_ai_job_error
-from services.ai_job_executors import HEAVY_JOB_TYPES, execute_job
-from services.ai_job_store import AiJobStore
+from services.ai_job_store import HEAVY_JOB_TYPES, AiJobStore
+from utils.capacity_meter import CapacityScope, capacity_scope
+from utils.profiler import ProfileScope, profile_scope
 from utils.sqs_client import get_sqs_client
 
+if TYPE_CHECKING:
+    from services.ai_job_errors import JobError
+
 logger = Logger()
 
 _sqs_client: Any = None
@@ -31,6 +37,20 @@ RECORD_RESULT_ATTEMPTS = 3
 RECORD_RESULT_BACKOFF_SECONDS = 0.5
 
 
+def execute_job(job: dict, on_progress: Optional[Callable[[dict], None]] = None) -> dict:
+    """ai_job_executors.execute_job を遅延 import して実行する。"""
+    from services.ai_job_executors import execute_job as _execute_job
+
+    return _execute_job(job, on_progress=on_progress)
+
+
+def classify_ai_job_error(exc: Exception) -> JobError:
+    """ai_job_errors.classify_ai_job_error を遅延 import して呼び出す。"""
+    from services.ai_job_errors import classify_ai_job_error as _classify
+
+    return _classify(exc)
+
+
 def _get_sqs_client() -> Any:
     """SQS クライアントを遅延生成して返す。"""
     global _sqs_client
@@ -89,16 +109,42 @@ def record_result_with_retry(
     return False
 
 
+def _progress_recorder(store: AiJobStore, job_id: str) -> Callable[[dict], None]:
+    """ジョブの進捗をベストエフォートで記録するコールバックを返す。
+
+    進捗の記録失敗でジョブ本体を失敗させない（最終結果は Phase C で記録される）。
+    """
+
+    def record(progress: dict) -> None:
+        try:
+            store.update_progress(job_id, progress)
+        except Exception as e:
+            logger.warning(
+                "Failed to record AI job progress",
+                extra={"job_id": job_id, "error": str(e)},
+            )
+
+    return record
+
+
 def run_job_inline(store: AiJobStore, job_id: str) -> None:
     """ジョブをその場で claim → 実行 → 記録する（inline モード / ワーカー共通の実行部）。
 
     例外は送出しない（結果は必ずジョブレコードに記録される）。
     claim できなかった場合（重複実行等）は何もしない。
+    DynamoDB の消費キャパシティは "job:<job_type>" 単位で集計する（utils/capacity_meter.py）。
+    採取対象のジョブは同じ名前でプロファイルも取る（utils/profiler.py）。
     """
+    with capacity_scope("job:unclaimed") as capacity, profile_scope("job:unclaimed", request_id=job_id) as profile:
+        _run_job(store, job_id, capacity, profile)
+
+
+def _run_job(store: AiJobStore, job_id: str, capacity: CapacityScope, profile: ProfileScope) -> None:
     job = store.claim(job_id)
     if job is None:
         logger.info("AI job already claimed or finished", extra={"job_id": job_id})
         return
+    capacity.route = profile.name = f"job:{job.get('job_type', 'unknown')}"
 
     from services.ai_job_executors import is_supported_schema
 
@@ -115,7 +161,7 @@ def run_job_inline(store: AiJobStore, job_id: str) -> None:
         return
 
     try:
-        result = execute_job(job)
+        result = execute_job(job, on_progress=_progress_recorder(store, job_id))
     except Exception as exc:
         job_error = classify_ai_job_error(exc)
         # 想定内の AI/ドメインエラーは warning、分類不能な internal（実装バグの
@@ -6,23 +6,23 @@ AiJobsTable への CRUD と、ワーカーの claim（queued→processing の条
 
 Decimal 変換（設計レビュー C-1）:
     result / payload には float が混入する（例: advice の study_stats.average_grade）。
-    boto3 の DynamoDB リソースは float を受け付けないため、書き込み時に
-    ``json.loads(json.dumps(x), parse_float=Decimal)`` で再帰変換し、読み出し時に
-    Decimal → int/float へ逆変換して JSON シリアライズ可能な形で返す。
+    boto3 の DynamoDB リソースは float を受け付けないため、書き込み時に float → Decimal
+    へ再帰変換し、読み出し時に Decimal → int/float へ逆変換して JSON シリアライズ可能な形で
+    返す。変換は utils/json_codec が型ごとに直接行う（旧実装の
+    ``json.loads(json.dumps(x), parse_float=Decimal)`` と同じ値で、文字列往復を伴わない）。
 """
 
 from __future__ import annotations
 
-import json
 import os
 import uuid
 from datetime import datetime, timedelta, timezone
-from decimal import Decimal
 from typing import Any, Optional
 
 from aws_lambda_powertools import Logger
 from botocore.exceptions import ClientError
 
+from utils import json_codec
 from utils.dynamodb_client import get_dynamodb_resource
 
 logger = Logger()
@@ -46,23 +46,22 @@ STATUS_PROCESSING = "processing"
 STATUS_COMPLETED = "completed"
 STATUS_FAILED = "failed"
 
+# heavy キュー（AiJobHeavyQueue）で処理する job_type。それ以外は interactive。
+# import_cards / export_data / reset_deck_cards は AI を呼ばないが、数千件の読み書きで
+# interactive キューのワーカーを占有しないよう heavy 側へ振り分ける。
+# submit 側（API Lambda）がキュー振り分けのためだけに executor 群を import しないよう
+# ここで定義する（ai_job_executors から再エクスポート）。
+HEAVY_JOB_TYPES = frozenset({"generate_from_url", "import_cards", "export_data", "reset_deck_cards"})
+
 
 def to_dynamodb_safe(value: Any) -> Any:
     """float を Decimal に再帰変換して DynamoDB に書き込める形にする。"""
-    return json.loads(json.dumps(value), parse_float=Decimal)
+    return json_codec.to_dynamodb(value)
 
 
 def from_dynamodb_safe(value: Any) -> Any:
     """DynamoDB の Decimal を int/float に再帰変換して JSON 化可能な形にする。"""
-    if isinstance(value, Decimal):
-        if value == value.to_integral_value():
-            return int(value)
-        return float(value)
-    if isinstance(value, dict):
-        return {k: from_dynamodb_safe(v) for k, v in value.items()}
-    if isinstance(value, list):
-        return [from_dynamodb_safe(v) for v in value]
-    return value
+    return json_codec.from_dynamodb(value)
 
 
 class AiJobStore:
@@ -146,6 +145,33 @@ class AiJobStore:
             raise
         return from_dynamodb_safe(response.get("Attributes", {}))
 
+    def update_progress(self, job_id: str, progress: dict) -> None:
+        """processing 中のジョブに途中経過（progress）を記録する。
+
+        updated_at も更新するため、長時間のジョブ（import_cards 等）が
+        STALE_PROCESSING_SECONDS 経過で stale とみなされ再 claim されることも防ぐ。
+        completed / failed 後の遅延書き込みは条件不成立で無視する。
+        """
+        try:
+            self.table.update_item(
+                Key={"job_id": job_id},
+                UpdateExpression="SET progress = :progress, updated_at = :now",
+                ConditionExpression="#st = :processing",
+                ExpressionAttributeNames={"#st": "status"},
+                ExpressionAttributeValues={
+                    ":progress": to_dynamodb_safe(progress),
+                    ":processing": STATUS_PROCESSING,
+                    ":now": datetime.now(timezone.utc).isoformat(),
+                },
+            )
+        except ClientError as e:
+            if (
+                e.response.get("Error", {}).get("Code")
+                == "ConditionalCheckFailedException"
+            ):
+                return
+            raise
+
     def complete(self, job_id: str, result: dict) -> None:
         """ジョブを completed にして結果を記録する。"""
         self.table.update_item(
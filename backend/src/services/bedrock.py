@@ -6,13 +6,13 @@ import random
 import time
 from typing import List, Optional
 
-import boto3
 from aws_lambda_powertools import Logger
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from .prompts import DifficultyLevel, Language, get_card_generation_prompt, get_grading_prompt, get_advice_prompt, get_refine_user_prompt, get_refine_system_prompt
 from .prompts.url_generate import get_url_card_generation_prompt
+from services.chunk_generation import CHUNK_GENERATION_CONCURRENCY, run_chunk_generation
 from services.ai_service import (
     AIServiceError,
     AITimeoutError,
@@ -27,6 +27,7 @@ from services.ai_service import (
     RefineResult,
 )
 from utils.ai_json import extract_json_from_text
+from utils.aws_clients import get_client
 
 logger = Logger()
 
@@ -72,6 +73,8 @@ class BedrockService:
     # C-4: Hard cap on per-request chunk → Bedrock invocations. A huge page can
     # produce many chunks; without a cap, cost/latency grows unboundedly.
     MAX_CHUNK_CALLS = 8
+    # Chunks are generated concurrently (see services/chunk_generation.py).
+    CHUNK_CONCURRENCY = CHUNK_GENERATION_CONCURRENCY
 
     def __init__(
         self,
@@ -96,15 +99,14 @@ class BedrockService:
                 connect_timeout=5,
                 retries={"max_attempts": 0},  # We handle retries ourselves
             )
-            endpoint_url = os.environ.get("BEDROCK_ENDPOINT_URL")
-            if endpoint_url:
-                self.client = boto3.client(
-                    "bedrock-runtime",
-                    config=config,
-                    endpoint_url=endpoint_url,
-                )
-            else:
-                self.client = boto3.client("bedrock-runtime", config=config)
+            # create_ai_service() はジョブごとに呼ばれるため、クライアントは
+            # プロセス共有のものを使う（utils/aws_clients.py）。
+            self.client = get_client(
+                "bedrock-runtime",
+                endpoint_url=os.environ.get("BEDROCK_ENDPOINT_URL"),
+                config=config,
+                profile="bedrock-generate",
+            )
 
     def generate_cards(
         self,
@@ -178,27 +180,10 @@ class BedrockService:
             GenerationResult with generated cards and metadata.
         """
         start_time = time.time()
-        all_cards: List[GeneratedCard] = []
         total_input_length = sum(len(c) for c in chunks)
         cards_per_chunk = max(3, target_count // max(len(chunks), 1))
 
-        # C-4: bound Bedrock calls. Process at most MAX_CHUNK_CALLS chunks and
-        # stop early once we already have enough cards for target_count.
-        processed_chunks = 0
-        total_chunks = len(chunks)
-        for chunk_text in chunks:
-            if len(all_cards) >= target_count:
-                break
-            if processed_chunks >= self.MAX_CHUNK_CALLS:
-                logger.warning(
-                    "Chunk call cap reached; skipping remaining chunks",
-                    extra={
-                        "processed_chunks": processed_chunks,
-                        "total_chunks": total_chunks,
-                        "max_chunk_calls": self.MAX_CHUNK_CALLS,
-                    },
-                )
-                break
+        def generate(chunk_text: str) -> List[GeneratedCard]:
             prompt = get_url_card_generation_prompt(
                 chunk_text=chunk_text,
                 card_count=cards_per_chunk,
@@ -207,13 +192,21 @@ class BedrockService:
                 language=language,
                 page_title=page_title,
             )
-            processed_chunks += 1
-            try:
-                response_text = self._invoke_with_retry(prompt)
-                cards = self._parse_response(response_text)
-                all_cards.extend(cards)
-            except (BedrockParseError, BedrockServiceError):
-                continue
+            return self._parse_response(self._invoke_with_retry(prompt))
+
+        # C-4: bound Bedrock calls (at most MAX_CHUNK_CALLS chunks, early stop
+        # once target_count is reached). Chunks run CHUNK_CONCURRENCY at a time
+        # and are merged in chunk order; a failed chunk is skipped.
+        outcome = run_chunk_generation(
+            chunks,
+            generate,
+            target_count=target_count,
+            cards_per_chunk=cards_per_chunk,
+            max_calls=self.MAX_CHUNK_CALLS,
+            max_workers=self.CHUNK_CONCURRENCY,
+            skip_errors=(BedrockParseError, BedrockServiceError),
+        )
+        all_cards = outcome.cards
 
         # Deduplicate by front text
         seen_fronts: set[str] = set()
@@ -0,0 +1,336 @@
+"""Card import: upload storage and streaming parsers for CSV / TSV / Anki exports.
+
+他の単語帳アプリからの移行用。1 枚ずつ POST /cards を呼ぶと数千枚で数分かかるため、
+ファイルを S3 (IMPORT_BUCKET) に直接アップロードさせ、import_cards ジョブ
+（ai_job_executors.execute_import_cards）がストリームで読みながらバッチ書き込みする。
+
+フロー:
+  1. POST /cards/import/upload-url → 署名付き PUT URL と upload_key を返す。
+  2. クライアントがファイルを PUT する。
+  3. POST /cards/import (upload_key, format) → import_cards ジョブを submit (202)。
+  4. ワーカーが本モジュールの parse_import_rows でファイルを 1 行ずつ読み、
+     CardService.import_cards がバッチ書き込みする。進捗はジョブレコードの progress に
+     定期的に記録され、GET /ai-jobs/{job_id} で参照できる。
+
+対応形式:
+  - csv / tsv: 1 列目 front、2 列目 back、3 列目 tags（空白またはカンマ区切り）。
+    1 行目が front / back を含むヘッダー行の場合は列名で対応付ける。
+  - anki: Anki の「Notes in Plain Text」エクスポート。先頭の ``#separator:`` /
+    ``#html:`` / ``#tags column:`` 等のヘッダー行を解釈し、guid / notetype / deck 列を
+    除いた先頭 2 列を front / back とする。.apkg（SQLite パッケージ）は対象外。
+
+IMPORT_BUCKET 未設定（ローカル開発既定）ではインポートは無効（ImportUnavailableError）。
+"""
+
+import codecs
+import csv
+import html
+import itertools
+import os
+import re
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from aws_lambda_powertools import Logger
+from botocore.exceptions import BotoCoreError, ClientError
+
+from utils.s3_client import get_s3_client
+from .card_repository import CardServiceError
+
+logger = Logger()
+
+IMPORT_KEY_PREFIX = "imports/"
+# 署名付きアップロード URL の有効期限（秒）。
+UPLOAD_URL_EXPIRES_SECONDS = 900
+# 取り込むファイルサイズの上限。5k 枚の CSV は 1MB 未満のため十分な余裕がある。
+MAX_IMPORT_BYTES = 10 * 1024 * 1024
+# ストリーム読み出しのチャンクサイズ。
+READ_CHUNK_BYTES = 64 * 1024
+
+_ANKI_SEPARATORS = {
+    "tab": "\t",
+    "comma": ",",
+    "semicolon": ";",
+    "space": " ",
+    "pipe": "|",
+    "colon": ":",
+}
+# Anki エクスポートで front / back 以外に割り当てられ得る列。
+_ANKI_META_COLUMNS = ("guid", "notetype", "deck", "tags")
+_TAG_SPLIT_RE = re.compile(r"[\s,]+")
+_BR_RE = re.compile(r"<br\s*/?>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+class CardImportError(CardServiceError):
+    """Base exception for card import errors."""
+
+    pass
+
+
+class ImportUnavailableError(CardImportError):
+    """Raised when the import bucket is not configured."""
+
+    pass
+
+
+class ImportFileNotFoundError(CardImportError):
+    """Raised when the uploaded import file does not exist."""
+
+    pass
+
+
+class ImportFileTooLargeError(CardImportError):
+    """Raised when the uploaded import file exceeds MAX_IMPORT_BYTES."""
+
+    pass
+
+
+class ImportFormatError(CardImportError):
+    """Raised when the import file cannot be decoded or parsed."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class ImportRow:
+    """インポートファイルの 1 行（検証前）。"""
+
+    line: int
+    front: str
+    back: str
+    tags: List[str] = field(default_factory=list)
+
+
+# ----------------------------------------------------------------------
+# Parsing
+# ----------------------------------------------------------------------
+
+
+def iter_text_lines(stream: Any) -> Iterator[str]:
+    """バイトストリームを UTF-8（BOM 可）としてデコードし、改行付きの行を順に返す。
+
+    ファイル全体をメモリに載せず、READ_CHUNK_BYTES ずつ読み進める。
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    while True:
+        chunk = stream.read(READ_CHUNK_BYTES)
+        final = not chunk
+        try:
+            text = decoder.decode(chunk or b"", final=final)
+        except UnicodeDecodeError:
+            raise ImportFormatError("Import file must be UTF-8 encoded text")
+        lines = (pending + text).splitlines(keepends=True)
+        # 末尾の行はチャンク境界で途切れている（"\r\n" の分断を含む）可能性があるため、
+        # 次のチャンクと連結してから返す。
+        pending = "" if final or not lines else lines.pop()
+        yield from lines
+        if final:
+            break
+
+
+def _split_tags(value: str) -> List[str]:
+    return [tag for tag in _TAG_SPLIT_RE.split(value or "") if tag]
+
+
+def _strip_html(value: str) -> str:
+    return html.unescape(_TAG_RE.sub("", _BR_RE.sub("\n", value)))
+
+
+def _records(lines: Iterable[str], delimiter: str) -> Iterator[Tuple[int, List[str]]]:
+    """csv.reader のレコードを (開始行番号, レコード) で返す（改行を含むフィールドに対応）。"""
+    reader = csv.reader(lines, delimiter=delimiter)
+    while True:
+        start = reader.line_num + 1
+        try:
+            record = next(reader)
+        except StopIteration:
+            return
+        yield start, record
+
+
+def _parse_delimited(lines: Iterable[str], delimiter: str) -> Iterator[ImportRow]:
+    columns: Optional[Dict[str, int]] = None
+    for line, record in _records(lines, delimiter):
+        if not any(cell.strip() for cell in record):
+            continue
+        if columns is None:
+            header = [cell.strip().casefold() for cell in record]
+            if "front" in header and "back" in header:
+                columns = {name: header.index(name) for name in ("front", "back", "tags") if name in header}
+                continue
+            columns = {"front": 0, "back": 1, "tags": 2}
+
+        def cell(name: str) -> str:
+            index = columns.get(name)
+            return record[index] if index is not None and index < len(record) else ""
+
+        yield ImportRow(
+            line=line,
+            front=cell("front"),
+            back=cell("back"),
+            tags=_split_tags(cell("tags")),
+        )
+
+
+def _parse_anki(lines: Iterable[str]) -> Iterator[ImportRow]:
+    iterator = iter(lines)
+    separator = "\t"
+    is_html = True
+    meta_columns: Dict[str, int] = {}
+    header_lines = 0
+    first: Optional[str] = None
+    for line in iterator:
+        if not line.startswith("#"):
+            first = line
+            break
+        header_lines += 1
+        key, _, value = line[1:].strip().partition(":")
+        key, value = key.strip().casefold(), value.strip()
+        if key == "separator":
+            separator = _ANKI_SEPARATORS.get(value.casefold(), value[:1] or "\t")
+        elif key == "html":
+            is_html = value.casefold() == "true"
+        elif key.endswith(" column") and key[: -len(" column")] in _ANKI_META_COLUMNS:
+            try:
+                meta_columns[key[: -len(" column")]] = int(value) - 1
+            except ValueError:
+                raise ImportFormatError(f"Invalid Anki header on line {header_lines}: {line.strip()}")
+    if first is None:
+        return
+
+    skip = set(meta_columns.values())
+    tags_index = meta_columns.get("tags")
+    for line_no, record in _records(itertools.chain([first], iterator), separator):
+        if not any(cell.strip() for cell in record):
+            continue
+        fields = [cell for i, cell in enumerate(record) if i not in skip]
+        front = fields[0] if fields else ""
+        back = fields[1] if len(fields) > 1 else ""
+        if is_html:
+            front, back = _strip_html(front), _strip_html(back)
+        tags = record[tags_index] if tags_index is not None and tags_index < len(record) else ""
+        yield ImportRow(
+            line=header_lines + line_no,
+            front=front,
+            back=back,
+            tags=_split_tags(tags),
+        )
+
+
+def parse_import_rows(lines: Iterable[str], import_format: str) -> Iterator[ImportRow]:
+    """テキスト行をストリームで解析し、ImportRow を順に返す（検証は行わない）。
+
+    空行はスキップする。列が足りない行は front / back を空文字で返し、
+    呼び出し側の CreateCardRequest 検証で不正行として数える。
+
+    Raises:
+        ImportFormatError: デコード・CSV 解析に失敗した場合（未知の形式を含む）。
+    """
+    if import_format == "csv":
+        rows = _parse_delimited(lines, ",")
+    elif import_format == "tsv":
+        rows = _parse_delimited(lines, "\t")
+    elif import_format == "anki":
+        rows = _parse_anki(lines)
+    else:
+        raise ImportFormatError(f"Unsupported import format: {import_format}")
+    try:
+        yield from rows
+    except csv.Error as e:
+        raise ImportFormatError(f"Failed to parse import file: {e}")
+
+
+# ----------------------------------------------------------------------
+# Upload storage
+# ----------------------------------------------------------------------
+
+
+class ImportUploadStore:
+    """IMPORT_BUCKET 上のアップロードファイルを扱う。
+
+    キーは ``imports/<user_id>/<uuid>``。submit 時に owns_key で他ユーザーの
+    キーを指定できないことを確認する。バケットには短期のライフサイクル削除を
+    設定しており（template.yaml）、取り込み後は delete でも削除する。
+    """
+
+    def __init__(self, bucket_name: Optional[str] = None, s3_client: Optional[Any] = None):
+        """Initialize ImportUploadStore.
+
+        Args:
+            bucket_name: S3 bucket name. Defaults to IMPORT_BUCKET env var.
+                空文字（未設定）の場合はインポートを無効化する。
+            s3_client: Optional boto3 S3 client for testing.
+        """
+        self.bucket_name = bucket_name if bucket_name is not None else os.environ.get("IMPORT_BUCKET", "")
+        self._client = s3_client
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.bucket_name)
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            self._client = get_s3_client()
+        return self._client
+
+    def _require_enabled(self) -> None:
+        if not self.enabled:
+            raise ImportUnavailableError("Card import is not configured")
+
+    @staticmethod
+    def owns_key(user_id: str, key: str) -> bool:
+        """key が user_id 用に発行されたアップロードキーか。"""
+        return key.startswith(f"{IMPORT_KEY_PREFIX}{user_id}/") and ".." not in key
+
+    def create_upload_url(self, user_id: str) -> Dict[str, Any]:
+        """署名付き PUT URL を発行する。
+
+        Returns:
+            ``{"upload_url", "upload_key", "expires_in"}``。
+
+        Raises:
+            ImportUnavailableError: バケット未設定時。
+        """
+        self._require_enabled()
+        key = f"{IMPORT_KEY_PREFIX}{user_id}/{uuid.uuid4()}"
+        url = self.client.generate_presigned_url(
+            "put_object",
+            Params={"Bucket": self.bucket_name, "Key": key},
+            ExpiresIn=UPLOAD_URL_EXPIRES_SECONDS,
+        )
+        return {"upload_url": url, "upload_key": key, "expires_in": UPLOAD_URL_EXPIRES_SECONDS}
+
+    def open(self, key: str) -> Any:
+        """アップロードファイルを開き、StreamingBody を返す。
+
+        Raises:
+            ImportUnavailableError: バケット未設定時。
+            ImportFileNotFoundError: ファイルが存在しない（未アップロード・期限切れ）場合。
+            ImportFileTooLargeError: MAX_IMPORT_BYTES を超える場合。
+            CardImportError: その他の S3 エラー時。
+        """
+        self._require_enabled()
+        try:
+            response = self.client.get_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                raise ImportFileNotFoundError("Import file not found; upload it before submitting")
+            raise CardImportError(f"Failed to read import file: {e}")
+        body = response["Body"]
+        if int(response.get("ContentLength", 0)) > MAX_IMPORT_BYTES:
+            body.close()
+            raise ImportFileTooLargeError(f"Import file exceeds {MAX_IMPORT_BYTES // (1024 * 1024)}MB")
+        return body
+
+    def delete(self, key: str) -> None:
+        """取り込み済みファイルを削除する（ベストエフォート。残ってもライフサイクルで消える）。"""
+        if not self.enabled:
+            return
+        try:
+            self.client.delete_object(Bucket=self.bucket_name, Key=key)
+        except (BotoCoreError, ClientError) as e:
+            logger.warning("Failed to delete import file", extra={"key": key, "error": str(e)})
@@ -6,19 +6,46 @@ CardService から DynamoDB アクセスと低レベルなエラー変換を分
 責務のみを持つ。
 """
 
+import base64
+import binascii
+import json
 import os
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from aws_lambda_powertools import Logger
 from boto3.dynamodb.types import TypeSerializer
 from botocore.exceptions import ClientError
 
 from utils.dynamodb_client import get_dynamodb_client, get_dynamodb_resource
+from utils.projection import apply_projection
+from utils.request_cache import MISS, request_cache
+
+from .data_version import version_timestamp
 
 # 【ロガー設定】: TransactionCanceledException などの内部エラーをログ出力するために必要 (EARS-009)
 logger = Logger()
 
+# BatchGetItem の 1 リクエストあたり最大キー数（DynamoDB の制約）。
+BATCH_GET_MAX_KEYS = 100
+# BatchGetItem / BatchWriteItem の UnprocessedKeys / UnprocessedItems 再試行設定。
+BATCH_MAX_RETRIES = 5
+BATCH_RETRY_BASE_DELAY = 0.05
+# BatchWriteItem の 1 リクエストあたり最大アイテム数（DynamoDB の制約）。
+BATCH_WRITE_MAX_ITEMS = 25
+# reserve_card_slots: 並行作成で条件が外れた際に、空き枠を読み直して再予約する回数。
+RESERVE_MAX_ATTEMPTS = 3
+
+# 差分同期 (GET /cards/changes)。
+# tombstone の保持期間。これより古い sync token は差分を保証できないため全件再同期させる。
+TOMBSTONE_RETENTION_DAYS = 30
+# 前回ウィンドウ上端からさかのぼって再取得する秒数。GSI の結果整合性と Lambda 間の
+# 時計ずれで「上端より前の updated_at を持つが、まだ GSI に見えていない」書き込みを拾う。
+# 重複して返るカードはクライアントが card_id で上書きするため無害。
+SYNC_OVERLAP_SECONDS = 5
+CHANGES_INDEX_NAME = "user_id-updated_at-index"
+
 
 class CardServiceError(Exception):
     """Base exception for card service errors."""
@@ -76,6 +103,46 @@ class ItemSizeExceededError(CardServiceError):
     pass
 
 
+class InvalidCursorError(CardServiceError):
+    """Raised when a pagination cursor cannot be decoded or belongs to another query."""
+
+    pass
+
+
+class SyncTokenExpiredError(CardServiceError):
+    """Raised when a sync token predates the tombstone retention window."""
+
+    pass
+
+
+def _encode_cursor(last_evaluated_key: Dict[str, Any]) -> str:
+    """GSI の LastEvaluatedKey を URL セーフな不透明カーソル文字列へエンコードする。"""
+    raw = json.dumps(last_evaluated_key, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Dict[str, Any]:
+    """_encode_cursor の逆変換。不正な文字列は InvalidCursorError にする。"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        decoded = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError, binascii.Error) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(decoded, dict) or not all(isinstance(v, str) for v in decoded.values()):
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+    return decoded
+
+
+def _tombstone_partition_key(user_id: str) -> str:
+    """削除記録 (tombstone) を置くパーティションキー "<user_id>#deleted" を返す。
+
+    カードと同じテーブルに置くが、ユーザーの通常パーティション (user_id) とは
+    キーが異なるため一覧・集計系の Query には現れない。updated_at を持つので
+    user_id-updated_at-index には投影され、差分同期で削除を検知できる。
+    """
+    return f"{user_id}#deleted"
+
+
 def _is_item_size_exceeded_error(error: ClientError) -> bool:
     """ValidationException のうち「アイテムサイズ超過」を示すものだけを判別する。
 
@@ -133,15 +200,29 @@ class CardRepository:
                 使う。レビュー指摘2: apply_review_update の 404/409 出し分け
                 （削除直後の実在確認）は結果整合性読み取りだと古いアイテムが
                 返り誤判定し得るため、その呼び出しでは True を渡すこと。
+
+        結果整合性読み取りはリクエストスコープキャッシュ（utils/request_cache.py）を
+        経由する。ConsistentRead はキャッシュを読まずに DynamoDB を読み、結果で
+        キャッシュを更新する（以降の読み取りは最新の値を返す）。
         """
+        if not consistent_read:
+            cached = request_cache.get(self.table_name, user_id, card_id)
+            if cached is not MISS:
+                return cached
         try:
             response = self.table.get_item(
                 Key={"user_id": user_id, "card_id": card_id},
                 ConsistentRead=consistent_read,
             )
-            return response.get("Item")
         except ClientError as e:
             raise CardServiceError(f"Failed to get card: {e}")
+        item = response.get("Item")
+        request_cache.put(self.table_name, user_id, card_id, item=item)
+        return item
+
+    def _invalidate_card(self, user_id: str, card_id: str) -> None:
+        """書き込み前にリクエストスコープキャッシュの該当カードを破棄する。"""
+        request_cache.invalidate(self.table_name, user_id, card_id)
 
     def create_card_atomic(self, card_item: Dict[str, Any], user_id: str, max_cards: int) -> None:
         """TransactWriteItems で card_count インクリメントとカード作成をアトミックに実行する。
@@ -157,6 +238,8 @@ class CardRepository:
 
             # Serialize the card item
             serialized_card = {k: serializer.serialize(v) for k, v in card_item.items()}
+            self._invalidate_card(user_id, card_item["card_id"])
+            request_cache.invalidate(self.users_table_name, user_id)
 
             # Perform the transactional write
             client.transact_write_items(
@@ -168,12 +251,15 @@ class CardRepository:
                             # 【UpdateExpression修正】: ADD を使用して
                             # card_count属性が存在しない場合は自動的に作成し、
                             # 存在する場合はインクリメントする
-                            'UpdateExpression': 'ADD card_count :inc',
+                            # data_version も同じ更新で加算し、条件付き GET の ETag を進める
+                            'UpdateExpression': 'SET data_version_at = :now ADD card_count :inc, data_version :one',
                             # 【ConditionExpression修正】: attribute_not_exists OR card_count < :limit
                             # card_count属性が未存在時は許可し、存在時はリミットチェック
                             'ConditionExpression': 'attribute_not_exists(card_count) OR card_count < :limit',
                             'ExpressionAttributeValues': {
                                 ':inc': {'N': '1'},
+                                ':one': {'N': '1'},
+                                ':now': {'N': str(version_timestamp())},
                                 ':limit': {'N': str(max_cards)},
                             }
                         }
@@ -203,6 +289,106 @@ class CardRepository:
                 raise InternalError("Card creation failed due to transaction conflict")
             raise CardServiceError(f"Failed to create card: {e}")
 
+    def reserve_card_slots(self, user_id: str, requested: int, max_cards: int) -> int:
+        """card_count に対して最大 requested 枠を 1 回の条件付き ADD で予約する。
+
+        bulk 作成用。カードごとに card_count を加算するトランザクションを発行すると
+        users アイテムがホットキーになるため、枠をまとめて確保してから BatchWriteItem で
+        書き込む。上限までの残り枠が requested に満たない場合は、残り枠だけを予約する
+        （従来の 1 件ずつ作成と同じく「上限まで保存し、超過分は保存しない」挙動）。
+
+        Returns:
+            予約できた枠数（1 以上）。
+
+        Raises:
+            CardLimitExceededError: 空き枠が 0 の場合。
+            CardServiceError: その他の DynamoDB エラー時。
+        """
+        amount = min(requested, max_cards)
+        for _ in range(RESERVE_MAX_ATTEMPTS):
+            if amount <= 0:
+                break
+            request_cache.invalidate(self.users_table_name, user_id)
+            try:
+                self.users_table.update_item(
+                    Key={"user_id": user_id},
+                    UpdateExpression="ADD card_count :n",
+                    # card_count + :n <= max_cards と同値（DynamoDB の条件式は加算を書けない）
+                    ConditionExpression="attribute_not_exists(card_count) OR card_count <= :threshold",
+                    ExpressionAttributeValues={":n": amount, ":threshold": max_cards - amount},
+                )
+                return amount
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise CardServiceError(f"Failed to reserve card slots: {e}")
+            # 並行作成で枠が埋まった、または残り枠が不足している。残り枠を読み直して再予約する。
+            try:
+                item = self.users_table.get_item(
+                    Key={"user_id": user_id},
+                    ProjectionExpression="card_count",
+                    ConsistentRead=True,
+                ).get("Item", {})
+            except ClientError as e:
+                raise CardServiceError(f"Failed to reserve card slots: {e}")
+            amount = min(requested, max_cards - int(item.get("card_count", 0)))
+        raise CardLimitExceededError(f"Card limit of {max_cards} exceeded")
+
+    def release_card_slots(self, user_id: str, count: int) -> None:
+        """reserve_card_slots で予約したが書き込めなかった枠を返却する（ベストエフォート）。
+
+        返却に失敗すると card_count が実カード数より大きいまま残る（上限に早く達する）
+        ため、error レベルで記録する。
+        """
+        if count <= 0:
+            return
+        request_cache.invalidate(self.users_table_name, user_id)
+        try:
+            self.users_table.update_item(
+                Key={"user_id": user_id},
+                UpdateExpression="ADD card_count :neg",
+                ConditionExpression="card_count >= :count",
+                ExpressionAttributeValues={":neg": -count, ":count": count},
+            )
+        except ClientError as e:
+            logger.error(
+                "Failed to release reserved card slots: card_count may be overstated",
+                extra={"user_id": user_id, "count": count, "error": str(e)},
+            )
+
+    def batch_put_items(self, items: List[Dict[str, Any]]) -> List[str]:
+        """BatchWriteItem でカードをまとめて書き込み、書き込めなかった card_id を返す。
+
+        25 件ずつ分割して発行し、UnprocessedItems は指数バックオフで再試行する。
+        再試行上限後も残ったアイテムや、リクエスト自体が失敗したチャンクのアイテムは
+        例外にせず失敗として返す（呼び出し側が予約枠を返却する）。
+        """
+        failed: List[str] = []
+        for item in items:
+            self._invalidate_card(item["user_id"], item["card_id"])
+        for start in range(0, len(items), BATCH_WRITE_MAX_ITEMS):
+            chunk = items[start:start + BATCH_WRITE_MAX_ITEMS]
+            request: Dict[str, Any] = {
+                self.table_name: [{"PutRequest": {"Item": item}} for item in chunk]
+            }
+            try:
+                for attempt in range(BATCH_MAX_RETRIES + 1):
+                    response = self.dynamodb.batch_write_item(RequestItems=request)
+                    request = response.get("UnprocessedItems") or {}
+                    if not request:
+                        break
+                    if attempt < BATCH_MAX_RETRIES:
+                        time.sleep(BATCH_RETRY_BASE_DELAY * (2 ** attempt))
+            except ClientError as e:
+                # 再試行中の失敗でも、先行リクエストで書き込み済みのアイテムは成功扱い。
+                logger.warning(
+                    "BatchWriteItem failed for card chunk",
+                    extra={"chunk_size": len(chunk), "error": str(e)},
+                )
+            failed.extend(
+                entry["PutRequest"]["Item"]["card_id"] for entry in request.get(self.table_name, [])
+            )
+        return failed
+
     def update_item(
         self,
         user_id: str,
@@ -240,6 +426,7 @@ class CardRepository:
             if expression_names:
                 update_kwargs["ExpressionAttributeNames"] = expression_names
 
+            self._invalidate_card(user_id, card_id)
             self.table.update_item(**update_kwargs)
         except ClientError as e:
             if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
@@ -309,13 +496,19 @@ class CardRepository:
     def delete_card_atomic(self, user_id: str, card_id: str) -> None:
         """TransactWriteItems でカード削除と card_count デクリメントをアトミックに実行する。
 
+        同じトランザクションで差分同期用の tombstone を書き込むため、削除が成功した
+        カードは必ず GET /cards/changes の deleted_card_ids に現れる。
+
         Raises:
             CardNotFoundError: 並行削除によりカードが既に削除されていた場合 (EARS-012)。
             CardServiceError: card_count が既に 0 の場合 (EARS-013)、その他の DynamoDB エラー時。
         """
+        now = datetime.now(timezone.utc)
+        self._invalidate_card(user_id, card_id)
+        request_cache.invalidate(self.users_table_name, user_id)
         try:
             client = self._client
-            # 【トランザクション実行】: 2つの操作をアトミックに実行する
+            # 【トランザクション実行】: 3つの操作をアトミックに実行する
             client.transact_write_items(
                 TransactItems=[
                     {
@@ -330,16 +523,34 @@ class CardRepository:
                     {
                         # 【Index 1】: Users テーブルの card_count を 1 デクリメント
                         # card_count > :zero の条件でネガティブ値を防止 (EARS-014)
+                        # data_version も同じ更新で加算し、条件付き GET の ETag を進める
                         'Update': {
                             'TableName': self.users_table_name,
                             'Key': {'user_id': {'S': user_id}},
-                            'UpdateExpression': 'SET card_count = card_count - :dec',
+                            'UpdateExpression': (
+                                'SET card_count = card_count - :dec, data_version_at = :now ADD data_version :one'
+                            ),
                             'ConditionExpression': 'card_count > :zero',
                             'ExpressionAttributeValues': {
                                 ':dec': {'N': '1'},
+                                ':one': {'N': '1'},
+                                ':now': {'N': str(version_timestamp())},
                                 ':zero': {'N': '0'}
                             }
                         }
+                    },
+                    {
+                        # 【Index 2】: 差分同期用 tombstone を "<user_id>#deleted" パーティションへ記録
+                        # ttl で TOMBSTONE_RETENTION_DAYS 経過後に自動削除される
+                        'Put': {
+                            'TableName': self.table_name,
+                            'Item': {
+                                'user_id': {'S': _tombstone_partition_key(user_id)},
+                                'card_id': {'S': card_id},
+                                'updated_at': {'S': now.isoformat()},
+                                'ttl': {'N': str(int(now.timestamp()) + TOMBSTONE_RETENTION_DAYS * 86400)},
+                            },
+                        }
                     }
                 ]
             )
@@ -362,85 +573,333 @@ class CardRepository:
         limit: int = 50,
         cursor: Optional[str] = None,
         deck_id: Optional[str] = None,
+        attributes: Optional[Iterable[str]] = None,
     ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
-        """カード一覧を 1 ページ分取得する（生アイテムと次カーソルを返す）。"""
+        """カード一覧を 1 ページ分取得する（生アイテムと次カーソルを返す）。
+
+        deck_id 指定時は deck-cards-index GSI 経由の query_deck_cards_page に委譲する。
+        attributes 指定時はその属性のみを ProjectionExpression で取得する（fields=）。
+        """
+        if deck_id:
+            return self.query_deck_cards_page(user_id, deck_id, limit, cursor, attributes)
+
         try:
             query_kwargs: Dict[str, Any] = {
                 "KeyConditionExpression": "user_id = :user_id",
                 "ExpressionAttributeValues": {":user_id": user_id},
                 "Limit": limit,
                 "ScanIndexForward": False,  # Newest first
+                # GET /cards の ETag は変更直後から付くため（api/conditional.py の consistent）、
+                # 強い整合性で読んで古い一覧に新しい ETag が付かないようにする。
+                "ConsistentRead": True,
             }
 
             if cursor:
                 query_kwargs["ExclusiveStartKey"] = {"user_id": user_id, "card_id": cursor}
+            apply_projection(query_kwargs, attributes)
 
-            if deck_id:
-                query_kwargs["FilterExpression"] = "deck_id = :deck_id"
-                query_kwargs["ExpressionAttributeValues"][":deck_id"] = deck_id
+            response = self.table.query(**query_kwargs)
+            items = response.get("Items", [])
+            last_key = response.get("LastEvaluatedKey")
+            # M-10: 終端 (LastEvaluatedKey なし) では次ページが存在しないため
+            # next_cursor は None のままにする。
+            next_cursor = last_key["card_id"] if last_key else None
+            return items, next_cursor
+        except ClientError as e:
+            raise CardServiceError(f"Failed to list cards: {e}")
 
-            collected: List[Dict[str, Any]] = []
-            next_cursor = None
-            while True:
-                response = self.table.query(**query_kwargs)
-                items = response.get("Items", [])
-                remaining = limit - len(collected)
-                collected.extend(items[:remaining])
+    def query_deck_cards_page(
+        self,
+        user_id: str,
+        deck_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        attributes: Optional[Iterable[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """指定デッキのカード一覧を deck-cards-index GSI で 1 ページ分取得する。
 
-                last_key = response.get("LastEvaluatedKey")
-                if len(items) > remaining:
-                    # The continuation query evaluates a full page for efficiency.
-                    # Resume after the last card actually returned so extra matches
-                    # from this response remain available on the next request.
-                    next_cursor = items[remaining - 1]["card_id"]
-                    break
+        旧実装はベーステーブルを FilterExpression(deck_id) 付きで Query していたが、
+        DynamoDB は Limit をフィルタ適用前に評価するため、大きなライブラリ中の小さな
+        デッキでは 1 ページを埋めるためにユーザーのパーティションをほぼ全走査していた。
+        本実装は HASH キー deck_index_key (= "<user_id>#<deck_id>") で GSI を Query する
+        ためフィルタが不要で、1 回の Query で最大 limit 件のキーが得られる。GSI は
+        KEYS_ONLY のため本体は BatchGetItem でハイドレートし、1 ページのコストを
+        ページサイズに比例させる。
 
-                if len(items) == remaining:
-                    # M-10: このレスポンスで丁度 limit を満たした。
-                    # まだ続きがある (last_key あり) 場合のみカーソルが必要だが、
-                    # LastEvaluatedKey は FilterExpression 適用後ではなくスキャン停止
-                    # 位置を指すため、deck_id フィルタ時にこれをカーソルへ流用すると
-                    # 次ページで既返却カードや別 deck のカードが混ざり、境界がずれて
-                    # 空ページ/スキップが生じうる。実際に返した最後のカード
-                    # (items[remaining - 1]) をカーソルにすることで、フィルタ有無に
-                    # 関わらず継続位置が正確になる。last_key が無い (終端) 場合は
-                    # 次ページが存在しないため next_cursor は None のままにする。
-                    if last_key:
-                        next_cursor = items[remaining - 1]["card_id"]
-                    break
+        並び順は GSI のキー順（next_review_at 昇順 = 復習期限が近い順）。
+        cursor は GSI の LastEvaluatedKey をエンコードした不透明な文字列で、
+        他デッキ・他ユーザーのカーソルは InvalidCursorError として拒否する。
 
-                if not deck_id or len(collected) >= limit or not last_key:
-                    if last_key:
-                        next_cursor = last_key["card_id"]
-                    break
+        Raises:
+            InvalidCursorError: cursor が不正、または別デッキのカーソルの場合。
+            CardServiceError: その他の DynamoDB エラー時。
+        """
+        index_key = f"{user_id}#{deck_id}"
+        query_kwargs: Dict[str, Any] = {
+            "IndexName": "deck-cards-index",
+            "KeyConditionExpression": "deck_index_key = :deck_index_key",
+            "ExpressionAttributeValues": {":deck_index_key": index_key},
+            "Limit": limit,
+            "ScanIndexForward": True,
+        }
+        if cursor:
+            start_key = _decode_cursor(cursor)
+            if start_key.get("deck_index_key") != index_key or start_key.get("user_id") != user_id:
+                raise InvalidCursorError("Cursor does not belong to this deck")
+            query_kwargs["ExclusiveStartKey"] = start_key
 
-                # DynamoDB applies Limit before FilterExpression. Continue scanning
-                # until a filtered page is full so an existing deck never appears
-                # empty merely because its cards were outside the first evaluated page.
-                query_kwargs["ExclusiveStartKey"] = last_key
+        try:
+            response = self.table.query(**query_kwargs)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ValidationException" and cursor:
+                raise InvalidCursorError(f"Invalid cursor: {e}") from e
+            raise CardServiceError(f"Failed to list deck cards: {e}")
+
+        keys = [
+            {"user_id": item["user_id"], "card_id": item["card_id"]}
+            for item in response.get("Items", [])
+        ]
+        last_key = response.get("LastEvaluatedKey")
+        next_cursor = _encode_cursor(last_key) if last_key else None
+        return self.batch_get_items(keys, attributes), next_cursor
+
+    def query_deck_card_ids(self, user_id: str, deck_id: str) -> List[str]:
+        """指定デッキの全カード ID を deck-cards-index GSI から取得する（キーのみ）。
+
+        Raises:
+            CardServiceError: DynamoDB エラー時。
+        """
+        query_kwargs: Dict[str, Any] = {
+            "IndexName": "deck-cards-index",
+            "KeyConditionExpression": "deck_index_key = :deck_index_key",
+            "ExpressionAttributeValues": {":deck_index_key": f"{user_id}#{deck_id}"},
+        }
+        card_ids: List[str] = []
+        while True:
+            try:
+                response = self.table.query(**query_kwargs)
+            except ClientError as e:
+                raise CardServiceError(f"Failed to list deck cards: {e}")
+            card_ids.extend(item["card_id"] for item in response.get("Items", []))
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return card_ids
+            query_kwargs["ExclusiveStartKey"] = last_key
+
+    def move_card_to_deck(
+        self,
+        user_id: str,
+        card_id: str,
+        deck_id: str,
+        updated_at: str,
+        expected_deck_id: Optional[str] = None,
+    ) -> str:
+        """カードを deck_id へ移動する条件付き UpdateItem（deck_index_key も更新）。
+
+        条件:
+          - attribute_exists(card_id): 削除済みカードをゴーストとして再作成しない（High-1）。
+          - 既に移動先にあるカードは書き込まない（updated_at・差分同期を汚さない）。
+          - expected_deck_id 指定時（デッキのマージ）は、収集後に別デッキへ移動された
+            カードを巻き戻さないよう deck_id = expected_deck_id を要求する（Medium-5 と同型）。
+
+        Returns:
+            "moved" / "unchanged" / "not_found" / "conflict"。
 
-            return collected, next_cursor
+        Raises:
+            CardServiceError: 条件不成立以外の DynamoDB エラー時。
+        """
+        condition = "attribute_exists(card_id) AND (attribute_not_exists(deck_id) OR deck_id <> :deck_id)"
+        expression_values: Dict[str, Any] = {
+            ":deck_id": deck_id,
+            ":deck_index_key": f"{user_id}#{deck_id}",
+            ":updated_at": updated_at,
+        }
+        if expected_deck_id is not None:
+            condition = "attribute_exists(card_id) AND deck_id = :expected_deck_id"
+            expression_values[":expected_deck_id"] = expected_deck_id
+        self._invalidate_card(user_id, card_id)
+        try:
+            self.table.update_item(
+                Key={"user_id": user_id, "card_id": card_id},
+                UpdateExpression=(
+                    "SET deck_id = :deck_id, deck_index_key = :deck_index_key, updated_at = :updated_at"
+                ),
+                ConditionExpression=condition,
+                ExpressionAttributeValues=expression_values,
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
+            )
         except ClientError as e:
-            raise CardServiceError(f"Failed to list cards: {e}")
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise CardServiceError(f"Failed to move card: {e}")
+            old_item = e.response.get("Item")
+            if not old_item:
+                return "not_found"
+            return "conflict" if expected_deck_id is not None else "unchanged"
+        return "moved"
+
+    def query_changes(
+        self,
+        user_id: str,
+        since: Optional[str],
+        limit: int = 100,
+    ) -> Tuple[List[Dict[str, Any]], List[str], str, bool]:
+        """sync token 以降に変更・削除されたカードを user_id-updated_at-index から取得する。
+
+        since は前回レスポンスの next_since（不透明な文字列）。内部的には
+          - s: 取得ウィンドウの下端（前回ウィンドウの上端）
+          - h: 取得ウィンドウの上端（ページング中のみ。初回ページで現在時刻に固定）
+          - p: 読み出し中のパーティション（c = カード, d = tombstone）
+          - kc / ku: ページング中の LastEvaluatedKey（card_id / updated_at）
+        を持つ。ウィンドウ上端を固定してからページングするため、同期中に書き込みが
+        続いても has_more は必ず収束する。ウィンドウ下端は SYNC_OVERLAP_SECONDS だけ
+        さかのぼって Query する（重複はクライアントが card_id で吸収する）。
+
+        since が None の場合は現在時刻を下端とする token だけを発行する（呼び出し側が
+        全件取得と組み合わせる）。
 
-    def scan_all_cards(self, user_id: str) -> List[Dict[str, Any]]:
-        """ユーザーの全カードをページネーションで取得する（生アイテム）。"""
+        Returns:
+            (変更されたカードの生アイテム, 削除された card_id, 次の sync token, has_more)
+
+        Raises:
+            InvalidCursorError: since が不正な場合。
+            SyncTokenExpiredError: since が TOMBSTONE_RETENTION_DAYS より古い場合。
+            CardServiceError: その他の DynamoDB エラー時。
+        """
+        now = datetime.now(timezone.utc)
+        if since is None:
+            return [], [], _encode_cursor({"s": now.isoformat()}), False
+
+        state = _decode_cursor(since)
+        if "s" not in state or state.get("p", "c") not in ("c", "d"):
+            raise InvalidCursorError("Invalid sync token")
         try:
-            items: List[Dict[str, Any]] = []
+            lower = datetime.fromisoformat(state["s"]) - timedelta(seconds=SYNC_OVERLAP_SECONDS)
+            upper = state.get("h") or now.isoformat()
+            datetime.fromisoformat(upper)
+        except ValueError as e:
+            raise InvalidCursorError("Invalid sync token") from e
+        if lower < now - timedelta(days=TOMBSTONE_RETENTION_DAYS):
+            # tombstone が TTL で消えている可能性があり、削除の取りこぼしを保証できない。
+            raise SyncTokenExpiredError("Sync token is older than the tombstone retention period")
+
+        partitions = {"c": user_id, "d": _tombstone_partition_key(user_id)}
+        phase = state.get("p", "c")
+        start_key = (
+            {"user_id": partitions[phase], "card_id": state["kc"], "updated_at": state["ku"]}
+            if state.get("kc") and state.get("ku")
+            else None
+        )
+        changed: List[Dict[str, Any]] = []
+        deleted: List[str] = []
+
+        while True:
             query_kwargs: Dict[str, Any] = {
-                "KeyConditionExpression": "user_id = :user_id",
-                "ExpressionAttributeValues": {":user_id": user_id},
+                "IndexName": CHANGES_INDEX_NAME,
+                "KeyConditionExpression": "user_id = :pk AND updated_at BETWEEN :lower AND :upper",
+                "ExpressionAttributeValues": {
+                    ":pk": partitions[phase],
+                    ":lower": lower.isoformat(),
+                    ":upper": upper,
+                },
+                "Limit": limit - len(changed) - len(deleted),
             }
-            while True:
+            if start_key:
+                query_kwargs["ExclusiveStartKey"] = start_key
+            try:
                 response = self.table.query(**query_kwargs)
-                items.extend(response.get("Items", []))
-                last_key = response.get("LastEvaluatedKey")
-                if not last_key:
-                    break
-                query_kwargs["ExclusiveStartKey"] = last_key
-            return items
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "ValidationException" and start_key:
+                    raise InvalidCursorError(f"Invalid sync token: {e}") from e
+                raise CardServiceError(f"Failed to query card changes: {e}")
+
+            items = response.get("Items", [])
+            if phase == "c":
+                changed.extend(items)
+            else:
+                deleted.extend(item["card_id"] for item in items)
+
+            last_key = response.get("LastEvaluatedKey")
+            remaining = limit - len(changed) - len(deleted)
+            if last_key:
+                next_state = {
+                    "s": state["s"], "h": upper, "p": phase,
+                    "kc": last_key["card_id"], "ku": last_key["updated_at"],
+                }
+                return changed, deleted, _encode_cursor(next_state), True
+            if phase == "d":
+                break
+            phase, start_key = "d", None
+            if remaining <= 0:
+                return changed, deleted, _encode_cursor({"s": state["s"], "h": upper, "p": "d"}), True
+
+        return changed, deleted, _encode_cursor({"s": upper}), False
+
+    def batch_get_items(
+        self, keys: List[Dict[str, str]], attributes: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """BatchGetItem でカード本体を取得し、keys の順序で返す。
+
+        100 件ずつ分割して発行し、UnprocessedKeys は指数バックオフで再試行する。
+        GSI（結果整合性）で得たキーのカードが取得時点で削除済みの場合は結果から除く。
+        attributes 指定時はその属性（と並べ替えに使う card_id）のみを取得する。
+
+        Raises:
+            CardServiceError: DynamoDB エラー時、または再試行上限後も未処理キーが残る場合。
+        """
+        if not keys:
+            return []
+
+        projection = apply_projection({}, None if attributes is None else {"card_id", *attributes})
+        found: Dict[str, Dict[str, Any]] = {}
+        try:
+            for start in range(0, len(keys), BATCH_GET_MAX_KEYS):
+                request: Dict[str, Any] = {
+                    self.table_name: {"Keys": keys[start:start + BATCH_GET_MAX_KEYS], **projection}
+                }
+                for attempt in range(BATCH_MAX_RETRIES + 1):
+                    response = self.dynamodb.batch_get_item(RequestItems=request)
+                    for item in response.get("Responses", {}).get(self.table_name, []):
+                        found[item["card_id"]] = item
+                    request = response.get("UnprocessedKeys") or {}
+                    if not request:
+                        break
+                    if attempt < BATCH_MAX_RETRIES:
+                        time.sleep(BATCH_RETRY_BASE_DELAY * (2 ** attempt))
+                if request:
+                    raise CardServiceError("Failed to get cards: unprocessed keys remain after retries")
         except ClientError as e:
-            raise CardServiceError(f"Failed to scan cards: {e}")
+            raise CardServiceError(f"Failed to get cards: {e}")
+
+        return [found[key["card_id"]] for key in keys if key["card_id"] in found]
+
+    def scan_all_cards(self, user_id: str) -> List[Dict[str, Any]]:
+        """ユーザーの全カードをページネーションで取得する（生アイテム）。"""
+        return [item for page in self.iter_card_pages(user_id) for item in page]
+
+    def iter_card_pages(self, user_id: str, page_size: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """ユーザーのカードを Query の 1 ページずつ返す（生アイテム）。
+
+        全件をメモリに載せずに処理したい呼び出し（データエクスポート等）向け。
+
+        Raises:
+            CardServiceError: DynamoDB エラー時。
+        """
+        query_kwargs: Dict[str, Any] = {
+            "KeyConditionExpression": "user_id = :user_id",
+            "ExpressionAttributeValues": {":user_id": user_id},
+        }
+        if page_size is not None:
+            query_kwargs["Limit"] = page_size
+        while True:
+            try:
+                response = self.table.query(**query_kwargs)
+            except ClientError as e:
+                raise CardServiceError(f"Failed to scan cards: {e}")
+            yield response.get("Items", [])
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return
+            query_kwargs["ExclusiveStartKey"] = last_key
 
     def query_cards_by_reference_url(self, user_id: str, url: str) -> List[Dict[str, Any]]:
         """生成元 URL が一致するカードを reference-url-index GSI で取得する（M-13）。
@@ -486,8 +945,9 @@ class CardRepository:
         limit: Optional[int] = None,
         before: Optional[datetime] = None,
         include_future: bool = False,
+        attributes: Optional[Iterable[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """復習対象カードの生アイテムを期限が古い順で取得する。"""
+        """復習対象カードの生アイテムを期限が古い順で取得する（attributes 指定時はその属性のみ）。"""
         try:
             # 【クエリ引数構築】: GSI (user_id-due-index) を使い、復習日時の昇順で取得する
             query_kwargs: Dict[str, Any] = {
@@ -512,6 +972,7 @@ class CardRepository:
             # limit が指定された場合のみ DynamoDB Query に Limit を付与し、レスポンスサイズを制限する。
             if limit is not None:
                 query_kwargs["Limit"] = limit
+            apply_projection(query_kwargs, attributes)
 
             # 【ページネーション】: limit=None の場合は LastEvaluatedKey で全件取得する
             if limit is None:
@@ -622,6 +1083,7 @@ class CardRepository:
         limit: int,
         before: Optional[datetime] = None,
         include_future: bool = False,
+        attributes: Optional[Iterable[str]] = None,
     ) -> List[Dict[str, Any]]:
         """指定デッキの復習対象カードを期限が古い順に最大 limit 件取得する。
 
@@ -630,6 +1092,7 @@ class CardRepository:
         limit に達するまでページングする。DynamoDB は Limit をフィルタ適用前に評価するため、
         1 ページあたりの走査件数を limit に抑えつつ、必要な件数だけ収集してメモリ使用を
         抑制する。ScanIndexForward=True で next_review_at 昇順（最も早く復習すべき順）。
+        FilterExpression は射影前のアイテムに評価されるため、attributes に deck_id は不要。
         """
         query_kwargs: Dict[str, Any] = {
             "IndexName": "user_id-due-index",
@@ -645,6 +1108,7 @@ class CardRepository:
                 before = datetime.now(timezone.utc)
             query_kwargs["KeyConditionExpression"] = "user_id = :user_id AND next_review_at <= :before"
             query_kwargs["ExpressionAttributeValues"][":before"] = before.isoformat()
+        apply_projection(query_kwargs, attributes)
 
         try:
             collected: List[Dict[str, Any]] = []
@@ -740,6 +1204,7 @@ class CardRepository:
             if return_values:
                 update_kwargs["ReturnValues"] = return_values
 
+            self._invalidate_card(user_id, card_id)
             response = self.table.update_item(**update_kwargs)
             return response.get("Attributes") if return_values else None
         except ClientError as e:
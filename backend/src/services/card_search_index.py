@@ -0,0 +1,374 @@
+"""Card full-text search index (per-user inverted n-gram index on DynamoDB).
+
+カードの front / back を n-gram トークンへ分解し、ユーザー単位の転置インデックスとして
+CARD_SEARCH_TABLE に保持する。GET /cards/search がクライアント側で全件ページングして
+絞り込んでいた処理を、クエリ term ごとの posting の BatchGetItem（O(term 数) の読み取り）で
+置き換えるための層。
+
+トークン化方針:
+  - NFKC 正規化 + casefold で全角/半角・大文字/小文字を同一視する（card-search spec FR-003/004）。
+  - 分かち書きの無い日本語（ひらがな・カタカナ・漢字の連続）は文字 bigram、
+    英数字などの単語は文字 trigram に分解する。記号・空白はトークン境界として扱う。
+  - n 未満の短いクエリ（1 文字の漢字、2 文字の英単語の断片など）も完全一致で引けるよう、
+    各連続区間の n 未満の部分文字列（CJK は 1-gram、単語は 1/2-gram）もトークンにする。
+  - フィールド全体を索引する（トークン数の上限は設けない。front / back の長さは
+    CreateCardRequest の上限で抑えられている）。
+
+保存形式（compact postings）:
+  PK ``pk`` = "<user_id>#<token>" の 1 トークン 1 アイテムで、front に出現するカード ID を
+  String Set ``f``、back に出現するカード ID を ``b`` に持つ。絞り込み用に
+  "<user_id>#deck:<deck_id>" / "<user_id>#tag:<正規化タグ>" の posting（``c``）も同じ表に持ち、
+  deck_id / tag 指定の検索は term の posting との積集合で候補を絞る。
+  posting のサイズはユーザーのカード枚数（MAX_CARDS_PER_USER = 2000）で抑えられ、
+  最も大きい 1-gram でも 1 集合あたり約 80 KB と 400 KB のアイテム上限に収まるため
+  シャーディングはしない。ADD / DELETE の集合演算は冪等なため、ストリームの再試行や
+  バックフィルとの重複適用でも壊れない。
+
+インデックスはリクエスト経路では更新しない。Cards テーブルの DynamoDB Streams を
+jobs/card_search_index_handler.py が受け取り、バッチ内のカードごとに変更前後のトークンの
+差分を求め、posting ごとに 1 回の UpdateItem（ADD / DELETE）にまとめて反映する
+（復習による更新など、検索対象の属性が変わらない変更は書き込まない）。
+ストリーム導入前のカードは scripts/backfill_card_search_index.py で投入する。
+
+CARD_SEARCH_TABLE 未設定（ローカル開発・テスト等）では検索は
+CardSearchUnavailableError を送出する。
+"""
+
+import os
+import re
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from aws_lambda_powertools import Logger
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.exceptions import ClientError
+
+from utils.dynamodb_client import get_dynamodb_resource
+from .card_repository import BATCH_GET_MAX_KEYS, BATCH_MAX_RETRIES, BATCH_RETRY_BASE_DELAY, CardServiceError
+
+logger = Logger()
+
+# CJK（ひらがな・カタカナ・長音・CJK 統合漢字）の連続区間は bigram、それ以外の
+# 単語文字の連続区間は trigram に分解する。
+_CJK_CHARS = "぀-ゟ゠-ヿ㐀-䶿一-鿿豈-﫿々〆ヵヶ"
+_RUN_RE = re.compile(rf"([{_CJK_CHARS}]+)|([^\W{_CJK_CHARS}_]+)")
+CJK_GRAM = 2
+WORD_GRAM = 3
+
+# クエリの最大長（正規化後）。
+MAX_QUERY_LENGTH = 100
+# posting 更新 UpdateItem の並列度（ストリームハンドラー・バックフィル）。
+INDEX_WRITE_CONCURRENCY = 8
+
+# 索引の対象になるカード属性（これらが変わらない更新では posting を書き換えない）。
+INDEXED_ATTRIBUTES = ("front", "back", "deck_id", "tags")
+
+# posting の属性: front / back に出現するカード、絞り込み用 posting のカード。
+FRONT, BACK, FILTER = "f", "b", "c"
+# 絞り込み用 posting のトークン接頭辞（n-gram トークンは単語文字のみのため衝突しない）。
+DECK_TOKEN_PREFIX = "deck:"
+TAG_TOKEN_PREFIX = "tag:"
+
+# posting キー → 属性 → (追加するカード ID, 削除するカード ID)
+PostingChanges = Dict[str, Dict[str, Tuple[Set[str], Set[str]]]]
+
+
+class CardSearchUnavailableError(CardServiceError):
+    """Raised when the search index table is not configured."""
+
+    pass
+
+
+def normalize_text(text: str) -> str:
+    """検索用にテキストを正規化する（NFKC + casefold）。"""
+    return unicodedata.normalize("NFKC", text or "").casefold()
+
+
+def _runs(normalized: str) -> Iterable[Tuple[str, int]]:
+    """正規化済みテキストを (連続区間, n-gram 長) に分割する。"""
+    for match in _RUN_RE.finditer(normalized):
+        cjk, word = match.groups()
+        if cjk:
+            yield cjk, CJK_GRAM
+        else:
+            yield word, WORD_GRAM
+
+
+def tokenize(text: str) -> Set[str]:
+    """テキストをインデックス用トークン集合へ分解する。
+
+    各連続区間の 1〜n 文字の部分文字列をトークンとする（n 未満の短いクエリも
+    完全一致で引けるようにするため）。
+    """
+    tokens: Set[str] = set()
+    for run, n in _runs(normalize_text(text)):
+        for size in range(1, min(n, len(run)) + 1):
+            for i in range(len(run) - size + 1):
+                tokens.add(run[i:i + size])
+    return tokens
+
+
+def query_terms(query: str) -> List[str]:
+    """検索クエリを posting を引く term のリストへ分解する。
+
+    n 以上の長さの区間は n-gram、n 未満の短い区間はその区間自体が term になる。
+    """
+    terms: Dict[str, None] = {}
+    for run, n in _runs(normalize_text(query)[:MAX_QUERY_LENGTH]):
+        if len(run) < n:
+            terms[run] = None
+            continue
+        for i in range(len(run) - n + 1):
+            terms[run[i:i + n]] = None
+    return list(terms)
+
+
+def posting_key(user_id: str, token: str) -> str:
+    """posting アイテムのパーティションキー。"""
+    return f"{user_id}#{token}"
+
+
+def deck_token(deck_id: str) -> str:
+    return DECK_TOKEN_PREFIX + deck_id
+
+
+def tag_token(tag: str) -> str:
+    return TAG_TOKEN_PREFIX + normalize_text(tag).strip()
+
+
+def card_postings(item: Optional[Mapping[str, Any]]) -> Set[Tuple[str, str]]:
+    """カードアイテムが載る (トークン, 属性) の集合（カードでないアイテムは空集合）。"""
+    if not item or "front" not in item:
+        return set()
+    postings = {(token, FRONT) for token in tokenize(item.get("front") or "")}
+    postings.update((token, BACK) for token in tokenize(item.get("back") or ""))
+    if item.get("deck_id"):
+        postings.add((deck_token(item["deck_id"]), FILTER))
+    postings.update((tag_token(tag), FILTER) for tag in item.get("tags") or () if tag.strip())
+    return postings
+
+
+def indexed_fields_changed(old: Optional[Mapping[str, Any]], new: Optional[Mapping[str, Any]]) -> bool:
+    """posting に影響する属性（INDEXED_ATTRIBUTES）が変わったか。"""
+    if old is None or new is None:
+        return True
+    return any(old.get(attr) != new.get(attr) for attr in INDEXED_ATTRIBUTES)
+
+
+def add_card_change(
+    changes: PostingChanges,
+    user_id: str,
+    card_id: str,
+    old: Optional[Mapping[str, Any]],
+    new: Optional[Mapping[str, Any]],
+) -> None:
+    """1 枚のカードの変更前後のトークン差分を changes に加える。"""
+    before, after = card_postings(old), card_postings(new)
+    for token, attr in after - before:
+        changes.setdefault(posting_key(user_id, token), {}).setdefault(attr, (set(), set()))[0].add(card_id)
+    for token, attr in before - after:
+        changes.setdefault(posting_key(user_id, token), {}).setdefault(attr, (set(), set()))[1].add(card_id)
+
+
+def changes_from_stream_records(records: Iterable[Mapping[str, Any]]) -> PostingChanges:
+    """Cards テーブルのストリームレコードから posting の差分を求める。
+
+    同じカードの複数レコードは「最初の変更前」と「最後の変更後」の差分に集約する
+    （レコードはキー単位で順序保証）。INDEXED_ATTRIBUTES が変わらない MODIFY
+    （復習結果の更新など）と、tombstone 等の "<user_id>#..." パーティションのアイテムは無視する。
+    """
+    deserializer = TypeDeserializer()
+
+    def image(raw: Optional[Mapping[str, Any]]) -> Optional[Dict[str, Any]]:
+        if raw is None:
+            return None
+        return {name: deserializer.deserialize(value) for name, value in raw.items()}
+
+    states: Dict[Tuple[str, str], Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]] = {}
+    for record in records:
+        change = record.get("dynamodb") or {}
+        keys = image(change.get("Keys")) or {}
+        user_id, card_id = keys.get("user_id"), keys.get("card_id")
+        if not isinstance(user_id, str) or not isinstance(card_id, str) or "#" in user_id:
+            continue
+        old, new = image(change.get("OldImage")), image(change.get("NewImage"))
+        if record.get("eventName") == "REMOVE":
+            new = None
+        elif not indexed_fields_changed(old, new):
+            continue
+        first_old = states[(user_id, card_id)][0] if (user_id, card_id) in states else old
+        states[(user_id, card_id)] = (first_old, new)
+
+    changes: PostingChanges = {}
+    for (user_id, card_id), (old, new) in states.items():
+        add_card_change(changes, user_id, card_id, old, new)
+    return changes
+
+
+def changes_for_cards(items: Iterable[Mapping[str, Any]]) -> PostingChanges:
+    """カードアイテムを新規に索引する差分（バックフィル・テストデータ投入用）。"""
+    changes: PostingChanges = {}
+    for item in items:
+        user_id, card_id = item.get("user_id"), item.get("card_id")
+        if isinstance(user_id, str) and isinstance(card_id, str) and "#" not in user_id:
+            add_card_change(changes, user_id, card_id, None, item)
+    return changes
+
+
+def _update_requests(key: str, attrs: Mapping[str, Tuple[Set[str], Set[str]]]) -> List[Dict[str, Any]]:
+    """posting 1 件分の UpdateItem 引数を組み立てる。
+
+    同じ属性への ADD と DELETE は 1 つの UpdateExpression に書けない（パスの重複）ため、
+    両方ある属性の DELETE は 2 回目の UpdateItem に分ける。
+    """
+    first: Dict[str, List[str]] = {"ADD": [], "DELETE": []}
+    second: Dict[str, List[str]] = {"ADD": [], "DELETE": []}
+    values: List[Dict[str, Any]] = [{}, {}]
+    for attr, (added, removed) in sorted(attrs.items()):
+        if added:
+            first["ADD"].append(f"{attr} :a{attr}")
+            values[0][f":a{attr}"] = added
+        if removed:
+            target, index = (second, 1) if added else (first, 0)
+            target["DELETE"].append(f"{attr} :d{attr}")
+            values[index][f":d{attr}"] = removed
+    requests = []
+    for clauses, expression_values in ((first, values[0]), (second, values[1])):
+        parts = [f"{op} {', '.join(items)}" for op, items in clauses.items() if items]
+        if parts:
+            requests.append(
+                {
+                    "Key": {"pk": key},
+                    "UpdateExpression": " ".join(parts),
+                    "ExpressionAttributeValues": expression_values,
+                }
+            )
+    return requests
+
+
+class CardSearchIndex:
+    """CARD_SEARCH_TABLE 上の転置インデックスを読み書きする。"""
+
+    def __init__(
+        self,
+        table_name: Optional[str] = None,
+        dynamodb_resource: Optional[Any] = None,
+    ):
+        """Initialize CardSearchIndex.
+
+        Args:
+            table_name: DynamoDB search index table name. Defaults to CARD_SEARCH_TABLE
+                env var. 空文字（未設定）の場合はインデックスを無効化する。
+            dynamodb_resource: Optional boto3 DynamoDB resource for testing.
+        """
+        self.table_name = table_name if table_name is not None else os.environ.get("CARD_SEARCH_TABLE", "")
+        self._dynamodb_resource_arg = dynamodb_resource
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.table_name)
+
+    # ------------------------------------------------------------------
+    # Index maintenance（ストリームハンドラー・バックフィル用）
+    # ------------------------------------------------------------------
+
+    def apply_changes(self, changes: PostingChanges) -> int:
+        """posting の差分を UpdateItem（ADD / DELETE）で反映する。
+
+        posting ごとに 1 回（同じ属性への追加と削除が両方ある場合のみ 2 回）の UpdateItem を
+        INDEX_WRITE_CONCURRENCY 並列で発行する。
+
+        Returns:
+            発行した UpdateItem の回数。
+
+        Raises:
+            CardServiceError: DynamoDB エラー時（ストリームのバッチごと再試行させるため送出する）。
+        """
+        if not self.enabled or not changes:
+            return 0
+        requests = [request for key, attrs in changes.items() for request in _update_requests(key, attrs)]
+        # リソースはスレッド間で共有できないため、書き込みスレッドには（スレッドセーフな）
+        # リソースのクライアントを渡す。リソース層の型変換はクライアントに登録済み。
+        client = get_dynamodb_resource(self._dynamodb_resource_arg).meta.client
+
+        def update(request: Dict[str, Any]) -> None:
+            client.update_item(TableName=self.table_name, **request)
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(INDEX_WRITE_CONCURRENCY, len(requests))) as executor:
+                list(executor.map(update, requests))
+        except ClientError as e:
+            raise CardServiceError(f"Failed to update search index: {e}")
+        return len(requests)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def lookup(
+        self,
+        user_id: str,
+        terms: List[str],
+        deck_id: Optional[str] = None,
+        tag: Optional[str] = None,
+    ) -> List[Tuple[Set[str], Set[str]]]:
+        """各 term にマッチするカード ID 集合 (front, back) を term の順で返す。
+
+        読むのは term と絞り込み条件の posting だけ（O(term 数)）。deck_id / tag を
+        指定した場合は、その posting との積集合を返す（候補の絞り込み前に適用するため、
+        条件付き検索で一致を取りこぼさない）。
+
+        Raises:
+            CardSearchUnavailableError: インデックスが無効な場合。
+            CardServiceError: DynamoDB エラー時、または再試行上限後も未処理キーが残る場合。
+        """
+        if not self.enabled:
+            raise CardSearchUnavailableError("Card search index is not configured")
+
+        filter_tokens = []
+        if deck_id:
+            filter_tokens.append(deck_token(deck_id))
+        if tag:
+            filter_tokens.append(tag_token(tag))
+        postings = self._batch_get_postings([posting_key(user_id, t) for t in [*terms, *filter_tokens]])
+
+        allowed: Optional[Set[str]] = None
+        for token in filter_tokens:
+            ids = set(postings.get(posting_key(user_id, token), {}).get(FILTER, ()))
+            allowed = ids if allowed is None else allowed & ids
+
+        results: List[Tuple[Set[str], Set[str]]] = []
+        for term in terms:
+            item = postings.get(posting_key(user_id, term), {})
+            front, back = set(item.get(FRONT, ())), set(item.get(BACK, ()))
+            if allowed is not None:
+                front, back = front & allowed, back & allowed
+            results.append((front, back))
+        return results
+
+    def _batch_get_postings(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """posting を BatchGetItem で取得する（UnprocessedKeys は指数バックオフで再試行）。"""
+        dynamodb = get_dynamodb_resource(self._dynamodb_resource_arg)
+        found: Dict[str, Dict[str, Any]] = {}
+        unique = list(dict.fromkeys(keys))
+        try:
+            for start in range(0, len(unique), BATCH_GET_MAX_KEYS):
+                request: Dict[str, Any] = {
+                    self.table_name: {"Keys": [{"pk": key} for key in unique[start:start + BATCH_GET_MAX_KEYS]]}
+                }
+                for attempt in range(BATCH_MAX_RETRIES + 1):
+                    response = dynamodb.batch_get_item(RequestItems=request)
+                    for item in response.get("Responses", {}).get(self.table_name, []):
+                        found[item["pk"]] = item
+                    request = response.get("UnprocessedKeys") or {}
+                    if not request:
+                        break
+                    if attempt < BATCH_MAX_RETRIES:
+                        time.sleep(BATCH_RETRY_BASE_DELAY * (2 ** attempt))
+                if request:
+                    raise CardServiceError("Failed to read search index: unprocessed keys remain after retries")
+        except ClientError as e:
+            raise CardServiceError(f"Failed to read search index: {e}")
+        return found
@@ -7,24 +7,50 @@ update 式の組み立てといったオーケストレーションに専念す
 再エクスポートする（``from services.card_service import CardNotFoundError`` を維持）。
 """
 
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from aws_lambda_powertools import Logger
+from pydantic import ValidationError
 
-from models.card import Card, Reference
+from models.card import Card, CardChangesResponse, CreateCardRequest, Reference, card_response_json
+from models.card_import import CardImportResult, ImportRowError
+from models.deck import MoveCardResult, MoveCardsResponse
 from utils.sentinel import UNSET as _UNSET
+from .card_import import ImportRow
 from .card_repository import (
+    BATCH_WRITE_MAX_ITEMS,
     CardLimitExceededError,
     CardNotFoundError,
     CardRepository,
     CardServiceError,
     InternalError,
+    InvalidCursorError,
+    SyncTokenExpiredError,
 )
+from .card_search_index import (
+    CardSearchIndex,
+    CardSearchUnavailableError,
+    normalize_text,
+    query_terms,
+)
+from .data_version import DataVersionStore
 from .srs import calculate_next_review_boundary
 
 logger = Logger()
 
+# import_cards: 1 回の枠予約・BatchWriteItem で扱う件数、書き込みスレッド数、
+# 進捗を報告する行間隔、結果に含める不正行の最大件数。
+IMPORT_BATCH_SIZE = BATCH_WRITE_MAX_ITEMS
+IMPORT_WRITE_CONCURRENCY = 4
+IMPORT_PROGRESS_INTERVAL_ROWS = 500
+IMPORT_MAX_REPORTED_ERRORS = 50
+
+# move_cards: 条件付き UpdateItem を並列に発行するスレッド数。
+MOVE_CONCURRENCY = 8
+
 # 後方互換のための再エクスポート (ruff の未使用 import 検出を回避)
 __all__ = [
     "CardService",
@@ -32,6 +58,8 @@ __all__ = [
     "CardNotFoundError",
     "CardLimitExceededError",
     "InternalError",
+    "InvalidCursorError",
+    "CardSearchUnavailableError",
 ]
 
 
@@ -39,6 +67,9 @@ class CardService:
     """Service for card-related business logic."""
 
     MAX_CARDS_PER_USER = 2000
+    # search_cards: 部分一致とみなす最小トークン被覆率と、本体を取得する候補数の上限。
+    SEARCH_MIN_COVERAGE = 0.6
+    SEARCH_MAX_CANDIDATES = 200
 
     def __init__(
         self,
@@ -47,6 +78,7 @@ class CardService:
         users_table_name: Optional[str] = None,
         reviews_table_name: Optional[str] = None,
         deck_service=None,
+        search_index: Optional[CardSearchIndex] = None,
     ):
         """Initialize CardService.
 
@@ -56,6 +88,9 @@ class CardService:
             users_table_name: DynamoDB users table name. Defaults to USERS_TABLE env var.
             reviews_table_name: DynamoDB reviews table name. Defaults to REVIEWS_TABLE env var.
             deck_service: Optional DeckService injected for deck_id validation (C-7).
+            search_index: Optional CardSearchIndex used by search_cards. Defaults to
+                CARD_SEARCH_TABLE env var（インデックスの更新は Cards テーブルのストリームで
+                jobs/card_search_index_handler.py が行う）。
         """
         self._repo = CardRepository(
             table_name=table_name,
@@ -69,6 +104,24 @@ class CardService:
         # 未注入時は使用時に遅延生成してキャッシュする（同一 dynamodb_resource を共有）。
         self._deck_service = deck_service
         self._dynamodb_resource_arg = dynamodb_resource
+        self._search_index = search_index or CardSearchIndex(dynamodb_resource=dynamodb_resource)
+        self._data_version = DataVersionStore(
+            users_table_name=self._repo.users_table_name,
+            dynamodb_resource=dynamodb_resource,
+        )
+
+    def _new_repo(self) -> CardRepository:
+        """同じテーブル設定の CardRepository を新たに作る（書き込みスレッドごとに使う）。
+
+        boto3 リソースはスレッド間で共有できないため、並列書き込みではスレッドごとに
+        リポジトリ（= リソース）を用意する。
+        """
+        return CardRepository(
+            table_name=self.table_name,
+            dynamodb_resource=self._dynamodb_resource_arg,
+            users_table_name=self._repo.users_table_name,
+            reviews_table_name=self._repo.reviews_table_name,
+        )
 
     def _get_deck_service(self):
         """Lazily construct (and cache) a DeckService for deck validation (C-7)."""
@@ -123,6 +176,8 @@ class CardService:
             references=references or [],
             next_review_at=now,  # Due immediately for new cards
             created_at=now,
+            # 作成時から updated_at を持たせ、差分同期用の user_id-updated_at-index に投影する。
+            updated_at=now,
         )
 
         # Use TransactWriteItems to atomically increment card_count (with limit
@@ -139,8 +194,14 @@ class CardService:
         """複数のカードデータをまとめて作成し、成功件数を返す。
 
         URL カード生成の保存フロー（ref-key 経由 / レガシー）で共通利用する。
-        各カードの作成失敗は握りつぶしてログに記録し、残りの保存を継続する
-        （部分成功を許容）。``front`` / ``back`` が空のカードはスキップする。
+        ``front`` / ``back`` が空のカードはスキップする。
+
+        create_card を件数分呼ぶと 1 件ごとに users アイテムの card_count を加算する
+        トランザクションになり、users アイテムがホットキーになる。本メソッドは
+          1. 件数分の枠を 1 回の条件付き ADD で予約し（上限までの残り枠だけ予約される）、
+          2. 予約分のカードを BatchWriteItem で書き込み（UnprocessedItems は再試行）、
+          3. 書き込めなかった分の枠を返却する。
+        部分成功を許容し、上限超過分・書き込み失敗分はログに記録して保存しない。
 
         M-19: 全件失敗時は 0 を返す。呼び出し側は「0 = 保存失敗」として扱い、
         誤って成功扱いの通知を出さないこと。
@@ -155,28 +216,216 @@ class CardService:
             保存に成功したカード枚数。
         """
         refs = references or []
-        saved_count = 0
-        for card in cards:
-            front = str(card.get("front", "")).strip()
-            back = str(card.get("back", "")).strip()
+        now = datetime.now(timezone.utc)
+        new_cards: List[Card] = []
+        for data in cards:
+            front = str(data.get("front", "")).strip()
+            back = str(data.get("back", "")).strip()
             if not front or not back:
                 continue
-            tags = card.get("suggested_tags") or card.get("tags") or []
-            try:
-                self.create_card(
+            new_cards.append(
+                Card(
                     user_id=user_id,
                     front=front,
                     back=back,
-                    tags=tags,
+                    tags=data.get("suggested_tags") or data.get("tags") or [],
                     references=refs,
+                    next_review_at=now,
+                    created_at=now,
+                    updated_at=now,
                 )
-                saved_count += 1
-            except Exception as e:
-                logger.warning(
-                    "Failed to save card in bulk_create_cards",
-                    extra={"error": str(e)},
+            )
+        if not new_cards:
+            return 0
+
+        try:
+            reserved = self._repo.reserve_card_slots(user_id, len(new_cards), self.MAX_CARDS_PER_USER)
+        except CardServiceError as e:
+            logger.warning(
+                "Failed to reserve card slots in bulk_create_cards",
+                extra={"user_id": user_id, "requested": len(new_cards), "error": str(e)},
+            )
+            return 0
+        if reserved < len(new_cards):
+            logger.warning(
+                "Card limit reached in bulk_create_cards; skipping remaining cards",
+                extra={"user_id": user_id, "requested": len(new_cards), "reserved": reserved},
+            )
+
+        batch = new_cards[:reserved]
+        failed_ids = set(self._repo.batch_put_items([c.to_dynamodb_item() for c in batch]))
+        saved = [c for c in batch if c.card_id not in failed_ids]
+        if failed_ids:
+            logger.warning(
+                "Failed to save some cards in bulk_create_cards",
+                extra={"user_id": user_id, "failed": len(failed_ids)},
+            )
+            self._repo.release_card_slots(user_id, len(failed_ids))
+
+        if saved:
+            self._data_version.bump(user_id)
+        return len(saved)
+
+    def import_cards(
+        self,
+        user_id: str,
+        rows: Iterable[ImportRow],
+        deck_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        on_progress: Optional[Callable[[Dict[str, int]], None]] = None,
+    ) -> CardImportResult:
+        """インポートファイルの行をストリームで検証し、バッチ書き込みする（import_cards ジョブ）。
+
+        各行を POST /cards と同じ CreateCardRequest で検証し、通った行を
+        IMPORT_BATCH_SIZE 件ずつ
+          1. reserve_card_slots で枠を予約し（上限に達したら以降の行は skipped_limit）、
+          2. IMPORT_WRITE_CONCURRENCY 並列のスレッドで BatchWriteItem し、
+          3. 書き込めなかった分の枠を返却する。
+        未完了のバッチは並列度の 2 倍までに抑え、ファイル全体をメモリに載せない。
+        boto3 リソースはスレッド間で共有できないため、書き込みスレッドごとに
+        CardRepository を生成する。
+
+        Args:
+            user_id: ユーザー ID。
+            rows: card_import.parse_import_rows の出力。
+            deck_id: 全カードに設定するデッキ ID（任意。存在・所有を検証する）。
+            tags: 全カードに付与するタグ（行のタグと結合する）。
+            on_progress: 進捗（processed_rows / imported / invalid / failed /
+                skipped_limit）を受け取るコールバック。呼び出し元スレッドから
+                IMPORT_PROGRESS_INTERVAL_ROWS 行ごとに呼ばれる。
+
+        Returns:
+            CardImportResult。
+
+        Raises:
+            DeckNotFoundError: deck_id が存在しない / 所有していない場合。
+            ImportFormatError: ファイルの解析に失敗した場合（それまでの書き込みは残る）。
+            CardServiceError: 枠予約の DynamoDB エラー時（同上）。
+        """
+        if deck_id is not None:
+            self._get_deck_service().get_deck(user_id, deck_id)
+
+        common_tags = tags or []
+        result = CardImportResult()
+        local = threading.local()
+
+        def thread_repo() -> CardRepository:
+            if not hasattr(local, "repo"):
+                local.repo = self._new_repo()
+            return local.repo
+
+        def write(batch: List[Card]) -> Tuple[int, int]:
+            repo = thread_repo()
+            failed_ids = set(repo.batch_put_items([c.to_dynamodb_item() for c in batch]))
+            if failed_ids:
+                repo.release_card_slots(user_id, len(failed_ids))
+            return len(batch) - len(failed_ids), len(failed_ids)
+
+        def collect(futures: Iterable[Future]) -> None:
+            for future in futures:
+                saved, failed = future.result()
+                result.imported += saved
+                result.failed += failed
+
+        def report() -> None:
+            if on_progress is not None:
+                on_progress(
+                    {
+                        "processed_rows": result.total_rows,
+                        "imported": result.imported,
+                        "invalid": result.invalid,
+                        "failed": result.failed,
+                        "skipped_limit": result.skipped_limit,
+                    }
                 )
-        return saved_count
+
+        now = datetime.now(timezone.utc)
+        batch: List[Card] = []
+        pending: Set[Future] = set()
+        try:
+            with ThreadPoolExecutor(max_workers=IMPORT_WRITE_CONCURRENCY) as executor:
+
+                def flush() -> None:
+                    nonlocal pending
+                    if not batch:
+                        return
+                    try:
+                        reserved = self._repo.reserve_card_slots(user_id, len(batch), self.MAX_CARDS_PER_USER)
+                    except CardLimitExceededError:
+                        reserved = 0
+                    if reserved < len(batch):
+                        result.limit_reached = True
+                        result.skipped_limit += len(batch) - reserved
+                    if reserved:
+                        if len(pending) >= IMPORT_WRITE_CONCURRENCY * 2:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            collect(done)
+                        pending.add(executor.submit(write, batch[:reserved]))
+                    batch.clear()
+
+                try:
+                    for row in rows:
+                        result.total_rows += 1
+                        if result.total_rows % IMPORT_PROGRESS_INTERVAL_ROWS == 0:
+                            report()
+                        if result.limit_reached:
+                            result.skipped_limit += 1
+                            continue
+                        try:
+                            request = CreateCardRequest(
+                                front=row.front.strip(),
+                                back=row.back.strip(),
+                                deck_id=deck_id,
+                                tags=list(dict.fromkeys(common_tags + row.tags)),
+                            )
+                        except ValidationError as e:
+                            result.invalid += 1
+                            if len(result.errors) < IMPORT_MAX_REPORTED_ERRORS:
+                                error = e.errors()[0]
+                                field_name = ".".join(str(part) for part in error["loc"])
+                                result.errors.append(
+                                    ImportRowError(line=row.line, message=f"{field_name}: {error['msg']}")
+                                )
+                            continue
+                        batch.append(
+                            Card(
+                                user_id=user_id,
+                                front=request.front,
+                                back=request.back,
+                                deck_id=deck_id,
+                                tags=request.tags,
+                                next_review_at=now,
+                                created_at=now,
+                                updated_at=now,
+                            )
+                        )
+                        if len(batch) >= IMPORT_BATCH_SIZE:
+                            flush()
+                    flush()
+                finally:
+                    # 解析エラーで中断した場合も、送出済みバッチの完了を待って件数に反映する。
+                    collect(wait(pending).done)
+        finally:
+            # 解析エラー等で中断しても、書き込み済みのカードは ETag に反映させる。
+            if result.imported:
+                self._data_version.bump(user_id)
+
+        if result.limit_reached:
+            logger.warning(
+                "Card limit reached during import; skipping remaining rows",
+                extra={"user_id": user_id, "skipped": result.skipped_limit},
+            )
+        logger.info(
+            "Card import finished",
+            extra={
+                "user_id": user_id,
+                "total_rows": result.total_rows,
+                "imported": result.imported,
+                "invalid": result.invalid,
+                "failed": result.failed,
+            },
+        )
+        return result
 
     def get_card(self, user_id: str, card_id: str) -> Card:
         """Get a card by ID.
@@ -361,8 +610,81 @@ class CardService:
             expression_values=expression_values,
             expression_names=expression_names,
         )
+        self._data_version.bump(user_id)
         return card
 
+    def move_cards(
+        self,
+        user_id: str,
+        deck_id: str,
+        card_ids: Optional[List[str]] = None,
+        source_deck_id: Optional[str] = None,
+    ) -> MoveCardsResponse:
+        """カードをまとめて deck_id へ移動する（POST /decks/<deck_id>/cards:move）。
+
+        PUT /cards/<id> を 1 枚ずつ呼ぶと毎回デッキ検証（C-7）と読み取りが走るため、
+        移動先デッキの検証を 1 回だけ行い、カードごとの条件付き UpdateItem を
+        MOVE_CONCURRENCY 並列で発行する。カード単位の結果を返し、一部の失敗で
+        全体を失敗にはしない。
+
+        card_ids: 指定カードを移動する（存在しないカードは not_found）。
+        source_deck_id: そのデッキの全カードを deck-cards-index から収集して移動する
+            （マージ）。収集後に別デッキへ移動・削除されたカードは conflict として残す。
+
+        デッキの card_count / due_count は deck-cards-index の COUNT で算出しており
+        （DeckService.get_deck_card_counts）、deck_index_key を deck_id と同じ
+        UpdateItem で書き換えるため、移動元・移動先の件数は常に一致する。
+
+        Raises:
+            DeckNotFoundError: 移動先（または移動元）デッキが存在しない / 所有していない場合。
+            CardServiceError: マージ対象の収集に失敗した場合。
+        """
+        deck_service = self._get_deck_service()
+        deck_service.get_deck(user_id, deck_id)
+        expected_deck_id = None
+        if source_deck_id is not None:
+            deck_service.get_deck(user_id, source_deck_id)
+            card_ids = self._repo.query_deck_card_ids(user_id, source_deck_id)
+            expected_deck_id = source_deck_id
+
+        response = MoveCardsResponse(deck_id=deck_id)
+        if not card_ids:
+            return response
+
+        updated_at = datetime.now(timezone.utc).isoformat()
+        local = threading.local()
+
+        def move(card_id: str) -> MoveCardResult:
+            if not hasattr(local, "repo"):
+                local.repo = self._new_repo()
+            try:
+                status = local.repo.move_card_to_deck(
+                    user_id, card_id, deck_id, updated_at, expected_deck_id=expected_deck_id
+                )
+            except CardServiceError as e:
+                logger.warning("Failed to move card", extra={"card_id": card_id, "error": str(e)})
+                status = "failed"
+            return MoveCardResult(card_id=card_id, status=status)
+
+        with ThreadPoolExecutor(max_workers=min(MOVE_CONCURRENCY, len(card_ids))) as executor:
+            response.results = list(executor.map(move, card_ids))
+        for result in response.results:
+            setattr(response, result.status, getattr(response, result.status) + 1)
+
+        if response.moved:
+            self._data_version.bump(user_id)
+        logger.info(
+            "Moved cards between decks",
+            extra={
+                "user_id": user_id,
+                "deck_id": deck_id,
+                "source_deck_id": source_deck_id,
+                "requested": len(card_ids),
+                "moved": response.moved,
+            },
+        )
+        return response
+
     def delete_card(self, user_id: str, card_id: str) -> None:
         """Delete a card atomically with card_count decrement.
 
@@ -398,14 +720,144 @@ class CardService:
         Args:
             user_id: The user's ID.
             limit: Maximum number of cards to return.
-            cursor: Pagination cursor (card_id to start after).
-            deck_id: Optional filter by deck ID.
+            cursor: Pagination cursor. deck_id 未指定時は直前ページ末尾の card_id、
+                deck_id 指定時は deck-cards-index の LastEvaluatedKey を符号化した
+                不透明な文字列（いずれも前ページの next_cursor をそのまま渡す）。
+            deck_id: Optional filter by deck ID. 指定時は deck-cards-index GSI 経由で
+                取得し、復習期限が近い順に並ぶ。
 
         Returns:
             Tuple of (list of cards, next cursor).
+
+        Raises:
+            InvalidCursorError: deck_id 指定時に cursor が不正な場合。
         """
         items, next_cursor = self._repo.query_cards_page(user_id, limit, cursor, deck_id)
-        return [Card.from_dynamodb_item(item) for item in items], next_cursor
+        return [Card.from_trusted_item(item) for item in items], next_cursor
+
+    def list_card_responses(
+        self,
+        user_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        deck_id: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """list_cards と同じページを CardResponse の JSON 形（dict）で返す。
+
+        GET /cards はアイテムをそのままレスポンスに流すだけなので、Card / CardResponse の
+        構築と model_dump を省き card_response_json で直接変換する。引数・例外は list_cards と同じ。
+        fields（検証済みの CardResponse フィールド名）指定時は同名の属性だけを射影して取得し、
+        そのフィールドだけを返す。
+        """
+        items, next_cursor = self._repo.query_cards_page(user_id, limit, cursor, deck_id, attributes=fields)
+        return [card_response_json(item, fields) for item in items], next_cursor
+
+    def get_card_changes(
+        self,
+        user_id: str,
+        since: Optional[str] = None,
+        limit: int = 100,
+    ) -> CardChangesResponse:
+        """sync token 以降に作成・更新・削除されたカードを返す（差分同期）。
+
+        since 未指定、または tombstone の保持期間より古い token の場合は
+        full_resync=True と新しい token を返す。クライアントは GET /cards で全件を
+        取り直し、以後はその token から差分を取得する。
+
+        Args:
+            user_id: The user's ID.
+            since: 前回レスポンスの next_since。
+            limit: 1 ページあたりの最大件数（変更 + 削除の合計）。
+
+        Raises:
+            InvalidCursorError: since が不正な場合。
+        """
+        full_resync = since is None
+        try:
+            items, deleted, next_since, has_more = self._repo.query_changes(user_id, since, limit)
+        except SyncTokenExpiredError:
+            full_resync = True
+            items, deleted, next_since, has_more = self._repo.query_changes(user_id, None, limit)
+        return CardChangesResponse(
+            changes=[Card.from_trusted_item(item).to_response() for item in items],
+            deleted_card_ids=deleted,
+            next_since=next_since,
+            has_more=has_more,
+            full_resync=full_resync,
+        )
+
+    def search_cards(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 20,
+        deck_id: Optional[str] = None,
+        tag: Optional[str] = None,
+    ) -> List[Tuple[Card, float]]:
+        """n-gram 転置インデックスでカードを全文検索し、スコア順に返す。
+
+        1. クエリを n-gram term に分解し、term と deck_id / tag の posting を BatchGetItem で
+           読んで各 term に一致する card_id 集合（front / back）を求める（O(term 数) の読み取り）。
+        2. term 被覆率（front 出現は加点）で候補をスコアリングし、SEARCH_MIN_COVERAGE 未満を
+           除外して上位 SEARCH_MAX_CANDIDATES 件の本体を BatchGetItem で取得する。
+           deck_id / tag は候補の切り詰め前に適用されるため、条件付き検索でも一致を取りこぼさない。
+        3. 本体でも deck_id / tag を確かめ（インデックスはストリーム経由で数秒遅れ得る）、
+           正規化済みクエリの完全一致（front > back）を加点してスコア降順に最大 limit 件を返す。
+
+        Args:
+            user_id: The user's ID.
+            query: 検索クエリ（全角/半角・大文字/小文字は区別しない）。
+            limit: 最大件数。
+            deck_id: 指定時はこのデッキのカードのみ。
+            tag: 指定時はこのタグを持つカードのみ。
+
+        Returns:
+            (Card, score) のリスト（score 降順）。
+
+        Raises:
+            CardSearchUnavailableError: 検索インデックスが未設定の場合。
+        """
+        terms = query_terms(query)
+        if not terms:
+            return []
+
+        postings = self._search_index.lookup(user_id, terms, deck_id=deck_id, tag=tag)
+        coverage: Dict[str, float] = {}
+        for front_ids, back_ids in postings:
+            for card_id in front_ids | back_ids:
+                coverage[card_id] = coverage.get(card_id, 0.0) + (1.5 if card_id in front_ids else 1.0)
+
+        min_score = self.SEARCH_MIN_COVERAGE * len(terms)
+        candidates = sorted(
+            ((card_id, score) for card_id, score in coverage.items() if score >= min_score),
+            key=lambda pair: (-pair[1], pair[0]),
+        )[: self.SEARCH_MAX_CANDIDATES]
+        if not candidates:
+            return []
+
+        items = self._repo.batch_get_items(
+            [{"user_id": user_id, "card_id": card_id} for card_id, _ in candidates]
+        )
+        scores = dict(candidates)
+        phrase = normalize_text(query).strip()
+        normalized_tag = normalize_text(tag) if tag else None
+        hits: List[Tuple[Card, float]] = []
+        for item in items:
+            card = Card.from_trusted_item(item)
+            if deck_id and card.deck_id != deck_id:
+                continue
+            if normalized_tag and normalized_tag not in (normalize_text(t) for t in card.tags):
+                continue
+            score = scores[card.card_id] / len(terms)
+            if phrase in normalize_text(card.front):
+                score += 1.0
+            elif phrase in normalize_text(card.back):
+                score += 0.5
+            hits.append((card, round(score, 4)))
+
+        hits.sort(key=lambda hit: (-hit[1], hit[0].card_id))
+        return hits[:limit]
 
     def find_cards_by_reference_url(self, user_id: str, url: str) -> List[Card]:
         """指定 URL を生成元参照に持つカードを reference-url-index GSI で検索する。
@@ -430,7 +882,7 @@ class CardService:
             指定 URL を生成元参照に持つカードのリスト。
         """
         items = self._repo.query_cards_by_reference_url(user_id, url)
-        return [Card.from_dynamodb_item(item) for item in items]
+        return [Card.from_trusted_item(item) for item in items]
 
     def get_card_count(self, user_id: str) -> int:
         """Get the number of cards for a user.
@@ -469,7 +921,7 @@ class CardService:
             List of cards due for review, oldest due first.
         """
         items = self._repo.query_due_cards(user_id, limit, before, include_future)
-        return [Card.from_dynamodb_item(item) for item in items]
+        return [Card.from_trusted_item(item) for item in items]
 
     def get_due_card_count(
         self,
@@ -518,4 +970,22 @@ class CardService:
         Card へ変換して返す。
         """
         items = self._repo.query_deck_due_cards(user_id, deck_id, limit, before, include_future)
-        return [Card.from_dynamodb_item(item) for item in items]
+        return [Card.from_trusted_item(item) for item in items]
+
+    def get_due_card_items(
+        self,
+        user_id: str,
+        limit: int,
+        before: Optional[datetime] = None,
+        include_future: bool = False,
+        deck_id: Optional[str] = None,
+        attributes: Optional[Iterable[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """get_due_cards / get_deck_due_cards と同じ順序・件数の生アイテムを返す。
+
+        attributes 指定時はその属性のみを射影して取得する（GET /cards/due?fields= 用。
+        射影したアイテムは Card の必須属性を欠き得るため Card へは変換しない）。
+        """
+        if deck_id is not None:
+            return self._repo.query_deck_due_cards(user_id, deck_id, limit, before, include_future, attributes)
+        return self._repo.query_due_cards(user_id, limit, before, include_future, attributes)
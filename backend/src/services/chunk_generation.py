@@ -0,0 +1,148 @@
+"""URL カード生成のチャンク単位 AI 呼び出しを並列に実行する（BedrockService / StrandsAIService 共通）。
+
+記事を分割した各チャンクを 1 回ずつモデルに渡してカードを生成する。逐次実行では
+6 チャンクの記事で 6 往復分待つことになり、generate_from_url ジョブが heavy キューの
+タイムアウトに近づくため、max_workers 本まで同時に呼び出す。
+
+- 順序: マージ結果は完了順ではなくチャンク順（逐次実行と同じ並び）。
+- 早期終了（C-4）: 先頭から連続して完了したチャンク（完了済みの prefix）のカード数が
+  target_count に達したら以降のチャンクは呼ばない。後ろのチャンクが先に完了しても、
+  それより前のチャンクが実行中なら待つ（逐次実行と同じく前のチャンクのカードを優先する）。
+  打ち切るのは prefix より後ろの実行中の呼び出しだけで、結果は捨てる（Python のスレッドは
+  中断できないため、呼び出し自体はバックグラウンドで完了する）。
+- 投入の抑制: 実行中のチャンクがそれぞれ cards_per_chunk 枚返せば target_count に届く
+  場合は、それ以上のチャンクを投入しない。1 チャンクで足りるページで余分な呼び出しを
+  しない（= 逐次実行と同じ呼び出し回数になる）ため、コストを増やさずに待ち時間だけ減らす。
+- エラー: skip_errors のチャンクは失敗として数えて次へ進む。stop_errors（タイムアウト等）
+  は新たな投入を止め、実行中のチャンクの完了を待って部分結果を返す。それ以外の例外は
+  実行中の呼び出しを打ち切ってそのまま送出する。
+- 上限: max_calls（MAX_CHUNK_CALLS）を超えるチャンクは呼ばない。
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence, Set, Tuple, Type
+
+from aws_lambda_powertools import Logger
+
+from services.ai_service import GeneratedCard
+
+logger = Logger()
+
+# チャンク単位の同時呼び出し数の既定値（Bedrock のアカウント単位の同時実行枠を
+# 1 リクエストで使い切らない程度に抑える）。
+CHUNK_GENERATION_CONCURRENCY = 4
+
+ErrorTypes = Tuple[Type[BaseException], ...]
+
+
+@dataclass
+class ChunkGenerationOutcome:
+    """run_chunk_generation の結果."""
+
+    cards: List[GeneratedCard] = field(default_factory=list)
+    processed_chunks: int = 0
+    failed_chunks: int = 0
+    stopped_chunks: int = 0
+
+
+def run_chunk_generation(
+    chunks: Sequence[str],
+    generate: Callable[[str], List[GeneratedCard]],
+    target_count: int,
+    cards_per_chunk: int,
+    max_calls: int,
+    max_workers: int = CHUNK_GENERATION_CONCURRENCY,
+    skip_errors: ErrorTypes = (),
+    stop_errors: ErrorTypes = (),
+) -> ChunkGenerationOutcome:
+    """chunks を最大 max_workers 並列で generate し、カードをチャンク順にマージして返す.
+
+    Args:
+        chunks: テキストチャンク（この順でマージする）。
+        generate: 1 チャンクからカードを生成する関数（ワーカースレッドで呼ばれる）。
+        target_count: 目標枚数。先頭から連続して完了したチャンクの合計がこれに達したら打ち切る。
+        cards_per_chunk: 1 チャンクあたりに依頼する枚数（投入数の見積もりに使う）。
+        max_calls: generate を呼ぶ回数の上限。
+        max_workers: 同時に実行する generate の上限。1 なら逐次実行と同じ。
+        skip_errors: そのチャンクだけを失敗扱いにして続行する例外。
+        stop_errors: 新たな投入を止めて部分結果を返す例外。
+
+    Returns:
+        ChunkGenerationOutcome（cards は重複除去・target_count への切り詰め前）。
+    """
+    outcome = ChunkGenerationOutcome()
+    if len(chunks) > max_calls:
+        logger.warning(
+            "Chunk call cap reached; skipping remaining chunks",
+            extra={
+                "total_chunks": len(chunks),
+                "max_chunk_calls": max_calls,
+            },
+        )
+    chunks = chunks[:max_calls]
+    if not chunks:
+        return outcome
+
+    results: Dict[int, List[GeneratedCard]] = {}
+    in_flight: Dict[Future, int] = {}
+    finished: Set[int] = set()
+    next_index = 0
+    collected = 0
+    # 先頭から連続して完了したチャンクの範囲 [0, prefix_end) とそのカード数。
+    prefix_end = 0
+    prefix_count = 0
+    stopped = False
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks))))
+    try:
+        while True:
+            while (
+                not stopped
+                and next_index < len(chunks)
+                and len(in_flight) < max_workers
+                and collected + len(in_flight) * cards_per_chunk < target_count
+            ):
+                in_flight[executor.submit(generate, chunks[next_index])] = next_index
+                next_index += 1
+                outcome.processed_chunks += 1
+            if not in_flight or prefix_count >= target_count:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=in_flight.__getitem__):
+                index = in_flight.pop(future)
+                finished.add(index)
+                try:
+                    cards = future.result()
+                except skip_errors:
+                    outcome.failed_chunks += 1
+                    continue
+                except stop_errors:
+                    outcome.stopped_chunks += 1
+                    stopped = True
+                    logger.warning(
+                        "URL card generation chunk stopped; returning partial results if available",
+                        extra={"chunk_index": index, "cards_so_far": collected},
+                    )
+                    continue
+                results[index] = cards
+                collected += len(cards)
+            while prefix_end in finished:
+                prefix_count += len(results.get(prefix_end, ()))
+                prefix_end += 1
+    finally:
+        # 目標到達・例外時は実行中の呼び出しを待たない（未開始のものは取り消す）。
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if in_flight:
+        logger.info(
+            "Target card count reached; abandoning outstanding chunk calls",
+            extra={"outstanding_chunks": len(in_flight), "cards_so_far": prefix_count},
+        )
+    # 打ち切ったチャンクより後ろで完了していた結果は、順序が飛ぶため使わない。
+    for index in sorted(results):
+        if index < prefix_end:
+            outcome.cards.extend(results[index])
+    return outcome
@@ -0,0 +1,266 @@
+"""User data export: streaming gzip NDJSON to S3 (export_data job).
+
+カード・デッキ・レビュー履歴を 1 行 1 レコードの NDJSON として gzip 圧縮し、
+EXPORT_BUCKET へマルチパートアップロードする。scan_all_cards / query_all_reviews で
+全件をメモリに載せる代わりに、DynamoDB の Query 1 ページ → gzip → パートバッファの
+順にストリームで流し、バッファが EXPORT_PART_BYTES に達するごとに UploadPart する。
+メモリ使用量は「1 ページ分のアイテム + 1 パート分の圧縮済みバイト列」で頭打ちになり、
+ライブラリの大きさに依存しない。
+
+出力形式（1 行 1 JSON）:
+  {"type": "meta", "format_version": 1, "exported_at": ..., "user_id": ...}
+  {"type": "deck", "data": {...}}
+  {"type": "card", "data": {...}}
+  {"type": "review", "data": {...}}
+data は DynamoDB の生アイテム（Decimal は int / float へ変換）。GSI 用の内部属性は除く。
+
+完了後は署名付き GET URL を返す。EXPORT_BUCKET 未設定では無効（ExportUnavailableError）。
+ローカル開発では S3_ENDPOINT_URL で S3 互換ストレージ（docker-compose の minio）を使う。
+"""
+
+import gzip
+import io
+import json
+import os
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from aws_lambda_powertools import Logger
+from botocore.exceptions import BotoCoreError, ClientError
+
+from utils.s3_client import get_s3_client
+from .card_repository import CardRepository, CardServiceError
+from .review_repository import ReviewRepository
+
+logger = Logger()
+
+EXPORT_KEY_PREFIX = "exports/"
+EXPORT_FORMAT_VERSION = 1
+# マルチパートの 1 パートの大きさ。S3 の最小パートサイズ（最後のパートを除き 5MiB）を満たす。
+EXPORT_PART_BYTES = 8 * 1024 * 1024
+# DynamoDB Query の 1 ページあたりの件数（メモリに同時に載るアイテム数の上限）。
+EXPORT_PAGE_SIZE = 200
+# 署名付きダウンロード URL の有効期限（秒）。
+DOWNLOAD_URL_EXPIRES_SECONDS = 3600
+# 進捗を報告するレコード間隔。
+EXPORT_PROGRESS_INTERVAL_RECORDS = 1000
+
+# GSI のキー等、エクスポート先で意味を持たない内部属性。
+_INTERNAL_ATTRIBUTES = frozenset({"deck_index_key", "reference_url_key"})
+
+
+class ExportUnavailableError(CardServiceError):
+    """Raised when the export bucket is not configured."""
+
+    pass
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class MultipartGzipWriter:
+    """gzip 圧縮した NDJSON を S3 マルチパートアップロードへ逐次書き出す。
+
+    with ブロックを正常終了すると CompleteMultipartUpload、例外時は
+    AbortMultipartUpload する（中途半端なパートを残さない）。
+    """
+
+    def __init__(self, client: Any, bucket: str, key: str, part_bytes: Optional[int] = None):
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._part_bytes = part_bytes or EXPORT_PART_BYTES
+        self._buffer = io.BytesIO()
+        self._gzip = gzip.GzipFile(fileobj=self._buffer, mode="wb")
+        self._upload_id: Optional[str] = None
+        self._parts: List[Dict[str, Any]] = []
+        self.size_bytes = 0
+
+    def __enter__(self) -> "MultipartGzipWriter":
+        response = self._client.create_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            # Content-Encoding: gzip にするとブラウザが透過的に展開してしまうため、
+            # .ndjson.gz ファイルとしてそのままダウンロードさせる。
+            ContentType="application/gzip",
+        )
+        self._upload_id = response["UploadId"]
+        return self
+
+    def write_record(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=_json_default, separators=(",", ":"))
+        self._gzip.write(line.encode("utf-8") + b"\n")
+        if self._buffer.tell() >= self._part_bytes:
+            self._flush_part()
+
+    def _flush_part(self) -> None:
+        data = self._buffer.getvalue()
+        part_number = len(self._parts) + 1
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        self.size_bytes += len(data)
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self._gzip.close()
+            # 最後のパートは 5MiB 未満でもよい（空ファイルでも gzip ヘッダーで 1 パート以上になる）。
+            self._flush_part()
+            self._client.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=self._key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": self._parts},
+            )
+            return
+        try:
+            self._client.abort_multipart_upload(Bucket=self._bucket, Key=self._key, UploadId=self._upload_id)
+        except (BotoCoreError, ClientError) as e:
+            logger.warning("Failed to abort export upload", extra={"key": self._key, "error": str(e)})
+
+
+class DataExporter:
+    """ユーザーのカード・デッキ・レビューを EXPORT_BUCKET へエクスポートする。"""
+
+    def __init__(
+        self,
+        bucket_name: Optional[str] = None,
+        s3_client: Optional[Any] = None,
+        dynamodb_resource: Optional[Any] = None,
+        card_repository: Optional[CardRepository] = None,
+        review_repository: Optional[ReviewRepository] = None,
+        decks_table_name: Optional[str] = None,
+    ):
+        """Initialize DataExporter.
+
+        Args:
+            bucket_name: S3 bucket name. Defaults to EXPORT_BUCKET env var.
+                空文字（未設定）の場合はエクスポートを無効化する。
+            s3_client: Optional boto3 S3 client for testing.
+            dynamodb_resource: Optional boto3 DynamoDB resource for testing.
+            card_repository: Optional CardRepository for testing.
+            review_repository: Optional ReviewRepository for testing.
+            decks_table_name: DynamoDB decks table name. Defaults to DECKS_TABLE env var.
+        """
+        self.bucket_name = bucket_name if bucket_name is not None else os.environ.get("EXPORT_BUCKET", "")
+        self._client = s3_client
+        self._dynamodb_resource_arg = dynamodb_resource
+        self._card_repo = card_repository
+        self._review_repo = review_repository
+        self.decks_table_name = decks_table_name or os.environ.get("DECKS_TABLE", "memoru-decks-dev")
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.bucket_name)
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            self._client = get_s3_client()
+        return self._client
+
+    @property
+    def card_repo(self) -> CardRepository:
+        if self._card_repo is None:
+            self._card_repo = CardRepository(dynamodb_resource=self._dynamodb_resource_arg)
+        return self._card_repo
+
+    @property
+    def review_repo(self) -> ReviewRepository:
+        if self._review_repo is None:
+            self._review_repo = ReviewRepository(dynamodb_resource=self._dynamodb_resource_arg)
+        return self._review_repo
+
+    def _iter_deck_pages(self, user_id: str) -> Iterable[List[Dict[str, Any]]]:
+        table = self.card_repo.dynamodb.Table(self.decks_table_name)
+        query_kwargs: Dict[str, Any] = {
+            "KeyConditionExpression": "user_id = :user_id",
+            "ExpressionAttributeValues": {":user_id": user_id},
+        }
+        while True:
+            try:
+                response = table.query(**query_kwargs)
+            except ClientError as e:
+                raise CardServiceError(f"Failed to query decks: {e}")
+            yield response.get("Items", [])
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return
+            query_kwargs["ExclusiveStartKey"] = last_key
+
+    def export(
+        self,
+        user_id: str,
+        on_progress: Optional[Callable[[Dict[str, int]], None]] = None,
+    ) -> Dict[str, Any]:
+        """エクスポートを実行し、ダウンロード情報を返す。
+
+        Returns:
+            ``{"download_url", "expires_in", "object_key", "size_bytes", "counts", "exported_at"}``。
+
+        Raises:
+            ExportUnavailableError: バケット未設定時。
+            CardServiceError: DynamoDB エラー時（アップロードは中止される）。
+        """
+        if not self.enabled:
+            raise ExportUnavailableError("Data export is not configured")
+
+        exported_at = datetime.now(timezone.utc)
+        key = f"{EXPORT_KEY_PREFIX}{user_id}/memoru-export-{exported_at.strftime('%Y%m%dT%H%M%SZ')}.ndjson.gz"
+        counts = {"decks": 0, "cards": 0, "reviews": 0}
+        sources = (
+            ("deck", "decks", self._iter_deck_pages(user_id)),
+            ("card", "cards", self.card_repo.iter_card_pages(user_id, EXPORT_PAGE_SIZE)),
+            ("review", "reviews", self.review_repo.iter_review_pages(user_id, EXPORT_PAGE_SIZE)),
+        )
+
+        with MultipartGzipWriter(self.client, self.bucket_name, key) as writer:
+            writer.write_record(
+                {
+                    "type": "meta",
+                    "format_version": EXPORT_FORMAT_VERSION,
+                    "exported_at": exported_at.isoformat(),
+                    "user_id": user_id,
+                }
+            )
+            written = 0
+            for record_type, count_key, pages in sources:
+                for page in pages:
+                    for item in page:
+                        data = {k: v for k, v in item.items() if k not in _INTERNAL_ATTRIBUTES}
+                        writer.write_record({"type": record_type, "data": data})
+                        counts[count_key] += 1
+                        written += 1
+                        if on_progress is not None and written % EXPORT_PROGRESS_INTERVAL_RECORDS == 0:
+                            on_progress(dict(counts))
+
+        url = self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket_name, "Key": key},
+            ExpiresIn=DOWNLOAD_URL_EXPIRES_SECONDS,
+        )
+        logger.info(
+            "Data export finished",
+            extra={"user_id": user_id, "size_bytes": writer.size_bytes, **counts},
+        )
+        return {
+            "download_url": url,
+            "expires_in": DOWNLOAD_URL_EXPIRES_SECONDS,
+            "object_key": key,
+            "size_bytes": writer.size_bytes,
+            "counts": counts,
+            "exported_at": exported_at.isoformat(),
+        }
@@ -0,0 +1,130 @@
+"""Per-user data version for conditional GET (ETag / 304).
+
+ユーザーのカード・デッキ・復習・設定が変わるたびに単調増加する番号を users テーブルの
+``data_version`` 属性に持たせる。読み取り系エンドポイント（GET /cards, /decks, /stats 等）は
+この番号から弱い ETag を作り、If-None-Match が一致すればクエリを実行せずに 304 を返す
+（api/conditional.py）。
+
+更新方針:
+  - カード作成・削除は card_count を更新するトランザクションに ``ADD data_version :one`` を
+    同居させる（CardRepository）。設定更新も同じ UpdateItem 内で加算する（UserService）。
+  - それ以外（カード更新・デッキ変更・復習）は本体の書き込み成功後に bump() を呼ぶ。
+    本体より先に加算すると、加算後・本体書き込み前に読んだ古い内容へ新しい ETag が
+    付き得るため、必ず「書き込み → 加算」の順にする。
+  - bump() の失敗はカード書き込みを失敗させない（ログのみ）。失敗時は次の変更まで
+    304 が古い内容を指し得るため error レベルで記録する。
+  - 加算と同時に ``data_version_at``（エポックミリ秒）を SET する。GSI や結果整合性読み取りは
+    書き込み直後に古い内容を返し得るため、api/conditional.py は変更直後の一定時間は
+    ETag を付けない（古い本文に新しいバージョンの ETag を固定しないため）。
+"""
+
+import os
+import time
+from typing import Any, NamedTuple, Optional
+
+from aws_lambda_powertools import Logger
+from botocore.exceptions import BotoCoreError, ClientError
+
+from utils.dynamodb_client import get_dynamodb_resource
+from utils.request_cache import request_cache
+
+logger = Logger()
+
+DATA_VERSION_ATTRIBUTE = "data_version"
+DATA_VERSION_AT_ATTRIBUTE = "data_version_at"
+SETTINGS_VERSION_ATTRIBUTE = "settings_version"
+
+
+def version_timestamp() -> int:
+    """data_version_at に書き込む現在時刻（エポックミリ秒）。"""
+    return int(time.time() * 1000)
+
+
+class DataVersion(NamedTuple):
+    """データバージョンと最終変更時刻（エポック秒。未記録は 0）。
+
+    settings_version は設定キャッシュ（services/user_settings_cache.py）の検証用に
+    同じ読み取りで返す。
+    """
+
+    version: int
+    changed_at: float
+    settings_version: int = 0
+
+
+class DataVersionStore:
+    """users テーブル上のユーザー単位データバージョンを読み書きする。"""
+
+    def __init__(
+        self,
+        users_table_name: Optional[str] = None,
+        dynamodb_resource: Optional[Any] = None,
+    ):
+        """Initialize DataVersionStore.
+
+        Args:
+            users_table_name: DynamoDB users table name. Defaults to USERS_TABLE env var.
+            dynamodb_resource: Optional boto3 DynamoDB resource for testing.
+        """
+        self.users_table_name = users_table_name or os.environ.get("USERS_TABLE", "memoru-users-dev")
+        self._dynamodb_resource_arg = dynamodb_resource
+        self._table: Optional[Any] = None
+
+    @property
+    def table(self) -> Any:
+        if self._table is None:
+            self._table = get_dynamodb_resource(self._dynamodb_resource_arg).Table(self.users_table_name)
+        return self._table
+
+    def get(self, user_id: str) -> Optional[DataVersion]:
+        """現在のデータバージョンを返す（未設定は 0、読み取り失敗時は None）。
+
+        変更直後の読み取りで古いバージョンを返すと 304 が古い内容を指すため、
+        強い整合性読み取りを使う。
+        """
+        try:
+            response = self.table.get_item(
+                Key={"user_id": user_id},
+                ProjectionExpression="#v, #t, #s",
+                ExpressionAttributeNames={
+                    "#v": DATA_VERSION_ATTRIBUTE,
+                    "#t": DATA_VERSION_AT_ATTRIBUTE,
+                    "#s": SETTINGS_VERSION_ATTRIBUTE,
+                },
+                ConsistentRead=True,
+            )
+        except (BotoCoreError, ClientError) as e:
+            logger.warning(
+                "Failed to read data version",
+                extra={"user_id": user_id, "error": str(e)},
+            )
+            return None
+        item = response.get("Item", {})
+        return DataVersion(
+            version=int(item.get(DATA_VERSION_ATTRIBUTE, 0)),
+            changed_at=int(item.get(DATA_VERSION_AT_ATTRIBUTE, 0)) / 1000,
+            settings_version=int(item.get(SETTINGS_VERSION_ATTRIBUTE, 0)),
+        )
+
+    def bump(self, user_id: str) -> None:
+        """データバージョンを 1 加算する（ベストエフォート）。
+
+        未作成ユーザーのアイテムを ADD で作ってしまわないよう attribute_exists で
+        ガードする（get_or_create_user の初回作成を妨げない）。
+        """
+        request_cache.invalidate(self.users_table_name, user_id)
+        try:
+            self.table.update_item(
+                Key={"user_id": user_id},
+                UpdateExpression="SET #t = :now ADD #v :one",
+                ConditionExpression="attribute_exists(user_id)",
+                ExpressionAttributeNames={"#v": DATA_VERSION_ATTRIBUTE, "#t": DATA_VERSION_AT_ATTRIBUTE},
+                ExpressionAttributeValues={":one": 1, ":now": version_timestamp()},
+            )
+        except (BotoCoreError, ClientError) as e:
+            if isinstance(e, ClientError) and e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return
+            logger.error(
+                "Failed to bump data version; cached reads may be stale until the next change",
+                extra={"user_id": user_id, "error": str(e)},
+            )
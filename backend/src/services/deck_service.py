@@ -1,18 +1,27 @@
 """Deck service for DynamoDB operations."""
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from aws_lambda_powertools import Logger
 from botocore.exceptions import ClientError
 
 from models.deck import Deck
 from utils.dynamodb_client import get_dynamodb_resource
+from utils.request_cache import MISS, request_cache
 from utils.sentinel import UNSET as _UNSET
+from .data_version import DataVersionStore
 
 logger = Logger()
 
+# デッキ削除時のカード deck_id リセット: UpdateItem の並列度と GSI の 1 ページの件数。
+# 1 ページに収まるデッキはリクエスト内で、それ以上は reset_deck_cards ジョブで処理する。
+DECK_RESET_CONCURRENCY = 8
+DECK_RESET_PAGE_SIZE = 200
+
 
 class DeckServiceError(Exception):
     """Base exception for deck service errors."""
@@ -21,9 +30,15 @@ class DeckServiceError(Exception):
 
 
 class DeckNotFoundError(DeckServiceError):
-    """Raised when deck is not found."""
+    """Raised when deck is not found.
 
-    pass
+    deck_id は見つからなかったデッキの ID（複数のデッキを検証する呼び出しで、
+    どちらが無いかを呼び出し元が区別できるようにする）。
+    """
+
+    def __init__(self, message: str, deck_id: Optional[str] = None) -> None:
+        super().__init__(message)
+        self.deck_id = deck_id
 
 
 class DeckLimitExceededError(DeckServiceError):
@@ -53,10 +68,12 @@ class DeckService:
         self.table_name = table_name or os.environ.get("DECKS_TABLE", "memoru-decks-dev")
         self.cards_table_name = cards_table_name or os.environ.get("CARDS_TABLE", "memoru-cards-dev")
 
+        self._dynamodb_resource_arg = dynamodb_resource
         self.dynamodb = get_dynamodb_resource(dynamodb_resource)
 
         self.table = self.dynamodb.Table(self.table_name)
         self.cards_table = self.dynamodb.Table(self.cards_table_name)
+        self._data_version = DataVersionStore(dynamodb_resource=dynamodb_resource)
 
     def create_deck(
         self,
@@ -127,6 +144,7 @@ class DeckService:
                 f"Deck limit of {self.MAX_DECKS_PER_USER} exceeded"
             )
 
+        self._data_version.bump(user_id)
         return deck
 
     def get_deck(self, user_id: str, deck_id: str) -> Deck:
@@ -142,17 +160,21 @@ class DeckService:
         Raises:
             DeckNotFoundError: If deck does not exist.
         """
-        try:
-            response = self.table.get_item(
-                Key={"user_id": user_id, "deck_id": deck_id}
-            )
-            if "Item" not in response:
-                raise DeckNotFoundError(f"Deck not found: {deck_id}")
-            return Deck.from_dynamodb_item(response["Item"])
-        except DeckNotFoundError:
-            raise
-        except ClientError as e:
-            raise DeckServiceError(f"Failed to get deck: {e}")
+        # デッキ存在確認（move_cards → update_deck 等）の重複読み取りは
+        # リクエストスコープキャッシュから返す（utils/request_cache.py）。
+        item = request_cache.get(self.table_name, user_id, deck_id)
+        if item is MISS:
+            try:
+                response = self.table.get_item(
+                    Key={"user_id": user_id, "deck_id": deck_id}
+                )
+            except ClientError as e:
+                raise DeckServiceError(f"Failed to get deck: {e}")
+            item = response.get("Item")
+            request_cache.put(self.table_name, user_id, deck_id, item=item)
+        if item is None:
+            raise DeckNotFoundError(f"Deck not found: {deck_id}", deck_id=deck_id)
+        return Deck.from_dynamodb_item(item)
 
     def list_decks(self, user_id: str) -> List[Deck]:
         """List all decks for a user.
@@ -296,21 +318,41 @@ class DeckService:
             if expression_names:
                 update_kwargs["ExpressionAttributeNames"] = expression_names
 
+            request_cache.invalidate(self.table_name, user_id, deck_id)
             self.table.update_item(**update_kwargs)
-            return deck
         except ClientError as e:
             raise DeckServiceError(f"Failed to update deck: {e}")
+        self._data_version.bump(user_id)
+        return deck
 
-    def delete_deck(self, user_id: str, deck_id: str) -> None:
+    def delete_deck(
+        self,
+        user_id: str,
+        deck_id: str,
+        submit_reset_job: Optional[Callable[[], Dict[str, Any]]] = None,
+    ) -> Optional[Dict[str, Any]]:
         """Delete a deck and reset deck_id on associated cards.
 
         1. Verify deck exists
-        2. Delete the deck item
-        3. Query cards with this deck_id and reset to null (best-effort)
+        2. Read the first page of the deck's cards from deck-cards-index
+        3. DECK_RESET_PAGE_SIZE 枚を超える大きなデッキは、デッキを削除する前に
+           submit_reset_job で reset_deck_cards ジョブを登録する（登録に失敗した場合は
+           例外をそのまま送出し、デッキは削除しない。再度の DELETE でやり直せる）
+        4. Delete the deck item
+        5. 小さなデッキはカードの deck_id をリクエスト内でリセットする (best-effort)
+
+        大きなデッキのリセットを API Lambda 内で行うとタイムアウトし得るうえ、デッキ削除後は
+        再度の DELETE が 404 になり続きを再開できないため、ジョブの登録を削除より先に行う。
+        submit_reset_job を渡さない呼び出し（スクリプト等）では大きなデッキも
+        reset_deck_cards でこのプロセス内でリセットする。
 
         Args:
             user_id: The user's ID.
             deck_id: The deck's ID.
+            submit_reset_job: 大きなデッキのリセットジョブを登録し、ジョブを返す関数。
+
+        Returns:
+            登録したリセットジョブ（大きなデッキの場合）。それ以外は None。
 
         Raises:
             DeckNotFoundError: If deck does not exist.
@@ -318,6 +360,15 @@ class DeckService:
         # Verify deck exists
         self.get_deck(user_id, deck_id)
 
+        try:
+            card_keys, last_key = self._query_deck_card_keys(user_id, deck_id)
+        except ClientError as e:
+            logger.warning(f"Failed to query cards for deck reset: {e}")
+            card_keys, last_key = [], None
+
+        job = submit_reset_job() if last_key and submit_reset_job is not None else None
+
+        request_cache.invalidate(self.table_name, user_id, deck_id)
         try:
             self.table.delete_item(
                 Key={"user_id": user_id, "deck_id": deck_id}
@@ -326,7 +377,12 @@ class DeckService:
             raise DeckServiceError(f"Failed to delete deck: {e}")
 
         # Best-effort: reset deck_id on associated cards
-        self._reset_cards_deck_id(user_id, deck_id)
+        if not last_key:
+            self._reset_card_keys(deck_id, card_keys)
+        elif job is None:
+            self.reset_deck_cards(user_id, deck_id)
+        self._data_version.bump(user_id)
+        return job
 
     def get_deck_card_counts(
         self, user_id: str, deck_ids: List[str]
@@ -481,79 +537,150 @@ class DeckService:
         except ClientError as e:
             raise DeckServiceError(f"Failed to get deck count: {e}")
 
-    def _reset_cards_deck_id(self, user_id: str, deck_id: str) -> None:
-        """Reset deck_id to null on cards that belong to the deleted deck.
+    def _query_deck_card_keys(
+        self, user_id: str, deck_id: str, exclusive_start_key: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict[str, str]], Optional[Dict[str, Any]]]:
+        """deck-cards-index GSI からデッキに属するカードのキーを 1 ページ分取得する。
 
-        This is a best-effort operation — partial failures are logged but not raised.
+        旧実装はユーザーのカードパーティション全体を Query して FilterExpression で
+        deck_id を絞っていたため、読み取りコストがユーザーの総カード数に比例していた。
+        GSI (KEYS_ONLY) は対象デッキのカードのみを返し、テーブルのキー
+        (user_id, card_id) を含む。deck_index_key を持たない（next_review_at のない
+        旧データを含む）カードは投影されない点は get_deck_card_counts と同じ。
 
-        Args:
-            user_id: The user's ID.
-            deck_id: The deleted deck's ID.
+        Returns:
+            (カードキーのリスト, LastEvaluatedKey)。
+
+        Raises:
+            ClientError: DynamoDB エラー時（呼び出し側で扱う）。
         """
-        try:
-            # Query cards with this deck_id
-            query_kwargs: Dict[str, Any] = {
-                "KeyConditionExpression": "user_id = :user_id",
-                "FilterExpression": "deck_id = :deck_id",
-                "ExpressionAttributeValues": {
-                    ":user_id": user_id,
-                    ":deck_id": deck_id,
-                },
-                "ProjectionExpression": "user_id, card_id",
-            }
+        query_kwargs: Dict[str, Any] = {
+            "IndexName": "deck-cards-index",
+            "KeyConditionExpression": "deck_index_key = :deck_index_key",
+            "ExpressionAttributeValues": {":deck_index_key": f"{user_id}#{deck_id}"},
+            "Limit": DECK_RESET_PAGE_SIZE,
+        }
+        if exclusive_start_key:
+            query_kwargs["ExclusiveStartKey"] = exclusive_start_key
+        response = self.cards_table.query(**query_kwargs)
+        keys = [
+            {"user_id": item["user_id"], "card_id": item["card_id"]}
+            for item in response.get("Items", [])
+        ]
+        return keys, response.get("LastEvaluatedKey")
+
+    def _reset_card_keys(self, deck_id: str, card_keys: List[Dict[str, str]]) -> Dict[str, int]:
+        """カードの deck_id / deck_index_key を DECK_RESET_CONCURRENCY 並列で REMOVE する。
+
+        boto3 リソースはスレッド間で共有できないため、スレッドごとに Table を用意する
+        （CardService.import_cards と同じ方式）。個々の失敗はログに残して数えるのみで、
+        送出しない。
 
-            card_keys: List[Dict[str, str]] = []
-            while True:
-                response = self.cards_table.query(**query_kwargs)
-                for item in response.get("Items", []):
-                    card_keys.append(
-                        {"user_id": item["user_id"], "card_id": item["card_id"]}
-                    )
-                last_key = response.get("LastEvaluatedKey")
-                if not last_key:
-                    break
-                query_kwargs["ExclusiveStartKey"] = last_key
+        Returns:
+            ``{"reset_cards", "skipped_cards", "failed_cards"}`` の件数。
+        """
+        counts = {"reset_cards": 0, "skipped_cards": 0, "failed_cards": 0}
+        if not card_keys:
+            return counts
 
-            if not card_keys:
-                return
-
-            # Update each card to remove deck_id
-            now = datetime.now(timezone.utc)
-            for key in card_keys:
-                try:
-                    # deck_id と GSI 用派生キー deck_index_key を併せて REMOVE する。
-                    # deck_index_key を残すとデッキ削除後も deck-cards-index に
-                    # 投影され続けてしまうため (PR #47 [P2])。
-                    #
-                    # Medium-5: ConditionExpression "deck_id = :deleted_deck_id" を
-                    # 付与する。上の Query でカードを収集した後、この UpdateItem を
-                    # 発行するまでの間に別リクエストが (a) カードを別デッキへ移動、
-                    # または (b) カード自体を削除している可能性がある。条件を付けない
-                    # と (a) では移動先の deck_id を誤って剥がしてしまい、(b) では
-                    # UpdateItem が upsert として働きゴーストアイテムを再作成してしまう
-                    # (High-1 と同型の欠陥)。deck_id が収集時点の値のままの場合のみ
-                    # REMOVE することで両方を防ぐ。アイテム不存在時も deck_id 属性が
-                    # 存在しないため条件が偽になり、(b) も同時に防止される。
-                    self.cards_table.update_item(
-                        Key=key,
-                        UpdateExpression="REMOVE deck_id, deck_index_key SET updated_at = :updated_at",
-                        ConditionExpression="deck_id = :deleted_deck_id",
-                        ExpressionAttributeValues={
-                            ":updated_at": now.isoformat(),
-                            ":deleted_deck_id": deck_id,
-                        },
-                    )
-                except ClientError as e:
-                    if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
-                        # 正常なスキップ: 収集後に別デッキへ移動された、または削除された
-                        # カード。どちらもこの reset を適用すべきでないため握りつぶす。
-                        logger.info(
-                            "Skipped deck_id reset: card was moved to another deck "
-                            f"or deleted after collection (card_id={key['card_id']})"
-                        )
-                        continue
-                    logger.warning(
-                        f"Failed to reset deck_id on card {key['card_id']}: {e}"
+        now_iso = datetime.now(timezone.utc).isoformat()
+        local = threading.local()
+
+        def reset(key: Dict[str, str]) -> str:
+            if not hasattr(local, "table"):
+                local.table = get_dynamodb_resource(self._dynamodb_resource_arg).Table(self.cards_table_name)
+            try:
+                # deck_id と GSI 用派生キー deck_index_key を併せて REMOVE する。
+                # deck_index_key を残すとデッキ削除後も deck-cards-index に
+                # 投影され続けてしまうため (PR #47 [P2])。
+                #
+                # Medium-5: ConditionExpression "deck_id = :deleted_deck_id" を
+                # 付与する。キーを収集した後、この UpdateItem を発行するまでの間に
+                # 別リクエストが (a) カードを別デッキへ移動、または (b) カード自体を
+                # 削除している可能性がある。条件を付けないと (a) では移動先の deck_id を
+                # 誤って剥がしてしまい、(b) では UpdateItem が upsert として働き
+                # ゴーストアイテムを再作成してしまう (High-1 と同型の欠陥)。
+                # deck_id が収集時点の値のままの場合のみ REMOVE することで両方を防ぐ。
+                request_cache.invalidate(self.cards_table_name, key["user_id"], key["card_id"])
+                local.table.update_item(
+                    Key=key,
+                    UpdateExpression="REMOVE deck_id, deck_index_key SET updated_at = :updated_at",
+                    ConditionExpression="deck_id = :deleted_deck_id",
+                    ExpressionAttributeValues={
+                        ":updated_at": now_iso,
+                        ":deleted_deck_id": deck_id,
+                    },
+                )
+                return "reset_cards"
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                    # 正常なスキップ: 収集後に別デッキへ移動された、または削除された
+                    # カード。どちらもこの reset を適用すべきでないため握りつぶす。
+                    logger.info(
+                        "Skipped deck_id reset: card was moved to another deck "
+                        f"or deleted after collection (card_id={key['card_id']})"
                     )
-        except ClientError as e:
-            logger.warning(f"Failed to query cards for deck reset: {e}")
+                    return "skipped_cards"
+                logger.warning(f"Failed to reset deck_id on card {key['card_id']}: {e}")
+                return "failed_cards"
+
+        with ThreadPoolExecutor(max_workers=min(DECK_RESET_CONCURRENCY, len(card_keys))) as executor:
+            for outcome in executor.map(reset, card_keys):
+                counts[outcome] += 1
+        return counts
+
+    def reset_deck_cards(
+        self,
+        user_id: str,
+        deck_id: str,
+        on_progress: Optional[Callable[[Dict[str, int]], None]] = None,
+        checkpoint: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, int]:
+        """削除済みデッキに属していたカードの deck_id をすべてリセットする（reset_deck_cards ジョブ本体）。
+
+        GSI をページ単位で読み、ページごとに並列で REMOVE して進捗を報告する。
+        リセット済みのカードは deck_index_key を失い GSI から外れるため、GSI 自体が
+        再開位置を兼ねる: ワーカーが途中で落ちて再 claim された場合も先頭から読み直せば
+        未処理（と前回失敗した）カードだけが残っている。checkpoint（前回実行の progress）は
+        件数の引き継ぎにのみ使う。
+
+        Args:
+            user_id: The user's ID.
+            deck_id: 削除済みデッキの ID。
+            on_progress: ページごとに累計件数を受け取るコールバック。
+            checkpoint: 前回実行時に記録された progress（再開時）。
+
+        Returns:
+            ``{"reset_cards", "skipped_cards", "failed_cards"}`` の累計件数。
+
+        Raises:
+            DeckServiceError: GSI の Query に失敗した場合。
+        """
+        previous = checkpoint or {}
+        totals = {
+            "reset_cards": int(previous.get("reset_cards", 0)),
+            "skipped_cards": int(previous.get("skipped_cards", 0)),
+            # 前回失敗したカードは GSI に残っており、今回改めて処理されるため数え直す。
+            "failed_cards": 0,
+        }
+
+        last_key: Optional[Dict[str, Any]] = None
+        while True:
+            try:
+                card_keys, last_key = self._query_deck_card_keys(user_id, deck_id, last_key)
+            except ClientError as e:
+                raise DeckServiceError(f"Failed to query cards for deck reset: {e}")
+            for name, count in self._reset_card_keys(deck_id, card_keys).items():
+                totals[name] += count
+            if on_progress is not None:
+                on_progress(dict(totals))
+            if not last_key:
+                break
+
+        if totals["reset_cards"]:
+            self._data_version.bump(user_id)
+        logger.info(
+            "Reset deck_id on cards of deleted deck",
+            extra={"user_id": user_id, "deck_id": deck_id, **totals},
+        )
+        return totals
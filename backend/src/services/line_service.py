@@ -8,13 +8,15 @@ import os
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
-import boto3
 import httpx
 from botocore.exceptions import ClientError
 
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.event_handler.exceptions import UnauthorizedError
 
+from utils import json_codec
+from utils.aws_clients import get_client
+
 from .user_service import UserService
 
 logger = Logger()
@@ -122,7 +124,7 @@ class LineService:
             return
 
         try:
-            client = boto3.client("secretsmanager")
+            client = get_client("secretsmanager")
             response = client.get_secret_value(SecretId=secret_arn)
             secret = json.loads(response["SecretString"])
             self.channel_access_token = secret.get("channel_access_token")
@@ -158,7 +160,7 @@ class LineService:
             List of parsed LineEvent objects.
         """
         try:
-            data = json.loads(body)
+            data = json_codec.loads(body)
             events = []
 
             for event_data in data.get("events", []):
@@ -287,7 +289,7 @@ class LineService:
         }
 
         try:
-            response = httpx.post(url, headers=headers, json=payload, timeout=10)
+            response = httpx.post(url, headers=headers, content=json_codec.dumps_bytes(payload), timeout=10)
             response.raise_for_status()
             return True
         except httpx.HTTPError as e:
@@ -327,7 +329,7 @@ class LineService:
         }
 
         try:
-            response = httpx.post(url, headers=headers, json=payload, timeout=10)
+            response = httpx.post(url, headers=headers, content=json_codec.dumps_bytes(payload), timeout=10)
             response.raise_for_status()
             return True
         except httpx.HTTPError as e:
@@ -8,7 +8,7 @@ SRS 計算やレスポンス組み立てといったビジネスロジックは
 """
 
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from aws_lambda_powertools import Logger
 from boto3.dynamodb.conditions import Key
@@ -64,19 +64,29 @@ class ReviewRepository:
             CardServiceError: DynamoDB クエリ失敗時（呼び出し元 get_review_summary が
                 既定値へフォールバックするために送出する）。
         """
-        try:
-            reviews: List[Dict[str, Any]] = []
-            query_kwargs: Dict[str, Any] = {
-                "IndexName": "user_id-reviewed_at-index",
-                "KeyConditionExpression": Key("user_id").eq(user_id),
-            }
-            while True:
+        return [item for page in self.iter_review_pages(user_id) for item in page]
+
+    def iter_review_pages(self, user_id: str, page_size: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """ユーザーのレビューを reviewed_at 順に Query の 1 ページずつ返す。
+
+        全件をメモリに載せずに処理したい呼び出し（データエクスポート等）向け。
+
+        Raises:
+            CardServiceError: DynamoDB クエリ失敗時。
+        """
+        query_kwargs: Dict[str, Any] = {
+            "IndexName": "user_id-reviewed_at-index",
+            "KeyConditionExpression": Key("user_id").eq(user_id),
+        }
+        if page_size is not None:
+            query_kwargs["Limit"] = page_size
+        while True:
+            try:
                 response = self.table.query(**query_kwargs)
-                reviews.extend(response.get("Items", []))
-                last_key = response.get("LastEvaluatedKey")
-                if not last_key:
-                    break
-                query_kwargs["ExclusiveStartKey"] = last_key
-            return reviews
-        except ClientError as e:
-            raise CardServiceError(f"Failed to query reviews: {e}")
+            except ClientError as e:
+                raise CardServiceError(f"Failed to query reviews: {e}")
+            yield response.get("Items", [])
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return
+            query_kwargs["ExclusiveStartKey"] = last_key
@@ -8,6 +8,7 @@ from aws_lambda_powertools import Logger
 from botocore.exceptions import ClientError
 
 from models.review import (
+    DUE_CARD_FIELD_ATTRIBUTES,
     DueCardInfo,
     DueCardsResponse,
     ReviewPreviousState,
@@ -26,6 +27,7 @@ from .card_repository import (
     OptimisticLockError,
 )
 from .card_service import CardService
+from .data_version import DataVersionStore
 from .review_repository import ReviewRepository
 from .srs import (
     ReviewHistoryEntry,
@@ -169,6 +171,7 @@ class ReviewService:
             table_name=self.cards_table_name,
             dynamodb_resource=dynamodb_resource,
         )
+        self._data_version = DataVersionStore(dynamodb_resource=dynamodb_resource)
 
     def submit_review(
         self,
@@ -267,6 +270,8 @@ class ReviewService:
             interval_before=card.interval,
             interval_after=result.interval,
         )
+        # カード・reviews の両方を書き終えてから加算する（stats の条件付き GET 用）。
+        self._data_version.bump(user_id)
 
         updated = ReviewUpdatedState(
             ease_factor=result.ease_factor,
@@ -407,6 +412,7 @@ class ReviewService:
             raise
         except CardServiceError as e:
             raise ReviewPersistenceError(f"Failed to undo review: {e}") from e
+        self._data_version.bump(user_id)
 
         # Parse due_date from restored_next_review_at (ユーザーローカル日付に変換。
         # パース不能な場合は従来どおり元の文字列をそのまま返す)
@@ -831,13 +837,8 @@ class ReviewService:
         now = datetime.now(timezone.utc)
 
         # 【総数と本体を分離取得】: total_due_count は COUNT（本体非転送）、本体は limit 件のみ。
+        total_due_count = self._get_total_due_count(user_id, deck_id, now, include_future)
         if deck_id is not None:
-            total_due_count = self.card_service.get_deck_due_card_count(
-                user_id=user_id,
-                deck_id=deck_id,
-                before=now,
-                include_future=include_future,
-            )
             limited_cards = self.card_service.get_deck_due_cards(
                 user_id=user_id,
                 deck_id=deck_id,
@@ -846,11 +847,6 @@ class ReviewService:
                 include_future=include_future,
             )
         else:
-            total_due_count = self.card_service.get_due_card_count(
-                user_id=user_id,
-                before=now,
-                include_future=include_future,
-            )
             limited_cards = self.card_service.get_due_cards(
                 user_id=user_id,
                 limit=limit,
@@ -891,6 +887,72 @@ class ReviewService:
             next_due_date=next_due_date,
         )
 
+    def get_due_cards_json(
+        self,
+        user_id: str,
+        fields: List[str],
+        limit: int = 20,
+        include_future: bool = False,
+        deck_id: Optional[str] = None,
+        user_timezone: str = "Asia/Tokyo",
+    ) -> Dict[str, Any]:
+        """get_due_cards の部分取得版（GET /cards/due?fields=）。
+
+        fields（検証済みの DueCardInfo フィールド名）の値に必要な属性だけを
+        ProjectionExpression で取得し、DueCardsResponse.model_dump(mode="json") と同じ形の
+        dict を返す（due_cards の各要素は fields のキーのみ）。一覧画面で back・references
+        を読まない場合に転送量とレスポンスサイズが減る。total_due_count / next_due_date は
+        get_due_cards と同じ。
+        """
+        now = datetime.now(timezone.utc)
+        total_due_count = self._get_total_due_count(user_id, deck_id, now, include_future)
+        attributes = {attribute for name in fields for attribute in DUE_CARD_FIELD_ATTRIBUTES[name]}
+        items = self.card_service.get_due_card_items(
+            user_id=user_id,
+            limit=limit,
+            before=now,
+            include_future=include_future,
+            deck_id=deck_id,
+            attributes=attributes,
+        )
+
+        due_cards = []
+        for item in items:
+            next_review_at = datetime.fromisoformat(item["next_review_at"]) if item.get("next_review_at") else None
+            values = {
+                "card_id": item.get("card_id"),
+                "front": item.get("front"),
+                "back": item.get("back"),
+                "deck_id": item.get("deck_id"),
+                "due_date": to_user_local_date(next_review_at, user_timezone) if next_review_at else None,
+                "overdue_days": max(0, (now - next_review_at).days) if next_review_at else 0,
+                "references": [{"type": ref["type"], "value": ref["value"]} for ref in item.get("references") or ()],
+            }
+            due_cards.append({name: values[name] for name in fields})
+
+        return {
+            "due_cards": due_cards,
+            "total_due_count": total_due_count,
+            "next_due_date": None if due_cards else self._get_next_due_date(user_id, user_timezone),
+        }
+
+    def _get_total_due_count(
+        self, user_id: str, deck_id: Optional[str], now: datetime, include_future: bool
+    ) -> int:
+        """total_due_count を COUNT クエリで求める（M-12。deck_id 指定時はデッキ内の件数）。"""
+        if deck_id is not None:
+            return self.card_service.get_deck_due_card_count(
+                user_id=user_id,
+                deck_id=deck_id,
+                before=now,
+                include_future=include_future,
+            )
+        return self.card_service.get_due_card_count(
+            user_id=user_id,
+            before=now,
+            include_future=include_future,
+        )
+
     def _get_next_due_date(
         self, user_id: str, user_timezone: str = "Asia/Tokyo"
     ) -> Optional[str]:
@@ -29,6 +29,7 @@ def calculate_sm2(
     repetitions: int,
     ease_factor: float,
     interval: int,
+    now: Optional[datetime] = None,
 ) -> SM2Result:
     """
     Calculate next review parameters using SM-2 algorithm.
@@ -47,6 +48,8 @@ def calculate_sm2(
         repetitions: Current number of successful reviews
         ease_factor: Current difficulty factor (>= 1.3)
         interval: Current review interval in days
+        now: 基準時刻（UTC）。省略時は現在時刻。シミュレーション（scripts/srs_simulator.py）
+            が仮想時刻で呼び出すために使う。
 
     Returns:
         SM2Result with updated parameters
@@ -79,7 +82,8 @@ def calculate_sm2(
         new_ease_factor = EASE_FACTOR_MINIMUM
 
     # Calculate next review date
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
     next_review_at = now + timedelta(days=new_interval)
 
     return SM2Result(
@@ -94,6 +98,7 @@ def calculate_next_review_boundary(
     interval: int,
     user_timezone: str = "Asia/Tokyo",
     day_start_hour: int = 4,
+    now: Optional[datetime] = None,
 ) -> datetime:
     """Calculate next_review_at normalized to user's day boundary.
 
@@ -101,6 +106,7 @@ def calculate_next_review_boundary(
         interval: Days until next review (from SM-2 calculation).
         user_timezone: User's IANA timezone string.
         day_start_hour: Hour when user's "day" starts (0-23).
+        now: 基準時刻（timezone-aware）。省略時は現在時刻。
 
     Returns:
         UTC datetime set to the day boundary time.
@@ -116,7 +122,7 @@ def calculate_next_review_boundary(
         logger.warning(f"Invalid timezone '{user_timezone}', falling back to Asia/Tokyo")
         user_tz = ZoneInfo("Asia/Tokyo")
 
-    now_utc = datetime.now(timezone.utc)
+    now_utc = now if now is not None else datetime.now(timezone.utc)
     local_now = now_utc.astimezone(user_tz)
 
     # 有効日付: 境界時刻前なら前日扱い
@@ -10,19 +10,10 @@ import json
 import os
 import time
 from contextlib import contextmanager
-from typing import Generator, List
+from typing import TYPE_CHECKING, Any, Generator, List
 
 from aws_lambda_powertools import Logger
 from botocore.config import Config as BotocoreConfig
-from strands import Agent
-from strands.models import BedrockModel, Model
-
-# OllamaModel: オプション依存（ollama パッケージが必要）。
-# 未インストール環境でもモジュール import が成功するよう try/except でラップする。
-try:
-    from strands.models.ollama import OllamaModel
-except ImportError:  # pragma: no cover
-    OllamaModel = None  # type: ignore[assignment,misc]
 
 from services.ai_service import (
     AIParseError,
@@ -39,6 +30,7 @@ from services.ai_service import (
     LearningAdvice,
     RefineResult,
 )
+from services.chunk_generation import CHUNK_GENERATION_CONCURRENCY, run_chunk_generation
 from services.prompts import (
     get_advice_prompt,
     get_card_generation_prompt,
@@ -59,6 +51,49 @@ from utils.agent_timeout import (
     DEFAULT_AGENT_TIMEOUT_SECONDS,
     resolve_timeout_seconds,
 )
+from utils.aws_clients import get_session
+
+if TYPE_CHECKING:
+    from strands.models import Model
+
+# strands SDK（opentelemetry 等を推移的に読み込む）は初回のモデル生成・Agent 呼び出し
+# まで import しない（コールドスタート短縮）。Agent / BedrockModel / OllamaModel は
+# モジュール属性として参照された時点で import して globals に保持するため、テストは
+# 従来どおり ``services.strands_service.Agent`` 等をパッチできる。
+_LAZY_STRANDS_ATTRS = ("Agent", "BedrockModel", "OllamaModel")
+
+
+def _load_strands_attr(name: str) -> Any:
+    if name == "Agent":
+        from strands import Agent
+
+        return Agent
+    if name == "BedrockModel":
+        from strands.models import BedrockModel
+
+        return BedrockModel
+    # OllamaModel: オプション依存（ollama パッケージが必要）。未インストールなら None。
+    try:
+        from strands.models.ollama import OllamaModel
+    except ImportError:  # pragma: no cover
+        return None
+    return OllamaModel
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_STRANDS_ATTRS:
+        value = _load_strands_attr(name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _strands(name: str) -> Any:
+    """strands のシンボルを返す（パッチ済み・import 済みなら globals の値）。"""
+    module_globals = globals()
+    if name in module_globals:
+        return module_globals[name]
+    return __getattr__(name)
 
 # Bedrock のデフォルトモデル ID
 _DEFAULT_BEDROCK_MODEL_ID = "global.anthropic.claude-haiku-4-5-20251001-v1:0"
@@ -124,6 +159,8 @@ class StrandsAIService:
     # C-4: 1 リクエストあたりの chunk → Bedrock 呼び出し回数のハード上限。
     # 巨大ページで chunk 数に比例してコスト/時間が無制限に増えるのを防ぐ。
     MAX_CHUNK_CALLS = 8
+    # チャンク単位の同時呼び出し数（services/chunk_generation.py）。
+    CHUNK_CONCURRENCY = CHUNK_GENERATION_CONCURRENCY
 
     def __init__(self, environment: str | None = None) -> None:
         """StrandsAIService を初期化する.
@@ -147,14 +184,15 @@ class StrandsAIService:
             # M-14: ollama パッケージ未インストール時は OllamaModel が None のままで
             # 呼び出すと不明瞭な 'NoneType' object is not callable になる。明示的な
             # エラーで原因とインストール方法を伝える。
-            if OllamaModel is None:
+            ollama_model_cls = _strands("OllamaModel")
+            if ollama_model_cls is None:
                 raise AIProviderError(
                     "ollama package is required for dev environment. "
                     "Install with: pip install strands-agents[ollama]"
                 )
             ollama_host = os.getenv("OLLAMA_HOST", _DEFAULT_OLLAMA_HOST)
             ollama_model = os.getenv("OLLAMA_MODEL", _DEFAULT_OLLAMA_MODEL)
-            model: Model = OllamaModel(
+            model: Model = ollama_model_cls(
                 host=ollama_host,
                 model_id=ollama_model,
                 ollama_client_args={"timeout": _agent_timeout_seconds()},
@@ -165,9 +203,11 @@ class StrandsAIService:
             # M-18: max_tokens を明示し、BedrockService (MAX_TOKENS=4096) と
             # コスト保護を対称にする。未指定だとモデルのハードリミット
             # (Haiku 4.5: 8192) に従い 1 チャンク出力が最大 2 倍になりうる。
-            model = BedrockModel(
+            model = _strands("BedrockModel")(
                 model_id=bedrock_model_id,
                 max_tokens=_MAX_TOKENS,
+                # 認証情報の解決はプロセス共有の Session で 1 回だけ行う（utils/aws_clients.py）。
+                boto_session=get_session(),
                 boto_client_config=BotocoreConfig(
                     read_timeout=_agent_timeout_seconds(),
                     connect_timeout=5,
@@ -211,7 +251,7 @@ class StrandsAIService:
                 language=language,
             )
 
-            agent = Agent(model=self.model, system_prompt=CARD_GENERATION_SYSTEM_PROMPT)
+            agent = _strands("Agent")(model=self.model, system_prompt=CARD_GENERATION_SYSTEM_PROMPT)
             response = agent(user_prompt)
 
             response_text = str(response)
@@ -320,30 +360,12 @@ class StrandsAIService:
             GenerationResult: 生成されたカードとメタ情報。
         """
         start_time = time.time()
-        all_cards: List[GeneratedCard] = []
         total_input_length = sum(len(c) for c in chunks)
 
         # Distribute target count across chunks
         cards_per_chunk = max(3, target_count // max(len(chunks), 1))
 
-        # C-4: bound Bedrock calls. Stop once we have enough cards and never
-        # exceed MAX_CHUNK_CALLS chunk invocations.
-        processed_chunks = 0
-        total_chunks = len(chunks)
-        timed_out_chunks = 0
-        for chunk_text in chunks:
-            if len(all_cards) >= target_count:
-                break
-            if processed_chunks >= self.MAX_CHUNK_CALLS:
-                logger.warning(
-                    "Chunk call cap reached; skipping remaining chunks",
-                    extra={
-                        "processed_chunks": processed_chunks,
-                        "total_chunks": total_chunks,
-                        "max_chunk_calls": self.MAX_CHUNK_CALLS,
-                    },
-                )
-                break
+        def generate(chunk_text: str) -> List[GeneratedCard]:
             user_prompt = get_url_card_generation_prompt(
                 chunk_text=chunk_text,
                 card_count=cards_per_chunk,
@@ -352,33 +374,31 @@ class StrandsAIService:
                 language=language,
                 page_title=page_title,
             )
-
-            try:
-                with _handle_ai_errors():
-                    agent = Agent(
-                        model=self.model,
-                        system_prompt=URL_CARD_GENERATION_SYSTEM_PROMPT,
-                    )
-                    processed_chunks += 1
-                    response = agent(user_prompt)
-                    response_text = str(response)
-                    cards = self._parse_generation_result(response_text)
-                all_cards.extend(cards)
-            except AIParseError:
-                # Skip chunks that fail to parse
-                continue
-            except AITimeoutError:
-                timed_out_chunks += 1
-                logger.warning(
-                    "URL card generation chunk timed out; returning partial results if available",
-                    extra={
-                        "processed_chunks": processed_chunks,
-                        "cards_so_far": len(all_cards),
-                    },
+            with _handle_ai_errors():
+                agent = _strands("Agent")(
+                    model=self.model,
+                    system_prompt=URL_CARD_GENERATION_SYSTEM_PROMPT,
                 )
-                break
+                response = agent(user_prompt)
+                return self._parse_generation_result(str(response))
+
+        # C-4: Bedrock 呼び出しは MAX_CHUNK_CALLS 回までとし、目標枚数に達したら打ち切る。
+        # チャンクは CHUNK_CONCURRENCY 並列で生成し、チャンク順にマージする。
+        # 解析できないチャンクは読み飛ばし、timeout 後は新たなチャンクを投げずに
+        # 生成済みのカードを返す。
+        outcome = run_chunk_generation(
+            chunks,
+            generate,
+            target_count=target_count,
+            cards_per_chunk=cards_per_chunk,
+            max_calls=self.MAX_CHUNK_CALLS,
+            max_workers=self.CHUNK_CONCURRENCY,
+            skip_errors=(AIParseError,),
+            stop_errors=(AITimeoutError,),
+        )
+        all_cards = outcome.cards
 
-        if not all_cards and timed_out_chunks > 0:
+        if not all_cards and outcome.stopped_chunks > 0:
             raise AITimeoutError("URL card generation timed out")
 
         # Deduplicate by front text (case-insensitive)
@@ -437,7 +457,7 @@ class StrandsAIService:
                 language=language,
             )
 
-            agent = Agent(model=self.model, system_prompt=GRADING_SYSTEM_PROMPT)
+            agent = _strands("Agent")(model=self.model, system_prompt=GRADING_SYSTEM_PROMPT)
             response = agent(user_prompt)
 
             response_text = str(response)
@@ -534,7 +554,7 @@ class StrandsAIService:
                 language=language,
             )
 
-            agent = Agent(model=self.model, system_prompt=ADVICE_SYSTEM_PROMPT)
+            agent = _strands("Agent")(model=self.model, system_prompt=ADVICE_SYSTEM_PROMPT)
             response = agent(user_prompt)
 
             response_text = str(response)
@@ -583,7 +603,7 @@ class StrandsAIService:
             )
 
             system_prompt = get_refine_system_prompt(language=language)
-            agent = Agent(model=self.model, system_prompt=system_prompt)
+            agent = _strands("Agent")(model=self.model, system_prompt=system_prompt)
             response = agent(user_prompt)
 
             response_text = str(response)
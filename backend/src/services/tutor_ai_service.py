@@ -12,7 +12,6 @@ import os
 import re
 from typing import TYPE_CHECKING
 
-import boto3
 from aws_lambda_powertools import Logger
 from botocore.config import Config
 from botocore.exceptions import ClientError
@@ -23,6 +22,7 @@ from utils.agent_timeout import (
     TUTOR_AGENT_TIMEOUT_ENV,
     resolve_timeout_seconds,
 )
+from utils.aws_clients import get_client, get_session
 
 if TYPE_CHECKING:
     # strands は遅延 import 方針のため、型参照のみ TYPE_CHECKING 配下で行う
@@ -105,13 +105,12 @@ class BedrockTutorAIService:
                 connect_timeout=5,
                 retries={"max_attempts": 2},
             )
-            endpoint_url = os.environ.get("BEDROCK_ENDPOINT_URL")
-            if endpoint_url:
-                self.client = boto3.client(
-                    "bedrock-runtime", config=config, endpoint_url=endpoint_url
-                )
-            else:
-                self.client = boto3.client("bedrock-runtime", config=config)
+            self.client = get_client(
+                "bedrock-runtime",
+                endpoint_url=os.environ.get("BEDROCK_ENDPOINT_URL"),
+                config=config,
+                profile="bedrock-tutor",
+            )
 
     def generate_response(
         self,
@@ -239,6 +238,7 @@ class StrandsTutorAIService:
                 # （system + 会話履歴）をキャッシュヒットさせて入力コストを削減する。
                 # 非 Anthropic モデルでは自動的に no-op（警告ログのみ）。
                 cache_config=CacheConfig(strategy="auto"),
+                boto_session=get_session(),
                 boto_client_config=Config(
                     read_timeout=_resolve_strands_tutor_timeout_seconds(),
                     connect_timeout=5,
@@ -85,6 +85,19 @@ class TutorService:
     # この時間を超えた processing 状態は stale とみなし、新しい送信が引き継げる。
     LOCK_TIMEOUT_SECONDS = int(os.environ.get("TUTOR_LOCK_TIMEOUT_SECONDS", "150"))
 
+    # list_sessions が読む属性（一覧は messages を返さないため射影で転送しない。
+    # _check_and_mark_timeout は status / updated_at、deck_id フィルタは deck_id を使う）。
+    LIST_ATTRIBUTES = (
+        "session_id",
+        "deck_id",
+        "mode",
+        "status",
+        "message_count",
+        "created_at",
+        "updated_at",
+        "ended_at",
+    )
+
     def __init__(
         self,
         table_name: str | None = None,
@@ -462,7 +475,7 @@ class TutorService:
         Returns:
             List of TutorSessionResponse objects.
         """
-        items = self._repo.query_sessions(user_id, status)
+        items = self._repo.query_sessions(user_id, status, attributes=self.LIST_ATTRIBUTES)
 
         if deck_id:
             items = [i for i in items if i.get("deck_id") == deck_id]
@@ -20,6 +20,7 @@ from strands.session import SessionManager
 from strands.types.content import Message
 
 from utils.dynamodb_client import get_dynamodb_resource
+from utils.request_cache import request_cache
 
 logger = Logger()
 
@@ -96,6 +97,7 @@ class DynamoDBSessionManager(SessionManager):
         """
         dynamo_msg = self._strands_to_dynamo_message(message)
 
+        request_cache.invalidate(self.table_name, self.user_id, self.session_id)
         self.table.update_item(
             Key={"user_id": self.user_id, "session_id": self.session_id},
             UpdateExpression="SET messages = list_append(if_not_exists(messages, :empty), :msg)",
@@ -138,6 +140,7 @@ class DynamoDBSessionManager(SessionManager):
                 converted["related_cards"] = prior.get("related_cards", [])
             dynamo_messages.append(converted)
 
+        request_cache.invalidate(self.table_name, self.user_id, self.session_id)
         self.table.update_item(
             Key={"user_id": self.user_id, "session_id": self.session_id},
             UpdateExpression="SET messages = :msgs",
@@ -169,6 +172,7 @@ class DynamoDBSessionManager(SessionManager):
             return
 
         last_index = len(messages) - 1
+        request_cache.invalidate(self.table_name, self.user_id, self.session_id)
         self.table.update_item(
             Key={"user_id": self.user_id, "session_id": self.session_id},
             UpdateExpression=f"SET messages[{last_index}] = :msg",
@@ -228,6 +232,7 @@ class DynamoDBSessionManager(SessionManager):
         last_index = len(messages) - 1
         next_index = last_index + 1
         try:
+            request_cache.invalidate(self.table_name, self.user_id, self.session_id)
             self.table.update_item(
                 Key={"user_id": self.user_id, "session_id": self.session_id},
                 UpdateExpression=f"SET messages[{last_index}].related_cards = :rc",
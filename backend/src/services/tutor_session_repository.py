@@ -6,7 +6,7 @@ TutorService からセッション/デッキ/カードテーブルへの DynamoD
 """
 
 import os
-from typing import Any
+from typing import Any, Iterable
 
 from aws_lambda_powertools import Logger
 from botocore.exceptions import ClientError
@@ -17,6 +17,8 @@ from services.tutor_errors import (
     SessionNotFoundError,
 )
 from utils.dynamodb_client import get_dynamodb_resource
+from utils.projection import apply_projection
+from utils.request_cache import MISS, request_cache
 
 logger = Logger()
 
@@ -50,29 +52,46 @@ class TutorSessionRepository:
         Raises:
             SessionNotFoundError: If the session does not exist.
         """
-        response = self.table.get_item(
-            Key={"user_id": user_id, "session_id": session_id}
-        )
-        item = response.get("Item")
+        item = request_cache.get(self.table_name, user_id, session_id)
+        if item is MISS:
+            response = self.table.get_item(
+                Key={"user_id": user_id, "session_id": session_id}
+            )
+            item = response.get("Item")
+            request_cache.put(self.table_name, user_id, session_id, item=item)
         if not item:
             raise SessionNotFoundError(f"Session {session_id} not found")
         return item
 
+    def _invalidate_session(self, user_id: str, session_id: str) -> None:
+        """書き込み前にリクエストスコープキャッシュの該当セッションを破棄する。"""
+        request_cache.invalidate(self.table_name, user_id, session_id)
+
     def put_session(self, item: dict) -> None:
         """Persist a session item (full replace)."""
+        self._invalidate_session(item["user_id"], item["session_id"])
         self.table.put_item(Item=item)
 
     def delete_session(self, user_id: str, session_id: str) -> None:
         """Delete a session item by key (raw; caller handles best-effort semantics)."""
+        self._invalidate_session(user_id, session_id)
         self.table.delete_item(Key={"user_id": user_id, "session_id": session_id})
 
-    def query_sessions(self, user_id: str, status: str | None = None) -> list[dict]:
+    def query_sessions(
+        self,
+        user_id: str,
+        status: str | None = None,
+        attributes: Iterable[str] | None = None,
+    ) -> list[dict]:
         """Query a user's sessions, optionally filtered by status via GSI.
 
         M-15: DynamoDB の Query は 1MB 上限でページ分割されるため、
         LastEvaluatedKey を辿って全ページを取得する。これを怠ると
         セッション数が多いユーザーで古いセッションが取得されず、
         _auto_end_active_sessions でアクティブセッションを見逃す。
+
+        attributes 指定時はその属性のみを ProjectionExpression で取得する
+        （一覧では messages を転送しない）。
         """
         if status:
             # Use GSI for status filtering
@@ -91,6 +110,8 @@ class TutorSessionRepository:
                 "ExpressionAttributeValues": {":uid": user_id},
             }
 
+        apply_projection(query_kwargs, attributes)
+
         items: list[dict] = []
         while True:
             response = self.table.query(**query_kwargs)
@@ -115,6 +136,7 @@ class TutorSessionRepository:
         Raises:
             ConcurrentSendError: If another send holds a fresh in-flight lock.
         """
+        self._invalidate_session(user_id, session_id)
         try:
             self.table.update_item(
                 Key={"user_id": user_id, "session_id": session_id},
@@ -150,6 +172,7 @@ class TutorSessionRepository:
 
         解放に失敗してもロックは LOCK_TIMEOUT 後に stale 化するため、例外は送出せずログのみ。
         """
+        self._invalidate_session(user_id, session_id)
         try:
             self.table.update_item(
                 Key={"user_id": user_id, "session_id": session_id},
@@ -185,6 +208,7 @@ class TutorSessionRepository:
         message_count++ や状態上書きを行わず、警告ログのみで正常 return する
         （AI 応答自体は呼び出し元からユーザーへ返る）。
         """
+        self._invalidate_session(user_id, session_id)
         try:
             if ttl is not None:
                 self.table.update_item(
@@ -244,6 +268,7 @@ class TutorSessionRepository:
 
     def mark_ended(self, user_id: str, session_id: str, now_iso: str, ttl: int) -> None:
         """Mark a session as ended with TTL."""
+        self._invalidate_session(user_id, session_id)
         self.table.update_item(
             Key={"user_id": user_id, "session_id": session_id},
             UpdateExpression="SET #st = :status, ended_at = :ended, updated_at = :upd, #ttl = :ttl",
@@ -261,6 +286,7 @@ class TutorSessionRepository:
 
         既に active でない場合 (ConditionalCheckFailed) は冪等に無視する。
         """
+        self._invalidate_session(user_id, session_id)
         try:
             self.table.update_item(
                 Key={"user_id": user_id, "session_id": session_id},
@@ -289,10 +315,14 @@ class TutorSessionRepository:
         Raises:
             DeckNotFoundError: If the deck does not exist.
         """
-        response = self.decks_table.get_item(
-            Key={"user_id": user_id, "deck_id": deck_id}
-        )
-        item = response.get("Item")
+        # DeckService.get_deck と同じキーを共有する（同一の生アイテム）。
+        item = request_cache.get(self.decks_table_name, user_id, deck_id)
+        if item is MISS:
+            response = self.decks_table.get_item(
+                Key={"user_id": user_id, "deck_id": deck_id}
+            )
+            item = response.get("Item")
+            request_cache.put(self.decks_table_name, user_id, deck_id, item=item)
         if not item:
             raise DeckNotFoundError(f"Deck {deck_id} not found")
         return item
@@ -9,6 +9,9 @@ from botocore.exceptions import ClientError
 
 from models.user import User
 from utils.dynamodb_client import get_dynamodb_client, get_dynamodb_resource
+from utils.request_cache import MISS, request_cache
+from .data_version import version_timestamp
+from .user_settings_cache import user_settings_cache
 
 
 class UserServiceError(Exception):
@@ -75,13 +78,22 @@ class UserService:
         Raises:
             UserNotFoundError: If user does not exist.
         """
-        try:
-            response = self.table.get_item(Key={"user_id": user_id})
-            if "Item" not in response:
-                raise UserNotFoundError(f"User not found: {user_id}")
-            return User.from_dynamodb_item(response["Item"])
-        except ClientError as e:
-            raise UserServiceError(f"Failed to get user: {e}")
+        # 1 リクエスト内の再読み込み（get_or_create_user → update_settings 等）は
+        # リクエストスコープキャッシュから返す（utils/request_cache.py）。
+        item = request_cache.get(self.table_name, user_id)
+        if item is MISS:
+            try:
+                response = self.table.get_item(Key={"user_id": user_id})
+            except ClientError as e:
+                raise UserServiceError(f"Failed to get user: {e}")
+            item = response.get("Item")
+            request_cache.put(self.table_name, user_id, item=item)
+        if item is None:
+            raise UserNotFoundError(f"User not found: {user_id}")
+        user = User.from_dynamodb_item(item)
+        # 完全なアイテムを読んだついでに設定キャッシュを settings_version で検証・更新する。
+        user_settings_cache.put(user_id, user.settings, user.settings_version)
+        return user
 
     def create_user(self, user_id: str, display_name: Optional[str] = None, picture_url: Optional[str] = None) -> User:
         """Create a new user.
@@ -100,6 +112,7 @@ class UserService:
             picture_url=picture_url,
             created_at=datetime.now(dt_timezone.utc),
         )
+        request_cache.invalidate(self.table_name, user_id)
         try:
             self.table.put_item(
                 Item=user.to_dynamodb_item(),
@@ -130,6 +143,27 @@ class UserService:
         except UserNotFoundError:
             return self.create_user(user_id, display_name, picture_url)
 
+    def get_settings(self, user_id: str) -> Dict[str, Any]:
+        """Get user settings, served from the warm-container cache when fresh.
+
+        timezone / day_start_hour を読むだけのホットパス向け。キャッシュミス時は
+        get_or_create_user と同様に未作成ユーザーを作成する。別コンテナでの設定変更は
+        最大 USER_SETTINGS_CACHE_TTL_SECONDS 秒遅れて反映される
+        (services/user_settings_cache.py)。
+
+        Args:
+            user_id: The user's unique identifier.
+
+        Returns:
+            Settings dict (copy; safe to mutate).
+        """
+        settings = user_settings_cache.get(user_id)
+        if settings is not None:
+            return settings
+        user = self.get_or_create_user(user_id)
+        user_settings_cache.put(user_id, user.settings, user.settings_version)
+        return dict(user.settings)
+
     @staticmethod
     def _link_lock_id(line_user_id: str) -> str:
         """Build the lock-item user_id for a line_user_id.
@@ -173,6 +207,8 @@ class UserService:
         now = datetime.now(dt_timezone.utc)
         lock_id = self._link_lock_id(line_user_id)
         client = self._client
+        request_cache.invalidate(self.table_name, user_id)
+        user_settings_cache.invalidate(user_id)
         try:
             # 低レベル client API のため属性値は {"S": ...} 形式を使う。
             client.transact_write_items(
@@ -203,7 +239,8 @@ class UserService:
                             "TableName": self.table.name,
                             "Key": {"user_id": {"S": user_id}},
                             "UpdateExpression": (
-                                "SET line_user_id = :line_id, updated_at = :updated_at"
+                                "SET line_user_id = :line_id, updated_at = :updated_at "
+                                "ADD settings_version :one"
                             ),
                             "ConditionExpression": (
                                 "attribute_not_exists(line_user_id) OR line_user_id = :line_id"
@@ -211,12 +248,14 @@ class UserService:
                             "ExpressionAttributeValues": {
                                 ":line_id": {"S": line_user_id},
                                 ":updated_at": {"S": now.isoformat()},
+                                ":one": {"N": "1"},
                             },
                         }
                     },
                 ]
             )
             user.line_user_id = line_user_id
+            user.settings_version += 1
             user.updated_at = now
             return user
         except ClientError as e:
@@ -315,6 +354,7 @@ class UserService:
         Returns:
             True if the update was applied, False if already up-to-date (idempotent skip).
         """
+        request_cache.invalidate(self.table_name, user_id)
         try:
             self.table.update_item(
                 Key={"user_id": user_id},
@@ -383,15 +423,31 @@ class UserService:
         expression_values[":updated_at"] = now.isoformat()
 
         try:
+            # timezone / day_start_hour は stats の集計結果を変えるため、
+            # 条件付き GET 用の data_version も同じ更新で加算する。
+            expression_values[":one"] = 1
+            expression_values[":data_version_at"] = version_timestamp()
+            # settings_version は設定キャッシュ (services/user_settings_cache.py) の検証用。
             update_kwargs = {
                 "Key": {"user_id": user_id},
-                "UpdateExpression": "SET " + ", ".join(update_parts),
+                "UpdateExpression": (
+                    "SET " + ", ".join(update_parts) + ", data_version_at = :data_version_at"
+                    " ADD data_version :one, settings_version :one"
+                ),
                 "ExpressionAttributeValues": expression_values,
+                "ReturnValues": "ALL_NEW",
             }
             if expression_names:
                 update_kwargs["ExpressionAttributeNames"] = expression_names
 
-            self.table.update_item(**update_kwargs)
+            request_cache.invalidate(self.table_name, user_id)
+            user_settings_cache.invalidate(user_id)
+            response = self.table.update_item(**update_kwargs)
+            attributes = response.get("Attributes")
+            if attributes and "settings" in attributes:
+                # write-through: 同一コンテナの以降の参照は更新後の設定を返す。
+                user.settings_version = int(attributes.get("settings_version", 0))
+                user_settings_cache.put(user_id, attributes["settings"], user.settings_version)
 
             # Update local user object
             if notification_time is not None:
@@ -433,6 +489,8 @@ class UserService:
 
         lock_id = self._link_lock_id(user.line_user_id)
         client = self._client
+        request_cache.invalidate(self.table_name, user_id)
+        user_settings_cache.invalidate(user_id)
         try:
             client.transact_write_items(
                 TransactItems=[
@@ -441,9 +499,14 @@ class UserService:
                         "Update": {
                             "TableName": self.table.name,
                             "Key": {"user_id": {"S": user_id}},
-                            "UpdateExpression": "REMOVE line_user_id SET updated_at = :now",
+                            "UpdateExpression": (
+                                "REMOVE line_user_id SET updated_at = :now ADD settings_version :one"
+                            ),
                             "ConditionExpression": "attribute_exists(line_user_id)",
-                            "ExpressionAttributeValues": {":now": {"S": now.isoformat()}},
+                            "ExpressionAttributeValues": {
+                                ":now": {"S": now.isoformat()},
+                                ":one": {"N": "1"},
+                            },
                         }
                     },
                     {
@@ -0,0 +1,117 @@
+"""Warm-container TTL + LRU cache for user settings.
+
+ほぼすべての REST ハンドラー（review / stats / bootstrap / cards 更新）は
+timezone と day_start_hour を読むためだけに get_or_create_user で users テーブルを
+GetItem していた。本モジュールはユーザー設定をコンテナ内メモリに保持し、
+ホットパスの設定参照を DynamoDB アクセスなしで返す。
+
+整合性:
+  - users アイテムは ``settings_version`` 属性を持ち、update_settings / link_line /
+    unlink_line が同じ書き込みで加算する。
+  - キャッシュはエントリごとに取得時の settings_version を保持し、それより古い
+    バージョンでは上書きしない（結果整合性読み取りで古い値へ巻き戻さない）。
+    UserService.get_user が完全なアイテムを読むたびにバージョンを照合し、
+    新しければエントリを差し替える（追加の読み取りなしで検証できる）。
+  - 同一コンテナでの書き込みは即時に反映（write-through / invalidate）。別コンテナでの
+    書き込みは最大 TTL 秒遅れて反映される（USER_SETTINGS_CACHE_TTL_SECONDS、0 で無効）。
+    ただし条件付き GET（api/conditional.py）は ETag 用に強い整合性で読んだ
+    settings_version で discard_if_older を呼ぶため、ETag 付き応答は古い設定で作られない。
+  - エントリ数は USER_SETTINGS_CACHE_MAX_ENTRIES で上限を設け、LRU で追い出す。
+"""
+
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_TTL_SECONDS = 60.0
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class UserSettingsCache:
+    """user_id → (settings, settings_version, 取得時刻) の TTL + LRU キャッシュ。"""
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize UserSettingsCache.
+
+        Args:
+            ttl_seconds: エントリの有効秒数。Defaults to USER_SETTINGS_CACHE_TTL_SECONDS env var.
+                0 以下の場合はキャッシュを無効化する。
+            max_entries: 保持する最大ユーザー数。Defaults to USER_SETTINGS_CACHE_MAX_ENTRIES env var.
+            clock: 単調時計（テスト用）。
+        """
+        if ttl_seconds is None:
+            ttl_seconds = float(os.environ.get("USER_SETTINGS_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS))
+        if max_entries is None:
+            max_entries = int(os.environ.get("USER_SETTINGS_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], int, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """有効期限内の設定のコピーを返す（未キャッシュ・期限切れは None）。"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or self._clock() - entry[2] >= self.ttl_seconds:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return copy.deepcopy(entry[0])
+
+    def put(self, user_id: str, settings: Dict[str, Any], version: int) -> None:
+        """読み取り・書き込み結果で設定を保持する。
+
+        有効期限内の既存エントリより古い version は無視する。同じ version なら
+        取得時刻も更新する（内容が変わっていないことが version で確認できたため
+        TTL を延長してよい）。
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(user_id)
+            if entry is not None and version < entry[1] and now - entry[2] < self.ttl_seconds:
+                return
+            self._entries[user_id] = (copy.deepcopy(settings), version, now)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard_if_older(self, user_id: str, version: int) -> None:
+        """保持しているエントリが version より古ければ捨てる（次の get はミスになる）。"""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[1] < version:
+                del self._entries[user_id]
+
+    def invalidate(self, user_id: str) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# コンテナ内で共有する単一インスタンス。
+user_settings_cache = UserSettingsCache()
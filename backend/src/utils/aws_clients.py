@@ -0,0 +1,128 @@
+"""プロセス共有の AWS クライアントレジストリ。
+
+これまでサービスインスタンスごと（CardRepository / DeckService / UserService /
+ReviewRepository / レート制限 / BedrockService / LINE の Secrets Manager 等）に
+boto3 クライアント・リソースを生成していた。生成のたびにエンドポイント解決・
+認証情報チェーンの探索・コネクションプールの作成が走り、最初の API 呼び出しでは
+TLS ハンドシェイクもやり直しになる。本モジュールは 1 つの boto3 Session から
+クライアントを遅延生成してプロセス内で共有し、ウォームコンテナでは確立済みの
+コネクションを使い回す。
+
+  - クライアントは (サービス名, エンドポイント URL, profile) ごとに 1 つ。boto3 の
+    クライアントはスレッドセーフなので ThreadPoolExecutor のワーカー間でも共有する。
+  - リソース (boto3.resource) はスレッドセーフでないため、スレッドごとに 1 つ保持する
+    （move_cards / デッキ削除のリセット等が従来どおりスレッド単位で使える）。
+  - Session からのクライアント生成自体はスレッドセーフでないためロックで直列化する。
+  - 既定の botocore Config: max_pool_connections（並列 UpdateItem と同数以上）、
+    TCP keepalive、adaptive リトライ。呼び出し側の Config（Bedrock の長い
+    read_timeout 等）はこれにマージする。profile はマージ後の設定ごとに別クライアントを
+    持つための名前。
+  - reset() はクライアント・リソースのキャッシュを破棄する（テストのモック切り替え用）。
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+# 1 クライアントあたりの HTTP コネクションプール上限（botocore 既定は 10）。
+# CardService.MOVE_CONCURRENCY / DECK_RESET_CONCURRENCY 等の並列書き込みが
+# プール待ちにならない大きさにする。
+DEFAULT_MAX_POOL_CONNECTIONS = 32
+
+DEFAULT_CONFIG = Config(
+    max_pool_connections=int(os.environ.get("AWS_MAX_POOL_CONNECTIONS", DEFAULT_MAX_POOL_CONNECTIONS)),
+    # アイドル中のコネクションを NAT / ロードバランサーに切られにくくする。
+    tcp_keepalive=True,
+    # スロットリング時はクライアント側でも送信レートを絞る。
+    retries={"mode": "adaptive", "max_attempts": 3},
+)
+
+_lock = threading.Lock()
+_session: Optional[boto3.session.Session] = None
+_clients: Dict[Tuple[str, Optional[str], str], Any] = {}
+_local = threading.local()
+# reset() のたびに進め、古い世代のスレッドローカルリソースを無効にする。
+_generation = 0
+
+
+def get_session() -> boto3.session.Session:
+    """プロセス共有の boto3 Session を返す（遅延生成）。"""
+    global _session
+    with _lock:
+        if _session is None:
+            _session = boto3.session.Session()
+        return _session
+
+
+def _merge_config(config: Optional[Config]) -> Config:
+    return DEFAULT_CONFIG.merge(config) if config is not None else DEFAULT_CONFIG
+
+
+def get_client(
+    service_name: str,
+    endpoint_url: Optional[str] = None,
+    config: Optional[Config] = None,
+    profile: str = "default",
+) -> Any:
+    """プロセス共有の boto3 クライアントを返す。
+
+    Args:
+        service_name: boto3 のサービス名（"dynamodb", "sqs" 等）。
+        endpoint_url: ローカル開発用のエンドポイント URL（None で AWS 既定）。
+        config: DEFAULT_CONFIG にマージする botocore Config。
+        profile: 同じサービスで Config の異なるクライアントを区別する名前。
+            config を渡す呼び出し側は固有の profile を指定すること。
+    """
+    key = (service_name, endpoint_url, profile)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    # boto3-stubs の client / resource はサービス名の Literal ごとのオーバーロードしか
+    # 持たず、任意の service_name: str では解決できないため Session を Any として呼ぶ。
+    session: Any = get_session()
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = session.client(service_name, endpoint_url=endpoint_url or None, config=_merge_config(config))
+            _clients[key] = client
+        return client
+
+
+def get_resource(
+    service_name: str,
+    endpoint_url: Optional[str] = None,
+    config: Optional[Config] = None,
+    profile: str = "default",
+) -> Any:
+    """呼び出しスレッド専用の boto3 リソースを返す（スレッド内で共有）。"""
+    resources = getattr(_local, "resources", None)
+    if resources is None or getattr(_local, "generation", None) != _generation:
+        resources = _local.resources = {}
+        _local.generation = _generation
+    key = (service_name, endpoint_url, profile)
+    resource = resources.get(key)
+    if resource is None:
+        session: Any = get_session()  # get_client と同じ理由で Any として呼ぶ
+        with _lock:
+            resource = session.resource(service_name, endpoint_url=endpoint_url or None, config=_merge_config(config))
+        resources[key] = resource
+    return resource
+
+
+def reset(session: bool = False) -> None:
+    """クライアント・リソースのキャッシュを破棄する。
+
+    Args:
+        session: True なら Session も破棄する（認証情報・読み込み済みサービスモデルの
+            キャッシュごと作り直す）。テストのモック切り替えではクライアントの破棄で足り、
+            Session を残すほうがサービスモデルの再読み込みを避けられる。
+    """
+    global _session, _generation
+    with _lock:
+        if session:
+            _session = None
+        _clients.clear()
+        _generation += 1
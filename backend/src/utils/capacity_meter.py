@@ -0,0 +1,323 @@
+"""Per-request DynamoDB consumed-capacity accounting.
+
+どのエンドポイント・ジョブが RCU / WCU を消費しているかを観測するため、リポジトリが
+utils/dynamodb_client 経由で取得する DynamoDB クライアントに botocore のイベント
+ハンドラーを登録し、1 リクエスト（API 呼び出し / AI ジョブ 1 件）ごとに以下を集計する。
+
+  - テーブル / インデックス別の消費 RCU・WCU（ReturnConsumedCapacity=INDEXES）
+  - テーブル / インデックス別の呼び出し回数・読み取りアイテム数・レイテンシ（BatchGet / Transact 等の
+    複数テーブル操作は関係する各テーブルに 1 回として数えるため、テーブル別の合計は
+    リクエスト全体の calls / latency_ms を超えることがある）
+
+スコープは ``capacity_scope()`` で開き、閉じる際に構造化ログ 1 行と CloudWatch EMF
+メトリクス（ConsumedReadCapacity / ConsumedWriteCapacity / DynamoDBCalls /
+DynamoDBItemsRead / DynamoDBLatency。次元 Route, Table, Index）を出力する。スコープ外の呼び出しには
+ReturnConsumedCapacity を付けず、何も記録しない。
+
+  - api/handler.handler: Route はマッチしたルート（例: "GET /stats"）。
+  - ai_job_service.run_job_inline: Route は "job:<job_type>"。API リクエスト内の
+    inline 実行はリクエスト側のスコープに合算する（スコープは入れ子にしない）。
+
+DYNAMODB_CAPACITY_METRICS_ENABLED が "true" 以外（ローカル開発・テスト既定）では
+スコープを開かない。テストは ``capacity_meter.begin()`` / ``end()`` で直接集計を検証できる。
+ThreadPoolExecutor のワーカースレッドからも記録されるため、内部状態はロックで保護する。
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.metrics import EphemeralMetrics, MetricUnit
+
+logger = Logger()
+
+METRICS_NAMESPACE_DEFAULT = "Memoru"
+
+# ReturnConsumedCapacity を受け付ける操作。
+READ_OPERATIONS = frozenset({"GetItem", "Query", "Scan", "BatchGetItem", "TransactGetItems"})
+WRITE_OPERATIONS = frozenset(
+    {"PutItem", "UpdateItem", "DeleteItem", "BatchWriteItem", "TransactWriteItems"}
+)
+
+# botocore のリクエストコンテキストに計測情報を保持するキー。
+_CONTEXT_KEY = "capacity_meter"
+_HANDLER_ID = "memoru-capacity-meter"
+
+# (テーブル名, インデックス名 or None)
+UsageKey = Tuple[str, Optional[str]]
+
+
+def capacity_metrics_enabled() -> bool:
+    return os.environ.get("DYNAMODB_CAPACITY_METRICS_ENABLED", "").lower() == "true"
+
+
+def _new_usage() -> Dict[str, float]:
+    return {"read_units": 0.0, "write_units": 0.0, "calls": 0, "items_read": 0, "latency_ms": 0.0}
+
+
+class CapacityMeter:
+    """リクエストスコープの DynamoDB 消費キャパシティ集計。"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._active = False
+        self._usage: Dict[UsageKey, Dict[str, float]] = {}
+        self._calls = 0
+        self._items_read = 0
+        self._latency_ms = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def begin(self) -> None:
+        """スコープを開始する（前回の集計は破棄）。"""
+        with self._lock:
+            self._usage.clear()
+            self._calls = 0
+            self._items_read = 0
+            self._latency_ms = 0.0
+            self._active = True
+
+    def end(self) -> Dict[str, Any]:
+        """スコープを終了し、集計結果を返す。"""
+        with self._lock:
+            summary = self._summary_locked()
+            self._active = False
+            self._usage.clear()
+            return summary
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return self._summary_locked()
+
+    def record_call(
+        self,
+        operation: str,
+        tables: List[UsageKey],
+        latency_ms: float,
+        items_read: Optional[Dict[UsageKey, int]] = None,
+    ) -> None:
+        """1 回の API 呼び出しを記録する（items_read はテーブル別の返却アイテム数）。"""
+        with self._lock:
+            if not self._active:
+                return
+            self._calls += 1
+            self._latency_ms += latency_ms
+            for key in tables:
+                usage = self._usage.setdefault(key, _new_usage())
+                usage["calls"] += 1
+                usage["latency_ms"] += latency_ms
+            for key, count in (items_read or {}).items():
+                self._usage.setdefault(key, _new_usage())["items_read"] += count
+                self._items_read += count
+
+    def record_capacity(self, operation: str, consumed: Any) -> None:
+        """レスポンスの ConsumedCapacity（dict / list）を記録する。"""
+        if not consumed:
+            return
+        entries = consumed if isinstance(consumed, list) else [consumed]
+        with self._lock:
+            if not self._active:
+                return
+            for entry in entries:
+                table = entry.get("TableName")
+                if not table:
+                    continue
+                if "Table" in entry or "GlobalSecondaryIndexes" in entry or "LocalSecondaryIndexes" in entry:
+                    self._add_units_locked((table, None), operation, entry.get("Table") or {})
+                    for group in ("GlobalSecondaryIndexes", "LocalSecondaryIndexes"):
+                        for index, units in (entry.get(group) or {}).items():
+                            self._add_units_locked((table, index), operation, units)
+                else:
+                    # ReturnConsumedCapacity=TOTAL 相当（内訳なし）。
+                    self._add_units_locked((table, None), operation, entry)
+
+    def _add_units_locked(self, key: UsageKey, operation: str, units: Dict[str, Any]) -> None:
+        read = units.get("ReadCapacityUnits")
+        write = units.get("WriteCapacityUnits")
+        if read is None and write is None:
+            total = float(units.get("CapacityUnits") or 0)
+            read, write = (total, 0.0) if operation in READ_OPERATIONS else (0.0, total)
+        usage = self._usage.setdefault(key, _new_usage())
+        usage["read_units"] += float(read or 0)
+        usage["write_units"] += float(write or 0)
+
+    def _summary_locked(self) -> Dict[str, Any]:
+        by_table = [
+            {
+                "table": table,
+                "index": index,
+                "read_units": usage["read_units"],
+                "write_units": usage["write_units"],
+                "calls": int(usage["calls"]),
+                "items_read": int(usage["items_read"]),
+                "latency_ms": round(usage["latency_ms"], 3),
+            }
+            for (table, index), usage in sorted(self._usage.items(), key=lambda kv: (kv[0][0], kv[0][1] or ""))
+        ]
+        return {
+            "calls": self._calls,
+            "items_read": self._items_read,
+            "latency_ms": round(self._latency_ms, 3),
+            "read_units": sum(entry["read_units"] for entry in by_table),
+            "write_units": sum(entry["write_units"] for entry in by_table),
+            "by_table": by_table,
+        }
+
+
+# プロセス内で共有する単一インスタンス。
+capacity_meter = CapacityMeter()
+
+
+# =============================================================================
+# botocore event handlers
+# =============================================================================
+
+
+def _tables_for(params: Dict[str, Any]) -> List[UsageKey]:
+    """リクエストパラメータから関係するテーブル（・インデックス）を抽出する。"""
+    table = params.get("TableName")
+    if table:
+        return [(table, params.get("IndexName"))]
+    tables: List[UsageKey] = []
+    for name in params.get("RequestItems") or {}:
+        tables.append((name, None))
+    for item in params.get("TransactItems") or []:
+        for action in item.values():
+            name = action.get("TableName") if isinstance(action, dict) else None
+            if name and (name, None) not in tables:
+                tables.append((name, None))
+    return tables
+
+
+def _items_read(parsed: Dict[str, Any], tables: List[UsageKey]) -> Dict[UsageKey, int]:
+    """読み取ったアイテム数をテーブル別に数える。
+
+    Query / Scan はフィルタ・Select=COUNT で返却件数が減っても読み取り（課金）対象は
+    評価件数のため ScannedCount を使う。
+    """
+    if "ScannedCount" in parsed or "Item" in parsed or "Items" in parsed:
+        if "ScannedCount" in parsed:
+            count = int(parsed["ScannedCount"])
+        else:
+            count = 1 if parsed.get("Item") else len(parsed.get("Items") or [])
+        return {tables[0]: count} if tables and count else {}
+    responses = parsed.get("Responses")
+    if isinstance(responses, dict):  # BatchGetItem
+        return {(name, None): len(items) for name, items in responses.items() if items}
+    if isinstance(responses, list):  # TransactGetItems
+        count = sum(1 for response in responses if response.get("Item"))
+        return {tables[0]: count} if tables and count else {}
+    return {}
+
+
+def _on_before_parameter_build(params: Dict[str, Any], model: Any, context: Dict[str, Any], **kwargs: Any) -> None:
+    if not capacity_meter.active:
+        return
+    operation = model.name
+    if operation in READ_OPERATIONS or operation in WRITE_OPERATIONS:
+        params.setdefault("ReturnConsumedCapacity", "INDEXES")
+    context[_CONTEXT_KEY] = {"operation": operation, "tables": _tables_for(params)}
+
+
+def _on_before_call(context: Dict[str, Any], **kwargs: Any) -> None:
+    state = context.get(_CONTEXT_KEY)
+    if state is not None:
+        state["started"] = time.perf_counter()
+
+
+def _on_after_call(parsed: Dict[str, Any], context: Dict[str, Any], **kwargs: Any) -> None:
+    state = context.get(_CONTEXT_KEY)
+    if state is None:
+        return
+    started = state.get("started")
+    latency_ms = (time.perf_counter() - started) * 1000 if started is not None else 0.0
+    parsed = parsed or {}
+    capacity_meter.record_call(state["operation"], state["tables"], latency_ms, _items_read(parsed, state["tables"]))
+    capacity_meter.record_capacity(state["operation"], parsed.get("ConsumedCapacity"))
+
+
+def instrument_client(client: Any) -> Any:
+    """DynamoDB クライアントに計測ハンドラーを登録する（登録済みなら何もしない）。"""
+    events = client.meta.events
+    # provide-client-params は他のハンドラーが返した新しい dict が採用されうるため、
+    # パラメータを直接書き換えられる before-parameter-build で付与する。
+    events.register("before-parameter-build.dynamodb", _on_before_parameter_build, unique_id=f"{_HANDLER_ID}-params")
+    events.register("before-call.dynamodb", _on_before_call, unique_id=f"{_HANDLER_ID}-before")
+    events.register("after-call.dynamodb", _on_after_call, unique_id=f"{_HANDLER_ID}-after")
+    return client
+
+
+# =============================================================================
+# Scope / emission
+# =============================================================================
+
+
+class CapacityScope:
+    """capacity_scope() が返すハンドル。route は閉じるまでに書き換えてよい。"""
+
+    def __init__(self, route: str, owner: bool) -> None:
+        self.route = route
+        self.owner = owner
+        self.summary: Optional[Dict[str, Any]] = None
+
+
+@contextmanager
+def capacity_scope(route: str) -> Iterator[CapacityScope]:
+    """集計スコープを開き、閉じる際にログと EMF メトリクスを出力する。
+
+    無効時・既にスコープが開いている場合（API リクエスト内の inline ジョブ等）は
+    何もしない（外側のスコープに合算される）。
+    """
+    owner = capacity_metrics_enabled() and not capacity_meter.active
+    scope = CapacityScope(route, owner)
+    if owner:
+        capacity_meter.begin()
+    try:
+        yield scope
+    finally:
+        if owner:
+            scope.summary = capacity_meter.end()
+            emit(scope.route, scope.summary)
+
+
+def emit(route: str, summary: Dict[str, Any]) -> None:
+    """集計結果を構造化ログ 1 行と EMF メトリクスで出力する（失敗しても例外にしない）。
+
+    EMF ドキュメントはテーブル / インデックス（次元セット）ごとに 1 行で、5 つのメトリクスを
+    まとめて載せる（メトリクスごとに single_metric で出すと 1 リクエストで 5×N 行になるため）。
+    """
+    if not summary["calls"]:
+        return
+    logger.info(
+        "DynamoDB consumed capacity",
+        extra={
+            "route": route,
+            "dynamodb_calls": summary["calls"],
+            "dynamodb_items_read": summary["items_read"],
+            "dynamodb_latency_ms": summary["latency_ms"],
+            "consumed_read_units": summary["read_units"],
+            "consumed_write_units": summary["write_units"],
+            "dynamodb_by_table": summary["by_table"],
+        },
+    )
+    namespace = os.environ.get("POWERTOOLS_METRICS_NAMESPACE", METRICS_NAMESPACE_DEFAULT)
+    try:
+        metrics = EphemeralMetrics(namespace=namespace)
+        for entry in summary["by_table"]:
+            metrics.add_dimension(name="Route", value=route)
+            metrics.add_dimension(name="Table", value=entry["table"])
+            metrics.add_dimension(name="Index", value=entry["index"] or "-")
+            metrics.add_metric(name="ConsumedReadCapacity", unit=MetricUnit.Count, value=entry["read_units"])
+            metrics.add_metric(name="ConsumedWriteCapacity", unit=MetricUnit.Count, value=entry["write_units"])
+            metrics.add_metric(name="DynamoDBCalls", unit=MetricUnit.Count, value=entry["calls"])
+            metrics.add_metric(name="DynamoDBItemsRead", unit=MetricUnit.Count, value=entry["items_read"])
+            metrics.add_metric(name="DynamoDBLatency", unit=MetricUnit.Milliseconds, value=entry["latency_ms"])
+            # flush で次元・メトリクスはクリアされ、次のテーブルは新しいドキュメントになる。
+            metrics.flush_metrics()
+    except Exception as e:  # メトリクス出力の失敗で応答を失敗させない
+        logger.debug("Failed to emit DynamoDB capacity metrics", extra={"error": str(e)})
@@ -3,35 +3,38 @@
 各サービスで重複していた boto3 リソース初期化ロジックを一元化する。
 ローカル開発時は DYNAMODB_ENDPOINT_URL / AWS_ENDPOINT_URL で
 エンドポイントを差し替えられる。
+
+実体は utils.aws_clients のレジストリから取得する（リソースはスレッドごと、
+クライアントはプロセス共有）。返すクライアントには消費キャパシティ計測
+（utils.capacity_meter）のイベントハンドラーを登録する。
 """
 
 import os
 from typing import Any, Optional
 
-import boto3
+from utils.aws_clients import get_client, get_resource
+from utils.capacity_meter import instrument_client
 
 
 def get_endpoint_url() -> Optional[str]:
     """ローカル開発用の DynamoDB エンドポイント URL を返す（未設定時は None）。"""
-    return os.environ.get("DYNAMODB_ENDPOINT_URL") or os.environ.get("AWS_ENDPOINT_URL")
+    return os.environ.get("DYNAMODB_ENDPOINT_URL") or os.environ.get("AWS_ENDPOINT_URL") or None
 
 
 def get_dynamodb_resource(dynamodb_resource: Optional[Any] = None) -> Any:
     """boto3 DynamoDB リソースを取得する。
 
     Args:
-        dynamodb_resource: テスト等で注入されたリソース。指定時はそのまま返す。
+        dynamodb_resource: テスト等で注入されたリソース。指定時はそれを（計測ハンドラーを
+            登録して）返す。
 
     Returns:
         boto3 DynamoDB リソース。
     """
-    if dynamodb_resource is not None:
-        return dynamodb_resource
-
-    endpoint_url = get_endpoint_url()
-    if endpoint_url:
-        return boto3.resource("dynamodb", endpoint_url=endpoint_url)
-    return boto3.resource("dynamodb")
+    if dynamodb_resource is None:
+        dynamodb_resource = get_resource("dynamodb", endpoint_url=get_endpoint_url())
+    instrument_client(dynamodb_resource.meta.client)
+    return dynamodb_resource
 
 
 def get_dynamodb_client() -> Any:
@@ -44,7 +47,4 @@ def get_dynamodb_client() -> Any:
     Returns:
         boto3 DynamoDB クライアント。
     """
-    endpoint_url = get_endpoint_url()
-    if endpoint_url:
-        return boto3.client("dynamodb", endpoint_url=endpoint_url)
-    return boto3.client("dynamodb")
+    return instrument_client(get_client("dynamodb", endpoint_url=get_endpoint_url()))
@@ -0,0 +1,105 @@
+"""JSON シリアライズの共通層（API レスポンス・ジョブ payload・LINE API 送信）。
+
+API レスポンスは Powertools Resolver の既定シリアライザ（``json.dumps`` + Encoder）を、
+ジョブの result / payload は ``json.loads(json.dumps(x), parse_float=Decimal)`` の
+文字列往復を通っており、カード一覧や生成結果のような大きな dict ではこれがハンドラ CPU の
+目立つ割合を占める。本モジュールはその経路を一か所に集める。
+
+- ``dumps`` / ``dumps_bytes`` / ``loads``: orjson がインストールされていれば orjson、
+  無ければ標準 json を使う（orjson はオプション依存。未インストールでも動作は同じ）。
+  出力はコンパクト表記（区切りに空白なし）。非 ASCII 文字はエスケープせず UTF-8 のまま出す。
+  Decimal は Powertools の Encoder と同じく文字列に、pydantic モデルは
+  ``model_dump(mode="json")`` に、dataclass は dict に変換する。orjson が扱えない値
+  （64bit を超える int 等）は標準 json にフォールバックするため、標準 json で出力できる
+  ものは必ず出力できる。
+- ``to_dynamodb`` / ``from_dynamodb``: float ↔ Decimal の再帰変換を文字列往復なしで行う。
+  float は ``Decimal(repr(f))`` に変換する（``json.dumps`` → ``parse_float=Decimal`` と同じ値）。
+"""
+
+import dataclasses
+import json
+from decimal import Decimal
+from types import ModuleType
+from typing import Any, Callable, Optional, Union
+
+_orjson: Optional[ModuleType]
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - orjson は Lambda バンドルには含まれる
+    _orjson = None
+
+_ORJSON_OPTIONS = 0 if _orjson is None else _orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """標準型以外の値を JSON 化可能な値にする（Powertools の Encoder と同じ規則）。"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    model_dump: Optional[Callable[..., Any]] = getattr(obj, "model_dump", None)
+    if model_dump is not None:
+        return model_dump(mode="json")
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+def dumps(obj: Any) -> str:
+    """obj をコンパクトな JSON 文字列にする。"""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass
+    return _stdlib_dumps(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """obj を UTF-8 の JSON バイト列にする（HTTP リクエストボディ用）。"""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    return _stdlib_dumps(obj).encode()
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """JSON 文字列 / バイト列をパースする。
+
+    不正な JSON は json.JSONDecodeError（orjson.JSONDecodeError はそのサブクラス）を送出する。
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def to_dynamodb(value: Any) -> Any:
+    """float を Decimal に再帰変換して DynamoDB に書き込める形にする。
+
+    tuple は list に、str 以外の dict キーは JSON と同じ表記の文字列にする
+    （旧実装の JSON 往復と同じ結果）。
+    """
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    if isinstance(value, dict):
+        return {k if isinstance(k, str) else json.dumps(k): to_dynamodb(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_dynamodb(v) for v in value]
+    return value
+
+
+def from_dynamodb(value: Any) -> Any:
+    """DynamoDB の Decimal を int/float に再帰変換して JSON 化可能な形にする。"""
+    if isinstance(value, Decimal):
+        if value == value.to_integral_value():
+            return int(value)
+        return float(value)
+    if isinstance(value, dict):
+        return {k: from_dynamodb(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [from_dynamodb(v) for v in value]
+    return value
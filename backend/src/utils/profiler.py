@@ -0,0 +1,422 @@
+"""Opt-in per-request profiling hook.
+
+本番で特定のルートが遅いとき、X-Ray セグメント（tracer.capture_method）だけでは
+関数単位のホットスポットが分からない。選ばれたリクエストに限り以下を採取し、
+リクエスト ID 付きでオフライン解析用に書き出す。
+
+  - 統計的プロファイル（既定 PROFILING_MODE=sampling）: 別スレッドが
+    PROFILING_INTERVAL_MS（既定 5ms）ごとに全スレッドのスタックを採取し、collapsed stack
+    形式（flamegraph.pl / speedscope でそのまま読める ``.folded``）で出力する。
+    PROFILING_MODE=cprofile では cProfile（決定的。オーバーヘッドが大きく、呼び出しスレッドのみ）
+    の ``.pstats`` を出力する（``python -m pstats`` / snakeviz で読める）。
+  - tracemalloc: スコープ中のピークメモリと、終了時点で残っている確保量上位の行。
+
+採取対象（PROFILING_ENABLED=true が前提。未設定時は何もしない）:
+
+  - PROFILING_SAMPLE_RATE（0.0〜1.0、既定 0）の確率でリクエストを採取する。
+  - PROFILING_DEBUG_USERS（カンマ区切りの user_id）に含まれるユーザーが
+    ``X-Memoru-Profile: 1`` ヘッダーを付けた API リクエストは必ず採取する。
+
+フック箇所:
+
+  - api/handler.handler: name はマッチしたルート（例: "GET /stats"）。
+  - webhook/line_handler.handler, jobs/url_generate_worker_handler.handler,
+    jobs/due_push_handler.handler: ``profiled("<name>")`` デコレーター。
+  - ai_job_service.run_job_inline（AI ジョブワーカー / inline 実行）: name は "job:<job_type>"
+    （tutor ターン等）。API リクエスト内の inline 実行は外側のスコープに含まれる
+    （capacity_scope と同じくスコープは入れ子にしない）。
+
+出力先 PROFILING_OUTPUT はローカルディレクトリ（既定 /tmp/memoru-profiles）または
+``s3://bucket/prefix``（utils.s3_client 経由。S3_ENDPOINT_URL で MinIO 等へ差し替え可）。
+キーは ``<name>/<UTC 時刻>-<request_id>.{json,folded|pstats}``。json には所要時間・
+サンプル数・自己時間 / 累積時間の上位関数・メモリ統計を含める。
+採取・書き出しの失敗はログのみとし、リクエストを失敗させない。
+"""
+
+import cProfile
+import functools
+import json
+import marshal
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from aws_lambda_powertools import Logger
+
+from utils.s3_client import get_s3_client
+
+logger = Logger()
+
+DEFAULT_OUTPUT_DIR = "/tmp/memoru-profiles"
+DEFAULT_INTERVAL_MS = 5.0
+DEBUG_HEADER = "x-memoru-profile"
+MODES = ("sampling", "cprofile")
+
+# json に含める上位関数 / 確保行の件数。
+TOP_N = 30
+
+_SLUG_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+_lock = threading.Lock()
+_active = False
+
+
+def profiling_enabled() -> bool:
+    return os.environ.get("PROFILING_ENABLED", "").lower() == "true"
+
+
+def _sample_rate() -> float:
+    try:
+        return min(1.0, max(0.0, float(os.environ.get("PROFILING_SAMPLE_RATE", "0"))))
+    except ValueError:
+        return 0.0
+
+
+def _debug_requested(user_id: Optional[str], headers: Optional[Mapping[str, Any]]) -> bool:
+    if not user_id or not headers:
+        return False
+    value = next((str(v) for k, v in headers.items() if k.lower() == DEBUG_HEADER), "")
+    if value.lower() not in ("1", "true"):
+        return False
+    allowed = {u.strip() for u in os.environ.get("PROFILING_DEBUG_USERS", "").split(",") if u.strip()}
+    return user_id in allowed
+
+
+def should_profile(user_id: Optional[str] = None, headers: Optional[Mapping[str, Any]] = None) -> bool:
+    """このリクエストを採取するか（デバッグヘッダー → サンプリング率の順に判定）。"""
+    if not profiling_enabled():
+        return False
+    if _debug_requested(user_id, headers):
+        return True
+    rate = _sample_rate()
+    return rate > 0 and random.random() < rate
+
+
+# =============================================================================
+# Collectors
+# =============================================================================
+
+
+def _short_path(filename: str) -> str:
+    """sys.path 上の最長一致プレフィックスを除き、モジュール相当のパスにする。"""
+    best = ""
+    for entry in sys.path:
+        if entry and filename.startswith(entry) and len(entry) > len(best):
+            best = entry
+    return filename[len(best) :].lstrip(os.sep) if best else filename
+
+
+class _StackSampler:
+    """一定間隔で全スレッドのスタックを採取する（collapsed stack 形式で集計）。"""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="memoru-profiler", daemon=True)
+        self._labels: Dict[Any, str] = {}
+
+    @property
+    def started(self) -> bool:
+        return self._thread.ident is not None
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    self.samples[self._collapse(names.get(ident, str(ident)), frame)] += 1
+
+    def _label(self, code: Any) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def _collapse(self, thread_name: str, frame: Any) -> str:
+        stack = []
+        while frame is not None:
+            stack.append(self._label(frame.f_code))
+            frame = frame.f_back
+        stack.append(thread_name)
+        return ";".join(reversed(stack))
+
+    def folded(self) -> bytes:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common()).encode()
+
+    def top_functions(self) -> Dict[str, List[Dict[str, Any]]]:
+        own: Counter = Counter()
+        total: Counter = Counter()
+        for stack, count in self.samples.items():
+            frames = stack.split(";")[1:]
+            if not frames:
+                continue
+            own[frames[-1]] += count
+            for name in set(frames):
+                total[name] += count
+        return {
+            "self": [{"function": name, "samples": count} for name, count in own.most_common(TOP_N)],
+            "cumulative": [{"function": name, "samples": count} for name, count in total.most_common(TOP_N)],
+        }
+
+
+def _cprofile_top(profiler: cProfile.Profile) -> Dict[str, List[Dict[str, Any]]]:
+    stats = pstats.Stats(profiler).stats  # type: ignore[attr-defined]
+    rows = [
+        {
+            "function": f"{name} ({_short_path(filename)}:{line})",
+            "calls": nc,
+            "self_ms": round(tt * 1000, 3),
+            "cumulative_ms": round(ct * 1000, 3),
+        }
+        for (filename, line, name), (_cc, nc, tt, ct, _callers) in stats.items()
+    ]
+    return {
+        "self": sorted(rows, key=lambda r: -r["self_ms"])[:TOP_N],
+        "cumulative": sorted(rows, key=lambda r: -r["cumulative_ms"])[:TOP_N],
+    }
+
+
+class ProfileScope:
+    """profile_scope() が返すハンドル。name は閉じるまでに書き換えてよい。"""
+
+    def __init__(self, name: str, request_id: str, active: bool) -> None:
+        self.name = name
+        self.request_id = request_id
+        self.active = active
+        self.summary: Optional[Dict[str, Any]] = None
+
+
+class _Session:
+    def __init__(self, mode: str, interval: float) -> None:
+        self.mode = mode
+        self.sampler = _StackSampler(interval) if mode == "sampling" else None
+        self.profiler = cProfile.Profile() if mode == "cprofile" else None
+        self.owns_tracemalloc = False
+        self.started = 0.0
+        self.duration_ms = 0.0
+        self.memory: Dict[str, Any] = {}
+
+    def start(self) -> None:
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+            self.owns_tracemalloc = True
+        self.started = time.perf_counter()
+        if self.sampler:
+            self.sampler.start()
+        if self.profiler:
+            self.profiler.enable()
+
+    def abort(self) -> None:
+        """start() が途中で失敗した場合に、開始済みの収集だけを止める。"""
+        if self.profiler:
+            self.profiler.disable()
+        if self.sampler and self.sampler.started:
+            self.sampler.stop()
+        if self.owns_tracemalloc:
+            tracemalloc.stop()
+
+    def stop(self) -> None:
+        if self.profiler:
+            self.profiler.disable()
+        if self.sampler:
+            self.sampler.stop()
+        self.duration_ms = (time.perf_counter() - self.started) * 1000
+        try:
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+            )
+        finally:
+            # ウォームコンテナの後続リクエストに tracemalloc のオーバーヘッドを残さない。
+            if self.owns_tracemalloc:
+                tracemalloc.stop()
+        self.memory = {
+            "current_kb": round(current / 1024, 1),
+            "peak_kb": round(peak / 1024, 1),
+            "top_allocations": [
+                {
+                    "location": f"{_short_path(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+                    "size_kb": round(stat.size / 1024, 1),
+                    "count": stat.count,
+                }
+                for stat in snapshot.statistics("lineno")[:TOP_N]
+            ],
+        }
+
+    def artifact(self) -> Tuple[str, bytes]:
+        if self.profiler:
+            self.profiler.create_stats()
+            # pstats.Stats.dump_stats と同じ形式（marshal された stats 辞書）。
+            return "pstats", marshal.dumps(self.profiler.stats)  # type: ignore[attr-defined]
+        assert self.sampler is not None
+        return "folded", self.sampler.folded()
+
+    def summary(self, scope: ProfileScope) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {
+            "name": scope.name,
+            "request_id": scope.request_id,
+            "mode": self.mode,
+            "captured_at": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(self.duration_ms, 1),
+            "memory": self.memory,
+        }
+        if self.sampler:
+            summary["interval_ms"] = self.sampler.interval * 1000
+            summary["samples"] = sum(self.sampler.samples.values())
+            summary["top_functions"] = self.sampler.top_functions()
+        else:
+            summary["top_functions"] = _cprofile_top(self.profiler)  # type: ignore[arg-type]
+        return summary
+
+
+# =============================================================================
+# Output
+# =============================================================================
+
+
+def _slug(value: str) -> str:
+    return _SLUG_RE.sub("_", value).strip("_") or "unknown"
+
+
+def write_profile(summary: Dict[str, Any], extension: str, data: bytes) -> str:
+    """json サマリーとプロファイル本体を PROFILING_OUTPUT に書き出し、その場所を返す。"""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    key = f"{_slug(summary['name'])}/{stamp}-{_slug(summary['request_id'])}"
+    body = json.dumps(summary, ensure_ascii=False, indent=2).encode()
+    output = os.environ.get("PROFILING_OUTPUT") or DEFAULT_OUTPUT_DIR
+
+    if output.startswith("s3://"):
+        bucket, _, prefix = output[len("s3://") :].partition("/")
+        key = f"{prefix.strip('/')}/{key}" if prefix.strip("/") else key
+        client = get_s3_client()
+        client.put_object(Bucket=bucket, Key=f"{key}.json", Body=body, ContentType="application/json")
+        client.put_object(Bucket=bucket, Key=f"{key}.{extension}", Body=data)
+        return f"s3://{bucket}/{key}"
+
+    path = os.path.join(output, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f"{path}.json", "wb") as f:
+        f.write(body)
+    with open(f"{path}.{extension}", "wb") as f:
+        f.write(data)
+    return path
+
+
+# =============================================================================
+# Scope
+# =============================================================================
+
+
+def _claim() -> bool:
+    global _active
+    with _lock:
+        if _active:
+            return False
+        _active = True
+        return True
+
+
+def _release() -> None:
+    global _active
+    with _lock:
+        _active = False
+
+
+def _new_session() -> _Session:
+    mode = os.environ.get("PROFILING_MODE", "sampling").lower()
+    if mode not in MODES:
+        mode = "sampling"
+    try:
+        interval_ms = float(os.environ.get("PROFILING_INTERVAL_MS", DEFAULT_INTERVAL_MS))
+    except ValueError:
+        interval_ms = DEFAULT_INTERVAL_MS
+    return _Session(mode, max(interval_ms, 0.5) / 1000)
+
+
+@contextmanager
+def profile_scope(
+    name: str,
+    request_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    headers: Optional[Mapping[str, Any]] = None,
+) -> Iterator[ProfileScope]:
+    """採取対象ならプロファイルを取り、閉じる際に書き出す。
+
+    無効時・対象外・既にスコープが開いている場合（API リクエスト内の inline ジョブ等）は
+    何もしない。
+    """
+    active = should_profile(user_id, headers) and _claim()
+    scope = ProfileScope(name, request_id or uuid.uuid4().hex, active)
+    if not active:
+        yield scope
+        return
+
+    session = _new_session()
+    try:
+        session.start()
+    except Exception as e:  # 例: cProfile 以外のプロファイラーが既に有効
+        session.abort()
+        _release()
+        scope.active = False
+        logger.warning("Failed to start request profile", extra={"profile_name": name, "error": str(e)})
+        yield scope
+        return
+
+    try:
+        yield scope
+    finally:
+        try:
+            session.stop()
+            scope.summary = session.summary(scope)
+            extension, data = session.artifact()
+            location = write_profile(scope.summary, extension, data)
+            logger.info(
+                "Request profile captured",
+                extra={
+                    "profile_name": scope.name,
+                    "request_id": scope.request_id,
+                    "duration_ms": scope.summary["duration_ms"],
+                    "memory_peak_kb": session.memory.get("peak_kb"),
+                    "profile_location": location,
+                },
+            )
+        except Exception as e:  # 採取・書き出しの失敗で応答を失敗させない
+            logger.warning("Failed to write request profile", extra={"profile_name": scope.name, "error": str(e)})
+        finally:
+            _release()
+
+
+def profiled(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Lambda ハンドラー (event, context) を profile_scope で包むデコレーター。"""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(event: Any, context: Any) -> Any:
+            with profile_scope(name, request_id=getattr(context, "aws_request_id", None)):
+                return func(event, context)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,35 @@
+"""DynamoDB ProjectionExpression の組み立て（一覧系の部分取得・fields= 用）。
+
+ProjectionExpression は読み取りキャパシティ（RCU はアイテム全体のサイズで決まる）を
+減らさないが、DynamoDB → Lambda の転送量・デシリアライズ量と、その先のレスポンスの
+組み立てコストを減らす。review_history（最大 100 件）や Tutor の messages のように
+一覧画面で使わない大きな属性を持つテーブルで効果が大きい。
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+
+def apply_projection(kwargs: Dict[str, Any], attributes: Optional[Iterable[str]]) -> Dict[str, Any]:
+    """Query / Scan / BatchGetItem の引数に attributes のみを返す ProjectionExpression を付ける。
+
+    属性名は予約語（status / interval 等）と衝突し得るため、すべて ``#pN`` の
+    プレースホルダーにする。既存の ExpressionAttributeNames（``#st`` 等）とはマージする。
+    attributes が None なら kwargs をそのまま返す（全属性）。kwargs は書き換えて返す。
+
+    Raises:
+        ValueError: attributes が空の場合（DynamoDB は空の射影を受け付けない）。
+    """
+    if attributes is None:
+        return kwargs
+    names = sorted(set(attributes))
+    if not names:
+        raise ValueError("attributes must not be empty")
+    expression_names = dict(kwargs.get("ExpressionAttributeNames") or {})
+    placeholders = []
+    for index, name in enumerate(names):
+        placeholder = f"#p{index}"
+        expression_names[placeholder] = name
+        placeholders.append(placeholder)
+    kwargs["ProjectionExpression"] = ", ".join(placeholders)
+    kwargs["ExpressionAttributeNames"] = expression_names
+    return kwargs
@@ -0,0 +1,99 @@
+"""Request-scoped read-through cache (identity map) for DynamoDB items.
+
+1 回の API 呼び出しの中では同じアイテムが繰り返し読まれる。例えば submit_review は
+get_or_create_user → get_card →（競合時）ConsistentRead の get_item と users / cards
+テーブルを何度も読み、Tutor 開始はデッキを読んでからカードを取得する。
+本モジュールはテーブル名 + 主キーをキーとする生アイテムのキャッシュを提供し、
+UserService / CardRepository / DeckService / TutorSessionRepository が共有する。
+
+方針:
+  - リクエストスコープ限定。api/handler.handler() が ``begin()`` / ``end()`` で
+    1 呼び出しごとに有効化・破棄する。スコープ外（ワーカー・バッチ・テスト）では
+    常にミスとして振る舞い、何も保持しない（コンテナ再利用で古い値を返さない）。
+  - 同一リクエスト内の書き込みは該当キーを ``invalidate()`` する。書き込みは
+    ConditionExpression や ADD を含むため、書き込み後の値を推測して上書きはしない。
+  - アイテムは deepcopy して保持・返却する。呼び出し側がアイテムを書き換えても
+    キャッシュ（と他の呼び出し側）に影響しない。
+  - 「存在しない」も結果としてキャッシュする（MISSING）。直後の作成は invalidate される。
+  - ThreadPoolExecutor のワーカースレッド（move_cards / デッキ削除のリセット）からも
+    invalidate されるため、内部状態はロックで保護する。Lambda の 1 コンテナは同時に
+    1 呼び出ししか処理しないため、モジュールレベルの単一インスタンスでよい。
+"""
+
+import copy
+import threading
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from aws_lambda_powertools import Logger
+
+logger = Logger()
+
+# get() が「キャッシュにない」ことを示す番兵。None は「アイテムが存在しない」結果。
+MISS = object()
+
+CacheKey = Tuple[str, Tuple[Hashable, ...]]
+
+
+class RequestCache:
+    """テーブル名 + 主キー → 生アイテム（存在しなければ None）の identity map。"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._items: Dict[CacheKey, Optional[Dict[str, Any]]] = {}
+        self._active = False
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def begin(self) -> None:
+        """リクエストスコープを開始する（前回の内容・カウンタは破棄）。"""
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+            self._active = True
+
+    def end(self) -> Dict[str, int]:
+        """リクエストスコープを終了し、そのリクエストのヒット/ミス数を返す。"""
+        with self._lock:
+            stats = self._stats_locked()
+            self._items.clear()
+            self._active = False
+            return stats
+
+    def get(self, table: str, *key: Hashable) -> Any:
+        """キャッシュ済みアイテムのコピーを返す。未キャッシュ・スコープ外なら MISS。"""
+        with self._lock:
+            if not self._active:
+                return MISS
+            cache_key = (table, key)
+            if cache_key not in self._items:
+                self.misses += 1
+                return MISS
+            self.hits += 1
+            return copy.deepcopy(self._items[cache_key])
+
+    def put(self, table: str, *key: Hashable, item: Optional[Dict[str, Any]]) -> None:
+        """読み取り結果を保持する（item=None は「存在しない」結果）。スコープ外では何もしない。"""
+        with self._lock:
+            if self._active:
+                self._items[(table, key)] = copy.deepcopy(item)
+
+    def invalidate(self, table: str, *key: Hashable) -> None:
+        """書き込みに伴い該当キーを破棄する。"""
+        with self._lock:
+            self._items.pop((table, key), None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return self._stats_locked()
+
+    def _stats_locked(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "items": len(self._items)}
+
+
+# プロセス内で共有する単一インスタンス。
+request_cache = RequestCache()
@@ -0,0 +1,25 @@
+"""S3 クライアント生成の共通ファクトリ。
+
+カードインポート（アップロードされた CSV / TSV / Anki エクスポートの読み出し）で使う
+boto3 S3 クライアントの初期化を一元化する。ローカル開発時は S3_ENDPOINT_URL で
+エンドポイントを差し替えられる（MinIO / LocalStack 等。utils.sqs_client と同じ役割）。
+
+NOTE: SQS と同様に AWS_ENDPOINT_URL へはフォールバックしない。env.json では
+AWS_ENDPOINT_URL が DynamoDB Local 用に使われており、共有すると S3 呼び出しが
+DynamoDB のエンドポイントへ向いてしまうため、専用の S3_ENDPOINT_URL のみを見る。
+"""
+
+import os
+from typing import Any, Optional
+
+from utils.aws_clients import get_client
+
+
+def get_s3_endpoint_url() -> Optional[str]:
+    """ローカル開発用の S3 エンドポイント URL を返す（未設定時は None）。"""
+    return os.environ.get("S3_ENDPOINT_URL") or None
+
+
+def get_s3_client() -> Any:
+    """boto3 S3 クライアントを取得する（utils.aws_clients のプロセス共有クライアント）。"""
+    return get_client("s3", endpoint_url=get_s3_endpoint_url())
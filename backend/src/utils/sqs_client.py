@@ -14,7 +14,7 @@ NOTE: DynamoDB の get_endpoint_url() と異なり AWS_ENDPOINT_URL へはフォ
 import os
 from typing import Any, Optional
 
-import boto3
+from utils.aws_clients import get_client
 
 
 def get_sqs_endpoint_url() -> Optional[str]:
@@ -23,8 +23,5 @@ def get_sqs_endpoint_url() -> Optional[str]:
 
 
 def get_sqs_client() -> Any:
-    """boto3 SQS クライアントを取得する。"""
-    endpoint_url = get_sqs_endpoint_url()
-    if endpoint_url:
-        return boto3.client("sqs", endpoint_url=endpoint_url)
-    return boto3.client("sqs")
+    """boto3 SQS クライアントを取得する（utils.aws_clients のプロセス共有クライアント）。"""
+    return get_client("sqs", endpoint_url=get_sqs_endpoint_url())
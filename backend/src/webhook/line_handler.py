@@ -35,6 +35,7 @@ from webhook.line_actions import (
     handle_start_action,
     handle_url_card_generation,
 )
+from utils.profiler import profiled
 
 logger = Logger()
 tracer = Tracer()
@@ -236,6 +237,7 @@ def handle_postback(event: LineEvent) -> None:
 
 @logger.inject_lambda_context
 @tracer.capture_lambda_handler
+@profiled("webhook:line")
 def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
     """Lambda handler for LINE webhook.
 
@@ -0,0 +1,44 @@
+"""Microbenchmark スイートのフィクスチャ.
+
+ホットパス上の純粋関数（SM-2 / 日付境界 / 集計 / チャンク分割 / カード変換 /
+Flex Message 生成 / AI JSON 抽出）を pytest-benchmark で計測する。
+
+通常のテスト実行（CI の ``pytest tests/ --benchmark-disable``）では各ベンチマークを
+1 回だけ実行するスモークテストとして扱い、計測は ``make bench`` または
+``scripts/bench_compare.py`` から ``--benchmark-only`` で行う。
+
+- BENCHMARK_SCALES（カンマ区切り、既定 "100,1000"）: 入力件数（レビュー履歴・
+  カード・段落などの件数）。
+- BENCHMARK_SRC_DIR: 計測対象の src ディレクトリ。bench_compare.py が比較対象コミットの
+  src を展開したディレクトリを指定する（未指定時は作業ツリーの backend/src）。
+"""
+
+import os
+import sys
+from typing import List
+
+import pytest
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:  # requirements-dev.txt 未導入の環境では収集しない
+    collect_ignore_glob = ["test_*.py"]
+
+_SRC_DIR = os.environ.get("BENCHMARK_SRC_DIR")
+if _SRC_DIR:
+    # tests/conftest.py が先頭に入れた作業ツリーの src より優先させる。
+    # このディレクトリのモジュールより先に src 配下が import されていると差し替えが効かない。
+    if "services" in sys.modules:
+        raise pytest.UsageError("BENCHMARK_SRC_DIR は tests/benchmarks のみを実行する場合に指定してください")
+    sys.path.insert(0, os.path.abspath(_SRC_DIR))
+
+
+def _scales() -> List[int]:
+    raw = os.environ.get("BENCHMARK_SCALES", "100,1000")
+    return [int(value) for value in raw.split(",") if value.strip()]
+
+
+@pytest.fixture(params=_scales(), ids=lambda n: f"n{n}")
+def scale(request) -> int:
+    """入力件数."""
+    return request.param
@@ -0,0 +1,128 @@
+"""Microbenchmark 用の合成入力.
+
+乱数は固定シードで生成し、同じ件数なら実行ごと・コミット間で同一の入力になるようにする
+（bench_compare.py の比較が入力差でぶれないため）。アイテム形式は
+Card.to_dynamodb_item / srs.add_review_history / ReviewRepository が書き込む形に揃える。
+"""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from services.srs import ReviewHistoryEntry, add_review_history
+
+BASE_TIME = datetime(2026, 1, 5, 3, 0, tzinfo=timezone.utc)
+TAGS = ["英単語", "歴史", "化学", "数学", "geography", "python", "aws", "文法"]
+
+
+def review_history(n: int, seed: int = 1) -> List[Dict[str, Any]]:
+    """add_review_history 形式の履歴を n 件（上限 100 件で切り詰め）生成する."""
+    rng = random.Random(seed)
+    history: List[Dict[str, Any]] = []
+    ease, interval = 2.5, 1
+    for i in range(n):
+        grade = rng.choice((2, 3, 4, 4, 5))
+        next_ease = max(1.3, ease + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02))
+        next_interval = 1 if grade < 3 else min(365, max(1, round(interval * next_ease)))
+        history = add_review_history(
+            history,
+            ReviewHistoryEntry(
+                reviewed_at=BASE_TIME + timedelta(days=i),
+                grade=grade,
+                ease_factor_before=round(ease, 2),
+                ease_factor_after=round(next_ease, 2),
+                interval_before=interval,
+                interval_after=next_interval,
+                repetitions_before=i,
+                repetitions_after=i + 1,
+                next_review_at_before=(BASE_TIME + timedelta(days=i)).isoformat(),
+                next_review_at_after=(BASE_TIME + timedelta(days=i + next_interval)).isoformat(),
+            ),
+        )
+        ease, interval = next_ease, next_interval
+    return history
+
+
+def card_items(n: int, seed: int = 1) -> List[Dict[str, Any]]:
+    """DynamoDB カードアイテムを n 件生成する（タグ・参考情報・履歴の有無を混在させる）."""
+    rng = random.Random(seed)
+    items = []
+    for i in range(n):
+        item: Dict[str, Any] = {
+            "user_id": "bench-user",
+            "card_id": f"card-{i:06d}",
+            "front": f"問題 {i}: " + "あいうえお" * rng.randint(1, 20),
+            "back": f"答え {i}: " + "answer text " * rng.randint(1, 30),
+            "tags": rng.sample(TAGS, rng.randint(0, 3)),
+            "interval": rng.randint(0, 120),
+            "ease_factor": str(round(rng.uniform(1.3, 2.8), 2)),
+            "repetitions": rng.randint(0, 12),
+            "created_at": (BASE_TIME - timedelta(days=rng.randint(0, 365))).isoformat(),
+            "next_review_at": (BASE_TIME + timedelta(days=rng.randint(-10, 60))).isoformat(),
+        }
+        if i % 3 == 0:
+            item["deck_id"] = f"deck-{i % 5}"
+            item["deck_index_key"] = f"bench-user#deck-{i % 5}"
+        if i % 4 == 0:
+            item["references"] = [{"type": "url", "value": f"https://example.com/page/{i}"}, {"type": "note", "value": "p.12"}]
+            item["reference_url_key"] = f"bench-user#https://example.com/page/{i}"
+        if i % 2 == 0:
+            item["updated_at"] = (BASE_TIME - timedelta(days=rng.randint(0, 30))).isoformat()
+            item["review_history"] = review_history(rng.randint(1, 20), seed=i)
+        items.append(item)
+    return items
+
+
+def review_items(cards: List[Dict[str, Any]], n: int, seed: int = 1) -> List[Dict[str, Any]]:
+    """cards に対するレビューアイテムを n 件生成する（reviewed_at は過去 n/10 日に分散）."""
+    rng = random.Random(seed)
+    span_minutes = max(1, n // 10) * 24 * 60
+    return [
+        {
+            "card_id": rng.choice(cards)["card_id"],
+            "user_id": "bench-user",
+            "reviewed_at": (BASE_TIME - timedelta(minutes=rng.randrange(span_minutes))).isoformat(),
+            "grade": rng.randint(0, 5),
+        }
+        for _ in range(n)
+    ]
+
+
+def streak_dates(n: int, today: datetime) -> List[str]:
+    """today から n 日連続する降順の日付リスト（calculate_streak が全件走査する最悪ケース）."""
+    return [(today - timedelta(days=i)).date().isoformat() for i in range(n)]
+
+
+def markdown_document(paragraphs: int, seed: int = 1) -> str:
+    """見出し・段落・長大段落を含む Markdown 風テキストを生成する."""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(paragraphs):
+        if i % 8 == 0:
+            lines.append(f"{'#' * rng.randint(1, 3)} セクション {i // 8}")
+        sentence = "これはカード生成用の本文です。" if i % 2 else "Lorem ipsum dolor sit amet. "
+        # 20 段落に 1 つは max_chunk_size を超える段落にして強制分割も通す。
+        repeat = 250 if i % 20 == 19 else rng.randint(3, 30)
+        lines.append(sentence * repeat)
+    return "\n\n".join(lines)
+
+
+def generated_cards(n: int) -> List[Dict[str, Any]]:
+    """AI 生成結果形式のカード dict を n 件生成する."""
+    return [
+        {
+            "front": f"質問 {i}: " + "長めの問題文 " * (i % 7 + 1),
+            "back": f"解答 {i}: " + "長めの解答文 " * (i % 11 + 1),
+            "tags": TAGS[i % len(TAGS) : i % len(TAGS) + 2],
+        }
+        for i in range(n)
+    ]
+
+
+def ai_response(cards: int, fenced: bool) -> str:
+    """モデルのレスポンステキスト（素の JSON / 前置き付き ```json コードブロック）を生成する."""
+    body = json.dumps({"cards": generated_cards(cards)}, ensure_ascii=False, indent=2)
+    if not fenced:
+        return body
+    return f"以下が生成したカードです。\n\n```json\n{body}\n```\n\n内容を確認してください。"
@@ -0,0 +1,49 @@
+"""Benchmarks for Card <-> DynamoDB item conversion."""
+
+import pytest
+
+from models.card import Card, CardListResponse, card_response_json
+
+from .inputs import card_items
+
+pytestmark = pytest.mark.benchmark(group="card")
+
+
+def test_from_dynamodb_item(benchmark, scale):
+    items = card_items(scale)
+    cards = benchmark(lambda: [Card.from_dynamodb_item(item) for item in items])
+    assert len(cards) == scale
+
+
+def test_to_dynamodb_item(benchmark, scale):
+    cards = [Card.from_dynamodb_item(item) for item in card_items(scale)]
+    items = benchmark(lambda: [card.to_dynamodb_item() for card in cards])
+    assert items[0]["card_id"] == cards[0].card_id
+
+
+def test_from_trusted_item(benchmark, scale):
+    items = card_items(scale)
+    cards = benchmark(lambda: [Card.from_trusted_item(item) for item in items])
+    assert len(cards) == scale
+
+
+def test_list_page_json_validated(benchmark, scale):
+    """GET /cards の旧経路（Card → CardResponse → model_dump）。"""
+    items = card_items(scale)
+
+    def run():
+        cards = [Card.from_dynamodb_item(item) for item in items]
+        return CardListResponse(cards=[card.to_response() for card in cards], total=len(cards)).model_dump(mode="json")
+
+    assert len(benchmark(run)["cards"]) == scale
+
+
+def test_list_page_json_direct(benchmark, scale):
+    """GET /cards の現経路（アイテム → JSON dict を直接）。"""
+    items = card_items(scale)
+
+    def run():
+        cards = [card_response_json(item) for item in items]
+        return {"cards": cards, "total": len(cards), "next_cursor": None}
+
+    assert len(benchmark(run)["cards"]) == scale
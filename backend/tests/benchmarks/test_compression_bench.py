@@ -0,0 +1,67 @@
+"""Benchmarks for api.compression on representative response bodies.
+
+圧縮時間に加え、圧縮前後のバイト数と削減率を extra_info に記録する
+（--benchmark-json の結果、または bench_compare.py の保存結果で確認できる）。
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from api import compression
+from models.card import card_response_json
+from models.tutor import TutorMessage, TutorSessionResponse
+from utils import json_codec
+
+from .inputs import BASE_TIME, card_items, generated_cards
+
+pytestmark = pytest.mark.benchmark(group="compression")
+
+ENCODINGS = ["gzip"] + (["br"] if compression._brotli is not None else [])
+
+
+def _card_list(n):
+    cards = [card_response_json(item) for item in card_items(n)]
+    return {"cards": cards, "total": len(cards), "next_cursor": None}
+
+
+def _tutor_session(n):
+    messages = [
+        TutorMessage(
+            role="assistant" if i % 2 else "user",
+            content=("この単語の使い方を例文で説明します。" * 6) if i % 2 else f"質問 {i}: 例文を教えて",
+            related_cards=[f"card-{i:06d}"] if i % 2 else [],
+            timestamp=BASE_TIME + timedelta(minutes=i),
+        )
+        for i in range(min(n, 100))
+    ]
+    return TutorSessionResponse(
+        session_id="tutor-bench",
+        deck_id="deck-1",
+        mode="free_talk",
+        status="active",
+        messages=messages,
+        message_count=len(messages),
+        created_at=BASE_TIME,
+        updated_at=BASE_TIME,
+    ).model_dump(mode="json")
+
+
+def _job_result(n):
+    return {"job_id": "aijob_bench", "status": "completed", "result": {"cards": generated_cards(n)}}
+
+
+PAYLOADS = {"card_list": _card_list, "tutor_session": _tutor_session, "job_result": _job_result}
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+@pytest.mark.parametrize("payload", sorted(PAYLOADS))
+def test_compress(benchmark, scale, payload, encoding):
+    raw = json_codec.dumps(PAYLOADS[payload](scale)).encode("utf-8")
+    compressed = benchmark(compression.compress_bytes, raw, encoding)
+    benchmark.extra_info.update(
+        raw_bytes=len(raw),
+        compressed_bytes=len(compressed),
+        reduction_pct=round((1 - len(compressed) / len(raw)) * 100, 1),
+    )
+    assert len(compressed) < len(raw)
@@ -0,0 +1,38 @@
+"""Benchmarks for services/flex_messages.py builders."""
+
+import pytest
+
+from services.flex_messages import (
+    MAX_PREVIEW_CARDS,
+    create_answer_message,
+    create_card_preview_carousel,
+    create_question_message,
+    create_reminder_message,
+)
+
+from .inputs import generated_cards
+
+pytestmark = pytest.mark.benchmark(group="flex")
+
+FRONT = "光合成で生成される物質は？" * 5
+BACK = "グルコースと酸素。葉緑体のチラコイドで光エネルギーを化学エネルギーに変換する。" * 10
+
+
+def test_create_question_message(benchmark):
+    assert benchmark(create_question_message, "card-1", FRONT)["type"] == "flex"
+
+
+def test_create_answer_message(benchmark):
+    assert benchmark(create_answer_message, "card-1", FRONT, BACK)["type"] == "flex"
+
+
+def test_create_reminder_message(benchmark):
+    assert benchmark(create_reminder_message, 42)["type"] == "flex"
+
+
+def test_create_card_preview_carousel(benchmark):
+    cards = generated_cards(MAX_PREVIEW_CARDS + 1)
+    message = benchmark(
+        create_card_preview_carousel, cards, "Benchmark page", "https://example.com/page", "bench-user", "ref-key"
+    )
+    assert message["type"] == "flex"
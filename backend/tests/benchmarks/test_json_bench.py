@@ -0,0 +1,56 @@
+"""Benchmarks for utils/json_codec against the previous stdlib paths."""
+
+import json
+from decimal import Decimal
+from functools import partial
+
+import pytest
+from aws_lambda_powertools.shared.json_encoder import Encoder
+
+from models.card import card_response_json
+from utils import json_codec
+
+from .inputs import card_items, generated_cards
+
+pytestmark = pytest.mark.benchmark(group="json")
+
+# Powertools Resolver の既定シリアライザ（json_codec 導入前の API レスポンス経路）。
+_resolver_default = partial(json.dumps, separators=(",", ":"), cls=Encoder)
+
+
+def _card_list(n):
+    cards = [card_response_json(item) for item in card_items(n)]
+    return {"cards": cards, "total": len(cards), "next_cursor": None}
+
+
+def _job_result(n):
+    return {"cards": generated_cards(n), "input_length": n * 120, "model_used": "bench", "processing_time_ms": 1234.5}
+
+
+def test_card_list_dumps_stdlib(benchmark, scale):
+    body = _card_list(scale)
+    assert benchmark(_resolver_default, body).startswith('{"cards"')
+
+
+def test_card_list_dumps_codec(benchmark, scale):
+    body = _card_list(scale)
+    assert benchmark(json_codec.dumps, body).startswith('{"cards"')
+
+
+def test_job_result_to_dynamodb_roundtrip(benchmark, scale):
+    """ai_job_store の旧変換（JSON 文字列往復）。"""
+    result = _job_result(scale)
+    stored = benchmark(lambda: json.loads(json.dumps(result), parse_float=Decimal))
+    assert stored["processing_time_ms"] == Decimal("1234.5")
+
+
+def test_job_result_to_dynamodb_codec(benchmark, scale):
+    result = _job_result(scale)
+    stored = benchmark(json_codec.to_dynamodb, result)
+    assert stored["processing_time_ms"] == Decimal("1234.5")
+
+
+def test_job_result_from_dynamodb(benchmark, scale):
+    stored = json_codec.to_dynamodb(_job_result(scale))
+    restored = benchmark(json_codec.from_dynamodb, stored)
+    assert restored["processing_time_ms"] == 1234.5
@@ -0,0 +1,51 @@
+"""Benchmarks for services/srs.py (SM-2 / day boundary / history)."""
+
+import pytest
+
+from services.srs import (
+    ReviewHistoryEntry,
+    add_review_history,
+    calculate_next_review_boundary,
+    calculate_sm2,
+    to_user_local_date,
+)
+
+from .inputs import BASE_TIME, review_history
+
+pytestmark = pytest.mark.benchmark(group="srs")
+
+
+@pytest.mark.parametrize("grade", [1, 4])
+def test_calculate_sm2(benchmark, grade):
+    result = benchmark(calculate_sm2, grade, 6, 2.36, 15)
+    assert result.repetitions == (0 if grade < 3 else 7)
+
+
+@pytest.mark.parametrize("user_timezone", ["Asia/Tokyo", "America/New_York"])
+def test_calculate_next_review_boundary(benchmark, user_timezone):
+    result = benchmark(calculate_next_review_boundary, 21, user_timezone, 4)
+    assert result.tzinfo is not None
+
+
+@pytest.mark.parametrize("value", [BASE_TIME, BASE_TIME.isoformat()], ids=["datetime", "isoformat"])
+def test_to_user_local_date(benchmark, value):
+    assert benchmark(to_user_local_date, value, "Asia/Tokyo") == "2026-01-05"
+
+
+def test_add_review_history(benchmark, scale):
+    history = review_history(scale)
+    entry = ReviewHistoryEntry(
+        reviewed_at=BASE_TIME,
+        grade=4,
+        ease_factor_before=2.5,
+        ease_factor_after=2.5,
+        interval_before=6,
+        interval_after=15,
+        repetitions_before=2,
+        repetitions_after=3,
+        next_review_at_before=BASE_TIME.isoformat(),
+        next_review_at_after=BASE_TIME.isoformat(),
+    )
+    # add_review_history は渡したリストへ追記するため、ラウンドごとに複製を渡す。
+    result = benchmark(lambda: add_review_history(list(history), entry))
+    assert len(result) == min(scale + 1, 100)
@@ -0,0 +1,33 @@
+"""Benchmarks for services/stats_service.py aggregation helpers."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from services.stats_service import (
+    calculate_streak,
+    calculate_tag_performance,
+    unique_local_review_dates_desc,
+)
+
+from .inputs import card_items, review_items, streak_dates
+
+pytestmark = pytest.mark.benchmark(group="stats")
+
+
+def test_calculate_tag_performance(benchmark, scale):
+    cards = card_items(scale)
+    reviews = review_items(cards, scale * 5)
+    result = benchmark(calculate_tag_performance, cards, reviews)
+    assert all(0.0 <= rate <= 1.0 for rate in result.values())
+
+
+def test_unique_local_review_dates_desc(benchmark, scale):
+    reviews = review_items(card_items(10), scale)
+    result = benchmark(unique_local_review_dates_desc, reviews, "Asia/Tokyo")
+    assert result == sorted(result, reverse=True)
+
+
+def test_calculate_streak(benchmark, scale):
+    dates = streak_dates(scale, datetime.now(timezone.utc))
+    assert benchmark(calculate_streak, dates, "UTC") == scale
@@ -0,0 +1,22 @@
+"""Benchmarks for content chunking and AI response JSON extraction."""
+
+import pytest
+
+from services.content_chunker import chunk_content
+from utils.ai_json import extract_json_from_text
+
+from .inputs import ai_response, markdown_document
+
+pytestmark = pytest.mark.benchmark(group="text")
+
+
+def test_chunk_content(benchmark, scale):
+    text = markdown_document(scale)
+    chunks = benchmark(chunk_content, text, "Benchmark page")
+    assert chunks and all(chunk.total_chunks == len(chunks) for chunk in chunks)
+
+
+@pytest.mark.parametrize("fenced", [False, True], ids=["plain", "fenced"])
+def test_extract_json_from_text(benchmark, scale, fenced):
+    text = ai_response(scale, fenced)
+    assert len(benchmark(extract_json_from_text, text)["cards"]) == scale
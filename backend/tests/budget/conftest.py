@@ -0,0 +1,157 @@
+"""Query-budget スイートのフィクスチャ.
+
+QUERY_BUDGET_SCALES（カンマ区切り、既定 "100"）のカード枚数ごとに moto 上へ
+テーブル・キュー・バケットを作成して合成データを投入し、各ルートの呼び出しを
+capacity_meter で計測する。通常のテスト実行では 100 枚のみ、1k / 10k は
+``QUERY_BUDGET_SCALES=100,1000,10000`` で明示的に実行する（10k の投入は数分かかる）。
+
+QUERY_BUDGET_REPORT にパスを指定すると、計測結果（呼び出し回数・読み取りアイテム数・
+壁時計時間）を JSON で書き出す（予算見直し・PR 比較用）。
+"""
+
+import importlib
+import json
+import os
+import pkgutil
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List
+
+import boto3
+import pytest
+from moto import mock_aws
+
+import api.handlers
+from services.line_service import LineService
+from utils import aws_clients
+from utils.capacity_meter import capacity_meter
+
+from .dataset import REGION, create_queues_and_buckets, create_tables, seed, table_names
+
+LINE_CHANNEL_SECRET = "budget-channel-secret"
+
+# サービスの singleton を moto 環境で作り直す対象モジュール。
+WIRED_MODULES = (
+    "api.handler",
+    "webhook.dependencies",
+    "webhook.line_actions",
+    "jobs.due_push_handler",
+    "services.url_generation_service",
+)
+
+
+def _scales() -> List[int]:
+    raw = os.environ.get("QUERY_BUDGET_SCALES", "100")
+    return [int(value) for value in raw.split(",") if value.strip()]
+
+
+def _build_service(value: Any) -> Any:
+    if isinstance(value, LineService):
+        return LineService(channel_access_token="budget-token", channel_secret=LINE_CHANNEL_SECRET)
+    return type(value)()
+
+
+def _rewire_services(monkeypatch: pytest.MonkeyPatch) -> None:
+    """モジュールレベルのサービス singleton を moto 環境下で作り直す.
+
+    サービスは import 時に boto3 リソースを生成するため、mock_aws 開始前に作られた
+    インスタンスは資格情報・計測フックが揃っていない。他の services.* モジュールで
+    定義されたクラスのインスタンスだけを対象にする（user_settings_cache のような
+    自モジュール定義の singleton は共有状態のため差し替えない）。
+    """
+    modules = list(WIRED_MODULES) + [
+        f"api.handlers.{info.name}" for info in pkgutil.iter_modules(api.handlers.__path__)
+    ]
+    for name in modules:
+        module = importlib.import_module(name)
+        for attr, value in list(vars(module).items()):
+            cls = type(value)
+            if cls.__module__.startswith("services.") and cls.__module__ != name and not isinstance(value, type):
+                monkeypatch.setattr(module, attr, _build_service(value))
+
+    ai_job_service = sys.modules["services.ai_job_service"]
+    monkeypatch.setattr(ai_job_service, "_sqs_client", None)
+    monkeypatch.setattr(importlib.import_module("utils.rate_limiter"), "_table", None)
+    monkeypatch.setattr(importlib.import_module("api.conditional"), "_data_version_store", None)
+    monkeypatch.setattr(importlib.import_module("api.handler"), "card_service", None)
+
+
+@pytest.fixture(scope="module", params=_scales(), ids=lambda cards: f"{cards}cards")
+def budget_env(request):
+    """合成データ投入済みの moto 環境（カード枚数ごと）."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for name, value in {
+            "AWS_ACCESS_KEY_ID": "testing",
+            "AWS_SECRET_ACCESS_KEY": "testing",
+            "AWS_SESSION_TOKEN": "testing",
+            "AWS_DEFAULT_REGION": REGION,
+            "ENVIRONMENT": "test",
+            "CONDITIONAL_GET_ENABLED": "true",
+            "TUTOR_SESSION_BACKEND": "dynamodb",
+            "LINE_CHANNEL_ID": "budget-channel",
+            **table_names(),
+        }.items():
+            monkeypatch.setenv(name, value)
+        for name in ("DYNAMODB_ENDPOINT_URL", "AWS_ENDPOINT_URL", "AI_JOB_WORKER_MODE", "DYNAMODB_CAPACITY_METRICS_ENABLED"):
+            monkeypatch.delenv(name, raising=False)
+
+        with mock_aws():
+            aws_clients.reset(session=True)
+            create_tables(boto3.resource("dynamodb", region_name=REGION))
+            for name, value in create_queues_and_buckets().items():
+                monkeypatch.setenv(name, value)
+            dataset = seed(boto3.resource("dynamodb", region_name=REGION), request.param)
+            _rewire_services(monkeypatch)
+            yield dataset
+        aws_clients.reset(session=True)
+
+
+@dataclass
+class Measurement:
+    route: str
+    cards: int
+    status: int
+    calls: int
+    items_read: int
+    wall_ms: float
+    by_table: List[Dict[str, Any]]
+
+
+_measurements: List[Measurement] = []
+
+
+@pytest.fixture
+def measure(budget_env) -> Callable[..., Any]:
+    """呼び出しを capacity_meter で計測し (結果, Measurement) を返す."""
+
+    def _measure(route: str, call: Callable[[], Dict[str, Any]]):
+        capacity_meter.begin()
+        started = time.perf_counter()
+        try:
+            result = call()
+        finally:
+            wall_ms = (time.perf_counter() - started) * 1000
+            summary = capacity_meter.end()
+        measurement = Measurement(
+            route=route,
+            cards=budget_env.cards,
+            status=int(result.get("statusCode", 0)),
+            calls=summary["calls"],
+            items_read=summary["items_read"],
+            wall_ms=round(wall_ms, 1),
+            by_table=summary["by_table"],
+        )
+        _measurements.append(measurement)
+        return result, measurement
+
+    return _measure
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _write_report():
+    yield
+    path = os.environ.get("QUERY_BUDGET_REPORT")
+    if path and _measurements:
+        with open(path, "w") as f:
+            json.dump([asdict(m) for m in _measurements], f, ensure_ascii=False, indent=2)
@@ -0,0 +1,307 @@
+"""Query-budget スイート用の moto 環境構築と合成データ投入.
+
+- テーブル定義は template.yaml の AWS::DynamoDB::Table から生成する（キー・GSI が
+  本番とずれないようにするため。SignupAllowlistTable は Cognito トリガー専用のため除く）。
+- 合成ユーザーはカード N 枚（デッキ 5 つに分散、約 1/3 が due、2/3 に review_history）
+  を持つ主ユーザーと、LINE 連携済みの小規模ユーザー 2 名。小規模ユーザーは
+  「他ユーザーのデータを読んでいないか」を items 予算で検出するための混在データ。
+- 書き込みはサービス層を通さず batch_writer で直接投入する（10k 枚でも現実的な時間で
+  投入するため）。アイテム形式は各モデルの to_dynamodb_item / srs.add_review_history /
+  card_search_index.changes_for_cards に揃える。
+"""
+
+import os
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import boto3
+import yaml
+
+from models.card import Card
+from models.deck import Deck
+from models.user import User
+from services.ai_job_store import JOB_ID_PREFIX, SCHEMA_VERSION, STATUS_COMPLETED
+from services.card_search_index import changes_for_cards
+from services.srs import ReviewHistoryEntry, add_review_history, calculate_sm2
+
+REGION = "ap-northeast-1"
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "template.yaml")
+
+# template.yaml の論理 ID → テーブル名を渡す環境変数。
+TABLE_ENV = {
+    "UsersTable": "USERS_TABLE",
+    "CardsTable": "CARDS_TABLE",
+    "ReviewsTable": "REVIEWS_TABLE",
+    "DecksTable": "DECKS_TABLE",
+    "TutorSessionsTable": "TUTOR_SESSIONS_TABLE",
+    "CardSearchTable": "CARD_SEARCH_TABLE",
+    "BrowserProfilesTable": "BROWSER_PROFILES_TABLE",
+    "ProcessedEventsTable": "PROCESSED_EVENTS_TABLE",
+    "AiJobsTable": "AI_JOBS_TABLE",
+    "RateLimitsTable": "RATE_LIMITS_TABLE",
+}
+
+MAIN_USER_ID = "budget-user"
+MAIN_LINE_USER_ID = "Ubudget0000000000000000000000000"
+NEIGHBOUR_USER_IDS = ("budget-neighbour-1", "budget-neighbour-2")
+NEIGHBOUR_CARDS = 20
+DECK_COUNT = 5
+HISTORY_PER_CARD = 2
+
+# front はデッキ単位の語彙 + 連番、back は語彙の意味。検索で一致するカードが
+# デッキ間に分散するようにする。
+VOCABULARY = (
+    ("りんご", "apple"),
+    ("みかん", "orange"),
+    ("ぶどう", "grape"),
+    ("もも", "peach"),
+    ("いちご", "strawberry"),
+    ("すいか", "watermelon"),
+    ("なし", "pear"),
+    ("かき", "persimmon"),
+)
+
+
+class _CFLoader(yaml.SafeLoader):
+    """CloudFormation 固有タグ (!Ref, !Sub 等) を許容するローダー."""
+
+
+def _cf_constructor(loader, tag_suffix, node):
+    if isinstance(node, yaml.ScalarNode):
+        return loader.construct_scalar(node)
+    if isinstance(node, yaml.SequenceNode):
+        return loader.construct_sequence(node)
+    return loader.construct_mapping(node)
+
+
+_CFLoader.add_multi_constructor("!", _cf_constructor)
+
+
+def table_definitions() -> Dict[str, Dict[str, Any]]:
+    """template.yaml から論理 ID → テーブル Properties を返す（TABLE_ENV 対象のみ）."""
+    with open(TEMPLATE_PATH) as f:
+        resources = yaml.load(f, Loader=_CFLoader)["Resources"]
+    return {
+        logical_id: resources[logical_id]["Properties"]
+        for logical_id in TABLE_ENV
+    }
+
+
+def table_names(prefix: str = "memoru-budget") -> Dict[str, str]:
+    """環境変数名 → テスト用テーブル名."""
+    return {env: f"{prefix}-{logical_id}" for logical_id, env in TABLE_ENV.items()}
+
+
+def create_tables(dynamodb: Any, prefix: str = "memoru-budget", exist_ok: bool = False) -> None:
+    """template.yaml のキー・GSI 定義でテーブルを作成する.
+
+    exist_ok=True では既存テーブルを作り直さない（DynamoDB Local を使い回す
+    scripts/load_replay.py 用）。
+    """
+    names = table_names(prefix)
+    existing = set(dynamodb.meta.client.list_tables()["TableNames"]) if exist_ok else set()
+    for logical_id, props in table_definitions().items():
+        if names[TABLE_ENV[logical_id]] in existing:
+            continue
+        kwargs: Dict[str, Any] = {
+            "TableName": names[TABLE_ENV[logical_id]],
+            "KeySchema": props["KeySchema"],
+            "AttributeDefinitions": props["AttributeDefinitions"],
+            "BillingMode": "PAY_PER_REQUEST",
+        }
+        if props.get("GlobalSecondaryIndexes"):
+            kwargs["GlobalSecondaryIndexes"] = [
+                {"IndexName": gsi["IndexName"], "KeySchema": gsi["KeySchema"], "Projection": gsi["Projection"]}
+                for gsi in props["GlobalSecondaryIndexes"]
+            ]
+        dynamodb.create_table(**kwargs)
+
+
+def create_queues_and_buckets() -> Dict[str, str]:
+    """AI ジョブキューと取り込み / エクスポートバケットを作成し、環境変数の値を返す."""
+    sqs = boto3.client("sqs", region_name=REGION)
+    s3 = boto3.client("s3", region_name=REGION)
+    env = {
+        "AI_JOB_QUEUE_URL": sqs.create_queue(QueueName="memoru-budget-ai-jobs")["QueueUrl"],
+        "AI_JOB_HEAVY_QUEUE_URL": sqs.create_queue(QueueName="memoru-budget-ai-jobs-heavy")["QueueUrl"],
+        "IMPORT_BUCKET": "memoru-budget-imports",
+        "EXPORT_BUCKET": "memoru-budget-exports",
+    }
+    for bucket in (env["IMPORT_BUCKET"], env["EXPORT_BUCKET"]):
+        s3.create_bucket(Bucket=bucket, CreateBucketConfiguration={"LocationConstraint": REGION})
+    return env
+
+
+@dataclass
+class Dataset:
+    """投入済みデータのうち、ルート呼び出しに使う ID."""
+
+    cards: int
+    user_id: str = MAIN_USER_ID
+    line_user_id: str = MAIN_LINE_USER_ID
+    deck_ids: List[str] = field(default_factory=list)
+    card_ids: List[str] = field(default_factory=list)
+    due_card_ids: List[str] = field(default_factory=list)
+    reviewed_card_ids: List[str] = field(default_factory=list)
+    empty_deck_id: str = ""
+    session_id: str = ""
+    profile_id: str = ""
+    job_id: str = ""
+
+
+def build_cards(user_id: str, count: int, deck_ids: List[str], now: datetime, dataset: Dataset = None):
+    """カードと review_history / Reviews テーブルのアイテムを生成する."""
+    cards, reviews = [], []
+    for i in range(count):
+        word, meaning = VOCABULARY[i % len(VOCABULARY)]
+        # 約 1/3 は due（過去）、残りは 1〜60 日後に分散させる。
+        offset = -timedelta(hours=1 + i % 48) if i % 3 == 0 else timedelta(days=1 + i % 60)
+        card = Card(
+            user_id=user_id,
+            front=f"{word} {i}",
+            back=f"{meaning} {i}",
+            # 6 枚に 1 枚は未分類（deck_id なし）。
+            deck_id=deck_ids[i % (len(deck_ids) + 1)] if i % (len(deck_ids) + 1) < len(deck_ids) else None,
+            tags=[f"tag{i % 4}"],
+            next_review_at=now + offset,
+            created_at=now - timedelta(days=90, minutes=i),
+            updated_at=now - timedelta(days=i % 30, minutes=i),
+        )
+        history: List[dict] = []
+        if i % 3 != 2:
+            ease, interval, reps = 2.5, 0, 0
+            for h in range(HISTORY_PER_CARD):
+                grade = 3 + (i + h) % 3
+                result = calculate_sm2(grade, reps, ease, interval)
+                reviewed_at = now - timedelta(days=(HISTORY_PER_CARD - h) * 7, minutes=i)
+                history = add_review_history(
+                    history,
+                    ReviewHistoryEntry(
+                        reviewed_at=reviewed_at,
+                        grade=grade,
+                        ease_factor_before=ease,
+                        ease_factor_after=result.ease_factor,
+                        interval_before=interval,
+                        interval_after=result.interval,
+                        repetitions_before=reps,
+                        repetitions_after=result.repetitions,
+                    ),
+                )
+                reviews.append(
+                    {
+                        "user_id": user_id,
+                        "reviewed_at": reviewed_at.isoformat(),
+                        "card_id": card.card_id,
+                        "grade": grade,
+                        "ease_factor_before": str(ease),
+                        "ease_factor_after": str(result.ease_factor),
+                        "interval_before": interval,
+                        "interval_after": result.interval,
+                    }
+                )
+                ease, interval, reps = result.ease_factor, result.interval, result.repetitions
+            card.ease_factor, card.interval, card.repetitions = ease, interval, reps
+        item = card.to_dynamodb_item()
+        if history:
+            item["review_history"] = history
+        cards.append(item)
+        if dataset is not None:
+            dataset.card_ids.append(card.card_id)
+            if i % 3 == 0:
+                dataset.due_card_ids.append(card.card_id)
+            if history:
+                dataset.reviewed_card_ids.append(card.card_id)
+    return cards, reviews
+
+
+def search_postings(cards: List[dict]) -> List[dict]:
+    """カードから検索インデックスの posting アイテムを生成する（ストリームハンドラーと同じ形式）."""
+    return [
+        {"pk": key, **{attr: added for attr, (added, _) in attrs.items() if added}}
+        for key, attrs in changes_for_cards(cards).items()
+    ]
+
+
+def seed(dynamodb: Any, cards: int) -> Dataset:
+    """主ユーザー（カード cards 枚）と小規模ユーザーを投入する."""
+    names = table_names()
+    now = datetime.now(timezone.utc)
+    dataset = Dataset(cards=cards)
+
+    users, decks, all_cards, reviews, postings = [], [], [], [], []
+    for user_id, line_user_id, count in (
+        (MAIN_USER_ID, MAIN_LINE_USER_ID, cards),
+        *((uid, f"U{uid}", NEIGHBOUR_CARDS) for uid in NEIGHBOUR_USER_IDS),
+    ):
+        user_decks = [Deck(user_id=user_id, name=f"deck {d}", created_at=now - timedelta(days=d)) for d in range(DECK_COUNT)]
+        decks.extend(deck.to_dynamodb_item() for deck in user_decks)
+        user_cards, user_reviews = build_cards(
+            user_id,
+            count,
+            [deck.deck_id for deck in user_decks],
+            now,
+            dataset if user_id == MAIN_USER_ID else None,
+        )
+        all_cards.extend(user_cards)
+        reviews.extend(user_reviews)
+        postings.extend(search_postings(user_cards))
+        user = User(user_id=user_id, line_user_id=line_user_id, display_name=user_id, created_at=now - timedelta(days=120))
+        item = user.to_dynamodb_item()
+        item["card_count"] = count
+        users.append(item)
+        if user_id == MAIN_USER_ID:
+            dataset.deck_ids = [deck.deck_id for deck in user_decks]
+
+    empty_deck = Deck(user_id=MAIN_USER_ID, name="empty deck")
+    decks.append(empty_deck.to_dynamodb_item())
+    dataset.empty_deck_id = empty_deck.deck_id
+
+    dataset.session_id = str(uuid.uuid4())
+    sessions = [
+        {
+            "user_id": MAIN_USER_ID,
+            "session_id": dataset.session_id,
+            "deck_id": dataset.deck_ids[0],
+            "mode": "free_talk",
+            "status": "active",
+            "message_count": 0,
+            "created_at": now.isoformat(),
+            "updated_at": now.isoformat(),
+            "system_prompt": "budget",
+            "deck_card_ids": dataset.card_ids[:10],
+        }
+    ]
+    dataset.profile_id = str(uuid.uuid4())
+    profiles = [{"user_id": MAIN_USER_ID, "profile_id": dataset.profile_id, "name": "budget", "created_at": now.isoformat()}]
+    dataset.job_id = f"{JOB_ID_PREFIX}{uuid.uuid4()}"
+    jobs = [
+        {
+            "job_id": dataset.job_id,
+            "user_id": MAIN_USER_ID,
+            "job_type": "generate",
+            "status": STATUS_COMPLETED,
+            "schema_version": SCHEMA_VERSION,
+            "payload": {},
+            "result": {"cards": []},
+            "created_at": now.isoformat(),
+            "updated_at": now.isoformat(),
+        }
+    ]
+
+    for env, items in (
+        ("USERS_TABLE", users),
+        ("DECKS_TABLE", decks),
+        ("CARDS_TABLE", all_cards),
+        ("REVIEWS_TABLE", reviews),
+        ("CARD_SEARCH_TABLE", postings),
+        ("TUTOR_SESSIONS_TABLE", sessions),
+        ("BROWSER_PROFILES_TABLE", profiles),
+        ("AI_JOBS_TABLE", jobs),
+    ):
+        with dynamodb.Table(names[env]).batch_writer() as writer:
+            for item in items:
+                writer.put_item(Item=item)
+    return dataset
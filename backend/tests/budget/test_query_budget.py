@@ -0,0 +1,343 @@
+"""DynamoDB クエリ予算の回帰テスト.
+
+API（api/handler の全ルート + grade-ai / advice の独立 Lambda）、LINE webhook、
+due push ジョブを合成データ上で 1 回ずつ実行し、DynamoDB の呼び出し回数と
+読み取りアイテム数（Query / Scan は ScannedCount）が宣言した予算を超えたら失敗させる。
+
+予算は ``Budget(calls, items, items_per_card, calls_per_1k_cards)`` で宣言し、
+上限は ``calls + calls_per_1k_cards * N / 1000`` / ``items + items_per_card * N``
+（N = 主ユーザーのカード枚数）。items_per_card / calls_per_1k_cards が 0 でない
+ルートはカード枚数に比例する（O(N)）ことを明示的に許容したもの。新しい全件読みは
+ここで予算超過として検出される。
+
+壁時計時間はレポート（QUERY_BUDGET_REPORT）に記録するが、moto のレイテンシは
+実 DynamoDB と無関係なため予算判定には使わない。
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import math
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import boto3
+import pytest
+
+from services.card_repository import _encode_cursor
+from services.card_service import CardService
+from services.line_service import LineService
+
+from .conftest import LINE_CHANNEL_SECRET
+from .dataset import MAIN_LINE_USER_ID, MAIN_USER_ID, REGION, table_names
+
+
+@dataclass(frozen=True)
+class Budget:
+    calls: int
+    items: int
+    items_per_card: float = 0.0
+    calls_per_1k_cards: float = 0.0
+
+    def limits(self, cards: int) -> Tuple[int, int]:
+        return (
+            self.calls + math.ceil(self.calls_per_1k_cards * cards / 1000),
+            self.items + math.ceil(self.items_per_card * cards),
+        )
+
+
+@dataclass(frozen=True)
+class RouteCase:
+    method: str
+    path: str
+    status: int
+    body: Optional[Dict[str, Any]] = None
+    query: Optional[Dict[str, str]] = None
+    # カード枚数が上限（CardService.MAX_CARDS_PER_USER）以上のときの期待ステータス。
+    over_limit_status: Optional[int] = None
+
+    @property
+    def route(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+# ---------------------------------------------------------------------------
+# ルート予算（ルート → Budget）
+# ---------------------------------------------------------------------------
+
+BUDGETS: Dict[str, Budget] = {
+    "GET /users/me": Budget(calls=1, items=1),
+    "PUT /users/me/settings": Budget(calls=2, items=1),
+    "POST /users/me/unlink-line": Budget(calls=3, items=2),
+    "POST /users/link-line": Budget(calls=3, items=1),
+    # O(N): カード全件からデッキ別枚数・due 件数・統計を集計する。
+    "GET /bootstrap": Budget(calls=18, items=50, items_per_card=3.9, calls_per_1k_cards=1.5),
+    "GET /cards": Budget(calls=3, items=101),
+    "GET /cards/changes": Budget(calls=2, items=200),
+    # O(term 数): 転置インデックスの posting と上位 SEARCH_MAX_CANDIDATES 件の本体だけを読む。
+    "GET /cards/search": Budget(calls=3, items=205),
+    # O(N): due 件数（COUNT）は due パーティション全体を読む。
+    "GET /cards/due": Budget(calls=3, items=30, items_per_card=0.34, calls_per_1k_cards=0.2),
+    "POST /cards": Budget(calls=3, items=2),
+    "GET /cards/{card_id}": Budget(calls=1, items=1),
+    "PUT /cards/{card_id}": Budget(calls=3, items=1),
+    "DELETE /cards/{delete_card_id}": Budget(calls=4, items=3),
+    "POST /reviews/{due_card_id}": Budget(calls=5, items=2),
+    "POST /reviews/{undo_card_id}/undo": Budget(calls=5, items=3),
+    "POST /reviews/{cardId}/grade-ai": Budget(calls=3, items=1),
+    "POST /advice": Budget(calls=2, items=0),
+    "POST /cards/import/upload-url": Budget(calls=0, items=0),
+    "POST /cards/import": Budget(calls=2, items=1),
+    "POST /exports": Budget(calls=1, items=0),
+    "POST /cards/generate": Budget(calls=2, items=0),
+    "POST /cards/generate-from-url": Budget(calls=2, items=0),
+    "POST /cards/refine": Budget(calls=2, items=0),
+    # O(N): デッキごとの枚数・due 件数を deck-cards-index から数える。
+    "GET /decks": Budget(calls=14, items=10, items_per_card=1.17, calls_per_1k_cards=0.6),
+    "POST /decks": Budget(calls=4, items=13),
+    # O(デッキの枚数): 更新後のレスポンスにデッキの枚数・due 件数を含める。
+    "PUT /decks/{deck_id}": Budget(calls=5, items=5, items_per_card=0.34, calls_per_1k_cards=0.2),
+    "DELETE /decks/{empty_deck_id}": Budget(calls=4, items=1),
+    "POST /decks/{deck_id}/cards:move": Budget(calls=12, items=2),
+    # O(N): 統計はカード・レビュー履歴の全件集計。
+    "GET /stats": Budget(calls=4, items=5, items_per_card=2.34, calls_per_1k_cards=0.7),
+    "GET /stats/weak-cards": Budget(calls=2, items=5, items_per_card=1.0, calls_per_1k_cards=0.5),
+    "GET /stats/forecast": Budget(calls=3, items=5, items_per_card=1.0, calls_per_1k_cards=0.5),
+    "GET /browser-profiles": Budget(calls=1, items=1),
+    "POST /browser-profiles": Budget(calls=1, items=0),
+    "DELETE /browser-profiles/{profile_id}": Budget(calls=2, items=1),
+    # O(N): デッキのカードを user_id パーティション + FilterExpression で取得するため、
+    # デッキ外のカードも読む（deck-cards-index 化の候補）。
+    "POST /tutor/sessions": Budget(calls=4, items=5, items_per_card=1.0, calls_per_1k_cards=0.5),
+    "POST /tutor/sessions/{session_id}/messages": Budget(calls=3, items=1),
+    "GET /tutor/sessions": Budget(calls=1, items=1),
+    "GET /tutor/sessions/{session_id}": Budget(calls=2, items=2),
+    "DELETE /tutor/sessions/{session_id}": Budget(calls=3, items=2),
+    "GET /ai-jobs/{job_id}": Budget(calls=1, items=1),
+    # O(due 件数): 出題と残り件数の表示に due 件数を数える。
+    "LINE postback start": Budget(calls=5, items=5, items_per_card=0.34, calls_per_1k_cards=0.2),
+    "LINE postback reveal": Budget(calls=4, items=2),
+    "LINE postback grade": Budget(calls=9, items=5, items_per_card=0.34, calls_per_1k_cards=0.2),
+    # 連携ユーザー数 + 通知対象ユーザーの due 件数。
+    "due push": Budget(calls=3, items=5, items_per_card=0.34, calls_per_1k_cards=0.2),
+}
+
+
+# パス中の {name} は Dataset の属性で置き換える（card_ids[1] 等は _resolve で展開）。
+API_ROUTES = (
+    RouteCase("GET", "/users/me", 200),
+    RouteCase("PUT", "/users/me/settings", 200, body={"notification_time": "21:00"}),
+    RouteCase("GET", "/bootstrap", 200),
+    RouteCase("GET", "/cards", 200),
+    RouteCase("GET", "/cards", 200, query={"deck_id": "{deck_id}"}),
+    RouteCase("GET", "/cards/changes", 200),
+    RouteCase("GET", "/cards/changes", 200, query={"since": "{since}"}),
+    RouteCase("GET", "/cards/search", 200, query={"q": "りんご"}),
+    RouteCase("GET", "/cards/due", 200),
+    RouteCase(
+        "POST",
+        "/cards",
+        201,
+        body={"front": "新しいカード", "back": "new card", "deck_id": "{deck_id}"},
+        over_limit_status=400,
+    ),
+    RouteCase("GET", "/cards/{card_id}", 200),
+    RouteCase("PUT", "/cards/{card_id}", 200, body={"back": "updated"}),
+    RouteCase("DELETE", "/cards/{delete_card_id}", 204),
+    RouteCase("POST", "/reviews/{due_card_id}", 200, body={"grade": 4}),
+    RouteCase("POST", "/reviews/{undo_card_id}/undo", 200),
+    RouteCase("POST", "/cards/import/upload-url", 200),
+    RouteCase("POST", "/cards/import", 202, body={"upload_key": "imports/{user_id}/budget.csv", "format": "csv"}),
+    RouteCase("POST", "/exports", 202),
+    RouteCase("POST", "/cards/generate", 202, body={"input_text": "光合成は植物が光を使って糖を作る仕組み。", "card_count": 3}),
+    RouteCase("POST", "/cards/generate-from-url", 202, body={"url": "https://example.com/article"}),
+    RouteCase("POST", "/cards/refine", 202, body={"front": "光合成とは", "back": "植物の仕組み"}),
+    RouteCase("GET", "/decks", 200),
+    RouteCase("POST", "/decks", 201, body={"name": "budget deck"}),
+    RouteCase("PUT", "/decks/{deck_id}", 200, body={"name": "renamed"}),
+    RouteCase("DELETE", "/decks/{empty_deck_id}", 204),
+    RouteCase("POST", "/decks/{deck_id}/cards:move", 200, body={"card_ids": "{move_card_ids}"}),
+    RouteCase("GET", "/stats", 200),
+    RouteCase("GET", "/stats/weak-cards", 200),
+    RouteCase("GET", "/stats/forecast", 200),
+    RouteCase("GET", "/browser-profiles", 200),
+    RouteCase("POST", "/browser-profiles", 201, body={"name": "work"}),
+    RouteCase("DELETE", "/browser-profiles/{profile_id}", 200),
+    RouteCase("POST", "/tutor/sessions", 202, body={"deck_id": "{deck_id}", "mode": "free_talk"}),
+    RouteCase("POST", "/tutor/sessions/{session_id}/messages", 202, body={"content": "質問です"}),
+    RouteCase("GET", "/tutor/sessions", 200),
+    RouteCase("GET", "/tutor/sessions/{session_id}", 200),
+    RouteCase("DELETE", "/tutor/sessions/{session_id}", 200),
+    RouteCase("GET", "/ai-jobs/{job_id}", 200),
+    # 解除 → 再連携の順で実行し、webhook / due push 用の LINE 連携を元に戻す。
+    RouteCase("POST", "/users/me/unlink-line", 200),
+    RouteCase("POST", "/users/link-line", 200, body={"id_token": "budget-id-token"}),
+)
+
+
+def _placeholders(dataset) -> Dict[str, Any]:
+    return {
+        "user_id": dataset.user_id,
+        "deck_id": dataset.deck_ids[0],
+        "empty_deck_id": dataset.empty_deck_id,
+        "card_id": dataset.card_ids[1],
+        "delete_card_id": dataset.card_ids[-1],
+        "due_card_id": dataset.due_card_ids[0],
+        # 採点対象（due_card_ids[0]）とは別の、履歴を持つカードを取り消す。
+        "undo_card_id": dataset.reviewed_card_ids[1],
+        "move_card_ids": dataset.card_ids[2:12],
+        "session_id": dataset.session_id,
+        "profile_id": dataset.profile_id,
+        "job_id": dataset.job_id,
+        # 直近 1 日分の差分同期（合成データでは約 1/30 のカードが対象）。
+        "since": _encode_cursor({"s": (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()}),
+    }
+
+
+def _resolve(value: Any, values: Dict[str, Any]) -> Any:
+    if isinstance(value, str):
+        if value.startswith("{") and value.endswith("}") and value[1:-1] in values:
+            return values[value[1:-1]]
+        return value.format(**values) if "{" in value else value
+    if isinstance(value, dict):
+        return {k: _resolve(v, values) for k, v in value.items()}
+    return value
+
+
+def _assert_within_budget(route: str, measurement) -> None:
+    budget = BUDGETS[route]
+    max_calls, max_items = budget.limits(measurement.cards)
+    detail = json.dumps(measurement.by_table, ensure_ascii=False)
+    assert measurement.calls <= max_calls, (
+        f"{route}: {measurement.calls} DynamoDB calls > budget {max_calls} ({measurement.cards} cards) {detail}"
+    )
+    assert measurement.items_read <= max_items, (
+        f"{route}: {measurement.items_read} items read > budget {max_items} ({measurement.cards} cards) {detail}"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_network():
+    """LINE API と URL 検証の DNS 解決を切り離す（DynamoDB 計測の対象外）."""
+    with patch.object(LineService, "reply_message"), patch.object(LineService, "push_message"), patch.object(
+        LineService, "verify_id_token", return_value=MAIN_LINE_USER_ID
+    ), patch("api.handlers.ai_handler.validate_url", side_effect=lambda url: url):
+        yield
+
+
+class TestApiRoutes:
+    @pytest.mark.parametrize("case", API_ROUTES, ids=lambda case: case.route)
+    def test_route_within_budget(self, case: RouteCase, budget_env, measure, api_gateway_event, lambda_context):
+        from api import handler as api_handler
+
+        values = _placeholders(budget_env)
+        path = _resolve(case.path, values)
+        event = api_gateway_event(
+            method=case.method,
+            path=path,
+            body=_resolve(case.body, values),
+            query_string_parameters=_resolve(case.query, values),
+            user_id=budget_env.user_id,
+        )
+        response, measurement = measure(case.route, lambda: api_handler.handler(event, lambda_context))
+
+        expected = case.status
+        if case.over_limit_status and budget_env.cards >= CardService.MAX_CARDS_PER_USER:
+            expected = case.over_limit_status
+        assert response["statusCode"] == expected, response.get("body")
+        _assert_within_budget(case.route, measurement)
+
+
+class TestStandaloneHandlers:
+    def test_grade_ai(self, budget_env, measure, api_gateway_event, lambda_context):
+        from api.handler import grade_ai_handler
+
+        card_id = budget_env.card_ids[3]
+        event = api_gateway_event(
+            method="POST",
+            path=f"/reviews/{card_id}/grade-ai",
+            body={"user_answer": "答え"},
+            path_parameters={"cardId": card_id},
+            user_id=budget_env.user_id,
+        )
+        response, measurement = measure("POST /reviews/{cardId}/grade-ai", lambda: grade_ai_handler(event, lambda_context))
+
+        assert response["statusCode"] == 202, response.get("body")
+        _assert_within_budget("POST /reviews/{cardId}/grade-ai", measurement)
+
+    def test_advice(self, budget_env, measure, api_gateway_event, lambda_context):
+        from api.handler import advice_handler
+
+        event = api_gateway_event(method="POST", path="/advice", user_id=budget_env.user_id)
+        response, measurement = measure("POST /advice", lambda: advice_handler(event, lambda_context))
+
+        assert response["statusCode"] == 202, response.get("body")
+        _assert_within_budget("POST /advice", measurement)
+
+
+def _line_event(dataset, postback_data: str) -> Dict[str, Any]:
+    body = json.dumps(
+        {
+            "events": [
+                {
+                    "type": "postback",
+                    "webhookEventId": str(uuid.uuid4()),
+                    "timestamp": 1704067200000,
+                    "source": {"type": "user", "userId": dataset.line_user_id},
+                    "replyToken": "budget-reply-token",
+                    "postback": {"data": postback_data},
+                }
+            ]
+        }
+    )
+    signature = base64.b64encode(
+        hmac.new(LINE_CHANNEL_SECRET.encode("utf-8"), body.encode("utf-8"), hashlib.sha256).digest()
+    ).decode("utf-8")
+    return {"body": body, "headers": {"x-line-signature": signature}, "isBase64Encoded": False}
+
+
+class TestLineWebhook:
+    @pytest.mark.parametrize(
+        "action,postback",
+        [
+            ("start", "action=start"),
+            ("reveal", "action=reveal&card_id={due_card_id}"),
+            ("grade", "action=grade&card_id={grade_card_id}&grade=4"),
+        ],
+    )
+    def test_postback_within_budget(self, action, postback, budget_env, measure, lambda_context):
+        from webhook.line_handler import handler
+
+        values = {"due_card_id": budget_env.due_card_ids[1], "grade_card_id": budget_env.due_card_ids[2]}
+        event = _line_event(budget_env, postback.format(**values))
+        with patch.object(LineService, "reply_message") as reply:
+            response, measurement = measure(f"LINE postback {action}", lambda: handler(event, lambda_context))
+
+        assert response["statusCode"] == 200
+        reply.assert_called_once()
+        _assert_within_budget(f"LINE postback {action}", measurement)
+
+
+class TestDuePush:
+    def test_due_push_within_budget(self, budget_env, measure, lambda_context):
+        from jobs.due_push_handler import handler
+
+        # 実行時刻（Asia/Tokyo）に通知時刻を合わせ、主ユーザーを通知対象にする。
+        now_local = datetime.now(timezone.utc).astimezone(ZoneInfo("Asia/Tokyo"))
+        users = boto3.resource("dynamodb", region_name=REGION).Table(table_names()["USERS_TABLE"])
+        users.update_item(
+            Key={"user_id": MAIN_USER_ID},
+            UpdateExpression="SET settings.notification_time = :t REMOVE last_notified_date",
+            ExpressionAttributeValues={":t": now_local.strftime("%H:%M")},
+        )
+        with patch.object(LineService, "push_message") as push:
+            response, measurement = measure("due push", lambda: handler({}, lambda_context))
+
+        assert json.loads(response["body"])["sent_notifications"] >= 1
+        assert push.call_count >= 1
+        _assert_within_budget("due push", measurement)
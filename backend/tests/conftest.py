@@ -22,6 +22,26 @@ os.environ["POWERTOOLS_SERVICE_NAME"] = "memoru-test"
 os.environ["POWERTOOLS_TRACE_DISABLED"] = "true"
 
 
+@pytest.fixture(autouse=True)
+def _clear_user_settings_cache():
+    """ウォームコンテナ用の設定キャッシュはプロセス共有のため、テスト間で破棄する。"""
+    from services.user_settings_cache import user_settings_cache
+
+    user_settings_cache.clear()
+    yield
+    user_settings_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_aws_clients():
+    """共有 AWS クライアントレジストリを破棄し、テストごとのモック (moto / patch) を効かせる。"""
+    from utils import aws_clients
+
+    aws_clients.reset()
+    yield
+    aws_clients.reset()
+
+
 @pytest.fixture
 def api_gateway_event():
     """Create a base API Gateway HTTP API event."""
@@ -385,7 +385,7 @@ class TestSubmitPollE2E:
         ) as mock_review_cls, patch(
             "services.ai_job_executors.create_ai_service"
         ) as mock_factory:
-            mock_user_cls.return_value.get_or_create_user.return_value.settings = {
+            mock_user_cls.return_value.get_settings.return_value = {
                 "timezone": "Asia/Tokyo"
             }
             mock_review_cls.return_value.get_review_summary.return_value = (
@@ -164,7 +164,7 @@ def test_link_line_event_exists_with_correct_path(api_events):
 
 
 def test_total_http_api_event_count(api_events):
-    """TC-042-04: 整合性 - ApiFunction の HttpApi イベント総数が 30 個
+    """TC-042-04: 整合性 - ApiFunction の HttpApi イベント総数が 37 個
 
     期待イベント:
     1. GetUser          - GET /users/me
@@ -197,12 +197,19 @@ def test_total_http_api_event_count(api_events):
     28. ListTutorSessions   - GET /tutor/sessions
     29. GetTutorSession     - GET /tutor/sessions/{sessionId}
     30. GetAiJob            - GET /ai-jobs/{jobId} (ai-async-jobs: ジョブポーリング)
+    31. SearchCards         - GET /cards/search (カード全文検索)
+    32. GetCardChanges      - GET /cards/changes (差分同期)
+    33. GetBootstrap        - GET /bootstrap (起動時の一括取得)
+    34. CreateImportUploadUrl - POST /cards/import/upload-url (インポートファイルのアップロード URL)
+    35. ImportCards         - POST /cards/import (インポートジョブの submit)
+    36. CreateExport        - POST /exports (データエクスポートジョブの submit)
+    37. MoveDeckCards       - POST /decks/{deckId}/cards:move (カードの一括移動 / デッキのマージ)
 
     注: GetReviewStats (GET /reviews/stats) はハンドラ未実装の死にルートだったため
     Medium-3 対応で削除済み（フロントは GetStats (/stats) を使用）。
     """
-    assert len(api_events) == 30, (
-        f"期待: 30 イベント、実際: {len(api_events)} イベント\n"
+    assert len(api_events) == 37, (
+        f"期待: 37 イベント、実際: {len(api_events)} イベント\n"
         f"現在のイベント: {list(api_events.keys())}"
     )
 
@@ -317,7 +324,7 @@ def test_event_path_and_method(api_events, event_name, expected_path, expected_m
 def test_no_duplicate_event_names(sam_template):
     """TC-042-09: 品質 - イベント名の重複がないこと
 
-    YAML で重複キーは後勝ちになるため、イベント数が期待通りの 30 個かで検証する。
+    YAML で重複キーは後勝ちになるため、イベント数が期待通りの 37 個かで検証する。
     """
     events = sam_template["Resources"]["ApiFunction"]["Properties"]["Events"]
     http_api_events = {
@@ -325,8 +332,8 @@ def test_no_duplicate_event_names(sam_template):
         if ev.get("Type") == "HttpApi"
     }
     # YAML で重複キーは後勝ちになるため、パース後にイベント数が期待通りかで検証
-    assert len(http_api_events) == 30, (
-        f"期待: 30 イベント, 実際: {len(http_api_events)} イベント\n"
+    assert len(http_api_events) == 37, (
+        f"期待: 37 イベント, 実際: {len(http_api_events)} イベント\n"
         f"イベント: {list(http_api_events.keys())}"
     )
 
@@ -57,6 +57,22 @@ class TestGetAiJob:
         assert "schema_version" not in body
         assert "user_id" not in body
 
+    def test_processing_job_includes_progress(self, api_gateway_event, lambda_context):
+        """import_cards 等の長いジョブは途中経過 progress を返す。"""
+        event = api_gateway_event(method="GET", path="/ai-jobs/aijob_123")
+
+        with patch("api.handlers.ai_jobs_handler.ai_job_store") as mock_store:
+            mock_store.get_job.return_value = _make_job(
+                status="processing", job_type="import_cards", progress={"processed_rows": 500}
+            )
+            from api.handler import handler
+
+            response = handler(event, lambda_context)
+
+        body = json.loads(response["body"])
+        assert body["status"] == "processing"
+        assert body["progress"] == {"processed_rows": 500}
+
     def test_failed_job_includes_error(self, api_gateway_event, lambda_context):
         event = api_gateway_event(method="GET", path="/ai-jobs/aijob_123")
 
@@ -0,0 +1,88 @@
+"""Unit tests for GET /bootstrap."""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from models.review import DueCardsResponse
+from models.stats import StatsResponse
+from models.user import User
+
+
+@pytest.fixture
+def services():
+    """bootstrap_handler の各サービスをまとめてパッチする。"""
+    with patch("api.handlers.bootstrap_handler.user_service") as user_service, patch(
+        "api.handlers.bootstrap_handler.deck_service"
+    ) as deck_service, patch(
+        "api.handlers.bootstrap_handler.review_service"
+    ) as review_service, patch(
+        "api.handlers.bootstrap_handler.stats_service"
+    ) as stats_service:
+        user_service.get_or_create_user.return_value = User(
+            user_id="test-user-id",
+            settings={"timezone": "America/New_York"},
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+        deck_service.list_decks.return_value = []
+        deck_service.get_deck_card_counts.return_value = {}
+        deck_service.get_deck_due_counts.return_value = {}
+        review_service.get_due_cards.return_value = DueCardsResponse(
+            due_cards=[], total_due_count=0, next_due_date=None
+        )
+        stats_service.get_stats.return_value = StatsResponse(
+            total_cards=0,
+            learned_cards=0,
+            unlearned_cards=0,
+            cards_due_today=0,
+            total_reviews=0,
+            average_grade=0.0,
+            streak_days=0,
+        )
+        yield user_service, deck_service, review_service, stats_service
+
+
+def _call(api_gateway_event, lambda_context, params=None):
+    event = api_gateway_event(method="GET", path="/bootstrap", query_string_parameters=params)
+    from api.handler import handler
+
+    return handler(event, lambda_context)
+
+
+class TestBootstrap:
+    def test_returns_all_sections_with_timings(self, services, api_gateway_event, lambda_context):
+        user_service, _, review_service, stats_service = services
+
+        response = _call(api_gateway_event, lambda_context, {"due_limit": "500"})
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert body["user"]["user_id"] == "test-user-id"
+        assert body["decks"] == {"decks": [], "total": 0}
+        assert body["due"]["total_due_count"] == 0
+        assert body["stats"]["total_cards"] == 0
+        assert set(body["meta"]) == {"user", "decks", "due", "stats"}
+        assert all(m["status"] == "ok" for m in body["meta"].values())
+        # ユーザーは 1 回だけ取得し、その timezone を各セクションへ渡す。
+        user_service.get_or_create_user.assert_called_once_with("test-user-id")
+        assert review_service.get_due_cards.call_args.kwargs["user_timezone"] == "America/New_York"
+        assert review_service.get_due_cards.call_args.kwargs["limit"] == 100
+        assert stats_service.get_stats.call_args.kwargs["user_timezone"] == "America/New_York"
+
+    def test_failed_section_is_null_and_flagged(self, services, api_gateway_event, lambda_context):
+        _, _, _, stats_service = services
+        stats_service.get_stats.side_effect = RuntimeError("boom")
+
+        response = _call(api_gateway_event, lambda_context)
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert body["stats"] is None
+        assert body["meta"]["stats"]["status"] == "error"
+        assert body["due"] is not None
+
+    def test_invalid_due_limit_returns_400(self, services, api_gateway_event, lambda_context):
+        response = _call(api_gateway_event, lambda_context, {"due_limit": "abc"})
+        assert response["statusCode"] == 400
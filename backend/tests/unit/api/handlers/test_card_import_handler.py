@@ -0,0 +1,124 @@
+"""Unit tests for POST /cards/import/upload-url and POST /cards/import."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from services.card_import import ImportUnavailableError, ImportUploadStore
+from services.deck_service import DeckNotFoundError
+
+UPLOAD_KEY = "imports/test-user-id/abc"
+
+
+@pytest.fixture
+def services():
+    """card_import_handler のサービスをまとめてパッチする（owns_key は実装のまま使う）。"""
+    with patch("api.handlers.card_import_handler.upload_store") as upload_store, patch(
+        "api.handlers.card_import_handler.deck_service"
+    ) as deck_service, patch(
+        "api.handlers.card_import_handler.user_service"
+    ) as user_service, patch(
+        "api.handlers.card_import_handler.submit_ai_job"
+    ) as submit:
+        upload_store.enabled = True
+        upload_store.owns_key.side_effect = ImportUploadStore.owns_key
+        submit.return_value = {"job_id": "aijob_1", "job_type": "import_cards", "status": "queued"}
+        yield upload_store, deck_service, user_service, submit
+
+
+def _post(api_gateway_event, lambda_context, path, body=None):
+    event = api_gateway_event(method="POST", path=path, body=body)
+    from api.handler import handler
+
+    return handler(event, lambda_context)
+
+
+class TestCreateImportUploadUrl:
+    def test_returns_presigned_url(self, services, api_gateway_event, lambda_context):
+        upload_store = services[0]
+        upload_store.create_upload_url.return_value = {
+            "upload_url": "https://s3.example.com/put",
+            "upload_key": UPLOAD_KEY,
+            "expires_in": 900,
+        }
+
+        response = _post(api_gateway_event, lambda_context, "/cards/import/upload-url")
+
+        assert response["statusCode"] == 200
+        assert json.loads(response["body"])["upload_key"] == UPLOAD_KEY
+        upload_store.create_upload_url.assert_called_once_with("test-user-id")
+
+    def test_unavailable_returns_503(self, services, api_gateway_event, lambda_context):
+        services[0].create_upload_url.side_effect = ImportUnavailableError("off")
+
+        response = _post(api_gateway_event, lambda_context, "/cards/import/upload-url")
+
+        assert response["statusCode"] == 503
+
+
+class TestImportCards:
+    def test_submits_import_job(self, services, api_gateway_event, lambda_context):
+        _, deck_service, user_service, submit = services
+
+        response = _post(
+            api_gateway_event,
+            lambda_context,
+            "/cards/import",
+            {"upload_key": UPLOAD_KEY, "format": "anki", "deck_id": "deck-1", "tags": [" jlpt "]},
+        )
+
+        assert response["statusCode"] == 202
+        assert json.loads(response["body"])["job_id"] == "aijob_1"
+        user_service.get_or_create_user.assert_called_once_with("test-user-id")
+        deck_service.get_deck.assert_called_once_with("test-user-id", "deck-1")
+        kwargs = submit.call_args.kwargs
+        assert kwargs["job_type"] == "import_cards"
+        assert kwargs["payload"] == {
+            "upload_key": UPLOAD_KEY,
+            "format": "anki",
+            "deck_id": "deck-1",
+            "tags": ["jlpt"],
+        }
+
+    def test_rejects_other_users_upload_key(self, services, api_gateway_event, lambda_context):
+        response = _post(
+            api_gateway_event,
+            lambda_context,
+            "/cards/import",
+            {"upload_key": "imports/other-user/abc", "format": "csv"},
+        )
+
+        assert response["statusCode"] == 400
+        services[3].assert_not_called()
+
+    def test_rejects_unknown_format(self, services, api_gateway_event, lambda_context):
+        response = _post(
+            api_gateway_event, lambda_context, "/cards/import", {"upload_key": UPLOAD_KEY, "format": "xlsx"}
+        )
+
+        assert response["statusCode"] == 400
+        services[3].assert_not_called()
+
+    def test_unknown_deck_returns_400(self, services, api_gateway_event, lambda_context):
+        services[1].get_deck.side_effect = DeckNotFoundError("Deck not found: d-x")
+
+        response = _post(
+            api_gateway_event,
+            lambda_context,
+            "/cards/import",
+            {"upload_key": UPLOAD_KEY, "format": "csv", "deck_id": "d-x"},
+        )
+
+        assert response["statusCode"] == 400
+        assert json.loads(response["body"])["code"] == "invalid_deck"
+        services[3].assert_not_called()
+
+    def test_disabled_returns_503(self, services, api_gateway_event, lambda_context):
+        services[0].enabled = False
+
+        response = _post(
+            api_gateway_event, lambda_context, "/cards/import", {"upload_key": UPLOAD_KEY, "format": "csv"}
+        )
+
+        assert response["statusCode"] == 503
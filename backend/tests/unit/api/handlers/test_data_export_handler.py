@@ -0,0 +1,51 @@
+"""Unit tests for POST /exports."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def services():
+    with patch("api.handlers.data_export_handler.exporter") as exporter, patch(
+        "api.handlers.data_export_handler.submit_ai_job"
+    ) as submit:
+        exporter.enabled = True
+        submit.return_value = {"job_id": "aijob_1", "job_type": "export_data", "status": "queued"}
+        yield exporter, submit
+
+
+def _post(api_gateway_event, lambda_context):
+    event = api_gateway_event(method="POST", path="/exports")
+    from api.handler import handler
+
+    return handler(event, lambda_context)
+
+
+class TestCreateExport:
+    def test_submits_export_job(self, services, api_gateway_event, lambda_context):
+        _, submit = services
+
+        response = _post(api_gateway_event, lambda_context)
+
+        assert response["statusCode"] == 202
+        assert json.loads(response["body"])["job_id"] == "aijob_1"
+        submit.assert_called_once_with(user_id="test-user-id", job_type="export_data", payload={})
+
+    def test_disabled_returns_503(self, services, api_gateway_event, lambda_context):
+        exporter, submit = services
+        exporter.enabled = False
+
+        response = _post(api_gateway_event, lambda_context)
+
+        assert response["statusCode"] == 503
+        submit.assert_not_called()
+
+    def test_submit_failure_returns_500(self, services, api_gateway_event, lambda_context):
+        _, submit = services
+        submit.side_effect = RuntimeError("boom")
+
+        response = _post(api_gateway_event, lambda_context)
+
+        assert response["statusCode"] == 500
@@ -23,7 +23,7 @@ def mock_user_service():
     StatsService に渡すため、全テストで自動的にパッチする。
     """
     with patch("api.handlers.stats_handler.user_service") as mock:
-        mock.get_or_create_user.return_value.settings = {"timezone": "Asia/Tokyo"}
+        mock.get_settings.return_value = {"timezone": "Asia/Tokyo"}
         yield mock
 
 
@@ -0,0 +1,125 @@
+"""Unit tests for api.compression (content-negotiated gzip / brotli responses)."""
+
+import base64
+import gzip
+import json
+from unittest.mock import patch
+
+import pytest
+
+from api import compression
+from api.compression import choose_encoding, compress_response, parse_accept_encoding
+
+BIG_BODY = json.dumps({"cards": [{"front": "日本語の問題", "back": "answer " * 10} for _ in range(50)]})
+
+
+@pytest.fixture
+def compression_env(monkeypatch):
+    monkeypatch.setenv("RESPONSE_COMPRESSION_ENABLED", "true")
+    monkeypatch.delenv("RESPONSE_COMPRESSION_MIN_BYTES", raising=False)
+
+
+def _response(body=BIG_BODY, status=200, **headers):
+    return {"statusCode": status, "headers": {"Content-Type": "application/json", **headers}, "body": body}
+
+
+def _event(accept_encoding="gzip, deflate, br"):
+    return {"headers": {"accept-encoding": accept_encoding}}
+
+
+class TestNegotiation:
+    def test_parse_q_values(self):
+        assert parse_accept_encoding("gzip;q=0.5, br, identity;q=0, x;q=bad") == {
+            "gzip": 0.5,
+            "br": 1.0,
+            "identity": 0.0,
+            "x": 0.0,
+        }
+
+    def test_prefers_brotli_only_when_available(self):
+        with patch.object(compression, "_brotli", None):
+            assert choose_encoding("br, gzip") == "gzip"
+            assert choose_encoding("br") is None
+        with patch.object(compression, "_brotli", object()):
+            assert choose_encoding("gzip, br") == "br"
+            assert choose_encoding("gzip, br;q=0.5") == "gzip"
+
+    def test_rejected_and_wildcard(self):
+        assert choose_encoding("gzip;q=0") is None
+        assert choose_encoding("*") in ("br", "gzip")
+        assert choose_encoding("*, gzip;q=0") == ("br" if compression._brotli else None)
+        assert choose_encoding(None) is None
+
+
+class TestCompressResponse:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("RESPONSE_COMPRESSION_ENABLED", raising=False)
+        response = _response()
+        assert compress_response(_event(), response) is response
+
+    def test_gzip_roundtrip(self, compression_env):
+        with patch.object(compression, "_brotli", None):
+            result = compress_response(_event(), _response())
+        assert result["isBase64Encoded"] is True
+        assert result["headers"]["Content-Encoding"] == "gzip"
+        assert result["headers"]["Vary"] == "Accept-Encoding"
+        raw = gzip.decompress(base64.b64decode(result["body"]))
+        assert raw.decode("utf-8") == BIG_BODY
+        assert len(result["body"]) < len(BIG_BODY)
+
+    def test_below_threshold_is_not_compressed(self, compression_env, monkeypatch):
+        monkeypatch.setenv("RESPONSE_COMPRESSION_MIN_BYTES", str(len(BIG_BODY.encode()) + 1))
+        result = compress_response(_event(), _response())
+        assert result["body"] == BIG_BODY
+        assert "isBase64Encoded" not in result
+        assert result["headers"]["Vary"] == "Accept-Encoding"
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            _response(status=304),
+            _response(**{"Content-Type": "image/png"}),
+            _response(**{"Content-Encoding": "gzip"}),
+            dict(_response(), isBase64Encoded=True),
+        ],
+        ids=["not-modified", "binary", "already-encoded", "base64"],
+    )
+    def test_skipped_responses(self, compression_env, response):
+        assert compress_response(_event(), response) is response
+
+    def test_client_without_accept_encoding(self, compression_env):
+        result = compress_response({"headers": {}}, _response(**{"vary": "Origin"}))
+        assert result["body"] == BIG_BODY
+        assert result["headers"]["vary"] == "Origin, Accept-Encoding"
+
+    def test_does_not_mutate_input(self, compression_env):
+        response = _response()
+        compress_response(_event("gzip"), response)
+        assert response == _response()
+
+
+class TestHandlerIntegration:
+    def test_router_response_is_compressed(self, compression_env, api_gateway_event, lambda_context):
+        from api.handler import handler
+
+        event = api_gateway_event(path="/cards", headers={"accept-encoding": "gzip"})
+        cards = [{"card_id": f"c{i}", "front": "問題" * 20} for i in range(40)]
+        with patch("api.handlers.cards_handler.card_service") as mock_service:
+            mock_service.list_card_responses.return_value = (cards, None)
+            response = handler(event, lambda_context)
+
+        assert response["statusCode"] == 200
+        assert response["headers"]["Content-Encoding"] == "gzip"
+        body = json.loads(gzip.decompress(base64.b64decode(response["body"])))
+        assert body == {"cards": cards, "total": 40, "next_cursor": None}
+
+    def test_standalone_handlers_pass_through_compression(self, compression_env, lambda_context):
+        from api.handler import advice_handler, grade_ai_handler
+
+        event = {"headers": {"accept-encoding": "gzip"}, "requestContext": {}}
+        for standalone in (grade_ai_handler, advice_handler):
+            response = standalone(event, lambda_context)
+            assert response["statusCode"] == 401
+            # 小さい応答は圧縮しないが、Vary が付くことで圧縮層を通ったことが分かる。
+            assert response["headers"]["Vary"] == "Accept-Encoding"
+            assert json.loads(response["body"]) == {"error": "Unauthorized"}
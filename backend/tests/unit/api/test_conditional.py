@@ -0,0 +1,155 @@
+"""Unit tests for api.conditional (weak ETag / 304 conditional GET)."""
+
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from api.conditional import DATA_VERSION_SETTLE_SECONDS, TIME_BUCKET_SECONDS, build_etag, etag_matches
+from services.data_version import DataVersion
+
+
+class TestBuildEtag:
+    def test_query_order_does_not_matter(self):
+        a = build_etag(3, "/cards", {"limit": "10", "cursor": "x"}, False)
+        b = build_etag(3, "/cards", {"cursor": "x", "limit": "10"}, False)
+        assert a == b
+        assert a.startswith('W/"3-0-')
+
+    def test_version_and_query_change_the_tag(self):
+        base = build_etag(3, "/cards", {}, False)
+        assert build_etag(4, "/cards", {}, False) != base
+        assert build_etag(3, "/cards", {"limit": "5"}, False) != base
+
+    def test_time_sensitive_tags_roll_over_per_bucket(self):
+        t = 1_700_000_000 - (1_700_000_000 % TIME_BUCKET_SECONDS)
+        same = build_etag(1, "/stats", {}, True, now=t + 1)
+        assert build_etag(1, "/stats", {}, True, now=t + TIME_BUCKET_SECONDS - 1) == same
+        assert build_etag(1, "/stats", {}, True, now=t + TIME_BUCKET_SECONDS) != same
+
+
+class TestEtagMatches:
+    def test_weak_comparison_and_lists(self):
+        etag = 'W/"1-0-abc"'
+        assert etag_matches('W/"1-0-abc"', etag)
+        assert etag_matches('"1-0-abc"', etag)
+        assert etag_matches('"other", W/"1-0-abc"', etag)
+        assert etag_matches("*", etag)
+
+    def test_missing_or_different(self):
+        assert not etag_matches(None, 'W/"1-0-abc"')
+        assert not etag_matches('W/"2-0-abc"', 'W/"1-0-abc"')
+
+
+class TestConditionalGetHandler:
+    """GET /stats/weak-cards を通したデコレーターの結線確認。"""
+
+    @pytest.fixture
+    def version_store(self, monkeypatch):
+        monkeypatch.setenv("CONDITIONAL_GET_ENABLED", "true")
+        store = MagicMock()
+        store.get.return_value = DataVersion(7, 0.0)
+        with patch("api.conditional._get_store", return_value=store):
+            yield store
+
+    def _call(self, api_gateway_event, lambda_context, headers=None):
+        event = api_gateway_event(method="GET", path="/stats/weak-cards", headers=headers)
+        from api.handler import handler
+
+        return handler(event, lambda_context)
+
+    def _header(self, response, name):
+        headers = {k.lower(): v for k, v in response.get("headers", {}).items()}
+        return headers.get(name.lower())
+
+    def test_miss_returns_body_with_etag_then_hit_returns_304(
+        self, version_store, api_gateway_event, lambda_context
+    ):
+        with patch("api.handlers.stats_handler.stats_service") as mock_service:
+            mock_service.get_weak_cards.return_value.model_dump.return_value = {"weak_cards": [], "total_count": 0}
+
+            first = self._call(api_gateway_event, lambda_context)
+            etag = self._header(first, "ETag")
+            assert first["statusCode"] == 200
+            assert json.loads(first["body"]) == {"weak_cards": [], "total_count": 0}
+            assert etag.startswith('W/"7-')
+
+            second = self._call(api_gateway_event, lambda_context, headers={"if-none-match": etag})
+            assert second["statusCode"] == 304
+            assert self._header(second, "ETag") == etag
+            assert mock_service.get_weak_cards.call_count == 1
+
+    def test_version_bump_invalidates(self, version_store, api_gateway_event, lambda_context):
+        with patch("api.handlers.stats_handler.stats_service") as mock_service:
+            mock_service.get_weak_cards.return_value.model_dump.return_value = {"weak_cards": [], "total_count": 0}
+            etag = self._header(self._call(api_gateway_event, lambda_context), "ETag")
+
+            version_store.get.return_value = DataVersion(8, 0.0)
+            response = self._call(api_gateway_event, lambda_context, headers={"if-none-match": etag})
+
+        assert response["statusCode"] == 200
+        assert mock_service.get_weak_cards.call_count == 2
+
+    def test_version_read_failure_falls_back_to_plain_response(
+        self, version_store, api_gateway_event, lambda_context
+    ):
+        version_store.get.return_value = None
+        with patch("api.handlers.stats_handler.stats_service") as mock_service:
+            mock_service.get_weak_cards.return_value.model_dump.return_value = {"weak_cards": [], "total_count": 0}
+            response = self._call(api_gateway_event, lambda_context, headers={"if-none-match": "*"})
+
+        assert response["statusCode"] == 200
+        assert self._header(response, "ETag") is None
+
+    def test_recent_change_skips_etag_until_reads_settle(
+        self, version_store, api_gateway_event, lambda_context
+    ):
+        """変更直後は本文が古い可能性があるため ETag を付けず、304 も返さない。"""
+        version_store.get.return_value = DataVersion(7, time.time())
+        with patch("api.handlers.stats_handler.stats_service") as mock_service:
+            mock_service.get_weak_cards.return_value.model_dump.return_value = {"weak_cards": [], "total_count": 0}
+            response = self._call(api_gateway_event, lambda_context, headers={"if-none-match": "*"})
+
+            assert response["statusCode"] == 200
+            assert self._header(response, "ETag") is None
+
+            version_store.get.return_value = DataVersion(7, time.time() - DATA_VERSION_SETTLE_SECONDS)
+            settled = self._call(api_gateway_event, lambda_context)
+        assert self._header(settled, "ETag").startswith('W/"7-')
+
+    def test_consistent_route_tags_right_after_change(self, version_store, api_gateway_event, lambda_context):
+        """GET /cards（deck_id なし）は強い整合性読み取りのため変更直後も ETag を付ける。"""
+        version_store.get.return_value = DataVersion(7, time.time())
+        from api.handler import handler
+
+        with patch("api.handlers.cards_handler.card_service") as mock_service:
+            mock_service.list_card_responses.return_value = ([], None)
+            plain = handler(api_gateway_event(method="GET", path="/cards"), lambda_context)
+            by_deck = handler(
+                api_gateway_event(method="GET", path="/cards", query_string_parameters={"deck_id": "d1"}),
+                lambda_context,
+            )
+
+        assert self._header(plain, "ETag").startswith('W/"7-')
+        assert self._header(by_deck, "ETag") is None
+
+    def test_settings_cached_before_a_newer_settings_version_are_discarded(
+        self, version_store, api_gateway_event, lambda_context
+    ):
+        """別コンテナでの設定変更後は、古いキャッシュの timezone で /stats を作らない。"""
+        from api.handler import handler
+        from services.user_settings_cache import user_settings_cache
+
+        user_settings_cache.put("test-user-id", {"timezone": "UTC"}, 1)
+        version_store.get.return_value = DataVersion(7, 0.0, settings_version=2)
+        with patch("api.handlers.stats_handler.user_service") as mock_users, patch(
+            "api.handlers.stats_handler.stats_service"
+        ) as mock_stats:
+            mock_users.get_settings.side_effect = lambda user_id: user_settings_cache.get(user_id) or {
+                "timezone": "Asia/Tokyo"
+            }
+            mock_stats.get_stats.return_value.model_dump.return_value = {}
+            handler(api_gateway_event(method="GET", path="/stats"), lambda_context)
+
+        assert mock_stats.get_stats.call_args.kwargs["user_timezone"] == "Asia/Tokyo"
@@ -1,4 +1,4 @@
-"""Unit tests for api.shared.parse_json_body.
+"""Unit tests for api.shared.parse_json_body / parse_fields_param.
 
 全 POST/PUT ハンドラーに重複していたボディパース（json_body 取得 → dict 検証 →
 Pydantic 変換 → ValidationError / JSONDecodeError ハンドリング）を一元化した
@@ -11,7 +11,7 @@ from types import SimpleNamespace
 from aws_lambda_powertools.event_handler import Response
 from pydantic import BaseModel
 
-from api.shared import parse_json_body
+from api.shared import parse_fields_param, parse_json_body
 
 
 class _SampleRequest(BaseModel):
@@ -63,3 +63,26 @@ class TestParseJsonBody:
         assert isinstance(result, Response)
         assert result.status_code == 400
         assert "Invalid JSON body" in result.body
+
+
+def _resolver_with_query(params):
+    return SimpleNamespace(current_event=SimpleNamespace(query_string_parameters=params))
+
+
+class TestParseFieldsParam:
+    def test_absent_returns_none(self):
+        assert parse_fields_param(_resolver_with_query(None), _SampleRequest) is None
+        assert parse_fields_param(_resolver_with_query({"limit": "5"}), _SampleRequest) is None
+
+    def test_model_order_and_always_fields(self):
+        resolver = _resolver_with_query({"fields": " count , count"})
+        assert parse_fields_param(resolver, _SampleRequest, always=("name",)) == ["name", "count"]
+
+    def test_unknown_or_empty_fields_return_400(self):
+        for raw in ("count,password", ",", ""):
+            result = parse_fields_param(_resolver_with_query({"fields": raw}), _SampleRequest)
+            assert isinstance(result, Response)
+            assert result.status_code == 400
+            body = json.loads(result.body)
+            assert body["allowed_fields"] == ["name", "count"]
+        assert body["unknown_fields"] == []
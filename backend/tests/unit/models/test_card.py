@@ -4,7 +4,9 @@ TASK-0157: Reference Pydantic モデルのバリデーション、Card モデル
 DynamoDB シリアライズ/デシリアライズ、後方互換性をテストする。
 """
 
+import json
 from datetime import datetime
+from decimal import Decimal
 
 import pytest
 from pydantic import ValidationError
@@ -15,6 +17,7 @@ from models.card import (
     CreateCardRequest,
     Reference,
     UpdateCardRequest,
+    card_response_json,
 )
 
 
@@ -274,3 +277,72 @@ class TestUpdateCardRequestReferences:
             UpdateCardRequest(references=refs)
         errors = exc_info.value.errors()
         assert any(error["loc"] == ("references",) for error in errors)
+
+
+class TestTrustedItemFastPath:
+    """Card.from_trusted_item / card_response_json が検証経路と同じ結果を返すことのテスト。"""
+
+    FULL_ITEM = {
+        "user_id": "user-1",
+        "card_id": "card-1",
+        "front": "Q",
+        "back": "A",
+        "deck_id": "deck-1",
+        "deck_index_key": "user-1#deck-1",
+        "tags": ["英単語", "aws"],
+        "references": [
+            {"type": "url", "value": "https://example.com"},
+            {"type": "note", "value": "p.12"},
+        ],
+        "reference_url_key": "user-1#https://example.com",
+        "interval": Decimal("6"),
+        "ease_factor": "2.36",
+        "repetitions": Decimal("3"),
+        "created_at": "2026-01-05T03:00:00+00:00",
+        "next_review_at": "2026-01-11T03:00:00.123456+00:00",
+        "updated_at": "2026-01-05T03:00:00+09:00",
+        "review_history": [{"grade": 4}],
+    }
+    MINIMAL_ITEM = {
+        "user_id": "user-1",
+        "card_id": "card-2",
+        "front": "Q",
+        "back": "A",
+        "created_at": "2026-01-05T03:00:00",
+    }
+
+    @pytest.mark.parametrize("item", [FULL_ITEM, MINIMAL_ITEM], ids=["full", "minimal"])
+    def test_from_trusted_item_matches_validated_path(self, item):
+        """from_trusted_item は from_dynamodb_item と同じ値・型の Card を返す。"""
+        trusted = Card.from_trusted_item(item)
+        validated = Card.from_dynamodb_item(item)
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.to_dynamodb_item() == validated.to_dynamodb_item()
+        assert type(trusted.interval) is int
+        assert type(trusted.ease_factor) is float
+
+    @pytest.mark.parametrize("item", [FULL_ITEM, MINIMAL_ITEM], ids=["full", "minimal"])
+    def test_card_response_json_matches_model_dump(self, item):
+        """card_response_json はキー順を含めて to_response().model_dump(mode="json") と一致する。"""
+        expected = Card.from_dynamodb_item(item).to_response().model_dump(mode="json")
+        actual = card_response_json(item)
+        assert actual == expected
+        assert list(actual) == list(expected)
+        assert json.dumps(actual, ensure_ascii=False) == json.dumps(expected, ensure_ascii=False)
+
+    @pytest.mark.parametrize("item", [FULL_ITEM, MINIMAL_ITEM], ids=["full", "minimal"])
+    def test_card_response_json_fields_subset(self, item):
+        """fields 指定時は全フィールド時と同じ値をそのフィールドだけ、CardResponse の順で返す。"""
+        full = card_response_json(item)
+        assert card_response_json(item, fields=list(full)) == full
+        projected = {name: item[name] for name in ("card_id", "next_review_at", "front") if name in item}
+        assert card_response_json(projected, fields={"next_review_at", "front", "card_id"}) == {
+            "card_id": full["card_id"],
+            "front": full["front"],
+            "next_review_at": full["next_review_at"],
+        }
+
+    def test_to_response_is_unchanged(self):
+        """to_response は検証済み CardResponse と同じ内容を返す。"""
+        card = Card.from_dynamodb_item(self.FULL_ITEM)
+        assert card.to_response() == CardResponse(**card.model_dump())
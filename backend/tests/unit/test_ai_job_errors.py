@@ -14,7 +14,14 @@ from services.ai_service import (
     AIServiceError,
     AITimeoutError,
 )
+from services.card_import import (
+    ImportFileNotFoundError,
+    ImportFileTooLargeError,
+    ImportFormatError,
+    ImportUnavailableError,
+)
 from services.card_service import CardNotFoundError
+from services.deck_service import DeckNotFoundError as CardDeckNotFoundError
 from services.tutor_ai_service import TutorAIServiceError, TutorAITimeoutError
 from services.tutor_errors import (
     ConcurrentSendError,
@@ -63,6 +70,12 @@ from services.url_generation_service import EmptyContentError
         (TutorAIServiceError("cfg"), 503, "ai_unavailable"),
         # カード系
         (CardNotFoundError("card"), 404, "not_found"),
+        # カードインポート系
+        (CardDeckNotFoundError("deck"), 404, "not_found"),
+        (ImportFileNotFoundError("missing"), 404, "not_found"),
+        (ImportFileTooLargeError("big"), 413, "payload_too_large"),
+        (ImportFormatError("bad"), 422, "validation_error"),
+        (ImportUnavailableError("off"), 503, "unavailable"),
         # 想定外
         (RuntimeError("boom"), 500, "internal"),
         (KeyError("job_type"), 500, "internal"),
@@ -27,11 +27,16 @@ from services.ai_job_errors import NoCardsGeneratedError, classify_ai_job_error
 from services.ai_job_executors import (
     EXECUTORS,
     HEAVY_JOB_TYPES,
+    PROGRESS_EXECUTORS,
     execute_advice,
+    execute_export_data,
     execute_generate,
     execute_generate_from_url,
     execute_grade_ai,
+    execute_import_cards,
+    execute_job,
     execute_refine,
+    execute_reset_deck_cards,
     execute_tutor_message,
     execute_tutor_start,
 )
@@ -422,7 +427,7 @@ class TestExecuteAdvice:
         study_stats / advice_info の全フィールド。"""
         user_cls, review_cls, factory = self._patches()
         with user_cls as mock_user_cls, review_cls as mock_review_cls, factory as mock_factory:
-            mock_user_cls.return_value.get_or_create_user.return_value.settings = {
+            mock_user_cls.return_value.get_settings.return_value = {
                 "timezone": "Asia/Tokyo"
             }
             mock_review_cls.return_value.get_review_summary.return_value = (
@@ -455,7 +460,7 @@ class TestExecuteAdvice:
         """旧 TC-062-AUTH-003/FLOW-001: ユーザー設定の timezone で集計する。"""
         user_cls, review_cls, factory = self._patches()
         with user_cls as mock_user_cls, review_cls as mock_review_cls, factory as mock_factory:
-            mock_user_cls.return_value.get_or_create_user.return_value.settings = {
+            mock_user_cls.return_value.get_settings.return_value = {
                 "timezone": "America/New_York"
             }
             mock_review_cls.return_value.get_review_summary.return_value = (
@@ -467,7 +472,7 @@ class TestExecuteAdvice:
 
             execute_advice("user-abc-123", dict(self.PAYLOAD))
 
-        mock_user_cls.return_value.get_or_create_user.assert_called_once_with(
+        mock_user_cls.return_value.get_settings.assert_called_once_with(
             "user-abc-123"
         )
         mock_review_cls.return_value.get_review_summary.assert_called_once_with(
@@ -478,7 +483,7 @@ class TestExecuteAdvice:
         """旧 TC-062-FLOW-002〜004: ReviewSummary が dict 化され language と共に渡る。"""
         user_cls, review_cls, factory = self._patches()
         with user_cls as mock_user_cls, review_cls as mock_review_cls, factory as mock_factory:
-            mock_user_cls.return_value.get_or_create_user.return_value.settings = {}
+            mock_user_cls.return_value.get_settings.return_value = {}
             summary = self._make_summary()
             mock_review_cls.return_value.get_review_summary.return_value = summary
             mock_service = MagicMock()
@@ -498,7 +503,7 @@ class TestExecuteAdvice:
         """旧 TC-062-DB-002: 全ゼロの ReviewSummary でも成功する。"""
         user_cls, review_cls, factory = self._patches()
         with user_cls as mock_user_cls, review_cls as mock_review_cls, factory as mock_factory:
-            mock_user_cls.return_value.get_or_create_user.return_value.settings = {}
+            mock_user_cls.return_value.get_settings.return_value = {}
             mock_review_cls.return_value.get_review_summary.return_value = ReviewSummary(
                 total_reviews=0,
                 average_grade=0.0,
@@ -518,7 +523,7 @@ class TestExecuteAdvice:
         """旧 TC-062-DB-001: 集計失敗は internal(500) として failed になる。"""
         user_cls, review_cls, factory = self._patches()
         with user_cls as mock_user_cls, review_cls as mock_review_cls, factory:
-            mock_user_cls.return_value.get_or_create_user.return_value.settings = {}
+            mock_user_cls.return_value.get_settings.return_value = {}
             mock_review_cls.return_value.get_review_summary.side_effect = Exception(
                 "DB connection error"
             )
@@ -533,7 +538,7 @@ class TestExecuteAdvice:
         """旧 TC-062-ERR-001〜005: AI 例外の旧ステータス分類を classify で引き継ぐ。"""
         user_cls, review_cls, factory = self._patches()
         with user_cls as mock_user_cls, review_cls as mock_review_cls, factory as mock_factory:
-            mock_user_cls.return_value.get_or_create_user.return_value.settings = {}
+            mock_user_cls.return_value.get_settings.return_value = {}
             mock_review_cls.return_value.get_review_summary.return_value = (
                 self._make_summary()
             )
@@ -838,6 +843,130 @@ class TestExecuteTutor:
         )
 
 
+# =============================================================================
+# execute_import_cards（POST /cards/import のジョブ本体）
+# =============================================================================
+
+
+class TestExecuteImportCards:
+    @patch("services.ai_job_executors.CardService")
+    @patch("services.ai_job_executors.ImportUploadStore")
+    def test_streams_upload_into_import_cards_and_deletes_it(self, mock_store_cls, mock_card_service_cls):
+        import io
+
+        from models.card_import import CardImportResult
+
+        body = io.BytesIO(b"Q1,A1\nQ2,A2\n")
+        mock_store = mock_store_cls.return_value
+        mock_store.open.return_value = body
+        seen_rows = []
+
+        def fake_import(user_id, rows, deck_id=None, tags=None, on_progress=None):
+            seen_rows.extend(rows)
+            on_progress({"processed_rows": 2})
+            return CardImportResult(total_rows=2, imported=2)
+
+        mock_card_service_cls.return_value.import_cards.side_effect = fake_import
+        progress = MagicMock()
+
+        result = execute_import_cards(
+            "u1",
+            {"upload_key": "imports/u1/x", "format": "csv", "deck_id": "d1", "tags": ["t"]},
+            progress,
+        )
+
+        assert result["imported"] == 2
+        assert [(r.front, r.back) for r in seen_rows] == [("Q1", "A1"), ("Q2", "A2")]
+        kwargs = mock_card_service_cls.return_value.import_cards.call_args.kwargs
+        assert kwargs["deck_id"] == "d1"
+        assert kwargs["tags"] == ["t"]
+        progress.assert_called_once_with({"processed_rows": 2})
+        mock_store.delete.assert_called_once_with("imports/u1/x")
+        assert body.closed
+
+    @patch("services.ai_job_executors.CardService")
+    @patch("services.ai_job_executors.ImportUploadStore")
+    def test_deletes_upload_even_when_import_fails(self, mock_store_cls, mock_card_service_cls):
+        import io
+
+        from services.card_import import ImportFormatError
+
+        mock_store_cls.return_value.open.return_value = io.BytesIO(b"")
+        mock_card_service_cls.return_value.import_cards.side_effect = ImportFormatError("bad")
+
+        with pytest.raises(ImportFormatError):
+            execute_import_cards("u1", {"upload_key": "imports/u1/x", "format": "csv"}, MagicMock())
+
+        mock_store_cls.return_value.delete.assert_called_once_with("imports/u1/x")
+        assert classify_ai_job_error(ImportFormatError("bad")).status == 422
+
+
+# =============================================================================
+# execute_export_data（POST /exports のジョブ本体）
+# =============================================================================
+
+
+class TestExecuteExportData:
+    @patch("services.ai_job_executors.DataExporter")
+    def test_returns_export_result(self, mock_exporter_cls):
+        mock_exporter_cls.return_value.export.return_value = {
+            "download_url": "https://example.com/x",
+            "expires_in": 3600,
+            "object_key": "exports/u1/x.ndjson.gz",
+            "size_bytes": 10,
+            "counts": {"decks": 1, "cards": 2, "reviews": 3},
+            "exported_at": "2026-01-01T00:00:00+00:00",
+        }
+        progress = MagicMock()
+
+        result = execute_export_data("u1", {}, progress)
+
+        mock_exporter_cls.return_value.export.assert_called_once_with("u1", on_progress=progress)
+        assert result["download_url"] == "https://example.com/x"
+        assert result["counts"] == {"decks": 1, "cards": 2, "reviews": 3}
+
+    def test_unavailable_export_maps_to_503(self):
+        from services.data_export import ExportUnavailableError
+
+        assert classify_ai_job_error(ExportUnavailableError("x")).status == 503
+
+
+# =============================================================================
+# execute_reset_deck_cards（大きなデッキ削除後のカード deck_id リセット）
+# =============================================================================
+
+
+class TestExecuteResetDeckCards:
+    @patch("services.ai_job_executors.DeckService")
+    def test_resumes_with_previous_progress_as_checkpoint(self, mock_deck_service_cls):
+        mock_deck_service_cls.return_value.reset_deck_cards.return_value = {
+            "reset_cards": 3,
+            "skipped_cards": 0,
+            "failed_cards": 0,
+        }
+        progress = MagicMock()
+        job = {
+            "job_type": "reset_deck_cards",
+            "user_id": "u1",
+            "payload": {"deck_id": "deck-1"},
+            "progress": {"reset_cards": 1},
+        }
+
+        result = execute_job(job, on_progress=progress)
+
+        assert result["reset_cards"] == 3
+        mock_deck_service_cls.return_value.reset_deck_cards.assert_called_once_with(
+            "u1", "deck-1", on_progress=progress, checkpoint={"reset_cards": 1}
+        )
+
+    @patch("services.ai_job_executors.DeckService")
+    def test_first_run_has_no_checkpoint(self, mock_deck_service_cls):
+        execute_reset_deck_cards("u1", {"deck_id": "deck-1"}, MagicMock())
+
+        kwargs = mock_deck_service_cls.return_value.reset_deck_cards.call_args.kwargs
+        assert kwargs["checkpoint"] is None
+
+
 # =============================================================================
 # ディスパッチテーブル
 # =============================================================================
@@ -857,8 +986,18 @@ class TestExecutorRegistry:
             "tutor_message",
         }
 
-    def test_generate_from_url_is_heavy(self):
-        assert HEAVY_JOB_TYPES == frozenset({"generate_from_url"})
+    def test_heavy_job_types(self):
+        assert HEAVY_JOB_TYPES == frozenset(
+            {"generate_from_url", "import_cards", "export_data", "reset_deck_cards"}
+        )
+
+    def test_import_cards_receives_progress_callback(self):
+        assert set(PROGRESS_EXECUTORS.keys()) == {"import_cards", "export_data", "reset_deck_cards"}
+        job = {"job_type": "import_cards", "user_id": "u1", "payload": {"upload_key": "k"}}
+        progress = MagicMock()
+        with patch.dict(PROGRESS_EXECUTORS, {"import_cards": MagicMock(return_value={"imported": 1})}):
+            assert execute_job(job, on_progress=progress) == {"imported": 1}
+            PROGRESS_EXECUTORS["import_cards"].assert_called_once_with("u1", {"upload_key": "k"}, progress)
 
     def test_all_executors_are_callable(self):
         for executor in EXECUTORS.values():
@@ -154,6 +154,40 @@ class TestRunJobInline:
         assert stored["status"] == "processing"  # queued に戻さない・failed にもしない
 
 
+    def test_progress_callback_records_on_job(self, store):
+        job = store.create_job("user-1", "import_cards", {})
+        seen = {}
+
+        def fake_execute(job_record, on_progress=None):
+            on_progress({"processed_rows": 500})
+            seen.update(store.get_job(job_record["job_id"]))
+            return {"imported": 500}
+
+        with patch.object(svc, "execute_job", side_effect=fake_execute):
+            svc.run_job_inline(store, job["job_id"])
+
+        assert seen["progress"] == {"processed_rows": 500}
+        stored = store.get_job(job["job_id"])
+        assert stored["status"] == "completed"
+        assert stored["result"] == {"imported": 500}
+
+    def test_progress_failure_does_not_fail_job(self, store):
+        job = store.create_job("user-1", "import_cards", {})
+
+        def fake_execute(job_record, on_progress=None):
+            on_progress({"processed_rows": 1})
+            return {"imported": 1}
+
+        with patch.object(svc, "execute_job", side_effect=fake_execute), patch.object(
+            store, "update_progress", side_effect=ClientError(
+                {"Error": {"Code": "InternalServerError", "Message": "boom"}}, "UpdateItem"
+            )
+        ):
+            svc.run_job_inline(store, job["job_id"])
+
+        assert store.get_job(job["job_id"])["status"] == "completed"
+
+
 class TestRecordResultWithRetry:
     def test_retries_then_succeeds(self, store, monkeypatch):
         monkeypatch.setattr(svc, "RECORD_RESULT_BACKOFF_SECONDS", 0)
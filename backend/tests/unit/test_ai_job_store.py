@@ -156,3 +156,25 @@ class TestCompleteAndFail:
         assert fetched["error"]["status"] == 504
         assert fetched["error"]["code"] == "ai_timeout"
         assert "result" not in fetched
+
+
+class TestUpdateProgress:
+    def test_records_progress_while_processing(self, store):
+        job = store.create_job("user-1", "import_cards", {})
+        claimed = store.claim(job["job_id"])
+        store.update_progress(job["job_id"], {"processed_rows": 500, "imported": 480})
+
+        fetched = store.get_job(job["job_id"])
+        assert fetched["status"] == "processing"
+        assert fetched["progress"] == {"processed_rows": 500, "imported": 480}
+        # updated_at が進むため、長いジョブが stale 扱いで再 claim されない。
+        assert fetched["updated_at"] >= claimed["updated_at"]
+
+    def test_ignored_after_completion(self, store):
+        job = store.create_job("user-1", "import_cards", {})
+        store.claim(job["job_id"])
+        store.complete(job["job_id"], {"imported": 1})
+
+        store.update_progress(job["job_id"], {"processed_rows": 1})
+
+        assert "progress" not in store.get_job(job["job_id"])
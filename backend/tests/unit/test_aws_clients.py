@@ -0,0 +1,73 @@
+"""Unit tests for utils/aws_clients.py (process-wide AWS client registry)."""
+
+import threading
+from unittest.mock import MagicMock
+
+from botocore.config import Config
+
+from utils import aws_clients
+from utils.dynamodb_client import get_dynamodb_client, get_dynamodb_resource
+
+
+class TestGetClient:
+    def test_returns_same_client_per_service_and_endpoint(self):
+        first = aws_clients.get_client("sqs")
+        assert aws_clients.get_client("sqs") is first
+        assert aws_clients.get_client("sqs", endpoint_url="http://elasticmq:9324") is not first
+
+    def test_applies_tuned_default_config(self):
+        config = aws_clients.get_client("dynamodb").meta.config
+        assert config.max_pool_connections == aws_clients.DEFAULT_CONFIG.max_pool_connections
+        assert config.tcp_keepalive is True
+        assert config.retries["mode"] == "adaptive"
+
+    def test_profile_separates_merged_config(self):
+        tuned = aws_clients.get_client(
+            "bedrock-runtime", config=Config(read_timeout=120, retries={"max_attempts": 0}), profile="bedrock-generate"
+        )
+        assert tuned is not aws_clients.get_client("bedrock-runtime")
+        assert tuned.meta.config.read_timeout == 120
+        assert tuned.meta.config.tcp_keepalive is True
+
+    def test_shared_across_threads(self):
+        seen = []
+        threads = [threading.Thread(target=lambda: seen.append(get_dynamodb_client())) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(client is seen[0] for client in seen)
+
+    def test_reset_discards_cached_clients(self):
+        first = aws_clients.get_client("sqs")
+        session = aws_clients.get_session()
+        aws_clients.reset()
+        assert aws_clients.get_client("sqs") is not first
+        assert aws_clients.get_session() is session
+
+    def test_reset_session(self):
+        session = aws_clients.get_session()
+        aws_clients.reset(session=True)
+        assert aws_clients.get_session() is not session
+
+
+class TestGetResource:
+    def test_shared_within_thread(self):
+        assert get_dynamodb_resource() is get_dynamodb_resource()
+
+    def test_separate_per_thread(self):
+        main = get_dynamodb_resource()
+        other = []
+        thread = threading.Thread(target=lambda: other.append(get_dynamodb_resource()))
+        thread.start()
+        thread.join()
+        assert other[0] is not main
+
+    def test_reset_discards_thread_local_resources(self):
+        first = get_dynamodb_resource()
+        aws_clients.reset()
+        assert get_dynamodb_resource() is not first
+
+    def test_injected_resource_is_returned_as_is(self):
+        injected = MagicMock()
+        assert get_dynamodb_resource(injected) is injected
@@ -261,7 +261,7 @@ class TestDynamoDbResourceFactory:
         from unittest.mock import patch as _patch
 
         with _patch(
-            "utils.dynamodb_client.boto3.resource"
+            "utils.dynamodb_client.get_resource"
         ) as mock_resource, _patch.dict(
             "os.environ", {"DYNAMODB_ENDPOINT_URL": "http://localhost:8000"}
         ):
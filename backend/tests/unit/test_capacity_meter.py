@@ -0,0 +1,211 @@
+"""Unit tests for utils/capacity_meter.py (per-request DynamoDB capacity accounting)."""
+
+import json
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from utils.capacity_meter import CapacityMeter, capacity_meter, capacity_scope, instrument_client
+
+REGION = "ap-northeast-1"
+
+
+@pytest.fixture
+def table():
+    with mock_aws():
+        resource = boto3.resource("dynamodb", region_name=REGION)
+        resource.create_table(
+            TableName="memoru-cards-test",
+            KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}, {"AttributeName": "card_id", "KeyType": "RANGE"}],
+            AttributeDefinitions=[
+                {"AttributeName": "user_id", "AttributeType": "S"},
+                {"AttributeName": "card_id", "AttributeType": "S"},
+                {"AttributeName": "deck_id", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": "deck-cards-index",
+                    "KeySchema": [{"AttributeName": "deck_id", "KeyType": "HASH"}],
+                    "Projection": {"ProjectionType": "KEYS_ONLY"},
+                }
+            ],
+        )
+        instrument_client(resource.meta.client)
+        yield resource.Table("memoru-cards-test")
+
+
+@pytest.fixture
+def meter():
+    capacity_meter.begin()
+    yield capacity_meter
+    capacity_meter.end()
+
+
+def _spy_params(table):
+    """送信パラメータを記録する（計測ハンドラーの後段で観測する）。"""
+    seen = []
+    table.meta.client.meta.events.register(
+        "before-call.dynamodb", lambda params, **kwargs: seen.append(json.loads(params["body"]))
+    )
+    return seen
+
+
+class TestCapacityMeter:
+    def test_records_indexes_breakdown(self):
+        meter = CapacityMeter()
+        meter.begin()
+        meter.record_capacity(
+            "Query",
+            {
+                "TableName": "cards",
+                "CapacityUnits": 2.5,
+                "Table": {"ReadCapacityUnits": 0.5, "CapacityUnits": 0.5},
+                "GlobalSecondaryIndexes": {"deck-cards-index": {"ReadCapacityUnits": 2.0, "CapacityUnits": 2.0}},
+            },
+        )
+        by_table = {(e["table"], e["index"]): e for e in meter.end()["by_table"]}
+        assert by_table[("cards", None)]["read_units"] == 0.5
+        assert by_table[("cards", "deck-cards-index")]["read_units"] == 2.0
+
+    def test_capacity_units_only_is_split_by_operation(self):
+        meter = CapacityMeter()
+        meter.begin()
+        meter.record_capacity("GetItem", {"TableName": "users", "CapacityUnits": 0.5})
+        meter.record_capacity("TransactWriteItems", [{"TableName": "cards", "CapacityUnits": 2.0}, {"TableName": "users", "CapacityUnits": 2.0}])
+        summary = meter.end()
+        assert summary["read_units"] == 0.5
+        assert summary["write_units"] == 4.0
+
+    def test_inactive_meter_records_nothing(self):
+        meter = CapacityMeter()
+        meter.record_call("GetItem", [("users", None)], 1.0)
+        meter.record_capacity("GetItem", {"TableName": "users", "CapacityUnits": 0.5})
+        meter.begin()
+        assert meter.summary() == {
+            "calls": 0,
+            "items_read": 0,
+            "latency_ms": 0.0,
+            "read_units": 0,
+            "write_units": 0,
+            "by_table": [],
+        }
+
+
+class TestInstrumentedClient:
+    def test_counts_calls_per_table_and_index(self, table, meter):
+        params = _spy_params(table)
+        table.put_item(Item={"user_id": "u1", "card_id": "c1", "deck_id": "d1"})
+        table.get_item(Key={"user_id": "u1", "card_id": "c1"})
+        table.query(
+            IndexName="deck-cards-index",
+            KeyConditionExpression="deck_id = :d",
+            ExpressionAttributeValues={":d": "d1"},
+        )
+
+        summary = meter.summary()
+        by_table = {(e["table"], e["index"]): e for e in summary["by_table"]}
+        assert summary["calls"] == 3
+        assert by_table[("memoru-cards-test", None)]["calls"] == 2
+        assert by_table[("memoru-cards-test", "deck-cards-index")]["calls"] == 1
+        assert by_table[("memoru-cards-test", None)]["items_read"] == 1
+        assert by_table[("memoru-cards-test", "deck-cards-index")]["items_read"] == 1
+        assert all(p["ReturnConsumedCapacity"] == "INDEXES" for p in params)
+
+    def test_count_query_reports_scanned_items(self, table, meter):
+        for i in range(3):
+            table.put_item(Item={"user_id": "u1", "card_id": f"c{i}"})
+        table.query(
+            KeyConditionExpression="user_id = :u",
+            ExpressionAttributeValues={":u": "u1"},
+            Select="COUNT",
+        )
+        assert meter.summary()["items_read"] == 3
+
+    def test_no_return_consumed_capacity_outside_scope(self, table):
+        params = _spy_params(table)
+        table.get_item(Key={"user_id": "u1", "card_id": "c1"})
+        assert "ReturnConsumedCapacity" not in params[0]
+
+    def test_instrument_is_idempotent(self, table, meter):
+        instrument_client(table.meta.client)
+        table.get_item(Key={"user_id": "u1", "card_id": "c1"})
+        assert meter.summary()["calls"] == 1
+
+
+class TestCapacityScope:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("DYNAMODB_CAPACITY_METRICS_ENABLED", raising=False)
+        with capacity_scope("GET /stats") as scope:
+            assert not capacity_meter.active
+        assert scope.summary is None
+
+    def test_emits_on_close_and_does_not_nest(self, monkeypatch):
+        monkeypatch.setenv("DYNAMODB_CAPACITY_METRICS_ENABLED", "true")
+        with patch("utils.capacity_meter.emit") as mock_emit:
+            with capacity_scope("GET /cards") as outer:
+                outer.route = "POST /cards/import"
+                with capacity_scope("job:import_cards") as inner:
+                    capacity_meter.record_call("PutItem", [("memoru-cards-test", None)], 3.0)
+                assert not inner.owner
+                assert capacity_meter.active
+        mock_emit.assert_called_once()
+        route, summary = mock_emit.call_args.args
+        assert route == "POST /cards/import"
+        assert summary["calls"] == 1
+        assert not capacity_meter.active
+
+    def test_emit_writes_emf_metrics(self, capsys):
+        from utils.capacity_meter import emit
+
+        emit(
+            "GET /stats",
+            {
+                "calls": 1,
+                "items_read": 2,
+                "latency_ms": 4.0,
+                "read_units": 1.5,
+                "write_units": 0.0,
+                "by_table": [
+                    {"table": "cards", "index": None, "read_units": 1.5, "write_units": 0.0, "calls": 1, "items_read": 2, "latency_ms": 4.0},
+                    {"table": "cards", "index": "due-index", "read_units": 0.5, "write_units": 0.0, "calls": 1, "items_read": 3, "latency_ms": 2.0},
+                ],
+            },
+        )
+        out = capsys.readouterr().out
+        metrics = [json.loads(line) for line in out.splitlines() if '"_aws"' in line]
+        # テーブル / インデックス（次元セット）ごとに 1 ドキュメントで 5 メトリクスを載せる。
+        assert len(metrics) == 2
+        read = metrics[0]
+        assert read["ConsumedReadCapacity"] == [1.5]
+        assert read["DynamoDBItemsRead"] == [2.0]
+        assert read["DynamoDBLatency"] == [4.0]
+        assert len(read["_aws"]["CloudWatchMetrics"][0]["Metrics"]) == 5
+        assert read["Route"] == "GET /stats"
+        assert read["Table"] == "cards"
+        assert read["Index"] == "-"
+        assert metrics[1]["Index"] == "due-index"
+        assert metrics[1]["DynamoDBItemsRead"] == [3.0]
+
+
+class TestHandlerRoute:
+    def test_route_dimension_uses_matched_route(self, api_gateway_event, lambda_context, monkeypatch):
+        from api import handler as api_handler
+
+        monkeypatch.setenv("DYNAMODB_CAPACITY_METRICS_ENABLED", "true")
+
+        def get_or_create_user(user_id):
+            capacity_meter.record_call("GetItem", [("memoru-users-test", None)], 1.0)
+            raise RuntimeError("boom")
+
+        with patch("api.handlers.user_handler.user_service") as mock_service, patch(
+            "utils.capacity_meter.emit"
+        ) as mock_emit:
+            mock_service.get_or_create_user.side_effect = get_or_create_user
+            with pytest.raises(RuntimeError):
+                api_handler.handler(api_gateway_event(path="/users/me"), lambda_context)
+
+        assert mock_emit.call_args.args[0] == "GET /users/me"
+        assert not capacity_meter.active
@@ -0,0 +1,139 @@
+"""Unit tests for services/card_import.py (parsers and upload storage)."""
+
+import io
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from services import card_import
+from services.card_import import (
+    ImportFileNotFoundError,
+    ImportFileTooLargeError,
+    ImportFormatError,
+    ImportUnavailableError,
+    ImportUploadStore,
+    iter_text_lines,
+    parse_import_rows,
+)
+
+BUCKET = "memoru-import-test"
+
+
+def _rows(text: str, fmt: str):
+    stream = io.BytesIO(text.encode("utf-8"))
+    return list(parse_import_rows(iter_text_lines(stream), fmt))
+
+
+class TestIterTextLines:
+    def test_joins_lines_split_across_chunks(self, monkeypatch):
+        monkeypatch.setattr(card_import, "READ_CHUNK_BYTES", 3)
+        text = "あいう,え\r\nおか,き\nlast"
+        lines = list(iter_text_lines(io.BytesIO(text.encode("utf-8"))))
+        assert lines == ["あいう,え\r\n", "おか,き\n", "last"]
+
+    def test_strips_bom(self):
+        lines = list(iter_text_lines(io.BytesIO("﻿front,back\n".encode("utf-8"))))
+        assert lines == ["front,back\n"]
+
+    def test_rejects_non_utf8(self):
+        with pytest.raises(ImportFormatError):
+            list(iter_text_lines(io.BytesIO("日本語".encode("shift_jis"))))
+
+
+class TestParseDelimited:
+    def test_csv_without_header(self):
+        rows = _rows('Q1,A1,tag1 tag2\n"Q, 2","A\n2"\n\nQ3\n', "csv")
+        assert [(r.front, r.back, r.tags) for r in rows] == [
+            ("Q1", "A1", ["tag1", "tag2"]),
+            ("Q, 2", "A\n2", []),
+            ("Q3", "", []),
+        ]
+        assert [r.line for r in rows] == [1, 2, 5]
+
+    def test_csv_header_maps_columns_by_name(self):
+        rows = _rows("Tags,Back,Front\nt1,A1,Q1\n", "csv")
+        assert (rows[0].front, rows[0].back, rows[0].tags) == ("Q1", "A1", ["t1"])
+
+    def test_tsv(self):
+        rows = _rows("Q1\tA, with comma\ta,b\n", "tsv")
+        assert (rows[0].front, rows[0].back, rows[0].tags) == ("Q1", "A, with comma", ["a", "b"])
+
+    def test_unknown_format(self):
+        with pytest.raises(ImportFormatError):
+            _rows("Q,A\n", "xlsx")
+
+
+class TestParseAnki:
+    def test_headers_html_and_tags_column(self):
+        text = (
+            "#separator:tab\n"
+            "#html:true\n"
+            "#guid column:1\n"
+            "#tags column:4\n"
+            "abc\t<b>犬</b>\tdog<br>いぬ &amp; ワン\tanimal jlpt\n"
+        )
+        rows = _rows(text, "anki")
+        assert len(rows) == 1
+        assert rows[0].front == "犬"
+        assert rows[0].back == "dog\nいぬ & ワン"
+        assert rows[0].tags == ["animal", "jlpt"]
+        assert rows[0].line == 5
+
+    def test_named_separator_and_plain_text(self):
+        rows = _rows("#separator:semicolon\n#html:false\n<Q>;A\n", "anki")
+        assert (rows[0].front, rows[0].back) == ("<Q>", "A")
+
+    def test_defaults_without_headers(self):
+        rows = _rows("Q1\tA1\n", "anki")
+        assert (rows[0].front, rows[0].back) == ("Q1", "A1")
+
+    def test_invalid_column_header(self):
+        with pytest.raises(ImportFormatError):
+            _rows("#tags column:x\nQ\tA\n", "anki")
+
+
+@pytest.fixture
+def upload_store():
+    with mock_aws():
+        s3 = boto3.client("s3", region_name="ap-northeast-1")
+        s3.create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": "ap-northeast-1"},
+        )
+        yield ImportUploadStore(bucket_name=BUCKET, s3_client=s3)
+
+
+class TestImportUploadStore:
+    def test_upload_url_is_scoped_to_user(self, upload_store):
+        upload = upload_store.create_upload_url("user-1")
+
+        assert upload["upload_key"].startswith("imports/user-1/")
+        assert BUCKET in upload["upload_url"]
+        assert upload["expires_in"] == card_import.UPLOAD_URL_EXPIRES_SECONDS
+        assert upload_store.owns_key("user-1", upload["upload_key"])
+        assert not upload_store.owns_key("user-2", upload["upload_key"])
+        assert not upload_store.owns_key("user-1", "imports/user-1/../user-2/x")
+
+    def test_open_and_delete(self, upload_store):
+        upload_store.client.put_object(Bucket=BUCKET, Key="imports/u/f", Body=b"Q,A\n")
+
+        body = upload_store.open("imports/u/f")
+        assert body.read() == b"Q,A\n"
+
+        upload_store.delete("imports/u/f")
+        with pytest.raises(ImportFileNotFoundError):
+            upload_store.open("imports/u/f")
+
+    def test_open_rejects_large_file(self, upload_store, monkeypatch):
+        monkeypatch.setattr(card_import, "MAX_IMPORT_BYTES", 3)
+        upload_store.client.put_object(Bucket=BUCKET, Key="imports/u/big", Body=b"Q,A\n")
+        with pytest.raises(ImportFileTooLargeError):
+            upload_store.open("imports/u/big")
+
+    def test_disabled_without_bucket(self):
+        store = ImportUploadStore(bucket_name="")
+        assert not store.enabled
+        with pytest.raises(ImportUnavailableError):
+            store.create_upload_url("user-1")
+        store.delete("imports/user-1/x")  # no-op
@@ -0,0 +1,204 @@
+"""Unit tests for card search tokenization, postings and stream handling."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from boto3.dynamodb.types import TypeSerializer
+from botocore.exceptions import ClientError
+
+from services.card_repository import CardServiceError
+from services.card_search_index import (
+    MAX_QUERY_LENGTH,
+    CardSearchIndex,
+    CardSearchUnavailableError,
+    _update_requests,
+    card_postings,
+    changes_for_cards,
+    changes_from_stream_records,
+    normalize_text,
+    query_terms,
+    tokenize,
+)
+
+
+class TestNormalizeText:
+    def test_full_width_and_case_are_folded(self):
+        assert normalize_text("ＡＢＣ１２３") == "abc123"
+        assert normalize_text("ｶﾀｶﾅ") == "カタカナ"
+
+
+class TestTokenize:
+    def test_cjk_run_uses_bigrams_and_unigrams(self):
+        assert tokenize("光合成") == {"光合", "合成", "光", "合", "成"}
+
+    def test_word_run_uses_trigrams_and_shorter_grams(self):
+        assert tokenize("Cell") == {"cel", "ell", "ce", "el", "ll", "c", "e", "l"}
+
+    def test_mixed_text_splits_on_script_and_symbols(self):
+        tokens = tokenize("DNA複製 (replication)")
+        assert {"dna", "複製", "rep", "ion"} <= tokens
+        assert not any(" " in t or "(" in t for t in tokens)
+
+    def test_whole_field_is_indexed(self):
+        text = "あいうえお" * 100 + "光合成"
+        assert {"光合", "合成"} <= tokenize(text)
+
+    def test_empty_text(self):
+        assert tokenize("") == set()
+
+
+class TestQueryTerms:
+    def test_long_runs_become_ngrams(self):
+        assert query_terms("光合成") == ["光合", "合成"]
+
+    def test_short_runs_are_looked_up_as_is(self):
+        assert query_terms("光 ab") == ["光", "ab"]
+        assert set(query_terms("光 ab")) <= tokenize("光合成 abc")
+
+    def test_query_is_truncated(self):
+        assert query_terms("a" * (MAX_QUERY_LENGTH + 50)) == ["aaa"]
+
+
+def _record(event_name, new=None, old=None, keys=None):
+    serializer = TypeSerializer()
+    image = new or old
+    keys = keys or {"user_id": image["user_id"], "card_id": image["card_id"]}
+    change = {"Keys": {k: serializer.serialize(v) for k, v in keys.items()}}
+    if new is not None:
+        change["NewImage"] = {k: serializer.serialize(v) for k, v in new.items()}
+    if old is not None:
+        change["OldImage"] = {k: serializer.serialize(v) for k, v in old.items()}
+    return {"eventName": event_name, "dynamodb": change}
+
+
+CARD = {"user_id": "u1", "card_id": "c1", "front": "光合成", "back": "Cell", "deck_id": "d1", "tags": ["Bio", "ＢＩＯ"]}
+
+
+class TestCardPostings:
+    def test_front_back_and_filters(self):
+        postings = card_postings(CARD)
+        assert ("光合", "f") in postings
+        assert ("cel", "b") in postings
+        assert ("deck:d1", "c") in postings
+        assert {p for p in postings if p[0].startswith("tag:")} == {("tag:bio", "c")}
+
+    def test_non_card_item_has_no_postings(self):
+        assert card_postings({"user_id": "u1", "card_id": "c1", "deleted_at": "2026-01-01"}) == set()
+
+
+class TestChangesFromStreamRecords:
+    def test_insert_adds_card_to_every_posting(self):
+        changes = changes_from_stream_records([_record("INSERT", new=CARD)])
+        assert changes["u1#光合"] == {"f": ({"c1"}, set())}
+        assert changes["u1#deck:d1"] == {"c": ({"c1"}, set())}
+        assert changes == changes_for_cards([CARD])
+
+    def test_modify_writes_only_the_token_diff(self):
+        edited = {**CARD, "front": "光合作用"}
+        changes = changes_from_stream_records([_record("MODIFY", new=edited, old=CARD)])
+        assert changes["u1#作用"] == {"f": ({"c1"}, set())}
+        assert changes["u1#成"] == {"f": (set(), {"c1"})}
+        assert "u1#光合" not in changes
+        assert "u1#cel" not in changes
+
+    def test_records_collapse_to_first_old_and_last_new(self):
+        edited = {**CARD, "front": "葉緑体"}
+        assert changes_from_stream_records(
+            [_record("INSERT", new=CARD), _record("MODIFY", new=edited, old=CARD)]
+        ) == changes_for_cards([edited])
+        assert changes_from_stream_records([_record("INSERT", new=CARD), _record("REMOVE", old=CARD)]) == {}
+
+    def test_remove_deletes_card_from_postings(self):
+        changes = changes_from_stream_records([_record("REMOVE", old=CARD)])
+        assert changes["u1#光合"] == {"f": (set(), {"c1"})}
+        assert all(not added for attrs in changes.values() for added, _ in attrs.values())
+
+    def test_review_only_modify_is_skipped(self):
+        reviewed = {**CARD, "interval": 3, "next_review_at": "2026-01-01T00:00:00+00:00"}
+        assert changes_from_stream_records([_record("MODIFY", new=reviewed, old=CARD)]) == {}
+
+    def test_tombstone_partition_is_skipped(self):
+        tombstone = {"user_id": "u1#deleted", "card_id": "c1", "deleted_at": "2026-01-01"}
+        assert changes_from_stream_records([_record("INSERT", new=tombstone), _record("REMOVE", old=tombstone)]) == {}
+
+
+class TestApplyChanges:
+    def test_add_and_delete_on_same_attribute_are_split(self):
+        requests = _update_requests("u1#光合", {"f": ({"c2"}, {"c1"}), "b": (set(), {"c3"})})
+        assert [r["UpdateExpression"] for r in requests] == ["ADD f :af DELETE b :db", "DELETE f :df"]
+        assert requests[1]["ExpressionAttributeValues"] == {":df": {"c1"}}
+
+    def test_one_update_per_posting(self):
+        dynamodb = MagicMock()
+        index = CardSearchIndex(table_name="t", dynamodb_resource=dynamodb)
+
+        updates = index.apply_changes(changes_for_cards([CARD, {**CARD, "card_id": "c2"}]))
+
+        client = dynamodb.meta.client
+        assert updates == client.update_item.call_count == len(changes_for_cards([CARD]))
+        assert {c.kwargs["TableName"] for c in client.update_item.call_args_list} == {"t"}
+
+    def test_client_error_is_raised_for_batch_retry(self):
+        dynamodb = MagicMock()
+        dynamodb.meta.client.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "x"}}, "UpdateItem"
+        )
+        index = CardSearchIndex(table_name="t", dynamodb_resource=dynamodb)
+
+        with pytest.raises(CardServiceError):
+            index.apply_changes(changes_for_cards([CARD]))
+
+
+class TestLookup:
+    def test_reads_only_term_and_filter_postings(self):
+        dynamodb = MagicMock()
+        dynamodb.batch_get_item.return_value = {
+            "Responses": {
+                "t": [
+                    {"pk": "u1#光合", "f": {"c1", "c2"}, "b": {"c3"}},
+                    {"pk": "u1#deck:d1", "c": {"c1", "c3"}},
+                ]
+            }
+        }
+        index = CardSearchIndex(table_name="t", dynamodb_resource=dynamodb)
+
+        results = index.lookup("u1", ["光合", "合成"], deck_id="d1")
+
+        assert results == [({"c1"}, {"c3"}), (set(), set())]
+        keys = dynamodb.batch_get_item.call_args.kwargs["RequestItems"]["t"]["Keys"]
+        assert keys == [{"pk": "u1#光合"}, {"pk": "u1#合成"}, {"pk": "u1#deck:d1"}]
+
+    def test_retries_unprocessed_keys_with_backoff_then_fails(self):
+        dynamodb = MagicMock()
+        dynamodb.batch_get_item.return_value = {"UnprocessedKeys": {"t": {"Keys": [{"pk": "u1#光合"}]}}}
+        index = CardSearchIndex(table_name="t", dynamodb_resource=dynamodb)
+
+        with patch("services.card_search_index.time.sleep") as sleep:
+            with pytest.raises(CardServiceError):
+                index.lookup("u1", ["光合"])
+
+        assert dynamodb.batch_get_item.call_count == 6
+        assert [c.args[0] for c in sleep.call_args_list] == [0.05, 0.1, 0.2, 0.4, 0.8]
+
+    def test_disabled_index_is_unavailable(self):
+        with pytest.raises(CardSearchUnavailableError):
+            CardSearchIndex(table_name="").lookup("u1", ["光合"])
+
+
+class TestStreamHandler:
+    def test_handler_applies_changed_cards_once_per_batch(self, lambda_context):
+        from jobs import card_search_index_handler
+
+        records = [
+            _record("INSERT", new=CARD),
+            _record("MODIFY", new={**CARD, "interval": 2}, old=CARD),
+            _record("REMOVE", old={**CARD, "card_id": "c2"}),
+        ]
+        with patch.object(card_search_index_handler, "search_index") as index:
+            index.apply_changes.return_value = 7
+            result = card_search_index_handler.handler({"Records": records}, lambda_context)
+
+        index.apply_changes.assert_called_once()
+        changes = index.apply_changes.call_args.args[0]
+        assert changes["u1#光合"] == {"f": ({"c1"}, {"c2"})}
+        assert result == {"records": 3, "postings": len(changes), "updates": 7}
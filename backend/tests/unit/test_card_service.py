@@ -1,5 +1,7 @@
 """Unit tests for card service."""
 
+import time
+
 import pytest
 from moto import mock_aws
 import boto3
@@ -12,6 +14,7 @@ from services.card_service import (
     CardServiceError,
 )
 from models.card import Reference
+from services.card_import import ImportRow
 
 
 @pytest.fixture
@@ -32,6 +35,8 @@ def dynamodb_table():
                 {"AttributeName": "card_id", "AttributeType": "S"},
                 {"AttributeName": "next_review_at", "AttributeType": "S"},
                 {"AttributeName": "reference_url_key", "AttributeType": "S"},
+                {"AttributeName": "deck_index_key", "AttributeType": "S"},
+                {"AttributeName": "updated_at", "AttributeType": "S"},
             ],
             GlobalSecondaryIndexes=[
                 {
@@ -42,6 +47,15 @@ def dynamodb_table():
                     ],
                     "Projection": {"ProjectionType": "ALL"},
                 },
+                {
+                    # デッキ別一覧 (list_cards の deck_id 指定) 用の GSI。
+                    "IndexName": "deck-cards-index",
+                    "KeySchema": [
+                        {"AttributeName": "deck_index_key", "KeyType": "HASH"},
+                        {"AttributeName": "next_review_at", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "KEYS_ONLY"},
+                },
                 {
                     # M-13: URL 重複検出を Query 化するための GSI。
                     "IndexName": "reference-url-index",
@@ -50,6 +64,15 @@ def dynamodb_table():
                     ],
                     "Projection": {"ProjectionType": "ALL"},
                 },
+                {
+                    # 差分同期 (GET /cards/changes) 用のスパース GSI。
+                    "IndexName": "user_id-updated_at-index",
+                    "KeySchema": [
+                        {"AttributeName": "user_id", "KeyType": "HASH"},
+                        {"AttributeName": "updated_at", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                },
             ],
             BillingMode="PAY_PER_REQUEST",
         )
@@ -582,88 +605,155 @@ class TestCardServiceList:
         for card in cards:
             assert card.deck_id == "deck-1"
 
-    def test_list_cards_by_deck_continues_past_empty_filtered_page(
+    def test_list_cards_by_deck_uses_gsi_without_filter(
         self, card_service, monkeypatch
     ):
-        """Deck filtering continues when DynamoDB filters every item on a page."""
-        matching_item = {
-            "user_id": "test-user-id",
-            "card_id": "matching-card",
-            "front": "Q",
-            "back": "A",
-            "deck_id": "deck-1",
-            "ease_factor": "2.5",
-            "interval": 0,
-            "repetitions": 0,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-        }
+        """deck_id 指定時は deck-cards-index を FilterExpression なしで 1 回だけ Query する."""
+        for i in range(3):
+            card_service.create_card(
+                user_id="test-user-id",
+                front=f"Q{i}",
+                back=f"A{i}",
+                deck_id="deck-1",
+            )
+        for i in range(5):
+            card_service.create_card(
+                user_id="test-user-id",
+                front=f"Other{i}",
+                back=f"Other{i}",
+                deck_id="deck-2",
+            )
+
         calls = []
+        original_query = card_service._repo.table.query
 
         def query(**kwargs):
             calls.append(kwargs.copy())
-            if len(calls) == 1:
-                return {
-                    "Items": [],
-                    "LastEvaluatedKey": {
-                        "user_id": "test-user-id",
-                        "card_id": "non-matching-card",
-                    },
-                }
-            return {"Items": [matching_item]}
+            return original_query(**kwargs)
 
         monkeypatch.setattr(card_service._repo.table, "query", query)
 
         cards, cursor = card_service.list_cards(
-            "test-user-id", limit=1, deck_id="deck-1"
+            "test-user-id", limit=10, deck_id="deck-1"
         )
 
-        assert [card.card_id for card in cards] == ["matching-card"]
+        assert len(cards) == 3
+        assert all(card.deck_id == "deck-1" for card in cards)
         assert cursor is None
-        assert calls[1]["ExclusiveStartKey"]["card_id"] == "non-matching-card"
+        assert len(calls) == 1
+        assert calls[0]["IndexName"] == "deck-cards-index"
+        assert "FilterExpression" not in calls[0]
+        assert calls[0]["ExpressionAttributeValues"] == {
+            ":deck_index_key": "test-user-id#deck-1"
+        }
+
+    def test_list_cards_by_deck_paginates_with_opaque_cursor(self, card_service):
+        """GSI の LastEvaluatedKey を符号化したカーソルで重複・欠落なくページングできる."""
+        created = set()
+        for i in range(5):
+            card = card_service.create_card(
+                user_id="test-user-id",
+                front=f"Q{i}",
+                back=f"A{i}",
+                deck_id="deck-1",
+            )
+            created.add(card.card_id)
 
-    def test_list_cards_by_deck_keeps_full_query_limit_without_skipping_matches(
+        seen = []
+        cursor = None
+        for _ in range(5):
+            cards, cursor = card_service.list_cards(
+                "test-user-id", limit=2, cursor=cursor, deck_id="deck-1"
+            )
+            seen.extend(card.card_id for card in cards)
+            if cursor is None:
+                break
+            assert cursor not in created  # card_id ではなく不透明なカーソル
+
+        assert sorted(seen) == sorted(created)
+        assert len(seen) == len(set(seen))
+
+    def test_list_cards_by_deck_skips_cards_deleted_after_index_read(
         self, card_service, monkeypatch
     ):
-        """Continuation queries stay efficient without skipping extra matches."""
+        """GSI で得たキーのカードが BatchGetItem 時点で消えていれば結果から除く."""
+        card = card_service.create_card(
+            user_id="test-user-id", front="Q", back="A", deck_id="deck-1"
+        )
 
-        def item(card_id):
+        def query(**kwargs):
             return {
-                "user_id": "test-user-id",
-                "card_id": card_id,
-                "front": card_id,
-                "back": card_id,
-                "deck_id": "deck-1",
-                "ease_factor": "2.5",
-                "interval": 0,
-                "repetitions": 0,
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "updated_at": datetime.now(timezone.utc).isoformat(),
+                "Items": [
+                    {"user_id": "test-user-id", "card_id": "deleted-card"},
+                    {"user_id": "test-user-id", "card_id": card.card_id},
+                ]
             }
 
-        calls = []
+        monkeypatch.setattr(card_service._repo.table, "query", query)
+
+        cards, cursor = card_service.list_cards("test-user-id", deck_id="deck-1")
+
+        assert [c.card_id for c in cards] == [card.card_id]
+        assert cursor is None
+
+    def test_list_cards_by_deck_rejects_cursor_from_other_deck(self, card_service):
+        """他デッキ（他ユーザー）のカーソルは InvalidCursorError で拒否する."""
+        from services.card_repository import _encode_cursor
+        from services.card_service import InvalidCursorError
+
+        foreign = _encode_cursor(
+            {
+                "deck_index_key": "other-user#deck-1",
+                "next_review_at": "2024-01-01T00:00:00+00:00",
+                "user_id": "other-user",
+                "card_id": "c1",
+            }
+        )
+        with pytest.raises(InvalidCursorError):
+            card_service.list_cards("test-user-id", cursor=foreign, deck_id="deck-1")
+        with pytest.raises(InvalidCursorError):
+            card_service.list_cards("test-user-id", cursor="not-a-cursor!", deck_id="deck-1")
+
+
+class TestListCardResponsesFields:
+    """CardService.list_card_responses の fields=（ProjectionExpression）のテスト."""
+
+    @pytest.mark.parametrize("deck_id", [None, "deck-1"], ids=["all", "deck"])
+    def test_fields_project_attributes_and_trim_response(self, card_service, monkeypatch, deck_id):
+        """指定フィールドの属性だけを取得し、全フィールド時と同じ値をそのフィールドだけ返す."""
+        for i in range(3):
+            card_service.create_card(
+                user_id="test-user-id",
+                front=f"Q{i}",
+                back=f"A{i}" * 50,
+                deck_id="deck-1",
+                tags=["t"],
+            )
+        full, _ = card_service.list_card_responses("test-user-id", deck_id=deck_id)
+
+        requests = []
+        original_query = card_service._repo.table.query
+        original_batch_get = card_service._repo.dynamodb.batch_get_item
 
         def query(**kwargs):
-            calls.append(kwargs.copy())
-            if len(calls) == 1:
-                return {
-                    "Items": [item("matching-a")],
-                    "LastEvaluatedKey": {
-                        "user_id": "test-user-id",
-                        "card_id": "non-matching-card",
-                    },
-                }
-            return {"Items": [item("matching-b"), item("matching-c")]}
+            requests.append(kwargs.copy())
+            return original_query(**kwargs)
+
+        def batch_get_item(RequestItems):
+            requests.extend(RequestItems.values())
+            return original_batch_get(RequestItems=RequestItems)
 
         monkeypatch.setattr(card_service._repo.table, "query", query)
+        monkeypatch.setattr(card_service._repo.dynamodb, "batch_get_item", batch_get_item)
 
-        cards, cursor = card_service.list_cards(
-            "test-user-id", limit=2, deck_id="deck-1"
-        )
+        fields = ["card_id", "front", "next_review_at"]
+        sparse, _ = card_service.list_card_responses("test-user-id", deck_id=deck_id, fields=fields)
 
-        assert [card.card_id for card in cards] == ["matching-a", "matching-b"]
-        assert cursor == "matching-b"
-        assert calls[1]["Limit"] == 2
+        assert sparse == [{name: card[name] for name in fields} for card in full]
+        projected = [r for r in requests if "ProjectionExpression" in r]
+        assert len(projected) == 1
+        names = projected[0]["ExpressionAttributeNames"]
+        assert sorted(names[p.strip()] for p in projected[0]["ProjectionExpression"].split(",")) == sorted(fields)
 
 
 class TestCardServiceDueCards:
@@ -1898,36 +1988,65 @@ class TestBulkCreateCards:
         saved = card_service.bulk_create_cards("u-bulk2", cards)
         assert saved == 1
 
-    def test_continues_on_individual_failure(self, card_service, monkeypatch):
-        real_create = card_service.create_card
-        seen = []
+    def _card_count(self, dynamodb_table, user_id):
+        item = dynamodb_table.Table("memoru-users-test").get_item(Key={"user_id": user_id}).get("Item", {})
+        return int(item.get("card_count", 0))
+
+    def test_reserves_slots_once_and_writes_in_batch(self, card_service, dynamodb_table, monkeypatch):
+        transact_calls = []
+        monkeypatch.setattr(
+            card_service._repo._client, "transact_write_items",
+            lambda **kwargs: transact_calls.append(kwargs),
+        )
+        cards = [{"front": f"Q{i}", "back": "A"} for i in range(30)]
+
+        saved = card_service.bulk_create_cards("u-bulk3", cards)
 
-        def flaky(**kwargs):
-            seen.append(kwargs["front"])
-            if kwargs["front"] == "Q2":
-                raise RuntimeError("transient")
-            return real_create(**kwargs)
+        # 1 件ずつのトランザクションは発行せず、card_count は 1 回の予約で進む。
+        assert saved == 30
+        assert transact_calls == []
+        assert self._card_count(dynamodb_table, "u-bulk3") == 30
+        stored, _ = card_service.list_cards(user_id="u-bulk3", limit=100)
+        assert len(stored) == 30
 
-        monkeypatch.setattr(card_service, "create_card", flaky)
+    def test_partial_write_failure_releases_reservation(self, card_service, dynamodb_table, monkeypatch):
+        real_batch_put = card_service._repo.batch_put_items
+
+        def drop_second(items):
+            failed = real_batch_put([items[0], items[2]])
+            return failed + [items[1]["card_id"]]
+
+        monkeypatch.setattr(card_service._repo, "batch_put_items", drop_second)
         cards = [
             {"front": "Q1", "back": "A1"},
             {"front": "Q2", "back": "A2"},
             {"front": "Q3", "back": "A3"},
         ]
-        saved = card_service.bulk_create_cards("u-bulk3", cards)
-        # 1 件失敗しても残りは保存され、全件試行される。
+        saved = card_service.bulk_create_cards("u-bulk3b", cards)
+        # 1 件失敗しても残りは保存され、失敗分の枠は返却される。
         assert saved == 2
-        assert seen == ["Q1", "Q2", "Q3"]
+        assert self._card_count(dynamodb_table, "u-bulk3b") == 2
 
-    def test_all_fail_returns_zero(self, card_service, monkeypatch):
-        def always_fail(**kwargs):
-            raise RuntimeError("down")
-
-        monkeypatch.setattr(card_service, "create_card", always_fail)
+    def test_all_fail_returns_zero(self, card_service, dynamodb_table, monkeypatch):
+        monkeypatch.setattr(
+            card_service._repo, "batch_put_items", lambda items: [i["card_id"] for i in items]
+        )
         saved = card_service.bulk_create_cards(
             "u-bulk4", [{"front": "Q", "back": "A"}]
         )
         assert saved == 0  # M-19: 呼び出し側は 0 を保存失敗として扱う
+        assert self._card_count(dynamodb_table, "u-bulk4") == 0
+
+    def test_saves_only_up_to_card_limit(self, card_service, dynamodb_table):
+        dynamodb_table.Table("memoru-users-test").put_item(
+            Item={"user_id": "u-bulk7", "card_count": card_service.MAX_CARDS_PER_USER - 2}
+        )
+        cards = [{"front": f"Q{i}", "back": "A"} for i in range(5)]
+
+        assert card_service.bulk_create_cards("u-bulk7", cards) == 2
+        assert self._card_count(dynamodb_table, "u-bulk7") == card_service.MAX_CARDS_PER_USER
+        # 上限到達後は 0 件。
+        assert card_service.bulk_create_cards("u-bulk7", cards) == 0
 
     def test_suggested_tags_take_precedence_over_tags(self, card_service):
         cards = [{"front": "Q", "back": "A", "suggested_tags": ["s"], "tags": ["t"]}]
@@ -1937,3 +2056,469 @@ class TestBulkCreateCards:
 
     def test_empty_card_list_returns_zero(self, card_service):
         assert card_service.bulk_create_cards("u-bulk6", []) == 0
+
+
+class TestImportCards:
+    """import_cards ジョブのバッチ書き込み（枠予約・検証・進捗）。"""
+
+    def _card_count(self, dynamodb_table, user_id):
+        item = dynamodb_table.Table("memoru-users-test").get_item(Key={"user_id": user_id}).get("Item", {})
+        return int(item.get("card_count", 0))
+
+    def _rows(self, count, start=1):
+        return [ImportRow(line=i, front=f"Q{i}", back=f"A{i}") for i in range(start, start + count)]
+
+    def test_imports_rows_in_batches_with_progress(self, card_service, dynamodb_table, monkeypatch):
+        from services import card_service as card_service_module
+
+        monkeypatch.setattr(card_service_module, "IMPORT_PROGRESS_INTERVAL_ROWS", 20)
+        progress = []
+        result = card_service.import_cards(
+            "u-import",
+            self._rows(60),
+            tags=["imported"],
+            on_progress=progress.append,
+        )
+
+        assert (result.total_rows, result.imported, result.invalid, result.failed) == (60, 60, 0, 0)
+        assert self._card_count(dynamodb_table, "u-import") == 60
+        assert [p["processed_rows"] for p in progress] == [20, 40, 60]
+        stored, _ = card_service.list_cards(user_id="u-import", limit=100)
+        assert len(stored) == 60
+        assert all(card.tags == ["imported"] for card in stored)
+
+    def test_invalid_rows_are_reported_and_skipped(self, card_service):
+        rows = [
+            ImportRow(line=1, front="Q1", back="A1", tags=["a"]),
+            ImportRow(line=2, front="   ", back="A2"),
+            ImportRow(line=3, front="Q3", back="x" * 2001),
+            ImportRow(line=4, front="Q4", back="A4", tags=[f"t{i}" for i in range(11)]),
+        ]
+        result = card_service.import_cards("u-import2", rows)
+
+        assert (result.imported, result.invalid) == (1, 3)
+        assert [e.line for e in result.errors] == [2, 3, 4]
+        assert result.errors[0].message.startswith("front:")
+
+    def test_stops_at_card_limit(self, card_service, dynamodb_table):
+        dynamodb_table.Table("memoru-users-test").put_item(
+            Item={"user_id": "u-import3", "card_count": card_service.MAX_CARDS_PER_USER - 30}
+        )
+        result = card_service.import_cards("u-import3", self._rows(100))
+
+        assert result.imported == 30
+        assert result.limit_reached is True
+        assert result.skipped_limit == 70
+        assert self._card_count(dynamodb_table, "u-import3") == card_service.MAX_CARDS_PER_USER
+
+    def test_failed_writes_release_slots(self, card_service, dynamodb_table, monkeypatch):
+        from services.card_repository import CardRepository
+
+        real_batch_put = CardRepository.batch_put_items
+
+        def drop_first(repo, items):
+            return real_batch_put(repo, items[1:]) + [items[0]["card_id"]]
+
+        monkeypatch.setattr(CardRepository, "batch_put_items", drop_first)
+        result = card_service.import_cards("u-import4", self._rows(50))
+
+        assert (result.imported, result.failed) == (48, 2)
+        assert self._card_count(dynamodb_table, "u-import4") == 48
+
+    def test_parse_error_keeps_written_cards(self, card_service, dynamodb_table):
+        from services.card_import import ImportFormatError
+
+        def rows():
+            yield from self._rows(30)
+            raise ImportFormatError("broken")
+
+        with pytest.raises(ImportFormatError):
+            card_service.import_cards("u-import5", rows())
+        assert self._card_count(dynamodb_table, "u-import5") == 25
+        stored, _ = card_service.list_cards(user_id="u-import5", limit=100)
+        assert len(stored) == 25
+
+    def test_validates_deck(self, card_service):
+        from unittest.mock import MagicMock
+
+        from services.deck_service import DeckNotFoundError
+
+        card_service._deck_service = MagicMock()
+        card_service._deck_service.get_deck.side_effect = DeckNotFoundError("Deck not found: d-x")
+        with pytest.raises(DeckNotFoundError):
+            card_service.import_cards("u-import6", self._rows(1), deck_id="d-x")
+
+
+class TestMoveCards:
+    """POST /decks/<deck_id>/cards:move のカード一括移動・デッキのマージ。"""
+
+    @pytest.fixture
+    def mover(self, card_service):
+        from unittest.mock import MagicMock
+
+        card_service._deck_service = MagicMock()
+        return card_service
+
+    def _put(self, dynamodb_table, card_id, deck_id=None, user_id="u-move"):
+        item = {
+            "user_id": user_id,
+            "card_id": card_id,
+            "front": "Q",
+            "back": "A",
+            "next_review_at": "2026-01-01T00:00:00+00:00",
+        }
+        if deck_id:
+            item["deck_id"] = deck_id
+            item["deck_index_key"] = f"{user_id}#{deck_id}"
+        dynamodb_table.Table("memoru-cards-test").put_item(Item=item)
+
+    def _get(self, dynamodb_table, card_id, user_id="u-move"):
+        return dynamodb_table.Table("memoru-cards-test").get_item(
+            Key={"user_id": user_id, "card_id": card_id}
+        )["Item"]
+
+    def test_moves_card_ids_with_per_card_results(self, mover, dynamodb_table):
+        self._put(dynamodb_table, "c1", "deck-a")
+        self._put(dynamodb_table, "c2")
+        self._put(dynamodb_table, "c3", "deck-b")
+
+        result = mover.move_cards("u-move", "deck-b", card_ids=["c1", "c2", "c3", "missing"])
+
+        assert [(r.card_id, r.status) for r in result.results] == [
+            ("c1", "moved"),
+            ("c2", "moved"),
+            ("c3", "unchanged"),
+            ("missing", "not_found"),
+        ]
+        assert (result.moved, result.unchanged, result.not_found) == (2, 1, 1)
+        for card_id in ("c1", "c2"):
+            item = self._get(dynamodb_table, card_id)
+            assert item["deck_id"] == "deck-b"
+            assert item["deck_index_key"] == "u-move#deck-b"
+        # 削除済み（存在しない）カードはゴーストとして作成されない。
+        assert "Item" not in dynamodb_table.Table("memoru-cards-test").get_item(
+            Key={"user_id": "u-move", "card_id": "missing"}
+        )
+        # 移動先デッキの検証は 1 回だけ。
+        mover._deck_service.get_deck.assert_called_once_with("u-move", "deck-b")
+
+    def test_merges_whole_deck_and_keeps_counts_consistent(self, mover, dynamodb_table):
+        from services.deck_service import DeckService
+
+        for i in range(5):
+            self._put(dynamodb_table, f"a{i}", "deck-a")
+        self._put(dynamodb_table, "b0", "deck-b")
+        self._put(dynamodb_table, "other", "deck-a", user_id="someone-else")
+
+        result = mover.move_cards("u-move", "deck-b", source_deck_id="deck-a")
+
+        assert result.moved == 5
+        counts = DeckService(
+            table_name="memoru-decks-test",
+            cards_table_name="memoru-cards-test",
+            dynamodb_resource=dynamodb_table,
+        ).get_deck_card_counts("u-move", ["deck-a", "deck-b"])
+        assert counts == {"deck-a": 0, "deck-b": 6}
+        assert self._get(dynamodb_table, "other", user_id="someone-else")["deck_id"] == "deck-a"
+
+    def test_merge_reports_cards_moved_elsewhere_as_conflict(self, mover, dynamodb_table, monkeypatch):
+        self._put(dynamodb_table, "a0", "deck-a")
+        self._put(dynamodb_table, "a1", "deck-a")
+        real_query = mover._repo.query_deck_card_ids
+
+        def query_then_move(user_id, deck_id):
+            card_ids = real_query(user_id, deck_id)
+            # 収集直後に別リクエストが a1 を deck-c へ移動したことを模擬する。
+            self._put(dynamodb_table, "a1", "deck-c")
+            return card_ids
+
+        monkeypatch.setattr(mover._repo, "query_deck_card_ids", query_then_move)
+
+        result = mover.move_cards("u-move", "deck-b", source_deck_id="deck-a")
+
+        assert {r.card_id: r.status for r in result.results} == {"a0": "moved", "a1": "conflict"}
+        assert self._get(dynamodb_table, "a1")["deck_id"] == "deck-c"
+
+    def test_missing_target_deck_raises_before_writing(self, mover, dynamodb_table):
+        from services.deck_service import DeckNotFoundError
+
+        self._put(dynamodb_table, "c1", "deck-a")
+        mover._deck_service.get_deck.side_effect = DeckNotFoundError("nope")
+
+        with pytest.raises(DeckNotFoundError):
+            mover.move_cards("u-move", "deck-x", card_ids=["c1"])
+
+        assert self._get(dynamodb_table, "c1")["deck_id"] == "deck-a"
+
+
+class TestSearchCards:
+    """GET /cards/search: ユーザー単位の n-gram 転置インデックスによる全文検索。
+
+    インデックスは Cards テーブルのストリームから更新されるため、テストでは
+    moto のストリームを読み出してハンドラーと同じ処理で反映する（sync）。
+    """
+
+    @pytest.fixture
+    def search_service(self, card_service, dynamodb_table):
+        from services.card_search_index import CardSearchIndex
+
+        dynamodb_table.meta.client.update_table(
+            TableName="memoru-cards-test",
+            StreamSpecification={"StreamEnabled": True, "StreamViewType": "NEW_AND_OLD_IMAGES"},
+        )
+        dynamodb_table.create_table(
+            TableName="memoru-card-search-test",
+            KeySchema=[{"AttributeName": "pk", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "pk", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        card_service._search_index = CardSearchIndex(
+            table_name="memoru-card-search-test", dynamodb_resource=dynamodb_table
+        )
+        return card_service
+
+    @pytest.fixture
+    def sync(self, search_service, dynamodb_table):
+        """未読のストリームレコードを検索インデックスへ反映する関数を返す。"""
+        from services.card_search_index import changes_from_stream_records
+
+        streams = boto3.client("dynamodbstreams", region_name="ap-northeast-1")
+        stream_arn = dynamodb_table.Table("memoru-cards-test").latest_stream_arn
+        shards = streams.describe_stream(StreamArn=stream_arn)["StreamDescription"]["Shards"]
+        iterators = [
+            streams.get_shard_iterator(
+                StreamArn=stream_arn, ShardId=shard["ShardId"], ShardIteratorType="TRIM_HORIZON"
+            )["ShardIterator"]
+            for shard in shards
+        ]
+
+        def _sync():
+            records = []
+            for i, iterator in enumerate(iterators):
+                response = streams.get_records(ShardIterator=iterator)
+                records.extend(response["Records"])
+                iterators[i] = response["NextShardIterator"]
+            search_service._search_index.apply_changes(changes_from_stream_records(records))
+            return records
+
+        return _sync
+
+    def test_japanese_and_english_queries(self, search_service, sync):
+        jp = search_service.create_card(user_id="u-s", front="光合成とは何か", back="植物が光で糖を作る反応")
+        en = search_service.create_card(user_id="u-s", front="What is Photosynthesis?", back="light reaction")
+        search_service.create_card(user_id="u-s", front="無関係", back="unrelated")
+        sync()
+
+        assert [c.card_id for c, _ in search_service.search_cards("u-s", "光合成")] == [jp.card_id]
+        # 全角・大文字小文字の違いは正規化で吸収される。
+        assert [c.card_id for c, _ in search_service.search_cards("u-s", "ＰＨＯＴＯ")] == [en.card_id]
+        # n 未満の短いクエリは同じ長さのトークンとの完全一致で照合される。
+        assert [c.card_id for c, _ in search_service.search_cards("u-s", "ph")] == [en.card_id]
+
+    def test_whole_back_is_searchable(self, search_service, sync):
+        """長い back の末尾の語も索引される（トークン数の上限で落とさない）。"""
+        card = search_service.create_card(user_id="u-s", front="長文", back="あいうえお" * 300 + " zygote")
+        sync()
+        assert [c.card_id for c, _ in search_service.search_cards("u-s", "zygote")] == [card.card_id]
+
+    def test_front_match_ranks_above_back_match(self, search_service, sync):
+        back_hit = search_service.create_card(user_id="u-s", front="問題", back="mitochondria")
+        front_hit = search_service.create_card(user_id="u-s", front="mitochondria", back="答え")
+        sync()
+
+        results = search_service.search_cards("u-s", "mitochondria")
+        assert [c.card_id for c, _ in results] == [front_hit.card_id, back_hit.card_id]
+        assert results[0][1] > results[1][1]
+
+    def test_is_scoped_to_user(self, search_service, sync):
+        search_service.create_card(user_id="u-other", front="秘密の単語", back="x")
+        sync()
+        assert search_service.search_cards("u-s", "秘密") == []
+
+    def test_update_and_delete_keep_index_in_sync(self, search_service, sync):
+        card = search_service.create_card(user_id="u-s", front="apple pie", back="dessert")
+        search_service.update_card(user_id="u-s", card_id=card.card_id, front="banana bread")
+        sync()
+
+        assert search_service.search_cards("u-s", "apple") == []
+        assert [c.card_id for c, _ in search_service.search_cards("u-s", "banana")] == [card.card_id]
+
+        search_service.delete_card("u-s", card.card_id)
+        sync()
+        assert search_service.search_cards("u-s", "banana") == []
+
+    def test_writes_do_not_touch_index_on_request_path(self, search_service, sync):
+        """作成・編集・削除はインデックスを書かず、ストリームの反映まで検索に出ない。"""
+        card = search_service.create_card(user_id="u-s", front="kiwi tart", back="x")
+        assert search_service.search_cards("u-s", "kiwi") == []
+        sync()
+        assert [c.card_id for c, _ in search_service.search_cards("u-s", "kiwi")] == [card.card_id]
+
+    def test_imported_cards_are_indexed_from_stream(self, search_service, sync, monkeypatch):
+        """import_cards は行ごとにインデックスを書かず、ストリーム経由でまとめて反映される。"""
+        from services.card_search_index import CardSearchIndex
+
+        writes = []
+        monkeypatch.setattr(CardSearchIndex, "apply_changes", lambda self, *a, **kw: writes.append(a) or 0)
+        rows = [ImportRow(line=i, front=f"melon {i}", back="x") for i in range(1, 31)]
+        result = search_service.import_cards("u-s", rows)
+        assert result.imported == 30
+        assert writes == []
+
+        monkeypatch.undo()
+        records = sync()
+        assert len(records) == 30
+        assert len(search_service.search_cards("u-s", "melon", limit=50)) == 30
+
+    def test_bulk_created_cards_are_indexed_from_stream(self, search_service, sync, monkeypatch):
+        """bulk_create_cards もカードごとにインデックスを書かない。"""
+        from services.card_search_index import CardSearchIndex
+
+        writes = []
+        monkeypatch.setattr(CardSearchIndex, "apply_changes", lambda self, *a, **kw: writes.append(a) or 0)
+        saved = search_service.bulk_create_cards("u-s", [{"front": f"grape {i}", "back": "x"} for i in range(5)])
+        assert saved == 5
+        assert writes == []
+
+        monkeypatch.undo()
+        sync()
+        assert len(search_service.search_cards("u-s", "grape")) == 5
+
+    def test_deck_and_tag_filters(self, search_service, sync):
+        a = search_service.create_card(user_id="u-s", front="vocab one", back="x", deck_id="d1", tags=["English"])
+        b = search_service.create_card(user_id="u-s", front="vocab two", back="x", deck_id="d2")
+        sync()
+
+        assert [c.card_id for c, _ in search_service.search_cards("u-s", "vocab", deck_id="d2")] == [b.card_id]
+        assert [c.card_id for c, _ in search_service.search_cards("u-s", "vocab", tag="english")] == [a.card_id]
+
+    def test_filters_apply_before_candidate_cap(self, search_service, sync, monkeypatch):
+        """deck_id / tag の絞り込みは候補数の上限より前に適用される。"""
+        monkeypatch.setattr(search_service, "SEARCH_MAX_CANDIDATES", 2)
+        for i in range(4):
+            search_service.create_card(user_id="u-s", front=f"quiz {i}", back="x", deck_id="d1")
+        # back のみの一致はスコアが低く、絞り込み前に上限で切ると候補から漏れる。
+        target = search_service.create_card(user_id="u-s", front="x", back="quiz 9", deck_id="d2", tags=["rare"])
+        sync()
+
+        assert [c.card_id for c, _ in search_service.search_cards("u-s", "quiz", deck_id="d2")] == [target.card_id]
+        assert [c.card_id for c, _ in search_service.search_cards("u-s", "quiz", tag="RARE")] == [target.card_id]
+
+    def test_unconfigured_index_raises_unavailable(self, card_service):
+        from services.card_service import CardSearchUnavailableError
+        from services.card_search_index import CardSearchIndex
+
+        card_service._search_index = CardSearchIndex(table_name="")
+        card_service.create_card(user_id="u-s", front="Q", back="A")
+        with pytest.raises(CardSearchUnavailableError):
+            card_service.search_cards("u-s", "Q")
+
+
+class TestGetCardChanges:
+    """GET /cards/changes: user_id-updated_at-index と tombstone による差分同期。"""
+
+    def test_without_since_requests_full_resync(self, card_service):
+        card_service.create_card(user_id="u-sync", front="Q", back="A")
+
+        result = card_service.get_card_changes("u-sync")
+
+        assert result.full_resync is True
+        assert result.changes == [] and result.deleted_card_ids == []
+        assert result.next_since
+
+    def test_returns_created_updated_and_deleted_cards(self, card_service):
+        token = card_service.get_card_changes("u-sync").next_since
+        kept = card_service.create_card(user_id="u-sync", front="Q1", back="A1")
+        removed = card_service.create_card(user_id="u-sync", front="Q2", back="A2")
+        card_service.update_card(user_id="u-sync", card_id=kept.card_id, front="Q1 edited")
+        card_service.delete_card("u-sync", removed.card_id)
+
+        result = card_service.get_card_changes("u-sync", since=token)
+
+        assert result.full_resync is False
+        assert result.has_more is False
+        assert [c.front for c in result.changes] == ["Q1 edited"]
+        assert result.deleted_card_ids == [removed.card_id]
+        # tombstone は通常パーティションの一覧には現れない。
+        listed, _ = card_service.list_cards(user_id="u-sync", limit=10)
+        assert [c.card_id for c in listed] == [kept.card_id]
+
+    def test_paginates_across_cards_and_tombstones(self, card_service):
+        token = card_service.get_card_changes("u-sync").next_since
+        created = [
+            card_service.create_card(user_id="u-sync", front=f"Q{i}", back="A") for i in range(3)
+        ]
+        card_service.delete_card("u-sync", created[0].card_id)
+
+        seen, deleted, pages = set(), [], 0
+        while True:
+            page = card_service.get_card_changes("u-sync", since=token, limit=1)
+            seen.update(c.card_id for c in page.changes)
+            deleted.extend(page.deleted_card_ids)
+            token = page.next_since
+            pages += 1
+            if not page.has_more:
+                break
+
+        assert seen == {created[1].card_id, created[2].card_id}
+        assert deleted == [created[0].card_id]
+        assert pages >= 3
+
+    def test_is_scoped_to_user(self, card_service):
+        token = card_service.get_card_changes("u-sync").next_since
+        other = card_service.create_card(user_id="u-other", front="Q", back="A")
+        card_service.delete_card("u-other", other.card_id)
+
+        result = card_service.get_card_changes("u-sync", since=token)
+        assert result.changes == [] and result.deleted_card_ids == []
+
+    def test_expired_token_requests_full_resync(self, card_service):
+        from services.card_repository import TOMBSTONE_RETENTION_DAYS, _encode_cursor
+
+        old = datetime.now(timezone.utc) - timedelta(days=TOMBSTONE_RETENTION_DAYS + 1)
+        result = card_service.get_card_changes("u-sync", since=_encode_cursor({"s": old.isoformat()}))
+
+        assert result.full_resync is True
+        assert result.next_since
+
+    def test_invalid_token_raises(self, card_service):
+        from services.card_service import InvalidCursorError
+
+        with pytest.raises(InvalidCursorError):
+            card_service.get_card_changes("u-sync", since="not-a-token")
+
+
+class TestDataVersion:
+    """条件付き GET 用の users.data_version がカード変更で進むこと。"""
+
+    def _version(self, dynamodb_table, user_id):
+        item = dynamodb_table.Table("memoru-users-test").get_item(Key={"user_id": user_id}).get("Item", {})
+        return int(item.get("data_version", 0))
+
+    def test_create_update_delete_bump_version(self, card_service, dynamodb_table):
+        card = card_service.create_card(user_id="u-ver", front="Q", back="A")
+        assert self._version(dynamodb_table, "u-ver") == 1
+
+        card_service.update_card(user_id="u-ver", card_id=card.card_id, front="Q2")
+        assert self._version(dynamodb_table, "u-ver") == 2
+
+        card_service.delete_card("u-ver", card.card_id)
+        assert self._version(dynamodb_table, "u-ver") == 3
+
+    def test_changes_record_change_time(self, card_service, dynamodb_table):
+        """変更ごとに data_version_at が記録され、DataVersionStore.get で読める。"""
+        before = time.time()
+        card = card_service.create_card(user_id="u-ver-at", front="Q", back="A")
+        created = card_service._data_version.get("u-ver-at")
+        assert created.version == 1
+        assert created.changed_at >= before - 1
+
+        card_service.update_card(user_id="u-ver-at", card_id=card.card_id, front="Q2")
+        card_service.delete_card("u-ver-at", card.card_id)
+        deleted = card_service._data_version.get("u-ver-at")
+        assert deleted.version == 3
+        assert deleted.changed_at >= created.changed_at
+
+    def test_bump_does_not_create_missing_user(self, card_service, dynamodb_table):
+        card_service._data_version.bump("u-missing")
+        assert "Item" not in dynamodb_table.Table("memoru-users-test").get_item(Key={"user_id": "u-missing"})
@@ -0,0 +1,179 @@
+"""Unit tests for services/chunk_generation.py (concurrent per-chunk AI generation)."""
+
+import threading
+import time
+
+import pytest
+
+from services.ai_service import AIParseError, AITimeoutError, GeneratedCard
+from services.chunk_generation import run_chunk_generation
+
+
+def _cards(chunk: str, n: int = 1) -> list:
+    return [GeneratedCard(front=f"{chunk}-Q{i}", back="A", suggested_tags=[]) for i in range(n)]
+
+
+def _fronts(outcome) -> list:
+    return [card.front for card in outcome.cards]
+
+
+class TestRunChunkGeneration:
+    def test_merges_in_chunk_order_not_completion_order(self):
+        delays = {"c0": 0.15, "c1": 0.05, "c2": 0.1, "c3": 0.0}
+
+        def generate(chunk):
+            time.sleep(delays[chunk])
+            return _cards(chunk)
+
+        outcome = run_chunk_generation(
+            list(delays), generate, target_count=100, cards_per_chunk=3, max_calls=8
+        )
+
+        assert _fronts(outcome) == ["c0-Q0", "c1-Q0", "c2-Q0", "c3-Q0"]
+        assert outcome.processed_chunks == 4
+
+    def test_latency_close_to_single_call(self):
+        def generate(chunk):
+            time.sleep(0.2)
+            return _cards(chunk, 3)
+
+        started = time.perf_counter()
+        outcome = run_chunk_generation(
+            [f"c{i}" for i in range(4)], generate, target_count=12, cards_per_chunk=3, max_calls=8, max_workers=4
+        )
+
+        assert len(outcome.cards) == 12
+        assert time.perf_counter() - started < 0.6
+
+    def test_does_not_submit_more_than_needed_for_target(self):
+        calls = []
+
+        def generate(chunk):
+            calls.append(chunk)
+            return _cards(chunk, 5)
+
+        outcome = run_chunk_generation(
+            [f"c{i}" for i in range(6)], generate, target_count=10, cards_per_chunk=5, max_calls=8, max_workers=4
+        )
+
+        assert sorted(calls) == ["c0", "c1"]
+        assert len(outcome.cards) == 10
+
+    def test_target_reached_abandons_outstanding_calls(self):
+        release = threading.Event()
+
+        def generate(chunk):
+            if chunk == "slow":
+                release.wait(5)
+            return _cards(chunk, 6)
+
+        started = time.perf_counter()
+        try:
+            outcome = run_chunk_generation(
+                ["a", "slow"], generate, target_count=6, cards_per_chunk=3, max_calls=8, max_workers=4
+            )
+        finally:
+            release.set()
+
+        assert time.perf_counter() - started < 2
+        assert outcome.processed_chunks == 2
+        assert _fronts(outcome) == [f"a-Q{i}" for i in range(6)]
+
+    def test_waits_for_earlier_chunk_even_if_later_chunk_reaches_target(self):
+        def generate(chunk):
+            if chunk == "slow":
+                time.sleep(0.2)
+            return _cards(chunk, 6)
+
+        outcome = run_chunk_generation(
+            ["slow", "a"], generate, target_count=6, cards_per_chunk=3, max_calls=8, max_workers=4
+        )
+
+        assert outcome.processed_chunks == 2
+        assert _fronts(outcome) == [f"slow-Q{i}" for i in range(6)] + [f"a-Q{i}" for i in range(6)]
+
+    def test_later_results_past_an_abandoned_chunk_are_dropped(self):
+        release = threading.Event()
+
+        def generate(chunk):
+            if chunk == "slow":
+                release.wait(5)
+            elif chunk == "a":
+                time.sleep(0.1)
+            return _cards(chunk, 3)
+
+        try:
+            outcome = run_chunk_generation(
+                ["a", "slow", "b"], generate, target_count=3, cards_per_chunk=1, max_calls=8, max_workers=4
+            )
+        finally:
+            release.set()
+
+        assert _fronts(outcome) == [f"a-Q{i}" for i in range(3)]
+
+    def test_skip_error_chunk_is_replaced_by_next_chunk(self):
+        calls = []
+
+        def generate(chunk):
+            calls.append(chunk)
+            if chunk == "c0":
+                raise AIParseError("bad json")
+            return _cards(chunk, 3)
+
+        outcome = run_chunk_generation(
+            [f"c{i}" for i in range(4)],
+            generate,
+            target_count=3,
+            cards_per_chunk=3,
+            max_calls=8,
+            skip_errors=(AIParseError,),
+        )
+
+        assert calls == ["c0", "c1"]
+        assert outcome.failed_chunks == 1
+        assert _fronts(outcome) == ["c1-Q0", "c1-Q1", "c1-Q2"]
+
+    def test_stop_error_keeps_in_flight_results_and_stops_submitting(self):
+        calls = []
+
+        def generate(chunk):
+            calls.append(chunk)
+            if chunk == "c0":
+                raise AITimeoutError("timed out")
+            time.sleep(0.05)
+            return _cards(chunk)
+
+        outcome = run_chunk_generation(
+            [f"c{i}" for i in range(6)],
+            generate,
+            target_count=100,
+            cards_per_chunk=3,
+            max_calls=8,
+            max_workers=2,
+            stop_errors=(AITimeoutError,),
+        )
+
+        assert sorted(calls) == ["c0", "c1"]
+        assert outcome.stopped_chunks == 1
+        assert _fronts(outcome) == ["c1-Q0"]
+
+    def test_unhandled_error_propagates(self):
+        def generate(chunk):
+            raise RuntimeError("throttled")
+
+        with pytest.raises(RuntimeError):
+            run_chunk_generation(["c0", "c1"], generate, target_count=10, cards_per_chunk=3, max_calls=8)
+
+    def test_max_calls_cap(self):
+        calls = []
+
+        def generate(chunk):
+            calls.append(chunk)
+            return _cards(chunk)
+
+        outcome = run_chunk_generation(
+            [f"c{i}" for i in range(20)], generate, target_count=1000, cards_per_chunk=3, max_calls=5
+        )
+
+        assert sorted(calls) == [f"c{i}" for i in range(5)]
+        assert outcome.processed_chunks == 5
@@ -0,0 +1,194 @@
+"""Unit tests for services/data_export.py (streaming gzip NDJSON export)."""
+
+import gzip
+import json
+import os
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from services import data_export
+from services.card_repository import CardRepository, CardServiceError
+from services.data_export import DataExporter, ExportUnavailableError, MultipartGzipWriter
+from services.review_repository import ReviewRepository
+
+BUCKET = "memoru-export-test"
+REGION = "ap-northeast-1"
+
+
+def _read_records(s3, key):
+    body = s3.get_object(Bucket=BUCKET, Key=key)["Body"].read()
+    return [json.loads(line) for line in gzip.decompress(body).decode("utf-8").splitlines()]
+
+
+@pytest.fixture
+def aws():
+    with mock_aws():
+        s3 = boto3.client("s3", region_name=REGION)
+        s3.create_bucket(Bucket=BUCKET, CreateBucketConfiguration={"LocationConstraint": REGION})
+        dynamodb = boto3.resource("dynamodb", region_name=REGION)
+        dynamodb.create_table(
+            TableName="memoru-cards-test",
+            KeySchema=[
+                {"AttributeName": "user_id", "KeyType": "HASH"},
+                {"AttributeName": "card_id", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "user_id", "AttributeType": "S"},
+                {"AttributeName": "card_id", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        dynamodb.create_table(
+            TableName="memoru-decks-test",
+            KeySchema=[
+                {"AttributeName": "user_id", "KeyType": "HASH"},
+                {"AttributeName": "deck_id", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "user_id", "AttributeType": "S"},
+                {"AttributeName": "deck_id", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        dynamodb.create_table(
+            TableName="memoru-reviews-test",
+            KeySchema=[
+                {"AttributeName": "card_id", "KeyType": "HASH"},
+                {"AttributeName": "reviewed_at", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "card_id", "AttributeType": "S"},
+                {"AttributeName": "reviewed_at", "AttributeType": "S"},
+                {"AttributeName": "user_id", "AttributeType": "S"},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": "user_id-reviewed_at-index",
+                    "KeySchema": [
+                        {"AttributeName": "user_id", "KeyType": "HASH"},
+                        {"AttributeName": "reviewed_at", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                }
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield s3, dynamodb
+
+
+@pytest.fixture
+def exporter(aws):
+    s3, dynamodb = aws
+    return DataExporter(
+        bucket_name=BUCKET,
+        s3_client=s3,
+        card_repository=CardRepository(table_name="memoru-cards-test", dynamodb_resource=dynamodb),
+        review_repository=ReviewRepository(table_name="memoru-reviews-test", dynamodb_resource=dynamodb),
+        decks_table_name="memoru-decks-test",
+    )
+
+
+class TestMultipartGzipWriter:
+    def test_splits_into_parts_and_round_trips(self, aws):
+        s3, _ = aws
+        # moto もパートサイズ下限 (5MiB) を検証するため、圧縮しにくいデータで 2 パート以上にする。
+        payloads = [os.urandom(1024 * 1024).hex() for _ in range(12)]
+        with MultipartGzipWriter(s3, BUCKET, "exports/u/big.ndjson.gz") as writer:
+            for payload in payloads:
+                writer.write_record({"type": "card", "data": {"blob": payload}})
+
+        assert len(writer._parts) >= 2
+        records = _read_records(s3, "exports/u/big.ndjson.gz")
+        assert [r["data"]["blob"] for r in records] == payloads
+        head = s3.head_object(Bucket=BUCKET, Key="exports/u/big.ndjson.gz")
+        assert head["ContentLength"] == writer.size_bytes
+
+    def test_aborts_upload_on_error(self, aws):
+        s3, _ = aws
+        with pytest.raises(RuntimeError):
+            with MultipartGzipWriter(s3, BUCKET, "exports/u/failed.ndjson.gz") as writer:
+                writer.write_record({"type": "meta"})
+                raise RuntimeError("boom")
+
+        assert s3.list_multipart_uploads(Bucket=BUCKET).get("Uploads", []) == []
+        assert s3.list_objects_v2(Bucket=BUCKET).get("KeyCount") == 0
+
+
+class TestDataExporter:
+    def test_exports_all_record_types_page_by_page(self, exporter, aws, monkeypatch):
+        s3, dynamodb = aws
+        monkeypatch.setattr(data_export, "EXPORT_PAGE_SIZE", 2)
+        cards = dynamodb.Table("memoru-cards-test")
+        for i in range(5):
+            cards.put_item(
+                Item={
+                    "user_id": "user-1",
+                    "card_id": f"card-{i}",
+                    "front": f"Q{i}",
+                    "back": f"A{i}",
+                    "ease_factor": Decimal("2.5"),
+                    "interval": Decimal(i),
+                    "deck_index_key": "user-1#deck-1",
+                }
+            )
+        cards.put_item(Item={"user_id": "user-2", "card_id": "other", "front": "x", "back": "y"})
+        dynamodb.Table("memoru-decks-test").put_item(Item={"user_id": "user-1", "deck_id": "deck-1", "name": "英単語"})
+        dynamodb.Table("memoru-reviews-test").put_item(
+            Item={"user_id": "user-1", "card_id": "card-0", "reviewed_at": "2026-01-01T00:00:00+00:00", "grade": Decimal(4)}
+        )
+
+        spy = MagicMock(wraps=exporter.card_repo.iter_card_pages)
+        monkeypatch.setattr(exporter.card_repo, "iter_card_pages", spy)
+        result = exporter.export("user-1")
+
+        spy.assert_called_once_with("user-1", 2)
+        assert result["counts"] == {"decks": 1, "cards": 5, "reviews": 1}
+        assert result["object_key"].startswith("exports/user-1/")
+        assert BUCKET in result["download_url"]
+        assert result["expires_in"] == data_export.DOWNLOAD_URL_EXPIRES_SECONDS
+
+        records = _read_records(s3, result["object_key"])
+        assert records[0]["type"] == "meta"
+        assert records[0]["user_id"] == "user-1"
+        assert [r["type"] for r in records[1:]] == ["deck"] + ["card"] * 5 + ["review"]
+        assert records[1]["data"]["name"] == "英単語"
+        card = records[2]["data"]
+        assert card["ease_factor"] == 2.5
+        assert card["interval"] == 0
+        assert "deck_index_key" not in card
+        assert records[-1]["data"]["grade"] == 4
+
+    def test_reports_progress(self, exporter, aws, monkeypatch):
+        _, dynamodb = aws
+        monkeypatch.setattr(data_export, "EXPORT_PROGRESS_INTERVAL_RECORDS", 2)
+        for i in range(4):
+            dynamodb.Table("memoru-cards-test").put_item(Item={"user_id": "user-1", "card_id": f"c{i}"})
+
+        progress = []
+        exporter.export("user-1", on_progress=progress.append)
+
+        assert progress == [{"decks": 0, "cards": 2, "reviews": 0}, {"decks": 0, "cards": 4, "reviews": 0}]
+
+    def test_aborts_on_read_error(self, exporter, aws, monkeypatch):
+        s3, _ = aws
+
+        def failing_pages(user_id, page_size=None):
+            raise CardServiceError("Failed to scan cards: boom")
+            yield  # pragma: no cover
+
+        monkeypatch.setattr(exporter.card_repo, "iter_card_pages", failing_pages)
+        with pytest.raises(CardServiceError):
+            exporter.export("user-1")
+
+        assert s3.list_multipart_uploads(Bucket=BUCKET).get("Uploads", []) == []
+        assert s3.list_objects_v2(Bucket=BUCKET).get("KeyCount") == 0
+
+    def test_disabled_without_bucket(self):
+        exporter = DataExporter(bucket_name="")
+        assert not exporter.enabled
+        with pytest.raises(ExportUnavailableError):
+            exporter.export("user-1")
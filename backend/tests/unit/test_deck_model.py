@@ -9,6 +9,8 @@ from models.deck import (
     Deck,
     DeckResponse,
     DeckListResponse,
+    MAX_MOVE_CARD_IDS,
+    MoveCardsRequest,
 )
 from pydantic import ValidationError
 
@@ -251,3 +253,21 @@ class TestDeckListResponse:
         assert len(list_resp.decks) == 1
         assert list_resp.total == 1
         assert list_resp.decks[0].name == "テスト"
+
+
+class TestMoveCardsRequest:
+    """MoveCardsRequest テスト."""
+
+    def test_card_ids_are_deduplicated_in_order(self):
+        request = MoveCardsRequest(card_ids=["c2", "c1", "c2", " "])
+        assert request.card_ids == ["c2", "c1"]
+
+    def test_requires_exactly_one_source(self):
+        with pytest.raises(ValidationError):
+            MoveCardsRequest()
+        with pytest.raises(ValidationError):
+            MoveCardsRequest(card_ids=["c1"], source_deck_id="deck-a")
+
+    def test_rejects_too_many_card_ids(self):
+        with pytest.raises(ValidationError):
+            MoveCardsRequest(card_ids=[f"c{i}" for i in range(MAX_MOVE_CARD_IDS + 1)])
@@ -4,6 +4,7 @@ import pytest
 from moto import mock_aws
 import boto3
 from datetime import datetime, timezone
+from unittest.mock import MagicMock
 
 from services.deck_service import (
     DeckService,
@@ -144,9 +145,10 @@ class TestGetDeck:
         assert deck.deck_id == created.deck_id
 
     def test_get_deck_not_found(self, deck_service):
-        """存在しないデッキで DeckNotFoundError."""
-        with pytest.raises(DeckNotFoundError):
+        """存在しないデッキで DeckNotFoundError（見つからなかった deck_id を持つ）."""
+        with pytest.raises(DeckNotFoundError) as exc_info:
             deck_service.get_deck("user-1", "nonexistent-id")
+        assert exc_info.value.deck_id == "nonexistent-id"
 
     def test_get_deck_wrong_user(self, deck_service):
         """別ユーザーのデッキは取得できない."""
@@ -272,6 +274,7 @@ class TestDeleteDeck:
                 "back": "A1",
                 "deck_id": deck.deck_id,
                 "deck_index_key": f"user-1#{deck.deck_id}",
+                "next_review_at": datetime.now(timezone.utc).isoformat(),
                 "interval": 1,
                 "ease_factor": "2.5",
                 "repetitions": 0,
@@ -286,6 +289,7 @@ class TestDeleteDeck:
                 "back": "A2",
                 "deck_id": deck.deck_id,
                 "deck_index_key": f"user-1#{deck.deck_id}",
+                "next_review_at": datetime.now(timezone.utc).isoformat(),
                 "interval": 1,
                 "ease_factor": "2.5",
                 "repetitions": 0,
@@ -337,6 +341,7 @@ class TestDeleteDeck:
                 "back": "A",
                 "deck_id": deck_a.deck_id,
                 "deck_index_key": f"user-1#{deck_a.deck_id}",
+                "next_review_at": datetime.now(timezone.utc).isoformat(),
                 "created_at": datetime.now(timezone.utc).isoformat(),
             }
         )
@@ -396,6 +401,7 @@ class TestDeleteDeck:
                 "back": "A",
                 "deck_id": deck.deck_id,
                 "deck_index_key": f"user-1#{deck.deck_id}",
+                "next_review_at": datetime.now(timezone.utc).isoformat(),
                 "created_at": datetime.now(timezone.utc).isoformat(),
             }
         )
@@ -421,6 +427,155 @@ class TestDeleteDeck:
         assert "Item" not in response
 
 
+class TestResetDeckCards:
+    """デッキ削除時のカード deck_id リセット（GSI 収集・並列 REMOVE・バックグラウンド化）."""
+
+    @staticmethod
+    def _put_cards(dynamodb_tables, deck_id, count, user_id="user-1"):
+        cards_table = dynamodb_tables.Table("memoru-cards-test")
+        for i in range(count):
+            cards_table.put_item(
+                Item={
+                    "user_id": user_id,
+                    "card_id": f"card-{i:04d}",
+                    "front": f"Q{i}",
+                    "back": f"A{i}",
+                    "deck_id": deck_id,
+                    "deck_index_key": f"{user_id}#{deck_id}",
+                    "next_review_at": datetime.now(timezone.utc).isoformat(),
+                }
+            )
+        return cards_table
+
+    def test_small_deck_is_reset_inline(self, deck_service, dynamodb_tables):
+        """1 ページに収まるデッキはリクエスト内でリセットし、ジョブを登録しない."""
+        deck = deck_service.create_deck(user_id="user-1", name="小")
+        cards_table = self._put_cards(dynamodb_tables, deck.deck_id, 3)
+        submit = MagicMock()
+
+        assert deck_service.delete_deck("user-1", deck.deck_id, submit_reset_job=submit) is None
+
+        submit.assert_not_called()
+        items = cards_table.scan()["Items"]
+        assert all("deck_id" not in item for item in items)
+
+    def test_large_deck_submits_job_before_delete(self, deck_service, dynamodb_tables, monkeypatch):
+        """1 ページを超えるデッキは削除前にリセットジョブを登録し、カードはリセットしない."""
+        import services.deck_service as deck_service_module
+
+        monkeypatch.setattr(deck_service_module, "DECK_RESET_PAGE_SIZE", 2)
+        deck = deck_service.create_deck(user_id="user-1", name="大")
+        cards_table = self._put_cards(dynamodb_tables, deck.deck_id, 5)
+        deck_present_at_submit = []
+
+        def submit():
+            deck_present_at_submit.append(deck_service.get_deck("user-1", deck.deck_id) is not None)
+            return {"job_id": "aijob_1"}
+
+        assert deck_service.delete_deck("user-1", deck.deck_id, submit_reset_job=submit) == {"job_id": "aijob_1"}
+
+        assert deck_present_at_submit == [True]
+        with pytest.raises(DeckNotFoundError):
+            deck_service.get_deck("user-1", deck.deck_id)
+        assert all(item["deck_id"] == deck.deck_id for item in cards_table.scan()["Items"])
+
+    def test_large_deck_is_kept_when_submit_fails(self, deck_service, dynamodb_tables, monkeypatch):
+        """ジョブを登録できない場合はデッキを削除せず例外を送出する（再度の DELETE でやり直せる）."""
+        import services.deck_service as deck_service_module
+
+        monkeypatch.setattr(deck_service_module, "DECK_RESET_PAGE_SIZE", 2)
+        deck = deck_service.create_deck(user_id="user-1", name="大")
+        self._put_cards(dynamodb_tables, deck.deck_id, 5)
+
+        with pytest.raises(RuntimeError):
+            deck_service.delete_deck(
+                "user-1", deck.deck_id, submit_reset_job=MagicMock(side_effect=RuntimeError("queue down"))
+            )
+
+        assert deck_service.get_deck("user-1", deck.deck_id).deck_id == deck.deck_id
+
+    def test_large_deck_without_submitter_is_reset_in_process(self, deck_service, dynamodb_tables, monkeypatch):
+        """submit_reset_job なしの呼び出しでは大きなデッキも全ページをリセットする."""
+        import services.deck_service as deck_service_module
+
+        monkeypatch.setattr(deck_service_module, "DECK_RESET_PAGE_SIZE", 2)
+        deck = deck_service.create_deck(user_id="user-1", name="大")
+        cards_table = self._put_cards(dynamodb_tables, deck.deck_id, 5)
+
+        assert deck_service.delete_deck("user-1", deck.deck_id) is None
+
+        assert all("deck_id" not in item for item in cards_table.scan()["Items"])
+
+    def test_reset_deck_cards_pages_and_reports_progress(self, deck_service, dynamodb_tables, monkeypatch):
+        """GSI をページ単位で処理し、ページごとに累計件数を報告する."""
+        import services.deck_service as deck_service_module
+
+        monkeypatch.setattr(deck_service_module, "DECK_RESET_PAGE_SIZE", 2)
+        cards_table = self._put_cards(dynamodb_tables, "deck-x", 5)
+        self._put_cards(dynamodb_tables, "deck-x", 2, user_id="user-2")
+        progress = []
+
+        totals = deck_service.reset_deck_cards("user-1", "deck-x", on_progress=progress.append)
+
+        assert totals == {"reset_cards": 5, "skipped_cards": 0, "failed_cards": 0}
+        assert [p["reset_cards"] for p in progress][-1] == 5
+        assert len(progress) >= 3
+        for item in cards_table.scan()["Items"]:
+            if item["user_id"] == "user-1":
+                assert "deck_id" not in item
+                assert "deck_index_key" not in item
+            else:
+                # 他ユーザーの同一 deck_id には触れない（deck_index_key のユーザー境界）。
+                assert item["deck_id"] == "deck-x"
+
+    def test_reset_deck_cards_resumes_from_checkpoint(self, deck_service, dynamodb_tables):
+        """再実行時は GSI に残ったカードのみを処理し、前回の件数を引き継ぐ."""
+        cards_table = self._put_cards(dynamodb_tables, "deck-x", 3)
+        # 前回実行で 1 枚目まで処理済みの状態を再現する。
+        cards_table.update_item(
+            Key={"user_id": "user-1", "card_id": "card-0000"},
+            UpdateExpression="REMOVE deck_id, deck_index_key",
+        )
+
+        totals = deck_service.reset_deck_cards(
+            "user-1",
+            "deck-x",
+            checkpoint={"reset_cards": 1, "skipped_cards": 0, "failed_cards": 2},
+        )
+
+        assert totals == {"reset_cards": 3, "skipped_cards": 0, "failed_cards": 0}
+        assert all("deck_id" not in item for item in cards_table.scan()["Items"])
+
+    def test_reset_deck_cards_counts_failures_without_raising(self, deck_service, dynamodb_tables, monkeypatch):
+        """条件不成立以外の UpdateItem 失敗は failed_cards として数えて続行する."""
+        from botocore.exceptions import ClientError
+
+        self._put_cards(dynamodb_tables, "deck-x", 3)
+        # リセットはスレッドごとに dynamodb.Table() を取り直すため、リソース側を差し替える。
+        flaky_table = dynamodb_tables.Table("memoru-cards-test")
+        real_update = flaky_table.update_item
+
+        def flaky_update(**kwargs):
+            if kwargs["Key"]["card_id"] == "card-0001":
+                raise ClientError(
+                    {"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "slow down"}},
+                    "UpdateItem",
+                )
+            return real_update(**kwargs)
+
+        monkeypatch.setattr(flaky_table, "update_item", flaky_update)
+        real_table = dynamodb_tables.Table
+        monkeypatch.setattr(
+            dynamodb_tables,
+            "Table",
+            lambda name: flaky_table if name == "memoru-cards-test" else real_table(name),
+        )
+
+        totals = deck_service.reset_deck_cards("user-1", "deck-x")
+
+        assert totals == {"reset_cards": 2, "skipped_cards": 0, "failed_cards": 1}
+
+
 class TestGetDeckCardCounts:
     """DeckService.get_deck_card_counts テスト."""
 
@@ -279,6 +279,138 @@ class TestDeleteDeckEndpoint:
 
         assert response["statusCode"] == 404
 
+    def test_delete_large_deck_submits_reset_job(self, api_gateway_event, lambda_context):
+        """大きなデッキはカードのリセットを reset_deck_cards ジョブへ回し 202 を返す."""
+        event = api_gateway_event(
+            method="DELETE",
+            path="/decks/deck-123",
+            path_parameters={"deck_id": "deck-123"},
+        )
+
+        def delete_deck(user_id, deck_id, submit_reset_job):
+            return submit_reset_job()
+
+        with patch("api.handlers.decks_handler.deck_service") as mock_service, patch(
+            "api.handlers.decks_handler.submit_ai_job"
+        ) as mock_submit:
+            mock_service.delete_deck.side_effect = delete_deck
+            mock_submit.return_value = {"job_id": "aijob_1", "job_type": "reset_deck_cards", "status": "queued"}
+            from api.handler import handler
+
+            response = handler(event, lambda_context)
+
+        assert response["statusCode"] == 202
+        assert json.loads(response["body"])["job_id"] == "aijob_1"
+        mock_submit.assert_called_once_with(
+            user_id="test-user-id", job_type="reset_deck_cards", payload={"deck_id": "deck-123"}
+        )
+        mock_service.reset_deck_cards.assert_not_called()
+
+    def test_delete_large_deck_fails_when_submit_fails(self, api_gateway_event, lambda_context):
+        """ジョブを submit できない場合はリクエスト内でリセットせずエラーを返す."""
+        event = api_gateway_event(
+            method="DELETE",
+            path="/decks/deck-123",
+            path_parameters={"deck_id": "deck-123"},
+        )
+
+        def delete_deck(user_id, deck_id, submit_reset_job):
+            return submit_reset_job()
+
+        with patch("api.handlers.decks_handler.deck_service") as mock_service, patch(
+            "api.handlers.decks_handler.submit_ai_job", side_effect=RuntimeError("queue down")
+        ):
+            mock_service.delete_deck.side_effect = delete_deck
+            from api.handler import handler
+
+            response = handler(event, lambda_context)
+
+        assert response["statusCode"] == 500
+        mock_service.reset_deck_cards.assert_not_called()
+
+
+# =============================================================================
+# POST /decks/<deck_id>/cards:move テスト
+# =============================================================================
+
+
+class TestMoveDeckCardsEndpoint:
+    """POST /decks/<deck_id>/cards:move エンドポイントテスト."""
+
+    def _event(self, api_gateway_event, body):
+        return api_gateway_event(
+            method="POST",
+            path="/decks/deck-123/cards:move",
+            path_parameters={"deck_id": "deck-123"},
+            body=body,
+        )
+
+    def test_move_card_ids(self, api_gateway_event, lambda_context):
+        """card_ids 指定でカード単位の結果を返す (200)."""
+        from models.deck import MoveCardResult, MoveCardsResponse
+
+        with patch("api.handlers.decks_handler.card_service") as mock_service:
+            mock_service.move_cards.return_value = MoveCardsResponse(
+                deck_id="deck-123",
+                moved=1,
+                not_found=1,
+                results=[
+                    MoveCardResult(card_id="c1", status="moved"),
+                    MoveCardResult(card_id="c2", status="not_found"),
+                ],
+            )
+            from api.handler import handler
+
+            response = handler(self._event(api_gateway_event, {"card_ids": ["c1", "c2"]}), lambda_context)
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert body["moved"] == 1
+        assert [r["status"] for r in body["results"]] == ["moved", "not_found"]
+        mock_service.move_cards.assert_called_once_with(
+            "test-user-id", "deck-123", card_ids=["c1", "c2"], source_deck_id=None
+        )
+
+    def test_merge_from_same_deck_is_rejected(self, api_gateway_event, lambda_context):
+        """移動元と移動先が同じデッキは 400."""
+        with patch("api.handlers.decks_handler.card_service") as mock_service:
+            from api.handler import handler
+
+            response = handler(self._event(api_gateway_event, {"source_deck_id": "deck-123"}), lambda_context)
+
+        assert response["statusCode"] == 400
+        mock_service.move_cards.assert_not_called()
+
+    def test_missing_source_is_validation_error(self, api_gateway_event, lambda_context):
+        """card_ids も source_deck_id も無い場合は 400."""
+        from api.handler import handler
+
+        response = handler(self._event(api_gateway_event, {}), lambda_context)
+
+        assert response["statusCode"] == 400
+
+    def test_missing_deck_returns_404(self, api_gateway_event, lambda_context):
+        """移動先デッキが存在しない場合は 404."""
+        with patch("api.handlers.decks_handler.card_service") as mock_service:
+            mock_service.move_cards.side_effect = DeckNotFoundError("Not found")
+            from api.handler import handler
+
+            response = handler(self._event(api_gateway_event, {"card_ids": ["c1"]}), lambda_context)
+
+        assert response["statusCode"] == 404
+
+    def test_missing_target_deck_is_named_in_error_when_merging(self, api_gateway_event, lambda_context):
+        """source_deck_id 指定時でも、見つからなかったのが移動先ならそのデッキ ID を返す."""
+        with patch("api.handlers.decks_handler.card_service") as mock_service:
+            mock_service.move_cards.side_effect = DeckNotFoundError("Deck not found: deck-123", deck_id="deck-123")
+            from api.handler import handler
+
+            response = handler(self._event(api_gateway_event, {"source_deck_id": "deck-src"}), lambda_context)
+
+        assert response["statusCode"] == 404
+        assert "deck-123" in json.loads(response["body"])["message"]
+        assert "deck-src" not in response["body"]
+
 
 # =============================================================================
 # GET /cards/due?deck_id=xxx テスト
@@ -306,7 +438,7 @@ class TestGetDueCardsWithDeckId:
         with patch("api.handlers.review_handler.review_service") as mock_service, patch(
             "api.handlers.review_handler.user_service"
         ) as mock_user_service:
-            mock_user_service.get_or_create_user.return_value.settings = {
+            mock_user_service.get_settings.return_value = {
                 "timezone": "Asia/Tokyo"
             }
             mock_service.get_due_cards.return_value = mock_response
@@ -338,7 +470,7 @@ class TestGetDueCardsWithDeckId:
         with patch("api.handlers.review_handler.review_service") as mock_service, patch(
             "api.handlers.review_handler.user_service"
         ) as mock_user_service:
-            mock_user_service.get_or_create_user.return_value.settings = {
+            mock_user_service.get_settings.return_value = {
                 "timezone": "Asia/Tokyo"
             }
             mock_service.get_due_cards.return_value = mock_response
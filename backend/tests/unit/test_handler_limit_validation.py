@@ -75,13 +75,13 @@ class TestListCardsLimitValidation:
         )
 
         with patch("api.handlers.cards_handler.card_service") as mock_service:
-            mock_service.list_cards.return_value = ([], None)
+            mock_service.list_card_responses.return_value = ([], None)
             from api.handler import handler
 
             response = handler(event, lambda_context)
 
         assert response["statusCode"] == 200
-        assert mock_service.list_cards.call_args.kwargs["limit"] == 1
+        assert mock_service.list_card_responses.call_args.kwargs["limit"] == 1
 
     def test_limit_negative_clamped_to_one(self, api_gateway_event, lambda_context):
         """A negative limit is clamped to 1."""
@@ -92,13 +92,13 @@ class TestListCardsLimitValidation:
         )
 
         with patch("api.handlers.cards_handler.card_service") as mock_service:
-            mock_service.list_cards.return_value = ([], None)
+            mock_service.list_card_responses.return_value = ([], None)
             from api.handler import handler
 
             response = handler(event, lambda_context)
 
         assert response["statusCode"] == 200
-        assert mock_service.list_cards.call_args.kwargs["limit"] == 1
+        assert mock_service.list_card_responses.call_args.kwargs["limit"] == 1
 
     def test_limit_above_max_clamped_to_100(self, api_gateway_event, lambda_context):
         """The existing upper bound (100) still holds."""
@@ -109,13 +109,13 @@ class TestListCardsLimitValidation:
         )
 
         with patch("api.handlers.cards_handler.card_service") as mock_service:
-            mock_service.list_cards.return_value = ([], None)
+            mock_service.list_card_responses.return_value = ([], None)
             from api.handler import handler
 
             response = handler(event, lambda_context)
 
         assert response["statusCode"] == 200
-        assert mock_service.list_cards.call_args.kwargs["limit"] == 100
+        assert mock_service.list_card_responses.call_args.kwargs["limit"] == 100
 
     def test_limit_non_integer_returns_400(self, api_gateway_event, lambda_context):
         """A non-integer limit still returns 400."""
@@ -126,7 +126,7 @@ class TestListCardsLimitValidation:
         )
 
         with patch("api.handlers.cards_handler.card_service") as mock_service:
-            mock_service.list_cards.return_value = ([], None)
+            mock_service.list_card_responses.return_value = ([], None)
             from api.handler import handler
 
             response = handler(event, lambda_context)
@@ -134,6 +134,80 @@ class TestListCardsLimitValidation:
         assert response["statusCode"] == 400
         assert "limit" in json.loads(response["body"])["error"]
 
+    def test_invalid_deck_cursor_returns_400(self, api_gateway_event, lambda_context):
+        """An undecodable / foreign deck cursor returns 400 instead of 500."""
+        from services.card_service import InvalidCursorError
+
+        event = api_gateway_event(
+            method="GET",
+            path="/cards",
+            query_string_parameters={"deck_id": "deck-1", "cursor": "bogus"},
+        )
+
+        with patch("api.handlers.cards_handler.card_service") as mock_service:
+            mock_service.list_card_responses.side_effect = InvalidCursorError("bad")
+            from api.handler import handler
+
+            response = handler(event, lambda_context)
+
+        assert response["statusCode"] == 400
+        assert json.loads(response["body"])["error"] == "Invalid cursor"
+
+    def test_search_cards_rejects_empty_query(self, api_gateway_event, lambda_context):
+        """GET /cards/search with a blank q returns 400 without touching the index."""
+        event = api_gateway_event(
+            method="GET",
+            path="/cards/search",
+            query_string_parameters={"q": "   "},
+        )
+
+        with patch("api.handlers.cards_handler.card_service") as mock_service:
+            from api.handler import handler
+
+            response = handler(event, lambda_context)
+
+        assert response["statusCode"] == 400
+        mock_service.search_cards.assert_not_called()
+
+    def test_search_cards_unconfigured_index_returns_503(self, api_gateway_event, lambda_context):
+        """CARD_SEARCH_TABLE 未設定時の検索は 503。"""
+        from services.card_service import CardSearchUnavailableError
+
+        event = api_gateway_event(
+            method="GET",
+            path="/cards/search",
+            query_string_parameters={"q": "光合成", "limit": "500"},
+        )
+
+        with patch("api.handlers.cards_handler.card_service") as mock_service:
+            mock_service.search_cards.side_effect = CardSearchUnavailableError("off")
+            from api.handler import handler
+
+            response = handler(event, lambda_context)
+
+        assert response["statusCode"] == 503
+        # limit は [1, 50] にクランプされて渡される。
+        assert mock_service.search_cards.call_args.kwargs["limit"] == 50
+
+    def test_card_changes_invalid_token_returns_400(self, api_gateway_event, lambda_context):
+        """GET /cards/changes with an undecodable sync token returns 400."""
+        from services.card_service import InvalidCursorError
+
+        event = api_gateway_event(
+            method="GET",
+            path="/cards/changes",
+            query_string_parameters={"since": "bogus"},
+        )
+
+        with patch("api.handlers.cards_handler.card_service") as mock_service:
+            mock_service.get_card_changes.side_effect = InvalidCursorError("bad")
+            from api.handler import handler
+
+            response = handler(event, lambda_context)
+
+        assert response["statusCode"] == 400
+        assert json.loads(response["body"])["error"] == "Invalid sync token"
+
 
 class TestUndoReviewConflictMapping:
     """POST /reviews/<id>/undo maps ConcurrentReviewError -> 409 (B-2)."""
@@ -149,7 +223,7 @@ class TestUndoReviewConflictMapping:
         with patch("api.handlers.review_handler.review_service") as mock_service, patch(
             "api.handlers.review_handler.user_service"
         ) as mock_user_service:
-            mock_user_service.get_or_create_user.return_value.settings = {
+            mock_user_service.get_settings.return_value = {
                 "timezone": "Asia/Tokyo"
             }
             mock_service.undo_review.side_effect = ConcurrentReviewError("conflict")
@@ -179,7 +253,7 @@ class TestDueCardsLimitValidation:
         with patch("api.handlers.review_handler.review_service") as mock_service, patch(
             "api.handlers.review_handler.user_service"
         ) as mock_user_service:
-            mock_user_service.get_or_create_user.return_value.settings = {
+            mock_user_service.get_settings.return_value = {
                 "timezone": "Asia/Tokyo"
             }
             mock_service.get_due_cards.return_value = self._empty_due_response()
@@ -201,7 +275,7 @@ class TestDueCardsLimitValidation:
         with patch("api.handlers.review_handler.review_service") as mock_service, patch(
             "api.handlers.review_handler.user_service"
         ) as mock_user_service:
-            mock_user_service.get_or_create_user.return_value.settings = {
+            mock_user_service.get_settings.return_value = {
                 "timezone": "Asia/Tokyo"
             }
             mock_service.get_due_cards.return_value = self._empty_due_response()
@@ -223,7 +297,7 @@ class TestDueCardsLimitValidation:
         with patch("api.handlers.review_handler.review_service") as mock_service, patch(
             "api.handlers.review_handler.user_service"
         ) as mock_user_service:
-            mock_user_service.get_or_create_user.return_value.settings = {
+            mock_user_service.get_settings.return_value = {
                 "timezone": "Asia/Tokyo"
             }
             mock_service.get_due_cards.return_value = self._empty_due_response()
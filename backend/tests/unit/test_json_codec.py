@@ -0,0 +1,92 @@
+"""Unit tests for utils/json_codec.py (shared JSON serializer and Decimal converters)."""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from aws_lambda_powertools.shared.json_encoder import Encoder
+
+from models.card import Reference
+from utils import json_codec
+
+PAYLOAD = {
+    "cards": [{"front": "日本語の問題", "back": "answer", "tags": ["英単語"], "ease_factor": 2.5, "interval": 3}],
+    "total": 1,
+    "next_cursor": None,
+    "ok": True,
+    "nested": {"list": [1, -2.75, 1e-05, 12345678901234567890]},
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request):
+    """orjson がある場合とない場合の両方で同じ結果になることを確認する。"""
+    if request.param == "orjson":
+        if json_codec._orjson is None:
+            pytest.skip("orjson is not installed")
+        yield request.param
+        return
+    with patch.object(json_codec, "_orjson", None):
+        yield request.param
+
+
+class TestDumps:
+    def test_matches_powertools_serializer(self, backend):
+        """Resolver 既定のシリアライザ（json.dumps + Encoder）と同じ値になる。"""
+        value = dict(PAYLOAD, amount=Decimal("1.50"), ref=Reference(type="url", value="https://example.com"))
+        expected = json.loads(json.dumps(value, separators=(",", ":"), cls=Encoder))
+        assert json.loads(json_codec.dumps(value)) == expected
+        assert json.loads(json_codec.dumps_bytes(value)) == expected
+
+    def test_compact_and_utf8(self, backend):
+        text = json_codec.dumps({"a": [1, 2], "text": "日本語"})
+        assert text == '{"a":[1,2],"text":"日本語"}'
+        assert json_codec.dumps_bytes({"text": "日本語"}) == '{"text":"日本語"}'.encode()
+
+    def test_non_str_keys_and_dataclasses(self, backend):
+        @dataclass
+        class Point:
+            x: int
+
+        assert json.loads(json_codec.dumps({1: Point(x=2)})) == {"1": {"x": 2}}
+
+    def test_unserializable_raises_type_error(self, backend):
+        with pytest.raises(TypeError):
+            json_codec.dumps({"value": object()})
+
+
+class TestLoads:
+    def test_roundtrip(self, backend):
+        assert json_codec.loads(json_codec.dumps(PAYLOAD)) == PAYLOAD
+        assert json_codec.loads(json_codec.dumps_bytes(PAYLOAD)) == PAYLOAD
+
+    def test_invalid_json_raises_json_decode_error(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads("{not json")
+
+
+class TestDynamoDBConverters:
+    def test_to_dynamodb_matches_json_roundtrip(self):
+        """旧実装 json.loads(json.dumps(x), parse_float=Decimal) と同じ値・型になる。"""
+        value = {"a": [1.5, {"b": 2, "c": (0.1, True, None)}], "d": "text", 3: 1e-05, "big": 1e20}
+        expected = json.loads(json.dumps(value), parse_float=Decimal)
+        actual = json_codec.to_dynamodb(value)
+        assert actual == expected
+        assert repr(actual) == repr(expected)
+
+    def test_to_dynamodb_keeps_existing_decimals(self):
+        assert json_codec.to_dynamodb({"x": Decimal("0.3")}) == {"x": Decimal("0.3")}
+
+    def test_from_dynamodb_restores_numbers(self):
+        restored = json_codec.from_dynamodb({"i": Decimal("10"), "f": Decimal("0.25"), "l": [Decimal("3.0")]})
+        assert restored == {"i": 10, "f": 0.25, "l": [3]}
+        assert type(restored["i"]) is int and type(restored["l"][0]) is int
+        assert type(restored["f"]) is float
+
+    def test_datetime_is_left_to_caller(self):
+        """datetime は変換しない（呼び出し側が isoformat 済みの値を渡す）。"""
+        now = datetime.now(timezone.utc)
+        assert json_codec.to_dynamodb({"t": now}) == {"t": now}
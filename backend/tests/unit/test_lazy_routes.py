@@ -0,0 +1,77 @@
+"""Unit tests for api/lazy_routes.py (lazy router registration)."""
+
+import os
+import pkgutil
+import subprocess
+import sys
+
+import api.handlers
+from api.lazy_routes import ROUTER_MODULES, LazyRouterResolver, route_segment
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "src")
+
+
+def _event(path, stage="$default"):
+    return {"rawPath": path, "requestContext": {"stage": stage}}
+
+
+class TestRouteSegment:
+    def test_first_segment(self):
+        assert route_segment(_event("/cards/due")) == "cards"
+        assert route_segment(_event("/users/me/settings")) == "users"
+
+    def test_strips_stage_prefix(self):
+        assert route_segment(_event("/prod/decks/d1", stage="prod")) == "decks"
+        assert route_segment(_event("/decks", stage="prod")) == "decks"
+
+    def test_root_path(self):
+        assert route_segment(_event("/")) is None
+
+
+class TestLazyRouterResolver:
+    def test_every_router_module_is_mapped(self):
+        handler_modules = {
+            f"api.handlers.{info.name}" for info in pkgutil.iter_modules(api.handlers.__path__)
+        }
+        mapped = {name for names in ROUTER_MODULES.values() for name in names}
+        assert mapped == handler_modules
+
+    def test_includes_only_routers_for_requested_prefix(self):
+        app = LazyRouterResolver()
+        app.include_routers_for(_event("/stats/forecast"))
+        assert app.included_modules == {"api.handlers.stats_handler"}
+
+    def test_cards_prefix_includes_shared_routers(self):
+        app = LazyRouterResolver()
+        app.include_routers_for(_event("/cards/due"))
+        assert set(ROUTER_MODULES["cards"]) <= app.included_modules
+        # /reviews 側から来ても review_handler を二重登録しない。
+        routes_before = len(app._static_routes) + len(app._dynamic_routes)
+        app.include_routers_for(_event("/reviews/c1"))
+        assert len(app._static_routes) + len(app._dynamic_routes) == routes_before
+
+    def test_unknown_prefix_includes_nothing(self):
+        app = LazyRouterResolver()
+        app.include_routers_for(_event("/unknown"))
+        assert app.included_modules == set()
+
+    def test_include_all_routers(self):
+        app = LazyRouterResolver()
+        app.include_all_routers()
+        assert app.included_modules == {name for names in ROUTER_MODULES.values() for name in names}
+
+
+class TestColdImport:
+    def test_api_handler_import_defers_heavy_modules(self):
+        """api.handler の import で AI SDK・URL 取り込み・executor 群を読み込まない。"""
+        code = (
+            "import sys, api.handler\n"
+            "heavy = ['strands', 'bs4', 'httpx', 'services.ai_job_executors', 'api.handlers.cards_handler']\n"
+            "print(','.join(m for m in heavy if m in sys.modules))\n"
+        )
+        env = dict(os.environ, PYTHONPATH=SRC_DIR)
+        env.pop("API_EAGER_ROUTERS", None)
+        proc = subprocess.run(
+            [sys.executable, "-c", code], cwd=SRC_DIR, env=env, capture_output=True, text=True, check=True
+        )
+        assert proc.stdout.strip() == ""
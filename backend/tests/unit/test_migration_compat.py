@@ -559,7 +559,7 @@ class TestFeatureFlagBehavior:
         """
         mock_client = MagicMock()
         with patch.dict(os.environ, {"USE_STRANDS": "false"}), \
-             patch("services.bedrock.boto3.client", return_value=mock_client):
+             patch("services.bedrock.get_client", return_value=mock_client):
             service = create_ai_service()
 
         assert isinstance(service, BedrockService)
@@ -577,7 +577,7 @@ class TestFeatureFlagBehavior:
             k: v for k, v in os.environ.items() if k != "USE_STRANDS"
         }
         with patch.dict(os.environ, env_without_use_strands, clear=True), \
-             patch("services.bedrock.boto3.client", return_value=mock_client):
+             patch("services.bedrock.get_client", return_value=mock_client):
             service = create_ai_service()
 
         assert isinstance(service, BedrockService)
@@ -598,7 +598,7 @@ class TestFeatureFlagBehavior:
         # 環境変数が true でも use_strands=False で Bedrock が返る
         mock_client = MagicMock()
         with patch.dict(os.environ, {"USE_STRANDS": "true"}), \
-             patch("services.bedrock.boto3.client", return_value=mock_client):
+             patch("services.bedrock.get_client", return_value=mock_client):
             service_bedrock = create_ai_service(use_strands=False)
         assert isinstance(service_bedrock, BedrockService)
 
@@ -676,7 +676,7 @@ class TestGenerationResultValidity:
         # BedrockService
         mock_client = MagicMock()
         with patch.dict(os.environ, {"USE_STRANDS": "false"}), \
-             patch("services.bedrock.boto3.client", return_value=mock_client):
+             patch("services.bedrock.get_client", return_value=mock_client):
             bedrock_service = create_ai_service()
         assert isinstance(bedrock_service, AIService)
         assert hasattr(bedrock_service, "generate_cards") and callable(bedrock_service.generate_cards)
@@ -916,7 +916,7 @@ class TestExistingTestProtection:
         if env_use_strands is None:
             # 未設定の場合、create_ai_service() は BedrockService を返す
             mock_client = MagicMock()
-            with patch("services.bedrock.boto3.client", return_value=mock_client):
+            with patch("services.bedrock.get_client", return_value=mock_client):
                 service = create_ai_service()
             assert isinstance(service, BedrockService)
         else:
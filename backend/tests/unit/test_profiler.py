@@ -0,0 +1,181 @@
+"""Unit tests for utils/profiler.py (opt-in per-request profiling)."""
+
+import json
+import marshal
+import os
+import time
+import tracemalloc
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from utils.profiler import profile_scope, profiled, should_profile
+
+REGION = "ap-northeast-1"
+
+
+@pytest.fixture
+def profiling_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("PROFILING_ENABLED", "true")
+    monkeypatch.setenv("PROFILING_SAMPLE_RATE", "1")
+    monkeypatch.setenv("PROFILING_OUTPUT", str(tmp_path))
+    monkeypatch.setenv("PROFILING_INTERVAL_MS", "1")
+    for name in ("PROFILING_MODE", "PROFILING_DEBUG_USERS"):
+        monkeypatch.delenv(name, raising=False)
+    return tmp_path
+
+
+def _busy(ms: float) -> list:
+    data = []
+    deadline = time.perf_counter() + ms / 1000
+    while time.perf_counter() < deadline:
+        data.append(sum(range(100)))
+    return data
+
+
+def _files(root) -> dict:
+    return {p.suffix: p for p in root.rglob("*") if p.is_file()}
+
+
+class TestShouldProfile:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("PROFILING_ENABLED", raising=False)
+        monkeypatch.setenv("PROFILING_SAMPLE_RATE", "1")
+        assert not should_profile()
+
+    def test_sample_rate_zero_never_profiles(self, profiling_env, monkeypatch):
+        monkeypatch.setenv("PROFILING_SAMPLE_RATE", "0")
+        assert not any(should_profile() for _ in range(50))
+
+    def test_debug_header_requires_allowlisted_user(self, profiling_env, monkeypatch):
+        monkeypatch.setenv("PROFILING_SAMPLE_RATE", "0")
+        monkeypatch.setenv("PROFILING_DEBUG_USERS", "admin-1, admin-2")
+        assert should_profile("admin-2", {"X-Memoru-Profile": "1"})
+        assert not should_profile("someone", {"x-memoru-profile": "1"})
+        assert not should_profile("admin-1", {"x-memoru-profile": "0"})
+        assert not should_profile("admin-1", None)
+
+
+class TestProfileScope:
+    def test_disabled_writes_nothing(self, profiling_env, monkeypatch):
+        monkeypatch.setenv("PROFILING_ENABLED", "false")
+        with profile_scope("GET /stats", request_id="req-1") as scope:
+            _busy(5)
+        assert not scope.active
+        assert scope.summary is None
+        assert not list(profiling_env.rglob("*"))
+
+    def test_sampling_profile_written_with_request_id(self, profiling_env):
+        with profile_scope("GET /cards", request_id="req-42") as scope:
+            scope.name = "GET /stats"
+            _busy(50)
+
+        files = _files(profiling_env)
+        assert set(files) == {".json", ".folded"}
+        assert files[".json"].parent.name == "GET_stats"
+        assert files[".json"].name.endswith("-req-42.json")
+
+        summary = json.loads(files[".json"].read_text())
+        assert summary["name"] == "GET /stats"
+        assert summary["request_id"] == "req-42"
+        assert summary["mode"] == "sampling"
+        assert summary["samples"] > 0
+        assert any("_busy" in row["function"] for row in summary["top_functions"]["cumulative"])
+        assert summary["memory"]["peak_kb"] > 0
+        assert not tracemalloc.is_tracing()
+
+        stack, count = files[".folded"].read_text().splitlines()[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert ";" in stack
+
+    def test_cprofile_mode_writes_loadable_stats(self, profiling_env, monkeypatch):
+        monkeypatch.setenv("PROFILING_MODE", "cprofile")
+        with profile_scope("job:advice", request_id="job-1"):
+            _busy(5)
+
+        files = _files(profiling_env)
+        stats = marshal.loads(files[".pstats"].read_bytes())
+        assert any(name == "_busy" for (_file, _line, name) in stats)
+        summary = json.loads(files[".json"].read_text())
+        assert summary["top_functions"]["cumulative"][0]["cumulative_ms"] > 0
+
+    def test_does_not_nest(self, profiling_env):
+        with profile_scope("GET /cards/generate") as outer:
+            with profile_scope("job:generate_cards") as inner:
+                _busy(2)
+        assert outer.active
+        assert not inner.active
+        assert len(list(profiling_env.rglob("*.json"))) == 1
+
+    def test_write_failure_does_not_fail_request(self, profiling_env):
+        with patch("utils.profiler.write_profile", side_effect=OSError("read-only")):
+            with profile_scope("GET /stats"):
+                result = "ok"
+        assert result == "ok"
+        with profile_scope("GET /stats") as scope:
+            pass
+        assert scope.active
+
+    def test_exception_in_body_is_propagated_and_profile_written(self, profiling_env):
+        with pytest.raises(RuntimeError):
+            with profile_scope("GET /stats"):
+                raise RuntimeError("boom")
+        assert len(list(profiling_env.rglob("*.json"))) == 1
+
+    def test_writes_to_s3_output(self, profiling_env, monkeypatch):
+        monkeypatch.setenv("PROFILING_OUTPUT", "s3://memoru-profiles-test/prod")
+        with mock_aws():
+            s3 = boto3.client("s3", region_name=REGION)
+            s3.create_bucket(
+                Bucket="memoru-profiles-test",
+                CreateBucketConfiguration={"LocationConstraint": REGION},
+            )
+            with profile_scope("GET /stats", request_id="req-s3"):
+                _busy(5)
+            keys = [o["Key"] for o in s3.list_objects_v2(Bucket="memoru-profiles-test")["Contents"]]
+
+        assert sorted(os.path.splitext(k)[1] for k in keys) == [".folded", ".json"]
+        assert all(k.startswith("prod/GET_stats/") and "-req-s3." in k for k in keys)
+
+
+class TestHandlerHooks:
+    def test_profiled_uses_lambda_request_id(self, profiling_env, lambda_context):
+        @profiled("job:due_push")
+        def handler(event, context):
+            return {"ok": True}
+
+        assert handler({}, lambda_context) == {"ok": True}
+        [summary] = [json.loads(p.read_text()) for p in profiling_env.rglob("*.json")]
+        assert summary["name"] == "job:due_push"
+        assert summary["request_id"] == "test-request-id"
+
+    def test_api_handler_profiles_matched_route(self, profiling_env, api_gateway_event, lambda_context):
+        from api import handler as api_handler
+
+        with patch("api.handlers.user_handler.user_service") as mock_service:
+            mock_service.get_or_create_user.side_effect = RuntimeError("boom")
+            with pytest.raises(RuntimeError):
+                api_handler.handler(api_gateway_event(path="/users/me"), lambda_context)
+
+        [summary] = [json.loads(p.read_text()) for p in profiling_env.rglob("*.json")]
+        assert summary["name"] == "GET /users/me"
+        assert summary["request_id"] == "test-request-id"
+
+    def test_api_debug_header_for_allowlisted_user(self, profiling_env, monkeypatch, api_gateway_event, lambda_context):
+        from api import handler as api_handler
+
+        monkeypatch.setenv("PROFILING_SAMPLE_RATE", "0")
+        monkeypatch.setenv("PROFILING_DEBUG_USERS", "test-user-id")
+        with patch("api.handlers.user_handler.user_service") as mock_service:
+            mock_service.get_or_create_user.side_effect = RuntimeError("boom")
+            with pytest.raises(RuntimeError):
+                api_handler.handler(api_gateway_event(path="/users/me"), lambda_context)
+            assert not list(profiling_env.rglob("*.json"))
+            with pytest.raises(RuntimeError):
+                api_handler.handler(
+                    api_gateway_event(path="/users/me", headers={"x-memoru-profile": "1"}), lambda_context
+                )
+
+        assert len(list(profiling_env.rglob("*.json"))) == 1
@@ -212,7 +212,7 @@ class TestResponseFormatFinal:
         ) as mock_review_cls, patch(
             "services.ai_job_executors.create_ai_service"
         ) as mock_factory:
-            mock_user_cls.return_value.get_or_create_user.return_value.settings = {}
+            mock_user_cls.return_value.get_settings.return_value = {}
             mock_review_cls.return_value.get_review_summary.return_value = (
                 make_mock_review_summary()
             )
@@ -314,7 +314,7 @@ class TestCrossEndpointErrorMappingFinal:
             "services.ai_job_executors.ReviewService"
         ) as mock_review_cls:
             mock_card_cls.return_value.get_card.return_value = make_mock_card()
-            mock_user_cls.return_value.get_or_create_user.return_value.settings = {}
+            mock_user_cls.return_value.get_settings.return_value = {}
             mock_review_cls.return_value.get_review_summary.return_value = (
                 make_mock_review_summary()
             )
@@ -385,7 +385,7 @@ class TestCrossEndpointErrorMappingFinal:
             "services.ai_job_executors.ReviewService"
         ) as mock_review_cls:
             mock_card_cls.return_value.get_card.return_value = make_mock_card()
-            mock_user_cls.return_value.get_or_create_user.return_value.settings = {}
+            mock_user_cls.return_value.get_settings.return_value = {}
             mock_review_cls.return_value.get_review_summary.return_value = (
                 make_mock_review_summary()
             )
@@ -55,8 +55,8 @@ class TestProtocolComplianceFinal:
             service = StrandsAIService()
         assert isinstance(service, AIService)
 
-    @patch("services.bedrock.boto3")
-    def test_bedrock_isinstance_protocol(self, mock_boto3):
+    @patch("services.bedrock.get_client")
+    def test_bedrock_isinstance_protocol(self, mock_get_client):
         """TC-QG-004-002: BedrockService が AIService Protocol を満たす (isinstance)."""
         service = BedrockService(bedrock_client=MagicMock())
         assert isinstance(service, AIService)
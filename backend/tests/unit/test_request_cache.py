@@ -0,0 +1,245 @@
+"""Unit tests for utils/request_cache.py (request-scoped identity map)."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from services.card_repository import CardRepository
+from services.deck_service import DeckNotFoundError, DeckService
+from services.tutor_session_repository import TutorSessionRepository
+from services.user_service import UserNotFoundError, UserService
+from utils.request_cache import MISS, RequestCache, request_cache
+
+REGION = "ap-northeast-1"
+CREATED_AT = "2026-01-01T00:00:00+00:00"
+
+
+def _create_table(dynamodb, name, hash_key, range_key=None):
+    key_schema = [{"AttributeName": hash_key, "KeyType": "HASH"}]
+    attributes = [{"AttributeName": hash_key, "AttributeType": "S"}]
+    if range_key:
+        key_schema.append({"AttributeName": range_key, "KeyType": "RANGE"})
+        attributes.append({"AttributeName": range_key, "AttributeType": "S"})
+    dynamodb.create_table(
+        TableName=name,
+        KeySchema=key_schema,
+        AttributeDefinitions=attributes,
+        BillingMode="PAY_PER_REQUEST",
+    )
+
+
+@pytest.fixture
+def dynamodb():
+    with mock_aws():
+        resource = boto3.resource("dynamodb", region_name=REGION)
+        _create_table(resource, "memoru-users-test", "user_id")
+        _create_table(resource, "memoru-cards-test", "user_id", "card_id")
+        _create_table(resource, "memoru-decks-test", "user_id", "deck_id")
+        _create_table(resource, "memoru-tutor-sessions-test", "user_id", "session_id")
+        yield resource
+
+
+@pytest.fixture
+def scope():
+    """1 リクエスト分のスコープを開く（テスト終了時に必ず閉じる）。"""
+    request_cache.begin()
+    yield request_cache
+    request_cache.end()
+
+
+def _spy_get_item(table):
+    spy = MagicMock(wraps=table.get_item)
+    table.get_item = spy
+    return spy
+
+
+class TestRequestCache:
+    def test_inactive_cache_is_pass_through(self):
+        cache = RequestCache()
+        cache.put("t", "k", item={"a": 1})
+        assert cache.get("t", "k") is MISS
+        assert cache.stats() == {"hits": 0, "misses": 0, "items": 0}
+
+    def test_counts_hits_and_misses_per_request(self):
+        cache = RequestCache()
+        cache.begin()
+        assert cache.get("t", "k") is MISS
+        cache.put("t", "k", item={"a": 1})
+        assert cache.get("t", "k") == {"a": 1}
+        assert cache.end() == {"hits": 1, "misses": 1, "items": 1}
+
+        cache.begin()
+        assert cache.get("t", "k") is MISS
+        assert cache.stats() == {"hits": 0, "misses": 1, "items": 0}
+
+    def test_caches_missing_items_as_none(self):
+        cache = RequestCache()
+        cache.begin()
+        cache.put("t", "k", item=None)
+        assert cache.get("t", "k") is None
+
+    def test_returns_copies(self):
+        cache = RequestCache()
+        cache.begin()
+        item = {"tags": ["a"]}
+        cache.put("t", "k", item=item)
+        item["tags"].append("b")
+        cached = cache.get("t", "k")
+        cached["tags"].append("c")
+        assert cache.get("t", "k") == {"tags": ["a"]}
+
+    def test_invalidate_is_keyed_by_table_and_key(self):
+        cache = RequestCache()
+        cache.begin()
+        cache.put("users", "u1", item={"user_id": "u1"})
+        cache.put("cards", "u1", "c1", item={"card_id": "c1"})
+        cache.invalidate("cards", "u1", "c1")
+        assert cache.get("cards", "u1", "c1") is MISS
+        assert cache.get("users", "u1") == {"user_id": "u1"}
+
+    def test_invalidate_from_worker_threads(self):
+        cache = RequestCache()
+        cache.begin()
+        for i in range(50):
+            cache.put("cards", "u1", f"c{i}", item={"card_id": f"c{i}"})
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda i: cache.invalidate("cards", "u1", f"c{i}"), range(50)))
+        assert cache.stats()["items"] == 0
+
+
+class TestUserServiceCache:
+    def test_repeated_reads_hit_cache(self, dynamodb, scope):
+        service = UserService(table_name="memoru-users-test", dynamodb_resource=dynamodb)
+        service.create_user("user-1")
+        spy = _spy_get_item(service.table)
+
+        service.get_or_create_user("user-1")
+        service.get_user("user-1")
+
+        assert spy.call_count == 1
+        assert scope.stats()["hits"] == 1
+
+    def test_update_settings_invalidates(self, dynamodb, scope):
+        service = UserService(table_name="memoru-users-test", dynamodb_resource=dynamodb)
+        service.create_user("user-1")
+        service.get_user("user-1")
+
+        service.update_settings("user-1", timezone="Asia/Tokyo")
+
+        assert service.get_user("user-1").settings["timezone"] == "Asia/Tokyo"
+
+    def test_cached_not_found_is_cleared_by_create(self, dynamodb, scope):
+        service = UserService(table_name="memoru-users-test", dynamodb_resource=dynamodb)
+        with pytest.raises(UserNotFoundError):
+            service.get_user("user-1")
+
+        service.create_user("user-1", display_name="Alice")
+
+        assert service.get_user("user-1").display_name == "Alice"
+
+    def test_no_caching_outside_request_scope(self, dynamodb):
+        service = UserService(table_name="memoru-users-test", dynamodb_resource=dynamodb)
+        service.create_user("user-1")
+        spy = _spy_get_item(service.table)
+
+        service.get_user("user-1")
+        service.get_user("user-1")
+
+        assert spy.call_count == 2
+
+
+class TestCardRepositoryCache:
+    def test_consistent_read_bypasses_and_refreshes_cache(self, dynamodb, scope):
+        repo = CardRepository(table_name="memoru-cards-test", dynamodb_resource=dynamodb)
+        table = dynamodb.Table("memoru-cards-test")
+        table.put_item(Item={"user_id": "u1", "card_id": "c1", "front": "old"})
+        assert repo.get_item("u1", "c1")["front"] == "old"
+
+        # 別経路（他リクエスト）の書き込みを模す。
+        table.put_item(Item={"user_id": "u1", "card_id": "c1", "front": "new"})
+        assert repo.get_item("u1", "c1")["front"] == "old"
+        assert repo.get_item("u1", "c1", consistent_read=True)["front"] == "new"
+        assert repo.get_item("u1", "c1")["front"] == "new"
+
+    def test_writes_invalidate(self, dynamodb, scope):
+        repo = CardRepository(table_name="memoru-cards-test", dynamodb_resource=dynamodb)
+        dynamodb.Table("memoru-cards-test").put_item(Item={"user_id": "u1", "card_id": "c1", "front": "old"})
+        repo.get_item("u1", "c1")
+
+        repo.update_item("u1", "c1", "SET front = :f", {":f": "new"})
+        assert repo.get_item("u1", "c1")["front"] == "new"
+
+        assert repo.move_card_to_deck("u1", "c1", "d1", "2026-01-01T00:00:00+00:00") == "moved"
+        assert repo.get_item("u1", "c1")["deck_id"] == "d1"
+
+
+class TestDeckCache:
+    def test_deck_reads_are_shared_with_tutor_repository(self, dynamodb, scope):
+        deck_service = DeckService(
+            table_name="memoru-decks-test", cards_table_name="memoru-cards-test", dynamodb_resource=dynamodb
+        )
+        tutor_repo = TutorSessionRepository(table_name="memoru-tutor-sessions-test", dynamodb_resource=dynamodb)
+        tutor_repo.decks_table_name = "memoru-decks-test"
+        dynamodb.Table("memoru-decks-test").put_item(
+            Item={"user_id": "u1", "deck_id": "d1", "name": "英単語", "created_at": CREATED_AT}
+        )
+        spy = _spy_get_item(deck_service.table)
+
+        deck_service.get_deck("u1", "d1")
+        assert tutor_repo.get_deck("u1", "d1")["name"] == "英単語"
+
+        assert spy.call_count == 1
+        assert scope.stats() == {"hits": 1, "misses": 1, "items": 1}
+
+    def test_update_and_delete_invalidate(self, dynamodb, scope):
+        deck_service = DeckService(
+            table_name="memoru-decks-test", cards_table_name="memoru-cards-test", dynamodb_resource=dynamodb
+        )
+        dynamodb.Table("memoru-decks-test").put_item(
+            Item={"user_id": "u1", "deck_id": "d1", "name": "old", "created_at": CREATED_AT}
+        )
+        deck_service.get_deck("u1", "d1")
+
+        deck_service.update_deck("u1", "d1", name="new")
+        assert deck_service.get_deck("u1", "d1").name == "new"
+
+        with patch.object(deck_service, "_query_deck_card_keys", return_value=([], None)):
+            deck_service.delete_deck("u1", "d1")
+        with pytest.raises(DeckNotFoundError):
+            deck_service.get_deck("u1", "d1")
+
+
+class TestTutorSessionCache:
+    def test_session_writes_invalidate(self, dynamodb, scope):
+        repo = TutorSessionRepository(table_name="memoru-tutor-sessions-test", dynamodb_resource=dynamodb)
+        repo.put_session({"user_id": "u1", "session_id": "s1", "status": "active"})
+        assert repo.get_session_item("u1", "s1")["status"] == "active"
+
+        repo.mark_ended("u1", "s1", "2026-01-01T00:00:00+00:00", 0)
+
+        assert repo.get_session_item("u1", "s1")["status"] == "ended"
+
+
+class TestHandlerScope:
+    def test_cache_is_cleared_per_invocation(self, api_gateway_event, lambda_context):
+        from api import handler as api_handler
+
+        seen = []
+
+        def resolve(event, context):
+            seen.append(request_cache.active)
+            request_cache.put("t", "k", item={"a": 1})
+            assert request_cache.get("t", "k") == {"a": 1}
+            return {"statusCode": 200, "body": json.dumps({})}
+
+        with patch.object(api_handler.app, "resolve", side_effect=resolve):
+            api_handler.handler(api_gateway_event(path="/users/me"), lambda_context)
+            api_handler.handler(api_gateway_event(path="/users/me"), lambda_context)
+
+        assert seen == [True, True]
+        assert not request_cache.active
+        assert request_cache.get("t", "k") is MISS
@@ -765,6 +765,23 @@ def _put_due_card(dynamodb, user_id: str, card_id: str, due_offset_hours: int =
     dynamodb.Table("memoru-cards-test").put_item(Item=item)
 
 
+class TestGetDueCardsJson:
+    """get_due_cards_json（GET /cards/due?fields=）のテスト."""
+
+    @pytest.mark.parametrize("deck_id", [None, "deck-a"], ids=["all", "deck"])
+    def test_fields_subset_matches_full_response(self, review_service, dynamodb_tables, deck_id):
+        for i in range(4):
+            _put_due_card(dynamodb_tables, "test-user-id", f"card-json-{i}", due_offset_hours=-(i * 30 + 1),
+                          deck_id="deck-a" if i % 2 else None)
+
+        full = review_service.get_due_cards("test-user-id", limit=3, deck_id=deck_id).model_dump(mode="json")
+        fields = ["card_id", "front", "overdue_days"]
+        sparse = review_service.get_due_cards_json("test-user-id", fields, limit=3, deck_id=deck_id)
+
+        assert sparse["total_due_count"] == full["total_due_count"]
+        assert sparse["next_due_date"] == full["next_due_date"]
+        assert sparse["due_cards"] == [{name: card[name] for name in fields} for card in full["due_cards"]]
+
 class TestGetDueCardsTotalDueCountFix:
     """TASK-0088: total_due_count が limit に影響されない正確な総数を返すことを検証するテスト群。
 
@@ -22,16 +22,20 @@ class TestGetSqsEndpointUrl:
 class TestGetSqsClient:
     def test_passes_endpoint_url_when_set(self, monkeypatch):
         monkeypatch.setenv("SQS_ENDPOINT_URL", "http://elasticmq:9324")
-        with patch.object(sqs_client, "boto3") as mock_boto3:
-            mock_boto3.client.return_value = MagicMock()
+        with patch.object(sqs_client, "get_client") as mock_get_client:
+            mock_get_client.return_value = MagicMock()
             sqs_client.get_sqs_client()
-            mock_boto3.client.assert_called_once_with(
+            mock_get_client.assert_called_once_with(
                 "sqs", endpoint_url="http://elasticmq:9324"
             )
 
     def test_omits_endpoint_url_when_unset(self, monkeypatch):
         monkeypatch.delenv("SQS_ENDPOINT_URL", raising=False)
-        with patch.object(sqs_client, "boto3") as mock_boto3:
-            mock_boto3.client.return_value = MagicMock()
+        with patch.object(sqs_client, "get_client") as mock_get_client:
+            mock_get_client.return_value = MagicMock()
             sqs_client.get_sqs_client()
-            mock_boto3.client.assert_called_once_with("sqs")
+            mock_get_client.assert_called_once_with("sqs", endpoint_url=None)
+
+    def test_returns_shared_client(self, monkeypatch):
+        monkeypatch.delenv("SQS_ENDPOINT_URL", raising=False)
+        assert sqs_client.get_sqs_client() is sqs_client.get_sqs_client()
@@ -152,6 +152,13 @@ class TestSM2Algorithm:
 
         assert expected_min <= result.next_review_at <= expected_max
 
+    def test_now_parameter_sets_base_time(self):
+        """now を指定すると現在時刻ではなく now を基準に next_review_at を計算する。"""
+        now = datetime(2026, 3, 1, 1, 0, 0, tzinfo=timezone.utc)
+        result = calculate_sm2(grade=4, repetitions=1, ease_factor=2.5, interval=1, now=now)
+
+        assert result.next_review_at == now + timedelta(days=6)
+
     def test_invalid_grade_negative(self):
         """Test invalid grade raises ValueError."""
         with pytest.raises(ValueError, match="Grade must be between 0 and 5"):
@@ -235,6 +242,15 @@ class TestCalculateNextReviewBoundary:
         expected = datetime(2026, 3, 1, 19, 0, 0, tzinfo=timezone.utc)
         assert result == expected
 
+    def test_now_parameter_without_patching(self):
+        """now を指定すると datetime.now() を使わずに境界を計算する（シミュレーター用）。"""
+        # 2026-03-01 01:00 JST（境界前=前日扱い）
+        now = datetime(2026, 2, 28, 16, 0, 0, tzinfo=timezone.utc)
+
+        result = calculate_next_review_boundary(interval=1, user_timezone="Asia/Tokyo", day_start_hour=4, now=now)
+
+        assert result == datetime(2026, 2, 28, 19, 0, 0, tzinfo=timezone.utc)
+
     def test_day_start_hour_14_night_shift(self):
         """REQ-002: day_start_hour=14 での夜勤ユーザー向け設定テスト。
         23:00 JST に復習 (14以降)、interval=1 → 翌日 14:00 JST。"""
@@ -440,6 +440,40 @@ class TestListSessions:
         assert len(body["sessions"]) == 2
 
 
+    def test_list_sessions_fields(self, api_gateway_event, lambda_context):
+        event = api_gateway_event(
+            method="GET",
+            path="/tutor/sessions",
+            query_string_parameters={"fields": "status,deck_id"},
+        )
+
+        with patch("api.handlers.tutor_handler.tutor_service") as mock_svc:
+            mock_svc.list_sessions.return_value = [_make_session()]
+            from api.handler import handler
+
+            response = handler(event, lambda_context)
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert body["total"] == 1
+        assert set(body["sessions"][0]) == {"session_id", "deck_id", "status"}
+
+    def test_list_sessions_unknown_field_returns_400(self, api_gateway_event, lambda_context):
+        event = api_gateway_event(
+            method="GET",
+            path="/tutor/sessions",
+            query_string_parameters={"fields": "status,secret"},
+        )
+
+        with patch("api.handlers.tutor_handler.tutor_service") as mock_svc:
+            from api.handler import handler
+
+            response = handler(event, lambda_context)
+            mock_svc.list_sessions.assert_not_called()
+
+        assert response["statusCode"] == 400
+        assert json.loads(response["body"])["unknown_fields"] == ["secret"]
+
 class TestGetSession:
     """GET /tutor/sessions/{sessionId} endpoint tests（同期のまま変更なし）."""
 
@@ -501,6 +501,19 @@ class TestListSessions:
         assert len(sessions) == 0
 
 
+    def test_list_sessions_does_not_read_messages(self, tutor_service, dynamodb_tables):
+        """一覧では messages を ProjectionExpression で取得しない（件数は message_count で返る）。"""
+        _seed_deck(dynamodb_tables)
+        session = tutor_service.start_session("test-user", "deck_001", "free_talk")
+
+        items = tutor_service._repo.query_sessions("test-user", attributes=tutor_service.LIST_ATTRIBUTES)
+        assert items and all("messages" not in item for item in items)
+
+        [listed] = tutor_service.list_sessions("test-user")
+        assert listed.session_id == session.session_id
+        assert listed.message_count == session.message_count
+        assert listed.messages == []
+
 class TestStartSessionWithSessionManager:
     """Tests for TutorService.start_session with SessionManager integration (TASK-0166)."""
 
@@ -639,13 +639,13 @@ class TestConstructor:
         assert sm.session_id == "sess1"
         assert sm.user_id == "user1"
 
-    @patch("utils.dynamodb_client.boto3")
-    def test_creates_dynamodb_resource_with_endpoint_url(self, mock_boto3):
+    @patch("utils.dynamodb_client.get_resource")
+    def test_creates_dynamodb_resource_with_endpoint_url(self, mock_get_resource):
         """When DYNAMODB_ENDPOINT_URL is set, it should be used for DynamoDB resource."""
         from services.tutor_session_manager import DynamoDBSessionManager
 
         mock_resource = MagicMock()
-        mock_boto3.resource.return_value = mock_resource
+        mock_get_resource.return_value = mock_resource
 
         with patch.dict("os.environ", {"DYNAMODB_ENDPOINT_URL": "http://localhost:8000"}):
             DynamoDBSessionManager(
@@ -653,17 +653,17 @@ class TestConstructor:
                 session_id="sess1",
                 user_id="user1",
             )
-        mock_boto3.resource.assert_called_once_with(
+        mock_get_resource.assert_called_once_with(
             "dynamodb", endpoint_url="http://localhost:8000"
         )
 
-    @patch("utils.dynamodb_client.boto3")
-    def test_creates_dynamodb_resource_with_aws_endpoint_url(self, mock_boto3):
+    @patch("utils.dynamodb_client.get_resource")
+    def test_creates_dynamodb_resource_with_aws_endpoint_url(self, mock_get_resource):
         """When AWS_ENDPOINT_URL is set, it should be used as fallback."""
         from services.tutor_session_manager import DynamoDBSessionManager
 
         mock_resource = MagicMock()
-        mock_boto3.resource.return_value = mock_resource
+        mock_get_resource.return_value = mock_resource
 
         with patch.dict(
             "os.environ",
@@ -679,17 +679,17 @@ class TestConstructor:
                         session_id="sess1",
                         user_id="user1",
                     )
-            mock_boto3.resource.assert_called_with(
+            mock_get_resource.assert_called_with(
                 "dynamodb", endpoint_url="http://localhost:4566"
             )
 
-    @patch("utils.dynamodb_client.boto3")
-    def test_creates_dynamodb_resource_default(self, mock_boto3):
+    @patch("utils.dynamodb_client.get_resource")
+    def test_creates_dynamodb_resource_default(self, mock_get_resource):
         """Without endpoint env vars, it should create default DynamoDB resource."""
         from services.tutor_session_manager import DynamoDBSessionManager
 
         mock_resource = MagicMock()
-        mock_boto3.resource.return_value = mock_resource
+        mock_get_resource.return_value = mock_resource
 
         with patch.dict("os.environ", {"DYNAMODB_ENDPOINT_URL": "", "AWS_ENDPOINT_URL": ""}):
             DynamoDBSessionManager(
@@ -697,7 +697,7 @@ class TestConstructor:
                 session_id="sess1",
                 user_id="user1",
             )
-        mock_boto3.resource.assert_called_once_with("dynamodb")
+        mock_get_resource.assert_called_once_with("dynamodb", endpoint_url=None)
 
 
 class TestReadMessages:
@@ -522,3 +522,63 @@ class TestGetOrCreateUser:
         # NOTE: card_count は to_dynamodb_item() に含まれないため、DynamoDBには存在しない
         # Fix 1 (if_not_exists) がcard_count欠如を安全に処理する
         assert "card_count" not in stored  # 【確認内容】: to_dynamodb_item()はcard_countを含まない 🔵
+
+
+class TestGetSettings:
+    """Tests for UserService.get_settings (warm-container settings cache)."""
+
+    @staticmethod
+    def _put_user(dynamodb_table, **extra):
+        dynamodb_table.Table("memoru-users-test").put_item(
+            Item={
+                "user_id": "test-user-id",
+                "settings": {"timezone": "Asia/Tokyo", "day_start_hour": 4},
+                "created_at": "2024-01-01T00:00:00",
+                **extra,
+            }
+        )
+
+    def test_served_from_cache_after_first_read(self, user_service, dynamodb_table):
+        self._put_user(dynamodb_table)
+        assert user_service.get_settings("test-user-id")["timezone"] == "Asia/Tokyo"
+
+        # 別コンテナでの変更を模す（settings_version は加算しない直接書き込み）。
+        self._put_user(dynamodb_table, settings={"timezone": "UTC"})
+
+        assert user_service.get_settings("test-user-id")["timezone"] == "Asia/Tokyo"
+
+    def test_creates_missing_user(self, user_service, dynamodb_table):
+        settings = user_service.get_settings("new-user-id")
+
+        assert settings["timezone"] == "Asia/Tokyo"
+        assert "Item" in dynamodb_table.Table("memoru-users-test").get_item(Key={"user_id": "new-user-id"})
+
+    def test_update_settings_writes_through_and_bumps_version(self, user_service, dynamodb_table):
+        self._put_user(dynamodb_table)
+        user_service.get_settings("test-user-id")
+
+        user = user_service.update_settings("test-user-id", timezone="UTC")
+
+        assert user.settings_version == 1
+        assert user_service.get_settings("test-user-id")["timezone"] == "UTC"
+        stored = dynamodb_table.Table("memoru-users-test").get_item(Key={"user_id": "test-user-id"})["Item"]
+        assert stored["settings_version"] == 1
+
+    def test_full_read_with_newer_version_replaces_entry(self, user_service, dynamodb_table):
+        self._put_user(dynamodb_table)
+        user_service.get_settings("test-user-id")
+
+        self._put_user(dynamodb_table, settings={"timezone": "UTC"}, settings_version=5)
+        user_service.get_user("test-user-id")
+
+        assert user_service.get_settings("test-user-id")["timezone"] == "UTC"
+
+    def test_link_and_unlink_bump_version(self, user_service, dynamodb_table):
+        self._put_user(dynamodb_table)
+        table = dynamodb_table.Table("memoru-users-test")
+
+        user = user_service.link_line("test-user-id", "U1234567890abcdef1234567890abcdef")
+        assert user.settings_version == 1
+        user_service.unlink_line("test-user-id")
+
+        assert table.get_item(Key={"user_id": "test-user-id"})["Item"]["settings_version"] == 2
@@ -0,0 +1,87 @@
+"""Unit tests for services/user_settings_cache.py (TTL + LRU settings cache)."""
+
+from services.user_settings_cache import UserSettingsCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _cache(**kwargs):
+    clock = FakeClock()
+    return UserSettingsCache(clock=clock, **{"ttl_seconds": 60, "max_entries": 2, **kwargs}), clock
+
+
+class TestUserSettingsCache:
+    def test_hit_within_ttl_and_miss_after(self):
+        cache, clock = _cache()
+        cache.put("u1", {"timezone": "UTC"}, 0)
+
+        clock.now = 59
+        assert cache.get("u1") == {"timezone": "UTC"}
+        clock.now = 60
+        assert cache.get("u1") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_returns_copies(self):
+        cache, _ = _cache()
+        cache.put("u1", {"timezone": "UTC"}, 0)
+        cache.get("u1")["timezone"] = "Asia/Tokyo"
+        assert cache.get("u1") == {"timezone": "UTC"}
+
+    def test_evicts_least_recently_used(self):
+        cache, _ = _cache()
+        cache.put("u1", {}, 0)
+        cache.put("u2", {}, 0)
+        cache.get("u1")
+        cache.put("u3", {}, 0)
+
+        assert cache.get("u2") is None
+        assert cache.get("u1") == {}
+        assert cache.get("u3") == {}
+
+    def test_older_version_does_not_overwrite_fresh_entry(self):
+        cache, _ = _cache()
+        cache.put("u1", {"timezone": "UTC"}, 2)
+        cache.put("u1", {"timezone": "Asia/Tokyo"}, 1)
+        assert cache.get("u1") == {"timezone": "UTC"}
+
+    def test_same_version_extends_ttl(self):
+        cache, clock = _cache()
+        cache.put("u1", {"timezone": "UTC"}, 1)
+        clock.now = 50
+        cache.put("u1", {"timezone": "UTC"}, 1)
+        clock.now = 100
+        assert cache.get("u1") == {"timezone": "UTC"}
+
+    def test_expired_entry_accepts_any_version(self):
+        cache, clock = _cache()
+        cache.put("u1", {"timezone": "UTC"}, 3)
+        clock.now = 61
+        cache.put("u1", {"timezone": "Asia/Tokyo"}, 0)
+        assert cache.get("u1") == {"timezone": "Asia/Tokyo"}
+
+    def test_disabled_with_zero_ttl(self):
+        cache, _ = _cache(ttl_seconds=0)
+        cache.put("u1", {}, 0)
+        assert not cache.enabled
+        assert cache.get("u1") is None
+
+    def test_invalidate(self):
+        cache, _ = _cache()
+        cache.put("u1", {}, 0)
+        cache.invalidate("u1")
+        assert cache.get("u1") is None
+
+    def test_discard_if_older(self):
+        cache, _ = _cache()
+        cache.put("u1", {"timezone": "UTC"}, 2)
+        cache.discard_if_older("u1", 2)
+        assert cache.get("u1") == {"timezone": "UTC"}
+
+        cache.discard_if_older("u1", 3)
+        assert cache.get("u1") is None
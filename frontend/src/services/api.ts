@@ -628,6 +628,9 @@ class ApiClient {
     });
   }
 
+  // 204 のほか、大きなデッキでは 202（カードの deck_id リセットジョブの受付）が返る。
+  // どちらもデッキは削除済みのためボディ（ジョブ）は読まない。ジョブが終わるまでカードは
+  // 削除済みデッキの deck_id を持ち続ける（一覧の再取得で順次「未分類」になる）。
   async deleteDeck(id: string): Promise<void> {
     await this.request<void>(`/decks/${encodeURIComponent(id)}`, {
       method: "DELETE",